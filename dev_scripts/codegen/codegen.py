@@ -3,8 +3,44 @@
 import argparse
 import os
 import pathlib
+import re
 import subprocess
 import sys
+from typing import List, Mapping
+
+import generate_local_verifier
+import generate_property_visitors
+
+#: Generated static classes, by the generated file, which the hand-written files
+#: of the SDK extend
+_PARTIAL_CLASSES = {
+    "jsonization.cs": ["Jsonization", "Serialize"],
+    "verification.cs": ["Verification"],
+    "visitation.cs": ["Visitation"],
+    "xmlization.cs": ["Xmlization", "Deserialize", "Serialize"],
+}  # type: Mapping[str, List[str]]
+
+
+def _make_partial(text: str, class_names: List[str]) -> str:
+    """Mark the static classes ``class_names`` in the generated ``text`` as partial."""
+    for class_name in class_names:
+        for pattern, replacement in [
+            (
+                rf"^( *)public static class {class_name}$",
+                rf"\1public static partial class {class_name}",
+            ),
+            (
+                rf"^( *)}}  // public static class {class_name}$",
+                rf"\1}}  // public static partial class {class_name}",
+            ),
+        ]:
+            text, count = re.subn(pattern, replacement, text, flags=re.MULTILINE)
+            assert count == 1, (
+                f"Expected exactly one match for {pattern!r} "
+                f"in the generated code, but got {count}"
+            )
+
+    return text
 
 
 def _generate_sdk(
@@ -27,6 +63,25 @@ def _generate_sdk(
         check=True,
     )
 
+    project_dir = sdk_path / "src/AasCore.Aas3_0"
+
+    for file_name, class_names in _PARTIAL_CLASSES.items():
+        path = project_dir / file_name
+        path.write_text(
+            _make_partial(path.read_text(encoding="utf-8"), class_names),
+            encoding="utf-8",
+        )
+
+    # NOTE: The local verifier is derived from the generated verification.
+    verification_text = (project_dir / "verification.cs").read_text(encoding="utf-8")
+    (project_dir / "verification_local_verifier.cs").write_text(
+        generate_local_verifier.generate(verification_text), encoding="utf-8"
+    )
+
+    # NOTE: The transformers over all the properties are derived from the generated
+    # types.
+    generate_property_visitors.generate(project_dir)
+
 
 def main() -> int:
     """Execute the main routine."""
@@ -0,0 +1,383 @@
+"""
+Generate the local verifier from the generated verification.
+
+The local verifier performs the same checks as ``Verification.Transformer``, but
+puts the children on an agenda instead of verifying them recursively. This allows
+``Verification.VerifyIteratively`` to walk the instances with an explicit stack,
+and ``Verification.Verify(that, options)`` to select the checks by their category.
+
+Since the checks are derived from the generated ``verification.cs``, we do not have
+to mirror the meta-model by hand. Re-run this script whenever ``verification.cs``
+has been re-generated.
+"""
+
+import argparse
+import os
+import pathlib
+import re
+import sys
+from typing import Dict, List, Set
+
+_HEADER = """\
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_local_verifier.py from verification.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+using CodeAnalysis = System.Diagnostics.CodeAnalysis;
+
+using System.Collections.Generic;  // can't alias
+using System.Linq;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Verify the invariants of a single instance, and put its children
+        /// on the agenda instead of verifying them recursively.
+        /// </summary>
+        /// <remarks>
+        /// The checks follow one-to-one the ones in <see cref="Transformer" />.
+        /// </remarks>
+        private class LocalVerifier
+            : Visitation.AbstractVisitorWithContext<Agenda>
+        {
+"""
+
+_PRIMITIVES_HEADER = """\
+            /// <summary>
+            /// Verify the constrained primitives as in <see cref="Verification" />,
+            /// but match the patterns through <see cref="Patterns" />.
+            /// </summary>
+            private static class Primitives
+            {
+"""
+
+_PRIMITIVES_FOOTER = """\
+            }  // private static class Primitives
+"""
+
+_FOOTER = """\
+        }  // private class LocalVerifier
+
+        [CodeAnalysis.SuppressMessage("ReSharper", "InconsistentNaming")]
+        private static readonly LocalVerifier _localVerifier = new LocalVerifier();
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
+"""
+
+
+def _indent_of(line: str) -> str:
+    """Return the leading whitespace of ``line``."""
+    return line[: len(line) - len(line.lstrip())]
+
+
+def _paren_delta(line: str) -> int:
+    """Count the opened minus the closed parentheses outside of string literals."""
+    delta = 0
+    in_string = False
+    escaped = False
+    for character in line:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif character == "\\":
+                escaped = True
+            elif character == '"':
+                in_string = False
+        else:
+            if character == '"':
+                in_string = True
+            elif character == "(":
+                delta += 1
+            elif character == ")":
+                delta -= 1
+    return delta
+
+
+def _find_closing(lines: List[str], start: int, indent: str) -> int:
+    """Find the index of the closing brace at ``indent`` starting from ``start``."""
+    i = start
+    while lines[i] != indent + "}":
+        i += 1
+    return i
+
+
+def _categorize_invariant(condition: str, message: str) -> str:
+    """Determine the category of the invariant as a C# expression."""
+    flags = []  # type: List[str]
+    if re.search(r"Constraint AAS[a-z]-", message):
+        flags.append("Checks.Constraints")
+    if "ValueConsistentWithXsdType" in condition:
+        flags.append("Checks.ValueTypes")
+    if len(flags) == 0:
+        flags.append("Checks.Invariants")
+    return " | ".join(flags)
+
+
+class _Converter:
+    """Convert the body of the transformer to the body of the local verifier."""
+
+    def __init__(self, enumerations: Set[str]) -> None:
+        """Initialize with the names of the enumerations in the meta-model."""
+        self.enumerations = enumerations
+
+    def convert(self, lines: List[str]) -> List[str]:
+        """Convert the ``lines`` of the transformer."""
+        # pylint: disable=too-many-branches,too-many-statements
+        out = []  # type: List[str]
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            stripped = line.strip()
+            indent = _indent_of(line)
+
+            mtch = re.match(
+                r"public override IEnumerable<Reporting\.Error> Transform(\w+)\($",
+                stripped,
+            )
+            if mtch is not None:
+                name = mtch.group(1)
+                assert lines[i + 1].strip() == f"Aas.I{name} that", lines[i + 1]
+                assert lines[i + 2].strip() == ")", lines[i + 2]
+                out.append(f"{indent}public override void Visit{name}(")
+                out.append(f"{indent}    Aas.I{name} that,")
+                out.append(f"{indent}    Agenda agenda")
+                out.append(f"{indent})")
+                i += 3
+                continue
+
+            if stripped.startswith("if (!("):
+                end_of_condition = i
+                while lines[end_of_condition + 1] != indent + "{":
+                    end_of_condition += 1
+                condition = "\n".join(lines[i : end_of_condition + 1])
+
+                assert (
+                    lines[end_of_condition + 2].strip()
+                    == "yield return new Reporting.Error("
+                ), lines[end_of_condition + 2]
+                end_of_block = _find_closing(lines, end_of_condition + 3, indent)
+                message = "\n".join(lines[end_of_condition + 3 : end_of_block])
+
+                flags = _categorize_invariant(condition, message)
+                out.append(
+                    line.replace("if (!(", f"if (agenda.Wants({flags}) && !(", 1)
+                )
+                i += 1
+                continue
+
+            mtch = re.match(
+                r"foreach \(var error in Verification\.Verify(\w+)\((.+)\)\)$",
+                stripped,
+            )
+            if mtch is None and stripped == "foreach (":
+                # NOTE: The long calls are broken over multiple lines.
+                mtch = re.match(
+                    r"var error in Verification\.Verify(\w+)\((.*)$",
+                    lines[i + 1].strip(),
+                )
+            if mtch is not None:
+                end_of_block = _find_closing(lines, i + 1, indent)
+                flag = (
+                    "Checks.Enumerations"
+                    if mtch.group(1) in self.enumerations
+                    else "Checks.ConstrainedPrimitives"
+                )
+                out.append(f"{indent}if (agenda.Wants({flag}))")
+                out.append(f"{indent}{{")
+                out.append("    " + line)
+                for converted in self.convert(lines[i + 1 : end_of_block + 1]):
+                    out.append(("    " + converted) if converted != "" else converted)
+                out.append(f"{indent}}}")
+                i = end_of_block + 1
+                continue
+
+            mtch = re.match(
+                r"foreach \(var error in Verification\.Verify\((.+)\)\)$", stripped
+            )
+            if mtch is not None:
+                expression = mtch.group(1)
+                end_of_block = _find_closing(lines, i + 1, indent)
+                block = "\n".join(lines[i + 1 : end_of_block])
+
+                indices = re.findall(r"IndexSegment\(\s*(\w+)\)", block)
+                names = re.findall(r'NameSegment\(\s*"(\w+)"\)', block)
+                assert len(names) == 1 and len(indices) <= 1, block
+
+                if len(indices) == 1:
+                    out.append(f"{indent}agenda.Item(")
+                    out.append(f"{indent}    {expression},")
+                    out.append(f'{indent}    "{names[0]}",')
+                    out.append(f"{indent}    {indices[0]});")
+                else:
+                    out.append(f"{indent}agenda.Child(")
+                    out.append(f"{indent}    {expression},")
+                    out.append(f'{indent}    "{names[0]}");')
+                i = end_of_block + 1
+                continue
+
+            if stripped == "yield return error;":
+                out.append(f"{indent}agenda.Error(error);")
+                i += 1
+                continue
+
+            if stripped == "yield break;":
+                # NOTE: The classes without any checks end with an empty body.
+                i += 1
+                continue
+
+            if stripped == "yield return new Reporting.Error(":
+                out.append(f"{indent}agenda.Error(")
+                out.append(f"{indent}    new Reporting.Error(")
+                depth = 1
+                j = i + 1
+                while True:
+                    depth += _paren_delta(lines[j])
+                    if depth == 0:
+                        assert lines[j].endswith(");"), lines[j]
+                        out.append("    " + lines[j][:-1] + ");")
+                        break
+                    out.append("    " + lines[j])
+                    j += 1
+                i = j + 1
+                continue
+
+            assert (
+                "yield" not in stripped and "Verification.Verify(" not in stripped
+            ), f"Unexpected line in the transformer: {line}"
+            out.append(line)
+            i += 1
+
+        return out
+
+
+def _extract_primitive_verifications(verification_text: str) -> Dict[str, str]:
+    """
+    Extract the verifications of the constrained primitives which match patterns.
+
+    The verifications are re-indented for the nested class ``Primitives``, and
+    match the patterns through ``Verification.Patterns``.
+    """
+    result = dict()  # type: Dict[str, str]
+
+    for mtch in re.finditer(
+        r"^        /// <summary>\n"
+        r"        /// Verify the constraints of <paramref name=\"that\" />\.\n"
+        r"        /// </summary>\n"
+        r"        public static IEnumerable<Reporting\.Error> Verify(\w+)\(\n"
+        r"            (?:string|byte\[\]) that\)\n"
+        r"        \{\n"
+        r".*?"
+        r"^        \}$",
+        verification_text,
+        flags=re.MULTILINE | re.DOTALL,
+    ):
+        code = mtch.group(0)
+        if "Verification.Matches" not in code:
+            continue
+
+        code = code.replace(
+            "public static IEnumerable<Reporting.Error>",
+            "internal static IEnumerable<Reporting.Error>",
+        ).replace("Verification.Matches", "Patterns.Matches")
+
+        result[mtch.group(1)] = (
+            "\n".join(
+                ("        " + line) if line != "" else line
+                for line in code.splitlines()
+            )
+            + "\n"
+        )
+
+    assert len(result) > 0, "Expected at least one verification matching a pattern"
+
+    return result
+
+
+def generate(verification_text: str) -> str:
+    """Generate the code of the local verifier based on ``verification_text``."""
+    lines = verification_text.splitlines()
+
+    start = next(
+        i
+        for i, line in enumerate(lines)
+        if line.strip().startswith("private class Transformer")
+    )
+    end = next(
+        i
+        for i, line in enumerate(lines)
+        if line.strip() == "}  // private class Transformer"
+    )
+
+    # NOTE: We skip the declaration of the class and its opening brace.
+    assert lines[start + 2].strip() == "{", lines[start + 2]
+    body = lines[start + 3 : end]
+
+    enumerations = set(
+        re.findall(
+            r"public static IEnumerable<Reporting\.Error> "
+            r"Verify(\w+)\(\s*Aas\.\1 that\)",
+            verification_text,
+        )
+    )
+
+    converter = _Converter(enumerations=enumerations)
+    visits = "\n".join(converter.convert(body))
+
+    primitives = _extract_primitive_verifications(verification_text)
+
+    # NOTE: The patterns are matched with the compiled regular expressions
+    # through Verification.Patterns, which also consults the pattern cache.
+    visits = re.sub(
+        r"\bVerification\.Verify("
+        + "|".join(re.escape(name) for name in primitives)
+        + r")\(",
+        r"Primitives.Verify\1(",
+        visits,
+    )
+    visits = visits.replace("Verification.Matches", "Patterns.Matches")
+
+    return (
+        _HEADER
+        + visits
+        + "\n\n"
+        + _PRIMITIVES_HEADER
+        + "\n".join(primitives.values())
+        + _PRIMITIVES_FOOTER
+        + _FOOTER
+    )
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--project_dir",
+        help="Directory of the C# project which contains verification.cs",
+        type=pathlib.Path,
+    )
+    args = parser.parse_args()
+
+    this_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+    project_dir = (
+        args.project_dir
+        if args.project_dir is not None
+        else this_dir.parent.parent / "src/AasCore.Aas3_0"
+    )  # type: pathlib.Path
+
+    verification_text = (project_dir / "verification.cs").read_text(encoding="utf-8")
+
+    (project_dir / "verification_local_verifier.cs").write_text(
+        generate(verification_text), encoding="utf-8"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
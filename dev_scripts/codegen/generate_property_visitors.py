@@ -0,0 +1,762 @@
+"""
+Generate the visitors and transformers which go over all the properties of the classes.
+
+The deep equality, the deep hashing, the digesting, the direct JSON writing and
+the descent with paths need to consider the properties of every concrete class,
+not only the children given by ``DescendOnce``. The pruned descent needs to know
+which classes can be reached through the properties. We derive the properties
+from the generated ``types.cs`` so that the generated code follows the meta-model
+whenever it changes. Re-run this script whenever ``types.cs`` has been
+re-generated.
+"""
+
+import argparse
+import os
+import pathlib
+import re
+import sys
+from typing import Dict, List, Optional, Set
+
+
+class Property:
+    """Represent a property of a concrete class."""
+
+    def __init__(
+        self,
+        name: str,
+        type_name: str,
+        kind: str,
+        optional: bool,
+        interface: Optional[str],
+    ) -> None:
+        """
+        Initialize with the given values.
+
+        The ``type_name`` is the C# type without the marker of nullability.
+        The ``kind`` is one of ``string``, ``bool``, ``bytes``, ``enum``,
+        ``instance`` or ``list``. The ``interface`` is given for the instances
+        and the lists, and denotes the type of the instance or of the items.
+        """
+        self.name = name
+        self.type_name = type_name
+        self.kind = kind
+        self.optional = optional
+        self.interface = interface
+
+
+class Class:
+    """Represent a concrete class of the meta-model."""
+
+    def __init__(self, name: str, interface: str, properties: List[Property]) -> None:
+        """Initialize with the given values."""
+        self.name = name
+        self.interface = interface
+        self.properties = properties
+
+        #: Interfaces of the concrete classes which extend :py:attr:`interface`
+        self.sub_interfaces = []  # type: List[str]
+
+        #: Interfaces which :py:attr:`interface` transitively extends, including
+        #: :py:attr:`interface` itself
+        self.super_interfaces = set()  # type: Set[str]
+
+
+def _kind_of(type_name: str, enumerations: Set[str]) -> str:
+    """Determine the kind of the property based on its C# ``type_name``."""
+    if type_name == "string":
+        return "string"
+    if type_name == "bool":
+        return "bool"
+    if type_name == "byte[]":
+        return "bytes"
+    if type_name in enumerations:
+        return "enum"
+    if re.fullmatch(r"List<I\w+>", type_name):
+        return "list"
+    if re.fullmatch(r"I\w+", type_name):
+        return "instance"
+
+    raise AssertionError(f"Unexpected type of a property: {type_name}")
+
+
+def parse_classes(types_text: str) -> List[Class]:
+    """Parse the concrete classes in the order of ``types_text``."""
+    lines = types_text.splitlines()
+
+    enumerations = set(re.findall(r"^    public enum (\w+)$", types_text, re.MULTILINE))
+
+    interface_bases = dict()  # type: Dict[str, List[str]]
+    for interface_mtch in re.finditer(
+        r"^    public interface (\w+)(.*?)^    \{$",
+        types_text,
+        flags=re.MULTILINE | re.DOTALL,
+    ):
+        interface_bases[interface_mtch.group(1)] = re.findall(
+            r"\bI\w+", interface_mtch.group(2)
+        )
+
+    classes = []  # type: List[Class]
+    i = 0
+    while i < len(lines):
+        mtch = re.fullmatch(r"    public class (\w+) : (I\w+)", lines[i])
+        if mtch is None:
+            i += 1
+            continue
+
+        properties = []  # type: List[Property]
+        i += 1
+        while lines[i] != "    }":
+            prop_mtch = re.fullmatch(
+                r"        public (\S+?)(\??) (\w+) \{ get; set; \}", lines[i]
+            )
+            if prop_mtch is not None:
+                type_mtch = re.search(r"\bI\w+", prop_mtch.group(1))
+                properties.append(
+                    Property(
+                        name=prop_mtch.group(3),
+                        type_name=prop_mtch.group(1),
+                        kind=_kind_of(prop_mtch.group(1), enumerations),
+                        optional=prop_mtch.group(2) == "?",
+                        interface=(
+                            type_mtch.group(0) if type_mtch is not None else None
+                        ),
+                    )
+                )
+            i += 1
+
+        classes.append(
+            Class(name=mtch.group(1), interface=mtch.group(2), properties=properties)
+        )
+
+    assert len(classes) > 0, "Expected at least one concrete class"
+
+    def extends(interface: str, base: str) -> bool:
+        """Check whether ``interface`` transitively extends ``base``."""
+        return any(
+            other == base or extends(other, base)
+            for other in interface_bases.get(interface, [])
+        )
+
+    for cls in classes:
+        cls.sub_interfaces = [
+            other.interface
+            for other in classes
+            if extends(other.interface, cls.interface)
+        ]
+        cls.super_interfaces = {cls.interface} | {
+            interface
+            for interface in interface_bases
+            if extends(cls.interface, interface)
+        }
+
+    return classes
+
+
+_EQUALITY_HEADER = """\
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Equality
+    {
+"""
+
+_EQUALITY_FOOTER = """\
+    }  // public static partial class Equality
+}  // namespace AasCore.Aas3_0
+"""
+
+
+def _equality_condition(prop: Property) -> str:
+    """Generate the C# expression comparing ``prop`` of ``that`` and ``casted``."""
+    that = f"that.{prop.name}"
+    casted = f"casted.{prop.name}"
+
+    if prop.kind in ("string", "bool", "enum"):
+        return f"{that} == {casted}"
+    if prop.kind == "bytes":
+        return f"BytesEqual({that}, {casted})"
+    if prop.kind == "list":
+        return f"ListsEqual({that}, {casted})"
+    if prop.kind == "instance":
+        if prop.optional:
+            return f"EqualOrBothNull({that}, {casted})"
+        return f"Transform({that}, {casted})"
+
+    raise AssertionError(f"Unexpected kind: {prop.kind}")
+
+
+def _generate_deep_equality(cls: Class) -> str:
+    """Generate the transform method of the deep equality checker for ``cls``."""
+    blocks = [f"""\
+            public override bool Transform{cls.name}(
+                Aas.{cls.interface} that,
+                Aas.IClass other
+            )
+            {{"""]
+
+    if len(cls.sub_interfaces) == 0:
+        blocks.append(f"""\
+                if (!(other is Aas.{cls.interface} casted))
+                {{
+                    return false;
+                }}""")
+    else:
+        exclusions = "".join(
+            f"\n                    || other is Aas.{sub_interface}"
+            for sub_interface in cls.sub_interfaces
+        )
+        blocks.append(f"""\
+                // NOTE: The instances of the more specific classes also implement
+                // the interface, but are never equal to the instances of this class.
+                if (!(other is Aas.{cls.interface} casted){exclusions})
+                {{
+                    return false;
+                }}""")
+
+    if len(cls.properties) == 0:
+        blocks.append("""\
+
+                return true;
+            }""")
+    else:
+        conditions = [_equality_condition(prop) for prop in cls.properties]
+        joined = "\n                    && ".join(conditions)
+        blocks.append(f"""\
+
+                return (
+                    {joined});
+            }}""")
+
+    return "\n".join(blocks)
+
+
+def _hash_expression(prop: Property) -> str:
+    """Generate the C# expression hashing ``prop`` of ``that``."""
+    that = f"that.{prop.name}"
+
+    if prop.kind in ("string", "bytes"):
+        return f"HashOf({that})"
+    if prop.kind == "bool":
+        return f"HashOf({that})" if prop.optional else f"HashOf((bool?){that})"
+    if prop.kind == "enum":
+        return f"HashOf((int?){that})"
+    if prop.kind == "list":
+        return f"HashOfList({that})"
+    if prop.kind == "instance":
+        return f"HashOf({that})" if prop.optional else f"Transform({that})"
+
+    raise AssertionError(f"Unexpected kind: {prop.kind}")
+
+
+def _generate_deep_hash(cls: Class) -> str:
+    """Generate the transform method of the deep hasher for ``cls``."""
+    lines = [f"""\
+            public override int Transform{cls.name}(
+                Aas.{cls.interface} that
+            )
+            {{
+                int hash = HashOf("{cls.name}");"""]
+    for prop in cls.properties:
+        lines.append(f"                hash = Combine(hash, {_hash_expression(prop)});")
+    lines.append("""\
+                return hash;
+            }""")
+
+    return "\n".join(lines)
+
+
+def generate_equality(classes: List[Class]) -> str:
+    """Generate the deep equality checker and the deep hasher for ``classes``."""
+    parts = [_EQUALITY_HEADER]
+
+    parts.append("        internal partial class DeepEqualityChecker\n        {\n")
+    parts.append("\n\n".join(_generate_deep_equality(cls) for cls in classes))
+    parts.append("\n        }  // internal partial class DeepEqualityChecker\n\n")
+
+    parts.append("        internal partial class DeepHasher\n        {\n")
+    parts.append("\n\n".join(_generate_deep_hash(cls) for cls in classes))
+    parts.append("\n        }  // internal partial class DeepHasher\n")
+
+    parts.append(_EQUALITY_FOOTER)
+
+    return "".join(parts)
+
+
+_DIGESTING_HEADER = """\
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Digesting
+    {
+        internal partial class EncodingVisitor
+        {
+"""
+
+_DIGESTING_FOOTER = """\
+        }  // internal partial class EncodingVisitor
+    }  // public static partial class Digesting
+}  // namespace AasCore.Aas3_0
+"""
+
+
+def _encoding_statement(prop: Property) -> str:
+    """Generate the C# statement encoding ``prop`` of ``that``."""
+    that = f"that.{prop.name}"
+
+    if prop.kind == "string":
+        return f'encoder.String("{prop.name}", {that});'
+    if prop.kind == "bool":
+        return f'encoder.Bool("{prop.name}", {that});'
+    if prop.kind == "bytes":
+        return f'encoder.Bytes("{prop.name}", {that});'
+    if prop.kind == "enum":
+        return f"""\
+encoder.Enum(
+                    "{prop.name}",
+                    Stringification.ToString({that}),
+                    (int?){that});"""
+    if prop.kind == "list":
+        return f'encoder.List("{prop.name}", {that});'
+    if prop.kind == "instance":
+        return f'encoder.Child("{prop.name}", {that});'
+
+    raise AssertionError(f"Unexpected kind: {prop.kind}")
+
+
+def _generate_encoding_visit(cls: Class) -> str:
+    """Generate the visit method of the encoding visitor for ``cls``."""
+    lines = [f"""\
+            public override void Visit{cls.name}(
+                Aas.{cls.interface} that,
+                Encoder encoder
+            )
+            {{
+                encoder.Class("{cls.name}");"""]
+    for prop in cls.properties:
+        lines.append(f"                {_encoding_statement(prop)}")
+    lines.append("            }")
+
+    return "\n".join(lines)
+
+
+def generate_digesting(classes: List[Class]) -> str:
+    """Generate the encoding visitor of the digests for ``classes``."""
+    return "".join(
+        [
+            _DIGESTING_HEADER,
+            "\n\n".join(_generate_encoding_visit(cls) for cls in classes),
+            "\n",
+            _DIGESTING_FOOTER,
+        ]
+    )
+
+
+_REACHABILITY_HEADER = """\
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Descending
+    {
+        /// <summary>
+        /// Map each concrete class of the meta-model to the concrete classes which
+        /// its instances can transitively contain.
+        /// </summary>
+        /// <remarks>
+        /// The table is derived from the types of the properties in the meta-model.
+        /// </remarks>
+        private static readonly Dictionary<System.Type, System.Type[]> DescendantTypes = (
+            new Dictionary<System.Type, System.Type[]>()
+            {
+"""
+
+_REACHABILITY_FOOTER = """\
+            });
+    }  // public static partial class Descending
+}  // namespace AasCore.Aas3_0
+"""
+
+
+def _descendant_classes(cls: Class, classes: List[Class]) -> List[Class]:
+    """
+    Determine the concrete classes which the instances of ``cls`` can contain.
+
+    The classes are given in the order of ``classes``.
+    """
+
+    def children_of(container: Class) -> Set[str]:
+        """Determine the names of the classes which ``container`` directly holds."""
+        return {
+            other.name
+            for prop in container.properties
+            if prop.interface is not None
+            for other in classes
+            if prop.interface in other.super_interfaces
+        }
+
+    by_name = {other.name: other for other in classes}
+
+    reached = set()  # type: Set[str]
+    stack = list(children_of(cls))
+    while len(stack) > 0:
+        name = stack.pop()
+        if name in reached:
+            continue
+        reached.add(name)
+        stack.extend(children_of(by_name[name]))
+
+    return [other for other in classes if other.name in reached]
+
+
+def _generate_reachability_entry(cls: Class, classes: List[Class]) -> str:
+    """Generate the entry of the table of the descendant types for ``cls``."""
+    descendants = _descendant_classes(cls, classes)
+
+    if len(descendants) == 0:
+        return f"""\
+                {{
+                    typeof(Aas.{cls.name}),
+                    new System.Type[0]
+                }}"""
+
+    items = ",\n".join(
+        f"                        typeof(Aas.{descendant.name})"
+        for descendant in descendants
+    )
+    return f"""\
+                {{
+                    typeof(Aas.{cls.name}),
+                    new[]
+                    {{
+{items}
+                    }}
+                }}"""
+
+
+def generate_reachability(classes: List[Class]) -> str:
+    """Generate the table of the descendant types for ``classes``."""
+    return "".join(
+        [
+            _REACHABILITY_HEADER,
+            ",\n".join(_generate_reachability_entry(cls, classes) for cls in classes),
+            "\n",
+            _REACHABILITY_FOOTER,
+        ]
+    )
+
+
+_JSON_WRITING_HEADER = """\
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs and
+ * jsonization.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Jsonization
+    {
+        internal partial class WritingVisitor<TWriter>
+        {
+"""
+
+_JSON_WRITING_FOOTER = """\
+        }  // internal partial class WritingVisitor<TWriter>
+    }  // public static partial class Jsonization
+}  // namespace AasCore.Aas3_0
+"""
+
+
+def _json_name(prop: Property) -> str:
+    """Determine the name of ``prop`` in the JSON serialization."""
+    return prop.name[0].lower() + prop.name[1:]
+
+
+def _indent(text: str, indent: str) -> str:
+    """Indent all the non-empty lines of ``text`` with ``indent``."""
+    return "\n".join(indent + line if line != "" else line for line in text.split("\n"))
+
+
+def _json_writing_statement(prop: Property) -> str:
+    """Generate the C# statement writing ``prop`` of ``that``, without indention."""
+    json_name = _json_name(prop)
+    that = f"that.{prop.name}"
+
+    if prop.kind == "string":
+        return f"""\
+writer.WriteString(
+    "{json_name}",
+    {that});"""
+    if prop.kind == "bool":
+        value = f"{that}.Value" if prop.optional else that
+        return f"""\
+writer.WriteBoolean(
+    "{json_name}",
+    {value});"""
+    if prop.kind == "bytes":
+        return f"""\
+writer.WriteString(
+    "{json_name}",
+    System.Convert.ToBase64String(
+        {that}));"""
+    if prop.kind == "enum":
+        if prop.optional:
+            return f"""\
+// We need to help the static analyzer with a null coalescing.
+Aas.{prop.type_name} value = {that}
+    ?? throw new System.InvalidOperationException();
+writer.WriteString(
+    "{json_name}",
+    Stringification.ToString(value)
+        ?? throw new System.ArgumentException(
+            $"Invalid {prop.type_name}: {{value}}"));"""
+        return f"""\
+writer.WriteString(
+    "{json_name}",
+    Stringification.ToString({that})
+        ?? throw new System.ArgumentException(
+            $"Invalid {prop.type_name}: {{{that}}}"));"""
+    if prop.kind == "list":
+        return f"""\
+writer.WriteStartArray("{json_name}");
+foreach ({prop.interface} item in {that})
+{{
+    Visit(item, writer);
+}}
+writer.WriteEndArray();"""
+    if prop.kind == "instance":
+        return f"""\
+writer.WritePropertyName("{json_name}");
+Visit({that}, writer);"""
+
+    raise AssertionError(f"Unexpected kind: {prop.kind}")
+
+
+def _json_model_type(cls: Class, jsonization_text: str) -> Optional[str]:
+    """
+    Determine the model type which the JSON serialization writes for ``cls``.
+
+    We check that the generated ``Transformer`` in ``jsonization_text`` writes
+    the properties under the expected names and in the expected order.
+    """
+    start = jsonization_text.index(
+        f"            public override Nodes.JsonObject Transform{cls.name}(\n"
+    )
+    end = jsonization_text.index("                return result;\n", start)
+    body = jsonization_text[start:end]
+
+    names = re.findall(r'result\["(\w+)"\] =', body)
+    model_type_mtch = re.search(r'result\["modelType"\] = "(\w+)";', body)
+
+    expected_names = [_json_name(prop) for prop in cls.properties]
+    if model_type_mtch is not None:
+        expected_names.append("modelType")
+
+    assert names == expected_names, (
+        f"Expected the JSON properties {expected_names} "
+        f"for the class {cls.name}, but got {names}"
+    )
+
+    return model_type_mtch.group(1) if model_type_mtch is not None else None
+
+
+def _generate_json_writing_visit(cls: Class, jsonization_text: str) -> str:
+    """Generate the visit method of the writing visitor for ``cls``."""
+    blocks = ["writer.WriteStartObject();"]
+
+    for prop in cls.properties:
+        statement = _json_writing_statement(prop)
+        if prop.optional:
+            blocks.append(
+                f"if (that.{prop.name} != null)\n{{\n"
+                f"{_indent(statement, '    ')}\n}}"
+            )
+        else:
+            blocks.append(statement)
+
+    model_type = _json_model_type(cls, jsonization_text)
+    if model_type is not None:
+        blocks.append(f"""\
+writer.WriteString(
+    "modelType",
+    "{model_type}");""")
+
+    blocks.append("writer.WriteEndObject();")
+
+    body = _indent("\n\n".join(blocks), " " * 16)
+    return f"""\
+            public override void Visit{cls.name}(
+                Aas.{cls.interface} that,
+                TWriter writer
+            )
+            {{
+{body}
+            }}"""
+
+
+def generate_json_writing(classes: List[Class], jsonization_text: str) -> str:
+    """Generate the visitor writing the JSON directly for ``classes``."""
+    return "".join(
+        [
+            _JSON_WRITING_HEADER,
+            "\n\n".join(
+                _generate_json_writing_visit(cls, jsonization_text) for cls in classes
+            ),
+            "\n",
+            _JSON_WRITING_FOOTER,
+        ]
+    )
+
+
+_CHILDREN_HEADER = """\
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Descending
+    {
+        private partial class ChildrenVisitor
+        {
+"""
+
+_CHILDREN_FOOTER = """\
+        }  // private partial class ChildrenVisitor
+    }  // public static partial class Descending
+}  // namespace AasCore.Aas3_0
+"""
+
+
+def _generate_children_visit(cls: Class) -> str:
+    """Generate the visit method of the children visitor for ``cls``."""
+    lines = [f"""\
+            public override void Visit{cls.name}(
+                Aas.{cls.interface} that,
+                Tracker tracker
+            )
+            {{"""]
+
+    children = [prop for prop in cls.properties if prop.kind in ("instance", "list")]
+    if len(children) == 0:
+        lines.append("                // Intentionally empty.")
+
+    for prop in children:
+        method = "Child" if prop.kind == "instance" else "Items"
+        lines.append(
+            f"                tracker.{method}({prop.name}Segment, that.{prop.name});"
+        )
+
+    lines.append("            }")
+
+    return "\n".join(lines)
+
+
+def generate_children(classes: List[Class]) -> str:
+    """Generate the visitor pushing the children with their names for ``classes``."""
+    # NOTE: The name segments are declared in the order of their first use.
+    names = []  # type: List[str]
+    for cls in classes:
+        for prop in cls.properties:
+            if prop.kind in ("instance", "list") and prop.name not in names:
+                names.append(prop.name)
+
+    segments = [
+        f"""\
+            private static readonly Reporting.NameSegment {name}Segment = (
+                new Reporting.NameSegment("{name[0].lower() + name[1:]}"));"""
+        for name in names
+    ]
+
+    return "".join(
+        [
+            _CHILDREN_HEADER,
+            "\n\n".join(segments),
+            "\n\n",
+            "\n\n".join(_generate_children_visit(cls) for cls in classes),
+            "\n",
+            _CHILDREN_FOOTER,
+        ]
+    )
+
+
+def generate(project_dir: pathlib.Path) -> None:
+    """Generate the visitors in ``project_dir`` based on its ``types.cs``."""
+    classes = parse_classes((project_dir / "types.cs").read_text(encoding="utf-8"))
+
+    (project_dir / "equality_transformers.cs").write_text(
+        generate_equality(classes), encoding="utf-8"
+    )
+
+    (project_dir / "digesting_encoding_visitor.cs").write_text(
+        generate_digesting(classes), encoding="utf-8"
+    )
+
+    (project_dir / "descending_reachability.cs").write_text(
+        generate_reachability(classes), encoding="utf-8"
+    )
+
+    (project_dir / "descending_children_visitor.cs").write_text(
+        generate_children(classes), encoding="utf-8"
+    )
+
+    jsonization_text = (project_dir / "jsonization.cs").read_text(encoding="utf-8")
+    (project_dir / "jsonization_writing_visitor.cs").write_text(
+        generate_json_writing(classes, jsonization_text), encoding="utf-8"
+    )
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--project_dir",
+        help="Directory of the C# project which contains types.cs",
+        type=pathlib.Path,
+    )
+    args = parser.parse_args()
+
+    this_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+    project_dir = (
+        args.project_dir
+        if args.project_dir is not None
+        else this_dir.parent.parent / "src/AasCore.Aas3_0"
+    )  # type: pathlib.Path
+
+    generate(project_dir)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
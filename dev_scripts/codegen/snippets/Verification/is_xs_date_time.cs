@@ -1,6 +1,3 @@
-private static readonly Regex RegexDatePrefix = (
-    new Regex("^(-?[0-9]+)-([0-9]{2})-([0-9]{2})"));
-
 /// <summary>
 /// Check whether the given year is a leap year.
 /// </summary>
@@ -41,130 +38,403 @@ public static bool IsLeapYear(System.Numerics.BigInteger year)
 }
 
 /// <summary>
-/// Check that the value starts with a valid date.
+/// Check that the <paramref name="cursor" /> is at the end of
+/// the <paramref name="value" />.
 /// </summary>
-/// <param name="value">
-///     an <c>xs:date</c>, an <c>xs:dateTime</c>,
-///     or an <c>xs:dateTimeStamp</c></param>
-/// <returns>
-///     <c>true</c> if the value starts with a valid date
-/// </returns>
-private static bool IsPrefixedWithValidDate(string value)
+/// <remarks>
+/// A single trailing new line is also accepted since <c>$</c> matches before it
+/// in the patterns of <see cref="MatchesXsDateTime" /> and the like, and we need
+/// to accept exactly the same values.
+/// </remarks>
+private static bool IsAtEnd(string value, int cursor)
 {
-    // NOTE (mristin, 2023-03-16):
-    // We can not use System.DateTime.ParseExact since it does not handle the zero and
-    // BCE years correctly. Therefore, we have to roll out our own date validator.
-    var match = RegexDatePrefix.Match(value);
-    if (!match.Success)
+    return cursor == value.Length
+        || (cursor == value.Length - 1 && value[cursor] == '\n');
+}
+
+private static bool IsDigit(char character)
+{
+    return character >= '0' && character <= '9';
+}
+
+/// <summary>
+/// Scan two digits at the <paramref name="cursor" />.
+/// </summary>
+/// <returns>The scanned number, or -1 if there are no two digits</returns>
+private static int ScanTwoDigits(string value, ref int cursor)
+{
+    if (cursor + 1 >= value.Length
+        || !IsDigit(value[cursor])
+        || !IsDigit(value[cursor + 1]))
+    {
+        return -1;
+    }
+
+    int result = (value[cursor] - '0') * 10 + (value[cursor + 1] - '0');
+    cursor += 2;
+    return result;
+}
+
+private static bool ScanCharacter(string value, ref int cursor, char expected)
+{
+    if (cursor >= value.Length || value[cursor] != expected)
     {
         return false;
     }
 
-    bool ok = System.Numerics.BigInteger.TryParse(
-        match.Groups[1].Value,
-        out System.Numerics.BigInteger year);
-    if (!ok)
+    cursor++;
+    return true;
+}
+
+/// <summary>
+/// Scan a valid date such as <c>2023-03-16</c> at the <paramref name="cursor" />.
+/// </summary>
+/// <remarks>
+/// <para>
+/// We can not use System.DateTime.ParseExact since it does not handle the zero and
+/// BCE years correctly. Therefore, we have to roll out our own date validator.
+/// </para>
+/// <para>
+/// The year can have arbitrary many digits. We never convert it to a number as
+/// we only need the year modulo 400 to tell whether it is a leap year.
+/// </para>
+/// </remarks>
+private static bool ScanDate(string value, ref int cursor)
+{
+    bool negative = ScanCharacter(value, ref cursor, '-');
+
+    int yearStart = cursor;
+    int yearModulo400 = 0;
+    while (cursor < value.Length && IsDigit(value[cursor]))
+    {
+        yearModulo400 = (yearModulo400 * 10 + (value[cursor] - '0')) % 400;
+        cursor++;
+    }
+
+    int yearDigitCount = cursor - yearStart;
+    if (yearDigitCount < 4)
     {
-        throw new System.InvalidOperationException(
-            $"Expected to parse the year from {match.Groups[1].Value}, " +
-            "but the parsing failed");
+        return false;
     }
 
-    ok = System.SByte.TryParse(match.Groups[2].Value, out sbyte month);
-    if (!ok)
+    if (value[yearStart] == '0')
     {
-        throw new System.InvalidOperationException(
-            $"Expected to parse the month from {match.Groups[2].Value}, " +
-            "but the parsing failed");
+        // The years with a leading zero have exactly four digits.
+        if (yearDigitCount != 4)
+        {
+            return false;
+        }
+
+        // Year zero does not exist, see: https://www.w3.org/TR/xmlschema-2/#dateTime
+        if (yearModulo400 == 0
+            && value[yearStart + 1] == '0'
+            && value[yearStart + 2] == '0'
+            && value[yearStart + 3] == '0')
+        {
+            return false;
+        }
     }
 
-    ok = System.SByte.TryParse(match.Groups[3].Value, out sbyte day);
-    if (!ok)
+    if (!ScanCharacter(value, ref cursor, '-'))
     {
-        throw new System.InvalidOperationException(
-            $"Expected to parse the day from {match.Groups[3].Value}, " +
-            "but the parsing failed");
+        return false;
     }
 
-    // Year zero does not exist, see: https://www.w3.org/TR/xmlschema-2/#dateTime
-    if (year == 0)
+    int month = ScanTwoDigits(value, ref cursor);
+    if (month < 1 || month > 12)
     {
         return false;
     }
 
-    if (day <= 0 || day > 31)
+    if (!ScanCharacter(value, ref cursor, '-'))
     {
         return false;
     }
 
-    if (month <= 0 || month >= 13)
+    int day = ScanTwoDigits(value, ref cursor);
+    if (day < 1)
     {
         return false;
     }
 
-    sbyte maxDaysInMonth;
+    int maxDaysInMonth;
     switch (month)
     {
-        case 1:
-            maxDaysInMonth = 31;
-            break;
         case 2:
-            maxDaysInMonth = (IsLeapYear(year)) ? (sbyte)29 : (sbyte)28;
-            break;
-        case 3:
-            maxDaysInMonth = 31;
+            // We consider the years B.C. to be one-off, see IsLeapYear.
+            int astronomicalYearModulo400 = negative
+                ? (yearModulo400 + 399) % 400
+                : yearModulo400;
+
+            bool isLeapYear = astronomicalYearModulo400 % 4 == 0
+                && (astronomicalYearModulo400 % 100 != 0
+                    || astronomicalYearModulo400 == 0);
+
+            maxDaysInMonth = isLeapYear ? 29 : 28;
             break;
         case 4:
-            maxDaysInMonth = 30;
-            break;
-        case 5:
-            maxDaysInMonth = 31;
-            break;
         case 6:
-            maxDaysInMonth = 30;
-            break;
-        case 7:
-            maxDaysInMonth = 31;
-            break;
-        case 8:
-            maxDaysInMonth = 31;
-            break;
         case 9:
-            maxDaysInMonth = 30;
-            break;
-        case 10:
-            maxDaysInMonth = 31;
-            break;
         case 11:
             maxDaysInMonth = 30;
             break;
-        case 12:
+        default:
             maxDaysInMonth = 31;
             break;
-        default:
-            throw new System.InvalidOperationException($"Unexpected month: {month}");
     }
 
-    if (day > maxDaysInMonth)
+    return day <= maxDaysInMonth;
+}
+
+/// <summary>
+/// Scan a time such as <c>12:34:56.789</c>, or the end of the day
+/// <c>24:00:00</c>, at the <paramref name="cursor" />.
+/// </summary>
+private static bool ScanTime(string value, ref int cursor)
+{
+    int hour = ScanTwoDigits(value, ref cursor);
+    if (hour < 0 || hour > 24 || !ScanCharacter(value, ref cursor, ':'))
+    {
+        return false;
+    }
+
+    int minute = ScanTwoDigits(value, ref cursor);
+    if (minute < 0 || minute > 59 || !ScanCharacter(value, ref cursor, ':'))
+    {
+        return false;
+    }
+
+    int second = ScanTwoDigits(value, ref cursor);
+    if (second < 0 || second > 59)
     {
         return false;
     }
 
+    bool fractionIsZero = true;
+    if (ScanCharacter(value, ref cursor, '.'))
+    {
+        int fractionStart = cursor;
+        while (cursor < value.Length && IsDigit(value[cursor]))
+        {
+            fractionIsZero = fractionIsZero && value[cursor] == '0';
+            cursor++;
+        }
+
+        if (cursor == fractionStart)
+        {
+            return false;
+        }
+    }
+
+    if (hour == 24)
+    {
+        return minute == 0 && second == 0 && fractionIsZero;
+    }
+
     return true;
 }
 
 /// <summary>
-/// Check that <paramref name="value" /> is a <c>xs:dateTime</c> with
-/// the time zone set to UTC.
+/// Scan a time zone offset such as <c>Z</c> or <c>+14:00</c> at
+/// the <paramref name="cursor" />.
 /// </summary>
+private static bool ScanTimezone(string value, ref int cursor)
+{
+    if (ScanCharacter(value, ref cursor, 'Z'))
+    {
+        return true;
+    }
+
+    if (!ScanCharacter(value, ref cursor, '+')
+        && !ScanCharacter(value, ref cursor, '-'))
+    {
+        return false;
+    }
+
+    int hour = ScanTwoDigits(value, ref cursor);
+    if (hour < 0 || hour > 14 || !ScanCharacter(value, ref cursor, ':'))
+    {
+        return false;
+    }
+
+    int minute = ScanTwoDigits(value, ref cursor);
+    if (minute < 0 || minute > 59)
+    {
+        return false;
+    }
+
+    return hour < 14 || minute == 0;
+}
+
+/// <summary>
+/// Scan a time zone offset equal to UTC, <em>i.e.</em>, <c>Z</c>, <c>+00:00</c> or
+/// <c>-00:00</c>, at the <paramref name="cursor" />.
+/// </summary>
+private static bool ScanUtcTimezone(string value, ref int cursor)
+{
+    if (ScanCharacter(value, ref cursor, 'Z'))
+    {
+        return true;
+    }
+
+    if (!ScanCharacter(value, ref cursor, '+')
+        && !ScanCharacter(value, ref cursor, '-'))
+    {
+        return false;
+    }
+
+    return ScanTwoDigits(value, ref cursor) == 0
+        && ScanCharacter(value, ref cursor, ':')
+        && ScanTwoDigits(value, ref cursor) == 0;
+}
+
+/// <summary>
+/// Check that <paramref name="value" /> is a valid <c>xs:date</c>.
+/// </summary>
+/// <remarks>
+/// This is equivalent to <see cref="MatchesXsDate" /> followed by the check
+/// of the day in the month, but scans the value in a single pass.
+/// </remarks>
+private static bool IsXsDate(
+    string value
+)
+{
+    int cursor = 0;
+    if (!ScanDate(value, ref cursor))
+    {
+        return false;
+    }
+
+    if (IsAtEnd(value, cursor))
+    {
+        return true;
+    }
+
+    return ScanTimezone(value, ref cursor) && IsAtEnd(value, cursor);
+}
+
+/// <summary>
+/// Check that <paramref name="value" /> is a valid <c>xs:dateTime</c>.
+/// </summary>
+/// <remarks>
+/// This is equivalent to <see cref="MatchesXsDateTime" /> followed by the check
+/// of the day in the month, but scans the value in a single pass.
+/// </remarks>
 public static bool IsXsDateTime(
     string value
 )
 {
-    if (!MatchesXsDateTime(value))
+    int cursor = 0;
+    if (!ScanDate(value, ref cursor)
+        || !ScanCharacter(value, ref cursor, 'T')
+        || !ScanTime(value, ref cursor))
+    {
+        return false;
+    }
+
+    if (IsAtEnd(value, cursor))
+    {
+        return true;
+    }
+
+    return ScanTimezone(value, ref cursor) && IsAtEnd(value, cursor);
+}
+
+/// <summary>
+/// Scan the components of a duration at the <paramref name="cursor" />,
+/// such as <c>1Y2M</c> or <c>3H4.5S</c>.
+/// </summary>
+/// <param name="value">to be scanned</param>
+/// <param name="cursor">where the components start</param>
+/// <param name="designators">allowed designators in the order of appearance</param>
+/// <param name="count">number of the scanned components</param>
+/// <returns>
+/// True if the components are valid; the last designator allows a fraction
+/// only if it is <c>S</c>.
+/// </returns>
+private static bool ScanDurationComponents(
+    string value,
+    ref int cursor,
+    string designators,
+    out int count)
+{
+    count = 0;
+    int nextDesignator = 0;
+    while (cursor < value.Length && IsDigit(value[cursor]))
+    {
+        while (cursor < value.Length && IsDigit(value[cursor]))
+        {
+            cursor++;
+        }
+
+        bool hasFraction = false;
+        if (ScanCharacter(value, ref cursor, '.'))
+        {
+            int fractionStart = cursor;
+            while (cursor < value.Length && IsDigit(value[cursor]))
+            {
+                cursor++;
+            }
+
+            if (cursor == fractionStart)
+            {
+                return false;
+            }
+
+            hasFraction = true;
+        }
+
+        if (cursor >= value.Length)
+        {
+            return false;
+        }
+
+        int designator = designators.IndexOf(value[cursor], nextDesignator);
+        if (designator < 0 || (hasFraction && value[cursor] != 'S'))
+        {
+            return false;
+        }
+
+        nextDesignator = designator + 1;
+        cursor++;
+        count++;
+    }
+
+    return true;
+}
+
+/// <summary>
+/// Check that <paramref name="value" /> is a valid <c>xs:duration</c>.
+/// </summary>
+/// <remarks>
+/// This is equivalent to <see cref="MatchesXsDuration" />, but scans the value
+/// in a single pass.
+/// </remarks>
+private static bool IsXsDuration(
+    string value
+)
+{
+    int cursor = 0;
+    ScanCharacter(value, ref cursor, '-');
+    if (!ScanCharacter(value, ref cursor, 'P'))
+    {
+        return false;
+    }
+
+    if (!ScanDurationComponents(value, ref cursor, "YMD", out int dateCount))
     {
         return false;
     }
 
-    return IsPrefixedWithValidDate(value);
+    int timeCount = 0;
+    if (ScanCharacter(value, ref cursor, 'T'))
+    {
+        if (!ScanDurationComponents(value, ref cursor, "HMS", out timeCount)
+            || timeCount == 0)
+        {
+            return false;
+        }
+    }
+
+    return dateCount + timeCount > 0 && IsAtEnd(value, cursor);
 }
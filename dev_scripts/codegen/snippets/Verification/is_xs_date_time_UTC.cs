@@ -2,14 +2,18 @@
 /// Check that <paramref name="value" /> is a <c>xs:dateTime</c> with
 /// the time zone set to UTC.
 /// </summary>
+/// <remarks>
+/// This is equivalent to <see cref="MatchesXsDateTimeUtc" /> followed by the check
+/// of the day in the month, but scans the value in a single pass.
+/// </remarks>
 public static bool IsXsDateTimeUtc(
     string value
 )
 {
-    if (!MatchesXsDateTimeUtc(value))
-    {
-        return false;
-    }
-
-    return IsPrefixedWithValidDate(value);
+    int cursor = 0;
+    return ScanDate(value, ref cursor)
+        && ScanCharacter(value, ref cursor, 'T')
+        && ScanTime(value, ref cursor)
+        && ScanUtcTimezone(value, ref cursor)
+        && IsAtEnd(value, cursor);
 }
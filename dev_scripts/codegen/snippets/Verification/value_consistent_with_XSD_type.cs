@@ -1,3 +1,21 @@
+// NOTE: We parse the numbers with the same styles as System.Xml.XmlConvert,
+// but without throwing the exceptions on invalid values.
+private const System.Globalization.NumberStyles XmlIntegerStyles = (
+    System.Globalization.NumberStyles.AllowLeadingSign
+    | System.Globalization.NumberStyles.AllowLeadingWhite
+    | System.Globalization.NumberStyles.AllowTrailingWhite);
+
+private const System.Globalization.NumberStyles XmlUnsignedIntegerStyles = (
+    System.Globalization.NumberStyles.AllowLeadingWhite
+    | System.Globalization.NumberStyles.AllowTrailingWhite);
+
+private const System.Globalization.NumberStyles XmlFloatingPointStyles = (
+    System.Globalization.NumberStyles.AllowLeadingSign
+    | System.Globalization.NumberStyles.AllowDecimalPoint
+    | System.Globalization.NumberStyles.AllowExponent
+    | System.Globalization.NumberStyles.AllowLeadingWhite
+    | System.Globalization.NumberStyles.AllowTrailingWhite);
+
 /// <summary>
 /// Check that the <paramref name="value" /> is consistent with
 /// the given <paramref name="valueType" />.
@@ -23,41 +41,19 @@ public static bool ValueConsistentWithXsdType(
         }
         case Aas.DataTypeDefXsd.Byte:
         {
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToSByte(value);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return sbyte.TryParse(
+                value,
+                XmlIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.Date:
         {
-            if (!MatchesXsDate(value))
-            {
-                return false;
-            }
-
-            return IsPrefixedWithValidDate(value);
+            return IsXsDate(value);
         }
         case Aas.DataTypeDefXsd.DateTime:
         {
-            if (!MatchesXsDateTime(value))
-            {
-                return false;
-            }
-
-            // The time part and the time zone part will be checked by
-            // MatchesXsDateTime. We need to check that the date part is
-            // correct in sense of the day/month combination.
-            return IsPrefixedWithValidDate(value);
+            return IsXsDateTime(value);
         }
         case Aas.DataTypeDefXsd.Decimal:
         {
@@ -74,45 +70,34 @@ public static bool ValueConsistentWithXsdType(
                 return false;
             }
 
-            double converted;
-            try
+            // System.Xml.XmlConvert.ToDouble maps "INF" and "-INF" to the infinities
+            // before parsing, so we do the same.
+            if (value == "INF" || value == "-INF")
             {
-                converted = System.Xml.XmlConvert.ToDouble(value);
+                return true;
             }
-            catch (System.FormatException)
+
+            if (!double.TryParse(
+                    value,
+                    XmlFloatingPointStyles,
+                    System.Globalization.NumberFormatInfo.InvariantInfo,
+                    out double converted))
             {
                 return false;
             }
 
-            if (System.Double.IsInfinity(converted))
-            {
-                // Check that the value is either "INF" or "-INF".
-                // Otherwise, the value is a decimal which is too big
-                // to be represented as a double-precision floating point
-                // number.
-                //
-                // Earlier C# used to throw an exception in this case. Today it
-                // simply rounds the parsed value to infinity. In the context
-                // of data exchange formats (such as AAS), this can cause
-                // critical errors, so we check for this edge case explicitly.
-                if (value.Length == 3)
-                {
-                    return value == "INF";
-                }
-                else if (value.Length == 4)
-                {
-                    return value == "-INF";
-                }
-                else
-                {
-                    return false;
-                }
-            }
-            return true;
+            // Otherwise, the value must not be a decimal which is too big
+            // to be represented as a double-precision floating point number.
+            //
+            // Earlier C# used to throw an exception in this case. Today it
+            // simply rounds the parsed value to infinity. In the context
+            // of data exchange formats (such as AAS), this can cause
+            // critical errors, so we check for this edge case explicitly.
+            return !System.Double.IsInfinity(converted);
         }
         case Aas.DataTypeDefXsd.Duration:
         {
-            return MatchesXsDuration(value);
+            return IsXsDuration(value);
         }
         case Aas.DataTypeDefXsd.Float:
         {
@@ -125,41 +110,30 @@ public static bool ValueConsistentWithXsdType(
                 return false;
             }
 
-            float converted;
-            try
+            // System.Xml.XmlConvert.ToSingle maps "INF" and "-INF" to the infinities
+            // before parsing, so we do the same.
+            if (value == "INF" || value == "-INF")
             {
-                converted = System.Xml.XmlConvert.ToSingle(value);
+                return true;
             }
-            catch (System.FormatException)
+
+            if (!float.TryParse(
+                    value,
+                    XmlFloatingPointStyles,
+                    System.Globalization.NumberFormatInfo.InvariantInfo,
+                    out float converted))
             {
                 return false;
             }
 
-            if (System.Single.IsInfinity(converted))
-            {
-                // Check that the value is either "INF" or "-INF".
-                // Otherwise, the value is a decimal which is too big
-                // to be represented as a single-precision floating point
-                // number.
-                //
-                // Earlier C# used to throw an exception in this case. Today it
-                // simply rounds the parsed value to infinity. In the context
-                // of data exchange formats (such as AAS), this can cause
-                // critical errors, so we check for this edge case explicitly.
-                if (value.Length == 3)
-                {
-                    return value == "INF";
-                }
-                else if (value.Length == 4)
-                {
-                    return value == "-INF";
-                }
-                else
-                {
-                    return false;
-                }
-            }
-            return true;
+            // Otherwise, the value must not be a decimal which is too big
+            // to be represented as a single-precision floating point number.
+            //
+            // Earlier C# used to throw an exception in this case. Today it
+            // simply rounds the parsed value to infinity. In the context
+            // of data exchange formats (such as AAS), this can cause
+            // critical errors, so we check for this edge case explicitly.
+            return !System.Single.IsInfinity(converted);
         }
         case Aas.DataTypeDefXsd.GDay:
         {
@@ -207,20 +181,11 @@ public static bool ValueConsistentWithXsdType(
         }
         case Aas.DataTypeDefXsd.Int:
         {
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToInt32(value);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return int.TryParse(
+                value,
+                XmlIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.Integer:
         {
@@ -228,20 +193,11 @@ public static bool ValueConsistentWithXsdType(
         }
         case Aas.DataTypeDefXsd.Long:
         {
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToInt64(value);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return long.TryParse(
+                value,
+                XmlIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.NegativeInteger:
         {
@@ -261,20 +217,11 @@ public static bool ValueConsistentWithXsdType(
         }
         case Aas.DataTypeDefXsd.Short:
         {
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToInt16(value);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return short.TryParse(
+                value,
+                XmlIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.String:
         {
@@ -306,24 +253,15 @@ public static bool ValueConsistentWithXsdType(
             //
             // The positive sign is indeed allowed in the lexical representation, see:
             // https://www.w3.org/TR/xmlschema11-2/#unsignedByte
-            string clipped = (value[0] == '+')
-                ? value.Substring(1, value.Length - 1)
-                : value;
+            System.ReadOnlySpan<char> clipped = (value[0] == '+')
+                ? System.MemoryExtensions.AsSpan(value, 1)
+                : System.MemoryExtensions.AsSpan(value);
 
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToByte(clipped);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return byte.TryParse(
+                clipped,
+                XmlUnsignedIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.UnsignedInt:
         {
@@ -347,24 +285,15 @@ public static bool ValueConsistentWithXsdType(
             //
             // The positive sign is indeed allowed in the lexical representation, see:
             // https://www.w3.org/TR/xmlschema11-2/#unsignedInt
-            string clipped = (value[0] == '+')
-                ? value.Substring(1, value.Length - 1)
-                : value;
+            System.ReadOnlySpan<char> clipped = (value[0] == '+')
+                ? System.MemoryExtensions.AsSpan(value, 1)
+                : System.MemoryExtensions.AsSpan(value);
 
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToUInt32(clipped);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return uint.TryParse(
+                clipped,
+                XmlUnsignedIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.UnsignedLong:
         {
@@ -388,24 +317,15 @@ public static bool ValueConsistentWithXsdType(
             //
             // The positive sign is indeed allowed in the lexical representation, see:
             // https://www.w3.org/TR/xmlschema11-2/#unsignedLong
-            string clipped = (value[0] == '+')
-                ? value.Substring(1, value.Length - 1)
-                : value;
+            System.ReadOnlySpan<char> clipped = (value[0] == '+')
+                ? System.MemoryExtensions.AsSpan(value, 1)
+                : System.MemoryExtensions.AsSpan(value);
 
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToUInt64(clipped);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return ulong.TryParse(
+                clipped,
+                XmlUnsignedIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         case Aas.DataTypeDefXsd.UnsignedShort:
         {
@@ -429,24 +349,15 @@ public static bool ValueConsistentWithXsdType(
             //
             // The positive sign is indeed allowed in the lexical representation, see:
             // https://www.w3.org/TR/xmlschema11-2/#unsignedShort
-            string clipped = (value[0] == '+')
-                ? value.Substring(1, value.Length - 1)
-                : value;
+            System.ReadOnlySpan<char> clipped = (value[0] == '+')
+                ? System.MemoryExtensions.AsSpan(value, 1)
+                : System.MemoryExtensions.AsSpan(value);
 
-            try
-            {
-                // ReSharper disable once ReturnValueOfPureMethodIsNotUsed
-                System.Xml.XmlConvert.ToUInt16(clipped);
-                return true;
-            }
-            catch (System.OverflowException)
-            {
-                return false;
-            }
-            catch (System.FormatException)
-            {
-                return false;
-            }
+            return ushort.TryParse(
+                clipped,
+                XmlUnsignedIntegerStyles,
+                System.Globalization.NumberFormatInfo.InvariantInfo,
+                out _);
         }
         default:
             throw new System.ArgumentException(
@@ -105,6 +105,8 @@ def main() -> int:
         print("Re-formatting...")
         reformat_targets = [
             "codegen/codegen.py",
+            "codegen/generate_local_verifier.py",
+            "codegen/generate_property_visitors.py",
             "codegen/download_aas_core_meta_model.py",
             "continuous_integration_of_dev_scripts",
             "update_to_aas_core_meta_codegen.py",
@@ -132,6 +134,8 @@ def main() -> int:
         print("Mypy'ing...")
         mypy_targets = [
             "codegen/codegen.py",
+            "codegen/generate_local_verifier.py",
+            "codegen/generate_property_visitors.py",
             "codegen/download_aas_core_meta_model.py",
             "continuous_integration_of_dev_scripts",
             "update_to_aas_core_meta_codegen.py",
@@ -152,6 +156,8 @@ def main() -> int:
         print("Pylint'ing...")
         pylint_targets = [
             "codegen/codegen.py",
+            "codegen/generate_local_verifier.py",
+            "codegen/generate_property_visitors.py",
             "codegen/download_aas_core_meta_model.py",
             "continuous_integration_of_dev_scripts",
             "update_to_aas_core_meta_codegen.py",
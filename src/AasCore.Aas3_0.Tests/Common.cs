@@ -117,5 +117,126 @@ namespace AasCore.Aas3_0.Tests
                     $"The expected verification errors do not match the actual ones for the file {path}");
             }
         }
+
+        /// <summary>
+        /// Collect the JSON files recursively under the given directory relative to
+        /// <see cref="TestDataDir" />, sorted by their paths.
+        /// </summary>
+        public static List<string> CollectJsonPaths(params string[] parts)
+        {
+            var paths = System.IO.Directory.GetFiles(
+                System.IO.Path.Combine(
+                    new[] { TestDataDir }.Concat(parts).ToArray()),
+                "*.json",
+                System.IO.SearchOption.AllDirectories).ToList();
+            paths.Sort();
+            return paths;
+        }
+
+        /// <summary>
+        /// Render the <paramref name="errors" /> as strings for the comparisons.
+        /// </summary>
+        public static List<string> RenderErrors(IEnumerable<Aas.Reporting.Error> errors)
+        {
+            return errors
+                .Select(
+                    error =>
+                        $"{Aas.Reporting.GenerateJsonPath(error.PathSegments)}: " +
+                        error.Cause)
+                .ToList();
+        }
+
+        /// <summary>
+        /// Load all the environments from the JSON test data, including those
+        /// which are invalid with respect to the constraints.
+        /// </summary>
+        public static IEnumerable<(string, Aas.Environment)> LoadEnvironments()
+        {
+            var paths = CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Expected");
+            paths.AddRange(
+                CollectJsonPaths(
+                    "Json", "ContainedInEnvironment", "Unexpected", "Invalid"));
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                yield return (
+                    path,
+                    Aas.Jsonization.Deserialize.EnvironmentFrom(
+                        Aas.Tests.CommonJson.ReadFromFile(path)));
+            }
+        }
+
+        /// <summary>
+        /// Make a small environment with a nested submodel element list to be
+        /// re-used across the tests.
+        /// </summary>
+        public static Aas.Environment MakeEnvironment()
+        {
+            var temperatures = new Aas.SubmodelElementList(
+                Aas.AasSubmodelElements.SubmodelElementCollection)
+            {
+                IdShort = "Temperatures",
+                Value = new List<Aas.ISubmodelElement>()
+            };
+            for (int i = 0; i < 5; i++)
+            {
+                temperatures.Value.Add(
+                    new Aas.SubmodelElementCollection
+                    {
+                        Value = new List<Aas.ISubmodelElement>
+                        {
+                            new Aas.Property(Aas.DataTypeDefXsd.Double)
+                            {
+                                IdShort = "Value",
+                                Value = $"{20 + i}.5"
+                            }
+                        }
+                    });
+            }
+
+            var sensors = new Aas.SubmodelElementCollection
+            {
+                IdShort = "Sensors",
+                Value = new List<Aas.ISubmodelElement> { temperatures }
+            };
+
+            var entity = new Aas.Entity(Aas.EntityType.SelfManagedEntity)
+            {
+                IdShort = "Machine",
+                Statements = new List<Aas.ISubmodelElement>
+                {
+                    new Aas.Property(Aas.DataTypeDefXsd.String)
+                    {
+                        IdShort = "SerialNumber"
+                    }
+                }
+            };
+
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    sensors,
+                    entity
+                }
+            };
+
+            return new Aas.Environment
+            {
+                AssetAdministrationShells = new List<Aas.IAssetAdministrationShell>
+                {
+                    new Aas.AssetAdministrationShell(
+                        "urn:some-shell",
+                        new Aas.AssetInformation(Aas.AssetKind.Instance))
+                },
+                Submodels = new List<Aas.ISubmodel> { submodel },
+                ConceptDescriptions = new List<Aas.IConceptDescription>
+                {
+                    new Aas.ConceptDescription("urn:some-concept-description")
+                }
+            };
+        }
     }
 }
\ No newline at end of file
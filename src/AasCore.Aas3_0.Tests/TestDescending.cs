@@ -0,0 +1,322 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestDescending
+    {
+        /// <summary>
+        /// Nest the submodel element collections <paramref name="depth" /> levels deep,
+        /// each with a property next to the nested collection.
+        /// </summary>
+        internal static Aas.ISubmodel MakeDeepSubmodel(int depth)
+        {
+            Aas.ISubmodelElement innermost = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "innermost"
+            };
+
+            for (int i = 0; i < depth; i++)
+            {
+                innermost = new Aas.SubmodelElementCollection
+                {
+                    IdShort = $"level{i}",
+                    Value = new List<Aas.ISubmodelElement>
+                    {
+                        new Aas.Property(Aas.DataTypeDefXsd.Int)
+                        {
+                            IdShort = "sibling"
+                        },
+                        innermost
+                    }
+                };
+            }
+
+            return new Aas.Submodel("urn:some-deep-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement> { innermost }
+            };
+        }
+
+        [Test]
+        public void Test_pre_order_same_as_descend()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var expected = environment.Descend().ToList();
+                var got = Aas.Descending.PreOrder(environment).ToList();
+
+                Assert.AreEqual(expected.Count, got.Count, path);
+                for (int i = 0; i < expected.Count; i++)
+                {
+                    Assert.AreSame(expected[i], got[i], $"{path} at {i}");
+                }
+            }
+        }
+
+        [Test]
+        public void Test_pre_order_on_a_deep_submodel()
+        {
+            var submodel = MakeDeepSubmodel(100);
+
+            var expected = submodel.Descend().ToList();
+            var got = Aas.Descending.PreOrder(submodel).ToList();
+
+            Assert.AreEqual(201, got.Count);
+            Assert.IsTrue(expected.Zip(got).All(pair => ReferenceEquals(pair.First, pair.Second)));
+        }
+
+        [Test]
+        public void Test_pre_order_of_a_leaf()
+        {
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something");
+            Assert.IsEmpty(Aas.Descending.PreOrder(key).ToList());
+        }
+
+        private static void AssertOfTypeSameAsDescend<T>(Aas.IClass that, string message)
+            where T : class, Aas.IClass
+        {
+            var expected = that.Descend().OfType<T>().ToList();
+            var got = Aas.Descending.OfType<T>(that).ToList();
+
+            Assert.AreEqual(expected.Count, got.Count, message);
+            for (int i = 0; i < expected.Count; i++)
+            {
+                Assert.AreSame(expected[i], got[i], $"{message} at {i}");
+            }
+        }
+
+        [Test]
+        public void Test_of_type_same_as_descend()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                AssertOfTypeSameAsDescend<Aas.IBlob>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.IFile>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.IReference>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.IKey>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.ISubmodelElement>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.IRelationshipElement>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.ILangStringTextType>(environment, path);
+                AssertOfTypeSameAsDescend<Aas.IDataSpecificationIec61360>(
+                    environment, path);
+                AssertOfTypeSameAsDescend<Aas.IClass>(environment, path);
+            }
+        }
+
+        [Test]
+        public void Test_of_type_on_a_deep_submodel()
+        {
+            var submodel = MakeDeepSubmodel(100);
+
+            Assert.AreEqual(
+                101, Aas.Descending.OfType<Aas.IProperty>(submodel).Count());
+            Assert.AreEqual(
+                100,
+                Aas.Descending.OfType<Aas.ISubmodelElementCollection>(submodel).Count());
+            Assert.IsEmpty(Aas.Descending.OfType<Aas.IBlob>(submodel).ToList());
+        }
+
+        [Test]
+        public void Test_walk_skips_children_and_stops()
+        {
+            var submodel = MakeDeepSubmodel(3);
+
+            var visited = new List<string?>();
+            Aas.Descending.Walk(
+                submodel,
+                instance =>
+                {
+                    var referable = (Aas.IReferable)instance;
+                    visited.Add(referable.IdShort);
+                    return referable.IdShort == "level1"
+                        ? Aas.Descending.Control.SkipChildren
+                        : Aas.Descending.Control.Continue;
+                });
+            Assert.AreEqual(
+                new List<string?> { "level2", "sibling", "level1" },
+                visited);
+
+            visited.Clear();
+            Aas.Descending.Walk(
+                submodel,
+                instance =>
+                {
+                    var referable = (Aas.IReferable)instance;
+                    visited.Add(referable.IdShort);
+                    return referable.IdShort == "sibling"
+                        ? Aas.Descending.Control.Stop
+                        : Aas.Descending.Control.Continue;
+                });
+            Assert.AreEqual(new List<string?> { "level2", "sibling" }, visited);
+        }
+
+        private static System.Text.Json.Nodes.JsonNode? Follow(
+            System.Text.Json.Nodes.JsonNode? node,
+            IEnumerable<Aas.Reporting.Segment> path)
+        {
+            foreach (var segment in path)
+            {
+                switch (segment)
+                {
+                    case Aas.Reporting.NameSegment nameSegment:
+                        node = node?.AsObject()[nameSegment.Name];
+                        break;
+                    case Aas.Reporting.IndexSegment indexSegment:
+                        node = node?.AsArray()[indexSegment.Index];
+                        break;
+                    default:
+                        throw new System.InvalidOperationException(
+                            $"Unexpected segment: {segment}");
+                }
+            }
+
+            return node;
+        }
+
+        [Test]
+        public void Test_with_path_agrees_with_jsonization()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var jsonable = Aas.Jsonization.Serialize.ToJsonObject(environment);
+
+                var expected = Aas.Descending.PreOrder(environment).ToList();
+
+                int i = 0;
+                foreach (var (instance, instancePath) in Aas.Descending.WithPath(environment))
+                {
+                    Assert.AreSame(expected[i], instance, $"{path} at {i}");
+
+                    string jsonPath = Aas.Reporting.GenerateJsonPath(instancePath);
+                    var node = Follow(jsonable, instancePath);
+                    Assert.IsNotNull(node, $"{path} at {jsonPath}");
+                    Assert.AreEqual(
+                        Aas.Jsonization.Serialize.ToJsonObject(instance).ToJsonString(),
+                        node!.ToJsonString(),
+                        $"{path} at {jsonPath}");
+                    i++;
+                }
+
+                Assert.AreEqual(expected.Count, i, path);
+            }
+        }
+
+        [Test]
+        public void Test_with_path_reuses_the_path()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+
+            var jsonPaths = new List<string>();
+            var xPaths = new List<string>();
+            Aas.Descending.Path? previous = null;
+            foreach (var step in Aas.Descending.WithPath(environment))
+            {
+                if (previous != null)
+                {
+                    Assert.AreSame(previous, step.Path);
+                }
+                previous = step.Path;
+
+                Assert.IsTrue(step.Path.IsReadOnly);
+                Assert.Throws<System.NotSupportedException>(
+                    () => ((ICollection<Aas.Reporting.Segment>)step.Path).Clear());
+
+                if (step.Instance is Aas.ISubmodelElementList)
+                {
+                    jsonPaths.Add(Aas.Reporting.GenerateJsonPath(step.Path));
+                    xPaths.Add(Aas.Reporting.GenerateRelativeXPath(step.Path));
+                }
+            }
+
+            Assert.AreEqual(
+                new List<string> { "submodels[0].submodelElements[0].value[0]" },
+                jsonPaths);
+            Assert.AreEqual(
+                new List<string> { "submodels/*[0]/submodelElements/*[0]/value/*[0]" },
+                xPaths);
+        }
+
+        private static long Measure(System.Func<IEnumerable<Aas.IClass>> descend, int repetitions)
+        {
+            var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+            for (int i = 0; i < repetitions; i++)
+            {
+                int count = 0;
+                foreach (var _ in descend())
+                {
+                    count++;
+                }
+                Assert.Greater(count, 0);
+            }
+            return stopwatch.ElapsedTicks;
+        }
+
+        [Test]
+        [Explicit("Benchmark")]
+        public void Test_benchmark_pre_order_against_descend()
+        {
+            const int repetitions = 10;
+
+            foreach (int depth in new[] { 10, 100, 1000 })
+            {
+                var submodel = MakeDeepSubmodel(depth);
+
+                // Warm up the just-in-time compilation.
+                Measure(() => submodel.Descend(), 1);
+                Measure(() => Aas.Descending.PreOrder(submodel), 1);
+
+                long descendTicks = Measure(() => submodel.Descend(), repetitions);
+                long preOrderTicks = Measure(
+                    () => Aas.Descending.PreOrder(submodel), repetitions);
+
+                System.Console.WriteLine(
+                    $"Descended {repetitions} times over collections nested {depth} deep: " +
+                    $"Descend {descendTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms, " +
+                    $"PreOrder {preOrderTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms");
+            }
+        }
+
+        [Test]
+        [Explicit("Benchmark")]
+        public void Test_benchmark_of_type_against_descend()
+        {
+            const int repetitions = 100;
+
+            var environments = Aas.Tests.Common.LoadEnvironments()
+                .Select(pair => pair.Item2)
+                .ToList();
+
+            long Run(System.Func<Aas.IClass, IEnumerable<Aas.IBlob>> find)
+            {
+                var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+                for (int i = 0; i < repetitions; i++)
+                {
+                    foreach (var environment in environments)
+                    {
+                        foreach (var _ in find(environment))
+                        {
+                            // Intentionally empty.
+                        }
+                    }
+                }
+                return stopwatch.ElapsedTicks;
+            }
+
+            // Warm up the just-in-time compilation.
+            Run(that => that.Descend().OfType<Aas.IBlob>());
+            Run(that => Aas.Descending.OfType<Aas.IBlob>(that));
+
+            long descendTicks = Run(that => that.Descend().OfType<Aas.IBlob>());
+            long ofTypeTicks = Run(that => Aas.Descending.OfType<Aas.IBlob>(that));
+
+            System.Console.WriteLine(
+                $"Looked for the blobs {repetitions} times in {environments.Count} environments: " +
+                $"Descend {descendTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms, " +
+                $"OfType {ofTypeTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms");
+        }
+    }
+}
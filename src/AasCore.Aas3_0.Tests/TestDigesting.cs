@@ -0,0 +1,235 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestDigesting
+    {
+        [Test]
+        public void Test_deep_copy_has_the_same_digest()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var digest = Aas.Digesting.Digest(environment);
+                Assert.AreEqual(Aas.Digesting.DigestLength, digest.Length, path);
+
+                Assert.AreEqual(
+                    digest,
+                    Aas.Digesting.Digest(Aas.Copying.Deep(environment)),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_change_in_a_leaf_changes_only_the_path_to_the_root()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var key = environment.Descend().OfType<Aas.IKey>().FirstOrDefault();
+                if (key == null)
+                {
+                    continue;
+                }
+
+                var cache = new Aas.Digesting.Cache(environment);
+
+                var before = new Dictionary<Aas.IClass, byte[]>(
+                    ReferenceEqualityComparer.Instance);
+                foreach (var instance in environment.Descend())
+                {
+                    before[instance] = cache.DigestOf(instance);
+                }
+                var rootBefore = cache.Digest();
+
+                var ancestors = new HashSet<Aas.IClass>(
+                    ReferenceEqualityComparer.Instance);
+                CollectAncestors(environment, key, new List<Aas.IClass>(), ancestors);
+
+                key.Value += "-changed";
+                cache.MarkDirty(key);
+
+                Assert.AreNotEqual(rootBefore, cache.Digest(), path);
+                Assert.AreEqual(
+                    Aas.Digesting.Digest(environment), cache.Digest(), path);
+
+                foreach (var instance in environment.Descend())
+                {
+                    if (ReferenceEquals(instance, key) || ancestors.Contains(instance))
+                    {
+                        Assert.AreNotEqual(
+                            before[instance], cache.DigestOf(instance), path);
+                    }
+                    else
+                    {
+                        Assert.AreEqual(
+                            before[instance], cache.DigestOf(instance), path);
+                    }
+                }
+            }
+        }
+
+        private static bool CollectAncestors(
+            Aas.IClass instance,
+            Aas.IClass target,
+            List<Aas.IClass> path,
+            HashSet<Aas.IClass> ancestors)
+        {
+            if (ReferenceEquals(instance, target))
+            {
+                foreach (var ancestor in path)
+                {
+                    ancestors.Add(ancestor);
+                }
+                return true;
+            }
+
+            path.Add(instance);
+            foreach (var child in instance.DescendOnce())
+            {
+                if (CollectAncestors(child, target, path, ancestors))
+                {
+                    return true;
+                }
+            }
+            path.RemoveAt(path.Count - 1);
+            return false;
+        }
+
+        [Test]
+        public void Test_added_and_removed_children()
+        {
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    new Aas.Property(Aas.DataTypeDefXsd.Int)
+                    {
+                        IdShort = "first"
+                    }
+                }
+            };
+
+            var cache = new Aas.Digesting.Cache(submodel);
+            var before = cache.Digest();
+
+            var removed = submodel.SubmodelElements[0];
+            var added = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "second"
+            };
+            submodel.SubmodelElements[0] = added;
+            cache.MarkDirty(submodel);
+
+            Assert.AreNotEqual(before, cache.Digest());
+            Assert.AreEqual(Aas.Digesting.Digest(submodel), cache.Digest());
+            Assert.AreEqual(
+                Aas.Digesting.Digest(added), cache.DigestOf(added));
+
+            Assert.Throws<System.ArgumentException>(() => cache.DigestOf(removed));
+            Assert.Throws<System.ArgumentException>(() => cache.MarkDirty(removed));
+
+            submodel.SubmodelElements[0] = removed;
+            cache.MarkDirty(submodel);
+            Assert.AreEqual(before, cache.Digest());
+        }
+
+        [Test]
+        public void Test_shared_child()
+        {
+            var shared = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "shared"
+            };
+
+            var first = new Aas.SubmodelElementCollection
+            {
+                IdShort = "first",
+                Value = new List<Aas.ISubmodelElement> { shared }
+            };
+
+            var second = new Aas.SubmodelElementCollection
+            {
+                IdShort = "second",
+                Value = new List<Aas.ISubmodelElement> { shared }
+            };
+
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement> { first, second }
+            };
+
+            var cache = new Aas.Digesting.Cache(submodel);
+            Assert.AreEqual(Aas.Digesting.Digest(submodel), cache.Digest());
+
+            // The change must propagate along both containers.
+            shared.Value = "1";
+            cache.MarkDirty(shared);
+            Assert.AreEqual(Aas.Digesting.Digest(submodel), cache.Digest());
+            Assert.AreEqual(Aas.Digesting.Digest(first), cache.DigestOf(first));
+            Assert.AreEqual(Aas.Digesting.Digest(second), cache.DigestOf(second));
+
+            // The shared child is still held by the other container.
+            first.Value.Remove(shared);
+            cache.MarkDirty(first);
+            Assert.AreEqual(Aas.Digesting.Digest(submodel), cache.Digest());
+
+            shared.Value = "2";
+            cache.MarkDirty(shared);
+            Assert.AreEqual(Aas.Digesting.Digest(second), cache.DigestOf(second));
+            Assert.AreEqual(Aas.Digesting.Digest(submodel), cache.Digest());
+        }
+
+        [Test]
+        public void Test_properties_are_distinguished()
+        {
+            Aas.IReference MakeReference()
+            {
+                return new Aas.Reference(
+                    Aas.ReferenceTypes.ExternalReference,
+                    new List<Aas.IKey>
+                    {
+                        new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something")
+                    });
+            }
+
+            // NOTE: Both submodels have the same single descendant, but in
+            // different properties.
+            var withSemanticId = new Aas.Submodel("urn:some-submodel")
+            {
+                SemanticId = MakeReference()
+            };
+            var withSupplementalSemanticIds = new Aas.Submodel("urn:some-submodel")
+            {
+                SupplementalSemanticIds = new List<Aas.IReference> { MakeReference() }
+            };
+
+            Assert.AreNotEqual(
+                Aas.Digesting.Digest(withSemanticId),
+                Aas.Digesting.Digest(withSupplementalSemanticIds));
+
+            var unset = new Aas.Submodel("urn:some-submodel");
+            var empty = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>()
+            };
+            Assert.AreNotEqual(
+                Aas.Digesting.Digest(unset),
+                Aas.Digesting.Digest(empty));
+        }
+
+        [Test]
+        public void Test_digest_is_stable()
+        {
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something");
+
+            // NOTE: The digest must be the same on all the servers, so it is
+            // hard-wired here.
+            Assert.AreEqual(
+                "B6A0A1CE03B9E576B92A6BE3CE3E9BB316D6F67CFD5D3FFF75622BD588DD47C7",
+                System.Convert.ToHexString(Aas.Digesting.Digest(key)));
+        }
+    }
+}
@@ -0,0 +1,133 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestEnvironmentIndex
+    {
+        [Test]
+        public void Test_identifiables_in_the_test_data()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var index = new Aas.EnvironmentIndex(environment);
+
+                var identifiables = environment
+                    .OverAssetAdministrationShellsOrEmpty().Cast<Aas.IIdentifiable>()
+                    .Concat(environment.OverSubmodelsOrEmpty())
+                    .Concat(environment.OverConceptDescriptionsOrEmpty())
+                    .ToList();
+
+                foreach (var identifiable in identifiables)
+                {
+                    Assert.IsNotNull(index.FindIdentifiable(identifiable.Id), path);
+                }
+
+                Assert.AreEqual(
+                    identifiables.Select(identifiable => identifiable.Id).Distinct().Count(),
+                    index.Count,
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_find_by_id_short_path()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var index = new Aas.EnvironmentIndex(environment);
+
+            var submodel = environment.Submodels![0];
+            var sensors = (Aas.ISubmodelElementCollection)submodel.SubmodelElements![0];
+            var temperatures = (Aas.ISubmodelElementList)sensors.Value![0];
+            var entity = (Aas.IEntity)submodel.SubmodelElements![1];
+
+            Assert.AreSame(submodel, index.FindIdentifiable("urn:some-submodel"));
+            Assert.AreSame(
+                environment.ConceptDescriptions![0],
+                index.FindIdentifiable("urn:some-concept-description"));
+            Assert.IsNull(index.FindIdentifiable("urn:unknown"));
+
+            Assert.AreSame(sensors, index.FindReferable("urn:some-submodel", "Sensors"));
+            Assert.AreSame(
+                temperatures.Value![3],
+                index.FindReferable("urn:some-submodel", "Sensors.Temperatures[3]"));
+            Assert.AreSame(
+                ((Aas.ISubmodelElementCollection)temperatures.Value![3]).Value![0],
+                index.FindReferable("urn:some-submodel", "Sensors.Temperatures[3].Value"));
+            Assert.AreSame(
+                entity.Statements![0],
+                index.FindReferable("urn:some-submodel", "Machine.SerialNumber"));
+
+            Assert.IsNull(index.FindReferable("urn:some-submodel", "Sensors.Temperatures[5]"));
+            Assert.IsNull(index.FindReferable("urn:some-submodel", "Sensors.Unknown"));
+            Assert.IsNull(index.FindReferable("urn:unknown", "Sensors"));
+        }
+
+        [Test]
+        public void Test_add_remove_and_reindex()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var index = new Aas.EnvironmentIndex(environment);
+
+            var other = new Aas.Submodel("urn:other-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    new Aas.Property(Aas.DataTypeDefXsd.Int) { IdShort = "Counter" }
+                }
+            };
+            index.Add(other);
+            Assert.AreSame(other, index.FindIdentifiable("urn:other-submodel"));
+            Assert.IsNotNull(index.FindReferable("urn:other-submodel", "Counter"));
+
+            Assert.Throws<System.ArgumentException>(
+                () => index.Add(new Aas.Submodel("urn:other-submodel")));
+
+            // Only the indexed instance is removed.
+            Assert.IsFalse(index.Remove(new Aas.Submodel("urn:other-submodel")));
+            Assert.IsTrue(index.Remove(other));
+            Assert.IsFalse(index.Remove(other));
+            Assert.IsNull(index.FindIdentifiable("urn:other-submodel"));
+            Assert.IsNull(index.FindReferable("urn:other-submodel", "Counter"));
+
+            var submodel = environment.Submodels![0];
+            submodel.SubmodelElements!.Add(
+                new Aas.Property(Aas.DataTypeDefXsd.Int) { IdShort = "Added" });
+            Assert.IsNull(index.FindReferable("urn:some-submodel", "Added"));
+
+            index.Reindex(submodel);
+            Assert.IsNotNull(index.FindReferable("urn:some-submodel", "Added"));
+
+            Assert.Throws<System.ArgumentException>(() => index.Reindex(other));
+        }
+
+        [Test]
+        public void Test_first_duplicate_is_indexed()
+        {
+            var first = new Aas.Property(Aas.DataTypeDefXsd.Int) { IdShort = "Same" };
+            var second = new Aas.Property(Aas.DataTypeDefXsd.Int) { IdShort = "Same" };
+
+            var firstSubmodel = new Aas.Submodel("urn:same")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement> { first, second }
+            };
+
+            var environment = new Aas.Environment
+            {
+                Submodels = new List<Aas.ISubmodel>
+                {
+                    firstSubmodel,
+                    new Aas.Submodel("urn:same")
+                }
+            };
+
+            var index = new Aas.EnvironmentIndex(environment);
+            Assert.AreEqual(1, index.Count);
+            Assert.AreSame(firstSubmodel, index.FindIdentifiable("urn:same"));
+            Assert.AreSame(first, index.FindReferable("urn:same", "Same"));
+        }
+    }
+}
@@ -0,0 +1,190 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestEquality
+    {
+        [Test]
+        public void Test_deep_copy_is_deeply_equal()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var copy = Aas.Copying.Deep(environment);
+                Assert.AreNotSame(environment, copy);
+
+                Assert.IsTrue(Aas.Equality.DeepEquals(environment, copy), path);
+                Assert.AreEqual(
+                    Aas.Equality.DeepHash(environment),
+                    Aas.Equality.DeepHash(copy),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_same_as_from_xml()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            var jsonDir = System.IO.Path.Combine(
+                Aas.Tests.Common.TestDataDir, "Json", "ContainedInEnvironment", "Expected");
+            var xmlDir = System.IO.Path.Combine(
+                Aas.Tests.Common.TestDataDir, "Xml", "ContainedInEnvironment", "Expected");
+
+            int compared = 0;
+            foreach (var path in paths)
+            {
+                // The directories of the classes are in Pascal case for JSON,
+                // and in camel case for XML.
+                var relative = System.IO.Path.GetRelativePath(jsonDir, path);
+                var xmlPath = System.IO.Path.ChangeExtension(
+                    System.IO.Path.Combine(
+                        xmlDir,
+                        char.ToLowerInvariant(relative[0]) + relative.Substring(1)),
+                    ".xml");
+                if (!System.IO.File.Exists(xmlPath))
+                {
+                    continue;
+                }
+
+                var fromJson = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                Aas.Environment fromXml;
+                using (var xmlReader = System.Xml.XmlReader.Create(xmlPath))
+                {
+                    fromXml = Aas.Xmlization.Deserialize.EnvironmentFrom(xmlReader);
+                }
+
+                Assert.IsTrue(Aas.Equality.DeepEquals(fromJson, fromXml), path);
+                Assert.AreEqual(
+                    Aas.Equality.DeepHash(fromJson),
+                    Aas.Equality.DeepHash(fromXml),
+                    path);
+                compared++;
+            }
+
+            Assert.Greater(compared, 0);
+        }
+
+        [Test]
+        public void Test_change_in_a_leaf_is_detected()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var copy = Aas.Copying.Deep(environment);
+
+                var key = copy.Descend().OfType<Aas.IKey>().FirstOrDefault();
+                if (key == null)
+                {
+                    continue;
+                }
+
+                key.Value += "-changed";
+
+                Assert.IsFalse(Aas.Equality.DeepEquals(environment, copy), path);
+                Assert.AreNotEqual(
+                    Aas.Equality.DeepHash(environment),
+                    Aas.Equality.DeepHash(copy),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_different_classes_with_the_same_properties()
+        {
+            var name = new Aas.LangStringNameType("en", "something");
+            var text = new Aas.LangStringTextType("en", "something");
+
+            Assert.IsFalse(Aas.Equality.DeepEquals(name, text));
+            Assert.AreNotEqual(
+                Aas.Equality.DeepHash(name),
+                Aas.Equality.DeepHash(text));
+        }
+
+        [Test]
+        public void Test_relationship_element_differs_from_annotated_one()
+        {
+            var first = new Aas.Reference(
+                Aas.ReferenceTypes.ExternalReference,
+                new List<Aas.IKey>
+                {
+                    new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:first")
+                });
+            var second = new Aas.Reference(
+                Aas.ReferenceTypes.ExternalReference,
+                new List<Aas.IKey>
+                {
+                    new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:second")
+                });
+
+            var plain = new Aas.RelationshipElement(first, second);
+            var annotated = new Aas.AnnotatedRelationshipElement(first, second);
+
+            // The comparison must be symmetric.
+            Assert.IsFalse(Aas.Equality.DeepEquals(plain, annotated));
+            Assert.IsFalse(Aas.Equality.DeepEquals(annotated, plain));
+            Assert.AreNotEqual(
+                Aas.Equality.DeepHash(plain),
+                Aas.Equality.DeepHash(annotated));
+
+            Assert.IsTrue(
+                Aas.Equality.DeepEquals(
+                    plain, new Aas.RelationshipElement(first, second)));
+        }
+
+        [Test]
+        public void Test_unset_list_differs_from_empty_list()
+        {
+            var unset = new Aas.Submodel("urn:some-submodel");
+            var empty = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>()
+            };
+
+            Assert.IsFalse(Aas.Equality.DeepEquals(unset, empty));
+            Assert.IsTrue(
+                Aas.Equality.DeepEquals(unset, new Aas.Submodel("urn:some-submodel")));
+        }
+
+        [Test]
+        public void Test_hash_is_stable()
+        {
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something");
+
+            // NOTE: The hash must not depend on the process, so it is hard-wired here.
+            Assert.AreEqual(-76009364, Aas.Equality.DeepHash(key));
+        }
+
+        [Test]
+        public void Test_comparer_as_dictionary_keys()
+        {
+            Aas.IReference MakeReference()
+            {
+                return new Aas.Reference(
+                    Aas.ReferenceTypes.ExternalReference,
+                    new List<Aas.IKey>
+                    {
+                        new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something")
+                    });
+            }
+
+            var counts = new Dictionary<Aas.IClass, int>(
+                Aas.Equality.DeepEqualityComparer.Instance);
+
+            foreach (var reference in new[] { MakeReference(), MakeReference() })
+            {
+                counts.TryGetValue(reference, out int count);
+                counts[reference] = count + 1;
+            }
+
+            Assert.AreEqual(1, counts.Count);
+            Assert.AreEqual(2, counts[MakeReference()]);
+        }
+    }
+}
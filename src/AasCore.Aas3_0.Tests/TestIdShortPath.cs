@@ -0,0 +1,195 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestIdShortPath
+    {
+        [Test]
+        public void Test_parse_and_render()
+        {
+            var path = Aas.IdShortPath.Parse("Sensors.Temperatures[3].Value");
+
+            Assert.AreEqual(
+                new List<string?> { "Sensors", "Temperatures", null, "Value" },
+                path.Segments.Select(segment => segment.IdShort).ToList());
+            Assert.AreEqual(
+                new List<int?> { null, null, 3, null },
+                path.Segments.Select(segment => segment.Index).ToList());
+
+            Assert.AreEqual("Sensors.Temperatures[3].Value", path.ToString());
+
+            Assert.AreEqual("[0][12]", Aas.IdShortPath.Parse("[0][12]").ToString());
+        }
+
+        [Test]
+        public void Test_invalid_paths()
+        {
+            foreach (var text in new[]
+                {
+                    "",
+                    ".",
+                    "a.",
+                    ".a",
+                    "a..b",
+                    "a.[0]",
+                    "a[",
+                    "a[]",
+                    "a[01]",
+                    "a[-1]",
+                    "a[x]",
+                    "a[99999999999]",
+                    "a]",
+                    "a[0]b"
+                })
+            {
+                Assert.IsFalse(
+                    Aas.IdShortPath.TryParse(text, out var path, out var error),
+                    text);
+                Assert.IsNull(path, text);
+                Assert.IsNotNull(error, text);
+
+                Assert.Throws<System.ArgumentException>(
+                    () => Aas.IdShortPath.Parse(text));
+            }
+        }
+
+        [Test]
+        public void Test_resolve()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var submodel = environment.Submodels![0];
+            var sensors = (Aas.ISubmodelElementCollection)submodel.SubmodelElements![0];
+            var temperatures = (Aas.ISubmodelElementList)sensors.Value![0];
+            var third = (Aas.ISubmodelElementCollection)temperatures.Value![3];
+            var entity = (Aas.IEntity)submodel.SubmodelElements![1];
+
+            Assert.AreSame(
+                third.Value![0],
+                Aas.IdShortPath.Parse("Sensors.Temperatures[3].Value").Resolve(submodel));
+            Assert.AreSame(
+                entity.Statements![0],
+                Aas.IdShortPath.Parse("Machine.SerialNumber").Resolve(submodel));
+
+            // Relative to a container
+            Assert.AreSame(
+                third,
+                Aas.IdShortPath.Parse("[3]").Resolve(temperatures));
+            Assert.AreSame(
+                third.Value![0],
+                Aas.IdShortPath.Parse("Temperatures[3].Value").Resolve(sensors));
+
+            foreach (var text in new[]
+                {
+                    "Unknown",
+                    "Sensors.Temperatures[5]",
+                    "Sensors.Temperatures.Value",
+                    "Sensors[0]",
+                    "Machine.SerialNumber.Something"
+                })
+            {
+                Assert.IsNull(Aas.IdShortPath.Parse(text).Resolve(submodel), text);
+            }
+
+            // The index of the environment agrees.
+            var index = new Aas.EnvironmentIndex(environment);
+            foreach (var text in new[]
+                {
+                    "Sensors.Temperatures[3].Value", "Machine.SerialNumber"
+                })
+            {
+                Assert.AreSame(
+                    index.FindReferable(submodel.Id, text),
+                    Aas.IdShortPath.Parse(text).Resolve(submodel));
+            }
+        }
+
+        private static List<Aas.ISubmodelElement> MakeChildren(int count)
+        {
+            return Enumerable.Range(0, count)
+                .Select(
+                    i => (Aas.ISubmodelElement)new Aas.Property(Aas.DataTypeDefXsd.Int)
+                    {
+                        IdShort = $"property{i}"
+                    })
+                .ToList();
+        }
+
+        [Test]
+        public void Test_child_index_follows_the_changes()
+        {
+            foreach (int count in new[] { 3, 100 })
+            {
+                var children = MakeChildren(count);
+
+                Assert.AreSame(children[1], Aas.ChildIndex.Find(children, "property1"));
+                Assert.IsNull(Aas.ChildIndex.Find(children, "unknown"));
+
+                // Insertion
+                var inserted = new Aas.Property(Aas.DataTypeDefXsd.Int)
+                {
+                    IdShort = "inserted"
+                };
+                children.Insert(0, inserted);
+                Assert.AreSame(inserted, Aas.ChildIndex.Find(children, "inserted"));
+                Assert.AreSame(children[2], Aas.ChildIndex.Find(children, "property1"));
+
+                // Removal
+                children.RemoveAt(0);
+                Assert.IsNull(Aas.ChildIndex.Find(children, "inserted"));
+                Assert.AreSame(children[1], Aas.ChildIndex.Find(children, "property1"));
+
+                // Renaming of the found child
+                children[1].IdShort = "renamed";
+                Assert.IsNull(Aas.ChildIndex.Find(children, "property1"));
+                Assert.AreSame(children[1], Aas.ChildIndex.Find(children, "renamed"));
+
+                // Replacement in place
+                var replacement = new Aas.Property(Aas.DataTypeDefXsd.Int)
+                {
+                    IdShort = "replacement"
+                };
+                children[2] = replacement;
+                Assert.AreSame(replacement, Aas.ChildIndex.Find(children, "replacement"));
+                Assert.IsNull(Aas.ChildIndex.Find(children, "property2"));
+            }
+        }
+
+        [Test]
+        public void Test_child_index_after_removal_and_insertion()
+        {
+            var children = MakeChildren(10);
+            Assert.AreSame(children[9], Aas.ChildIndex.Find(children, "property9"));
+
+            // The count stays the same.
+            children.RemoveAt(9);
+            var fresh = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "fresh"
+            };
+            children.Add(fresh);
+
+            Assert.AreSame(fresh, Aas.ChildIndex.Find(children, "fresh"));
+            Assert.IsNull(Aas.ChildIndex.Find(children, "property9"));
+            Assert.AreSame(children[3], Aas.ChildIndex.Find(children, "property3"));
+        }
+
+        [Test]
+        public void Test_first_duplicate_is_found()
+        {
+            var children = MakeChildren(20);
+            children[15].IdShort = "property5";
+
+            Assert.AreSame(children[5], Aas.ChildIndex.Find(children, "property5"));
+
+            // A duplicate introduced before the indexed child needs an explicit
+            // invalidation.
+            children[2].IdShort = "property5";
+            Aas.ChildIndex.Invalidate(children);
+            Assert.AreSame(children[2], Aas.ChildIndex.Find(children, "property5"));
+        }
+    }
+}
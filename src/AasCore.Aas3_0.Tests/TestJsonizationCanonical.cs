@@ -0,0 +1,135 @@
+using Aas = AasCore.Aas3_0; // renamed
+using Nodes = System.Text.Json.Nodes;
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestJsonizationCanonical
+    {
+        private static string ToCanonical(Aas.IClass instance)
+        {
+            var buffer = new System.Buffers.ArrayBufferWriter<byte>();
+            Aas.Jsonization.Serialize.ToCanonical(instance, buffer);
+            return System.Text.Encoding.UTF8.GetString(buffer.WrittenSpan);
+        }
+
+        /// <summary>
+        /// Check that the properties of all the objects are sorted by their names.
+        /// </summary>
+        private static void AssertSorted(Nodes.JsonNode? node, string label)
+        {
+            switch (node)
+            {
+                case Nodes.JsonObject obj:
+                    var names = obj.Select(property => property.Key).ToList();
+                    var sorted = names.OrderBy(name => name, System.StringComparer.Ordinal);
+                    Assert.AreEqual(sorted.ToList(), names, label);
+
+                    foreach (var property in obj)
+                    {
+                        AssertSorted(property.Value, label);
+                    }
+                    break;
+                case Nodes.JsonArray array:
+                    foreach (var item in array)
+                    {
+                        AssertSorted(item, label);
+                    }
+                    break;
+            }
+        }
+
+        [Test]
+        public void Test_round_trip_and_sorted()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var environment = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                string canonical = ToCanonical(environment);
+
+                var node = Nodes.JsonNode.Parse(canonical);
+                AssertSorted(node, path);
+
+                var parsed = Aas.Jsonization.Deserialize.EnvironmentFrom(node!);
+                Assert.IsTrue(Aas.Equality.DeepEquals(environment, parsed), path);
+
+                // The canonical form is a fixed point.
+                Assert.AreEqual(canonical, ToCanonical(parsed), path);
+            }
+        }
+
+        [Test]
+        public void Test_escaping()
+        {
+            var key = new Aas.Key(
+                Aas.KeyTypes.GlobalReference,
+                "a\"b\\c\u0001\u001f\b\f\n\r\t/<&>+'ä中\U0001F600");
+
+            Assert.AreEqual(
+                "{\"type\":\"GlobalReference\"," +
+                "\"value\":\"a\\\"b\\\\c\\u0001\\u001f\\b\\f\\n\\r\\t/<&>+'ä中\U0001F600\"}",
+                ToCanonical(key));
+        }
+
+        [Test]
+        public void Test_booleans_and_nested_objects()
+        {
+            var list = new Aas.SubmodelElementList(Aas.AasSubmodelElements.Property)
+            {
+                IdShort = "someList",
+                OrderRelevant = false,
+                SemanticId = new Aas.Reference(
+                    Aas.ReferenceTypes.ExternalReference,
+                    new List<Aas.IKey>
+                    {
+                        new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something")
+                    })
+            };
+
+            Assert.AreEqual(
+                "{\"idShort\":\"someList\",\"modelType\":\"SubmodelElementList\"," +
+                "\"orderRelevant\":false," +
+                "\"semanticId\":{\"keys\":[" +
+                "{\"type\":\"GlobalReference\",\"value\":\"urn:something\"}]," +
+                "\"type\":\"ExternalReference\"}," +
+                "\"typeValueListElement\":\"Property\"}",
+                ToCanonical(list));
+        }
+
+        [Test]
+        public void Test_lone_surrogate_throws()
+        {
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "broken\uD800");
+
+            Assert.Throws<System.Text.EncoderFallbackException>(
+                () => ToCanonical(key));
+        }
+
+        [Test]
+        public void Test_stream_over_many_flushes()
+        {
+            var submodels = new List<Aas.ISubmodel>();
+            for (int i = 0; i < 10000; i++)
+            {
+                submodels.Add(new Aas.Submodel($"urn:some-submodel:{i}"));
+            }
+            var environment = new Aas.Environment(null, submodels);
+
+            using var stream = new System.IO.MemoryStream();
+            Aas.Jsonization.Serialize.ToCanonical(environment, stream);
+
+            Assert.AreEqual(
+                ToCanonical(environment),
+                System.Text.Encoding.UTF8.GetString(stream.ToArray()));
+        }
+    }
+}
@@ -0,0 +1,496 @@
+using Aas = AasCore.Aas3_0; // renamed
+using Directory = System.IO.Directory;
+using Nodes = System.Text.Json.Nodes;
+using Path = System.IO.Path;
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestJsonizationStreaming
+    {
+        /// <summary>
+        /// Return at most one byte per read to exercise the refills of the buffer.
+        /// </summary>
+        internal class TricklingStream : System.IO.MemoryStream
+        {
+            public TricklingStream(byte[] buffer) : base(buffer)
+            {
+                // Intentionally empty.
+            }
+
+            public override int Read(byte[] buffer, int offset, int count)
+            {
+                return base.Read(buffer, offset, System.Math.Min(count, 1));
+            }
+
+            public override int Read(System.Span<byte> buffer)
+            {
+                return base.Read(buffer.Slice(0, System.Math.Min(buffer.Length, 1)));
+            }
+
+            public override System.Threading.Tasks.ValueTask<int> ReadAsync(
+                System.Memory<byte> buffer,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return base.ReadAsync(
+                    buffer.Slice(0, System.Math.Min(buffer.Length, 1)),
+                    cancellationToken);
+            }
+        }
+
+        private static string? DeserializationMessage(System.Func<Aas.Environment> deserialize)
+        {
+            try
+            {
+                deserialize();
+            }
+            catch (Aas.Jsonization.Exception exception)
+            {
+                return exception.Message;
+            }
+
+            return null;
+        }
+
+        [Test]
+        public void Test_round_trip_same_as_from_node()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths("Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var node = Aas.Tests.CommonJson.ReadFromFile(path);
+                var expected = Aas.Jsonization.Serialize.ToJsonObject(
+                    Aas.Jsonization.Deserialize.EnvironmentFrom(node)).ToJsonString();
+
+                using var stream = System.IO.File.OpenRead(path);
+                var environment = Aas.Jsonization.DeserializeStreaming.EnvironmentFrom(
+                    stream);
+
+                Assert.AreEqual(
+                    expected,
+                    Aas.Jsonization.Serialize.ToJsonObject(environment).ToJsonString(),
+                    $"Unexpected streaming deserialization of {path}");
+            }
+        }
+
+        [Test]
+        public void Test_errors_same_as_from_node()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Unexpected", "Unserializable");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var node = Aas.Tests.CommonJson.ReadFromFile(path);
+                string? expected = DeserializationMessage(
+                    () => Aas.Jsonization.Deserialize.EnvironmentFrom(node));
+                Assert.IsNotNull(expected, path);
+
+                byte[] bytes = System.IO.File.ReadAllBytes(path);
+                string? got = DeserializationMessage(
+                    () => Aas.Jsonization.DeserializeStreaming.EnvironmentFrom(
+                        new System.IO.MemoryStream(bytes)));
+
+                Assert.AreEqual(expected, got, path);
+            }
+        }
+
+        [Test]
+        public void Test_trickling_stream_with_byte_order_mark()
+        {
+            var path = Path.Combine(
+                Aas.Tests.Common.TestDataDir,
+                "Json",
+                "ContainedInEnvironment",
+                "Expected",
+                "Submodel",
+                "maximal.json");
+
+            var text = System.IO.File.ReadAllText(path);
+            var bytes = new System.Text.UTF8Encoding(true).GetPreamble()
+                .Concat(System.Text.Encoding.UTF8.GetBytes(text))
+                .ToArray();
+
+            var environment = Aas.Jsonization.DeserializeStreaming.EnvironmentFrom(
+                new TricklingStream(bytes));
+
+            var expected = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                Nodes.JsonNode.Parse(text)!);
+
+            Assert.AreEqual(
+                Aas.Jsonization.Serialize.ToJsonObject(expected).ToJsonString(),
+                Aas.Jsonization.Serialize.ToJsonObject(environment).ToJsonString());
+        }
+
+        [Test]
+        public void Test_item_larger_than_buffer()
+        {
+            var value = new string('x', 1024 * 1024);
+            var environment = new Aas.Environment(
+                null,
+                new List<Aas.ISubmodel>
+                {
+                    new Aas.Submodel("some-submodel")
+                    {
+                        SubmodelElements = new List<Aas.ISubmodelElement>
+                        {
+                            new Aas.Property(Aas.DataTypeDefXsd.String)
+                            {
+                                IdShort = "someProperty",
+                                Value = value
+                            }
+                        }
+                    },
+                    new Aas.Submodel("another-submodel")
+                });
+
+            string text = Aas.Jsonization.Serialize.ToJsonObject(environment).ToJsonString();
+
+            var parsed = Aas.Jsonization.DeserializeStreaming.EnvironmentFrom(
+                new System.IO.MemoryStream(System.Text.Encoding.UTF8.GetBytes(text)));
+
+            Assert.AreEqual(2, parsed.Submodels!.Count);
+            Assert.AreEqual(
+                value,
+                ((Aas.IProperty)parsed.Submodels[0].SubmodelElements![0]).Value);
+            Assert.AreEqual("another-submodel", parsed.Submodels[1].Id);
+        }
+
+        private static List<Aas.IIdentifiable> IdentifiablesOf(Aas.Environment environment)
+        {
+            var result = new List<Aas.IIdentifiable>();
+            result.AddRange(
+                environment.AssetAdministrationShells
+                ?? new List<Aas.IAssetAdministrationShell>());
+            result.AddRange(
+                environment.Submodels
+                ?? new List<Aas.ISubmodel>());
+            result.AddRange(
+                environment.ConceptDescriptions
+                ?? new List<Aas.IConceptDescription>());
+            return result;
+        }
+
+        private static List<string> Jsonize(IEnumerable<Aas.IIdentifiable> identifiables)
+        {
+            return identifiables
+                .Select(
+                    identifiable => Aas.Jsonization.Serialize.ToJsonObject(
+                        identifiable).ToJsonString())
+                .ToList();
+        }
+
+        private static Aas.Environment SomeEnvironment()
+        {
+            return new Aas.Environment(
+                new List<Aas.IAssetAdministrationShell>
+                {
+                    new Aas.AssetAdministrationShell(
+                        "some-shell",
+                        new Aas.AssetInformation(Aas.AssetKind.Instance))
+                },
+                new List<Aas.ISubmodel>
+                {
+                    new Aas.Submodel("some-submodel"),
+                    new Aas.Submodel("another-submodel"),
+                    new Aas.Submodel("yet-another-submodel")
+                },
+                new List<Aas.IConceptDescription>
+                {
+                    new Aas.ConceptDescription("some-concept-description")
+                });
+        }
+
+        private static byte[] BytesOf(Aas.Environment environment)
+        {
+            return System.Text.Encoding.UTF8.GetBytes(
+                Aas.Jsonization.Serialize.ToJsonObject(environment).ToJsonString());
+        }
+
+        [Test]
+        public void Test_identifiables_same_as_from_node()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths("Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var environment = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                using var stream = System.IO.File.OpenRead(path);
+                var got = Aas.Jsonization.DeserializeStreaming.IdentifiablesFrom(stream);
+
+                Assert.AreEqual(
+                    Jsonize(IdentifiablesOf(environment)),
+                    Jsonize(got),
+                    $"Unexpected lazy deserialization of {path}");
+            }
+        }
+
+        [Test]
+        public void Test_identifiables_errors_same_as_from_node()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Unexpected", "Unserializable");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var node = Aas.Tests.CommonJson.ReadFromFile(path);
+                string? expected = DeserializationMessage(
+                    () => Aas.Jsonization.Deserialize.EnvironmentFrom(node));
+                Assert.IsNotNull(expected, path);
+
+                byte[] bytes = System.IO.File.ReadAllBytes(path);
+                string? got = DeserializationMessage(
+                    () =>
+                    {
+                        Aas.Jsonization.DeserializeStreaming.IdentifiablesFrom(
+                            new System.IO.MemoryStream(bytes)).ToList();
+                        return new Aas.Environment();
+                    });
+
+                Assert.AreEqual(expected, got, path);
+            }
+        }
+
+        [Test]
+        public void Test_sections()
+        {
+            var environment = SomeEnvironment();
+            var bytes = BytesOf(environment);
+
+            Assert.AreEqual(
+                new List<string> { "some-shell" },
+                Aas.Jsonization.DeserializeStreaming.AssetAdministrationShellsFrom(
+                    new System.IO.MemoryStream(bytes)).Select(shell => shell.Id).ToList());
+
+            Assert.AreEqual(
+                new List<string> { "some-submodel", "another-submodel", "yet-another-submodel" },
+                Aas.Jsonization.DeserializeStreaming.SubmodelsFrom(
+                    new System.IO.MemoryStream(bytes)).Select(submodel => submodel.Id).ToList());
+
+            Assert.AreEqual(
+                new List<string> { "some-concept-description" },
+                Aas.Jsonization.DeserializeStreaming.ConceptDescriptionsFrom(
+                    new System.IO.MemoryStream(bytes)).Select(
+                    conceptDescription => conceptDescription.Id).ToList());
+        }
+
+        [Test]
+        public void Test_select_by_id_skips_the_others()
+        {
+            var environment = SomeEnvironment();
+
+            // The unselected submodel is invalid, but it must not be deserialized.
+            var text = Aas.Jsonization.Serialize.ToJsonObject(environment).ToJsonString()
+                .Replace(
+                    "{\"id\":\"another-submodel\",\"modelType\":\"Submodel\"}",
+                    "{\"id\":\"another-submodel\",\"modelType\":\"Submodel\",\"unexpected\":1}");
+            Assert.IsTrue(text.Contains("\"unexpected\""));
+
+            var got = Aas.Jsonization.DeserializeStreaming.IdentifiablesFrom(
+                new System.IO.MemoryStream(System.Text.Encoding.UTF8.GetBytes(text)),
+                id => id != "another-submodel" && id != "some-shell").ToList();
+
+            Assert.AreEqual(
+                new List<string>
+                {
+                    "some-submodel", "yet-another-submodel", "some-concept-description"
+                },
+                got.Select(identifiable => identifiable.Id).ToList());
+        }
+
+        [Test]
+        public void Test_lazy_enumeration_stops_early()
+        {
+            var bytes = BytesOf(SomeEnvironment());
+
+            // The remainder of the input is not valid JSON, but we stop before it.
+            var truncated = bytes.Take(
+                System.Text.Encoding.UTF8.GetString(bytes).IndexOf(
+                    "another-submodel", System.StringComparison.Ordinal)).ToArray();
+
+            var first = Aas.Jsonization.DeserializeStreaming.SubmodelsFrom(
+                new TricklingStream(truncated)).First();
+
+            Assert.AreEqual("some-submodel", first.Id);
+        }
+
+        [Test]
+        public void Test_async_same_as_sync()
+        {
+            var bytes = BytesOf(SomeEnvironment());
+
+            var expected = Jsonize(
+                Aas.Jsonization.DeserializeStreaming.IdentifiablesFrom(
+                    new System.IO.MemoryStream(bytes),
+                    id => id != "another-submodel"));
+
+            var got = new List<Aas.IIdentifiable>();
+            var enumerator = Aas.Jsonization.DeserializeStreaming.IdentifiablesFromAsync(
+                new TricklingStream(bytes),
+                id => id != "another-submodel").GetAsyncEnumerator();
+            try
+            {
+                while (enumerator.MoveNextAsync().AsTask().GetAwaiter().GetResult())
+                {
+                    got.Add(enumerator.Current);
+                }
+            }
+            finally
+            {
+                enumerator.DisposeAsync().AsTask().GetAwaiter().GetResult();
+            }
+
+            Assert.AreEqual(expected, Jsonize(got));
+        }
+
+        [Test]
+        public void Test_async_cancellation()
+        {
+            var bytes = BytesOf(SomeEnvironment());
+
+            using var source = new System.Threading.CancellationTokenSource();
+            source.Cancel();
+
+            var enumerator = Aas.Jsonization.DeserializeStreaming.SubmodelsFromAsync(
+                new TricklingStream(bytes),
+                cancellationToken: source.Token).GetAsyncEnumerator();
+
+            Assert.Catch<System.OperationCanceledException>(
+                () => enumerator.MoveNextAsync().AsTask().GetAwaiter().GetResult());
+        }
+
+        [Test]
+        public void Test_environment_from_async_same_as_sync()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths("Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                byte[] bytes = System.IO.File.ReadAllBytes(path);
+
+                var expected = Aas.Jsonization.DeserializeStreaming.EnvironmentFrom(
+                    new System.IO.MemoryStream(bytes));
+
+                var got = Aas.Jsonization.DeserializeStreaming.EnvironmentFromAsync(
+                    new TricklingStream(bytes)).GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Aas.Jsonization.Serialize.ToJsonObject(expected).ToJsonString(),
+                    Aas.Jsonization.Serialize.ToJsonObject(got).ToJsonString(),
+                    $"Unexpected asynchronous deserialization of {path}");
+            }
+        }
+
+        [Test]
+        public void Test_environment_from_async_error()
+        {
+            var bytes = System.Text.Encoding.UTF8.GetBytes(
+                "{\"submodels\": [{\"id\": \"something\"}]}");
+
+            var exception = Assert.Catch<Aas.Jsonization.Exception>(
+                () => Aas.Jsonization.DeserializeStreaming.EnvironmentFromAsync(
+                    new System.IO.MemoryStream(bytes)).GetAwaiter().GetResult());
+
+            Assert.AreEqual("submodels[0]", exception.Path);
+        }
+
+        [Test]
+        public void Test_submodel_from_same_as_from_node()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Expected", "Submodel");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var environment = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                foreach (var submodel in environment.OverSubmodelsOrEmpty())
+                {
+                    string expected = Aas.Jsonization.Serialize.ToJsonObject(
+                        submodel).ToJsonString();
+                    byte[] bytes = System.Text.Encoding.UTF8.GetBytes(expected);
+
+                    var got = Aas.Jsonization.DeserializeStreaming.SubmodelFrom(
+                        new TricklingStream(bytes));
+                    Assert.AreEqual(
+                        expected,
+                        Aas.Jsonization.Serialize.ToJsonObject(got).ToJsonString(),
+                        path);
+
+                    var gotAsync = Aas.Jsonization.DeserializeStreaming.SubmodelFromAsync(
+                        new TricklingStream(bytes)).GetAwaiter().GetResult();
+                    Assert.AreEqual(
+                        expected,
+                        Aas.Jsonization.Serialize.ToJsonObject(gotAsync).ToJsonString(),
+                        path);
+                }
+            }
+        }
+
+        [Test]
+        public void Test_from_with_any_class()
+        {
+            var bytes = System.Text.Encoding.UTF8.GetBytes(
+                "{\"type\": \"GlobalReference\", \"value\": \"urn:something\"}");
+
+            var key = Aas.Jsonization.DeserializeStreaming.From(
+                new System.IO.MemoryStream(bytes),
+                Aas.Jsonization.Deserialize.KeyFrom);
+            Assert.AreEqual("urn:something", key.Value);
+
+            var keyAsync = Aas.Jsonization.DeserializeStreaming.FromAsync(
+                new TricklingStream(bytes),
+                Aas.Jsonization.Deserialize.KeyFrom).GetAwaiter().GetResult();
+            Assert.AreEqual(Aas.KeyTypes.GlobalReference, keyAsync.Type);
+        }
+
+        [Test]
+        public void Test_single_value_errors()
+        {
+            var invalid = System.Text.Encoding.UTF8.GetBytes(
+                "{\"id\": \"something\", \"modelType\": \"Submodel\", \"kind\": 1}");
+            var expected = Assert.Catch<Aas.Jsonization.Exception>(
+                () => Aas.Jsonization.Deserialize.SubmodelFrom(
+                    Nodes.JsonNode.Parse(invalid)!));
+            var got = Assert.Catch<Aas.Jsonization.Exception>(
+                () => Aas.Jsonization.DeserializeStreaming.SubmodelFrom(
+                    new System.IO.MemoryStream(invalid)));
+            Assert.AreEqual(expected.Message, got.Message);
+
+            Assert.Catch<Aas.Jsonization.Exception>(
+                () => Aas.Jsonization.DeserializeStreaming.SubmodelFrom(
+                    new System.IO.MemoryStream(
+                        System.Text.Encoding.UTF8.GetBytes("null"))));
+
+            Assert.Catch<System.Text.Json.JsonException>(
+                () => Aas.Jsonization.DeserializeStreaming.SubmodelFrom(
+                    new System.IO.MemoryStream(
+                        System.Text.Encoding.UTF8.GetBytes(
+                            "{\"id\": \"something\", \"modelType\": \"Submodel\"} {}"))));
+        }
+
+        [Test]
+        public void Test_invalid_json_throws()
+        {
+            var bytes = System.Text.Encoding.UTF8.GetBytes(
+                "{\"submodels\": [{\"id\": \"something\", \"modelType\": \"Submodel\"}");
+
+            Assert.Catch<System.Text.Json.JsonException>(
+                () => Aas.Jsonization.DeserializeStreaming.EnvironmentFrom(
+                    new System.IO.MemoryStream(bytes)));
+        }
+    }
+}
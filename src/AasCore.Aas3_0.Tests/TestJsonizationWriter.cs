@@ -0,0 +1,130 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestJsonizationWriter
+    {
+        private static void AssertSameAsOverJsonObject(Aas.IClass instance, string label)
+        {
+            string expected = Aas.Jsonization.Serialize.ToJsonObject(instance).ToJsonString();
+
+            using var stream = new System.IO.MemoryStream();
+            Aas.Jsonization.Serialize.To(instance, stream);
+
+            Assert.AreEqual(
+                expected,
+                System.Text.Encoding.UTF8.GetString(stream.ToArray()),
+                $"Unexpected output of the writer for {label}");
+        }
+
+        [Test]
+        public void Test_same_as_over_json_object()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var environment = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                AssertSameAsOverJsonObject(environment, path);
+            }
+        }
+
+        [Test]
+        public void Test_same_as_over_json_object_with_special_characters()
+        {
+            var submodel = new Aas.Submodel("urn:something:<&>+'\"\\/ä中\U0001F600")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    new Aas.Blob("application/octet-stream")
+                    {
+                        IdShort = "someBlob",
+                        // The base64 encoding of these bytes contains '+' and '/'.
+                        Value = new byte[] { 0xFB, 0xEF, 0xFF, 0xFE }
+                    },
+                    new Aas.SubmodelElementList(Aas.AasSubmodelElements.Property)
+                    {
+                        IdShort = "someList",
+                        OrderRelevant = false
+                    }
+                }
+            };
+
+            AssertSameAsOverJsonObject(submodel, "a submodel with special characters");
+        }
+
+        [Test]
+        public void Test_writer_is_left_open()
+        {
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something");
+
+            using var stream = new System.IO.MemoryStream();
+            using (var writer = new System.Text.Json.Utf8JsonWriter(stream))
+            {
+                writer.WriteStartArray();
+                Aas.Jsonization.Serialize.To(key, writer);
+                Aas.Jsonization.Serialize.To(key, writer);
+                writer.WriteEndArray();
+            }
+
+            Assert.AreEqual(
+                "[{\"type\":\"GlobalReference\",\"value\":\"urn:something\"}," +
+                "{\"type\":\"GlobalReference\",\"value\":\"urn:something\"}]",
+                System.Text.Encoding.UTF8.GetString(stream.ToArray()));
+        }
+
+        [Test]
+        public void Test_to_async_same_as_over_json_object()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var environment = Aas.Jsonization.Deserialize.EnvironmentFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                using var stream = new System.IO.MemoryStream();
+                Aas.Jsonization.Serialize.ToAsync(environment, stream)
+                    .GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Aas.Jsonization.Serialize.ToJsonObject(environment).ToJsonString(),
+                    System.Text.Encoding.UTF8.GetString(stream.ToArray()),
+                    $"Unexpected asynchronous output of the writer for {path}");
+            }
+        }
+
+        [Test]
+        public void Test_to_async_over_many_flushes()
+        {
+            var submodels = new List<Aas.ISubmodel>();
+            for (int i = 0; i < 10000; i++)
+            {
+                submodels.Add(new Aas.Submodel($"urn:some-submodel:{i}"));
+            }
+            var environment = new Aas.Environment(null, submodels);
+
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something");
+
+            foreach (Aas.IClass instance in new Aas.IClass[] { environment, key })
+            {
+                using var stream = new System.IO.MemoryStream();
+                Aas.Jsonization.Serialize.ToAsync(instance, stream)
+                    .GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Aas.Jsonization.Serialize.ToJsonObject(instance).ToJsonString(),
+                    System.Text.Encoding.UTF8.GetString(stream.ToArray()));
+            }
+        }
+    }
+}
@@ -0,0 +1,262 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestReferenceResolver
+    {
+        private static Aas.IReference ModelReference(
+            params (Aas.KeyTypes, string)[] keys)
+        {
+            return new Aas.Reference(
+                Aas.ReferenceTypes.ModelReference,
+                keys
+                    .Select(key => (Aas.IKey)new Aas.Key(key.Item1, key.Item2))
+                    .ToList());
+        }
+
+        /// <summary>
+        /// Make the common environment with a file among the statements of
+        /// the entity.
+        /// </summary>
+        private static Aas.Environment MakeEnvironmentWithFile()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var entity = (Aas.IEntity)environment.Submodels![0].SubmodelElements![1];
+            entity.Statements!.Add(
+                new Aas.File("application/pdf") { IdShort = "Manual" });
+            return environment;
+        }
+
+        [Test]
+        public void Test_resolve_through_the_containers()
+        {
+            var environment = MakeEnvironmentWithFile();
+            var resolver = new Aas.ReferenceResolver(
+                new Aas.EnvironmentIndex(environment));
+
+            var submodel = environment.Submodels![0];
+            var sensors = (Aas.ISubmodelElementCollection)submodel.SubmodelElements![0];
+            var temperatures = (Aas.ISubmodelElementList)sensors.Value![0];
+            var third = (Aas.ISubmodelElementCollection)temperatures.Value![3];
+            var entity = (Aas.IEntity)submodel.SubmodelElements![1];
+
+            Assert.AreSame(
+                environment.ConceptDescriptions![0],
+                resolver.Resolve(
+                    ModelReference(
+                        (Aas.KeyTypes.ConceptDescription, "urn:some-concept-description"))));
+
+            Assert.AreSame(
+                third.Value![0],
+                resolver.Resolve(
+                    ModelReference(
+                        (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                        (Aas.KeyTypes.SubmodelElementCollection, "Sensors"),
+                        (Aas.KeyTypes.SubmodelElementList, "Temperatures"),
+                        (Aas.KeyTypes.SubmodelElementCollection, "3"),
+                        (Aas.KeyTypes.Property, "Value"))));
+
+            // The generic key types match the more specific instances.
+            Assert.AreSame(
+                entity.Statements![0],
+                resolver.Resolve(
+                    ModelReference(
+                        (Aas.KeyTypes.Identifiable, "urn:some-submodel"),
+                        (Aas.KeyTypes.SubmodelElement, "Machine"),
+                        (Aas.KeyTypes.DataElement, "SerialNumber"))));
+
+            Assert.AreSame(
+                entity.Statements![1],
+                resolver.Resolve(
+                    ModelReference(
+                        (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                        (Aas.KeyTypes.Entity, "Machine"),
+                        (Aas.KeyTypes.File, "Manual"),
+                        (Aas.KeyTypes.FragmentReference, "page=3"))));
+        }
+
+        [Test]
+        public void Test_unresolvable()
+        {
+            var environment = MakeEnvironmentWithFile();
+            var resolver = new Aas.ReferenceResolver(
+                new Aas.EnvironmentIndex(environment));
+
+            var unresolvable = new List<Aas.IReference>
+            {
+                new Aas.Reference(
+                    Aas.ReferenceTypes.ExternalReference,
+                    new List<Aas.IKey>
+                    {
+                        new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:some-submodel")
+                    }),
+                ModelReference((Aas.KeyTypes.Submodel, "urn:unknown")),
+                // The type of the key does not match.
+                ModelReference((Aas.KeyTypes.ConceptDescription, "urn:some-submodel")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.Property, "Sensors")),
+                // The index is out of range, has a leading zero or is not a number.
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Sensors"),
+                    (Aas.KeyTypes.SubmodelElementList, "Temperatures"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "5")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Sensors"),
+                    (Aas.KeyTypes.SubmodelElementList, "Temperatures"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "03")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Sensors"),
+                    (Aas.KeyTypes.SubmodelElementList, "Temperatures"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "third")),
+                // The fragment reference must be the last key.
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.FragmentReference, "some-fragment"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Sensors")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.Entity, "Machine"),
+                    (Aas.KeyTypes.File, "Manual"),
+                    (Aas.KeyTypes.FragmentReference, "page=3"),
+                    (Aas.KeyTypes.FragmentReference, "page=4")),
+                // The fragment reference must follow a file or a blob.
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.Entity, "Machine"),
+                    (Aas.KeyTypes.Property, "SerialNumber"),
+                    (Aas.KeyTypes.FragmentReference, "some-fragment")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.Entity, "Machine"),
+                    (Aas.KeyTypes.SubmodelElement, "Manual"),
+                    (Aas.KeyTypes.FragmentReference, "page=3")),
+                // The values must be ID-shorts so that they can not walk
+                // a different path.
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.SubmodelElementList, "Sensors.Temperatures")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Sensors"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Temperatures[3]")),
+                ModelReference(
+                    (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "")),
+                // Shells do not contain referables.
+                ModelReference(
+                    (Aas.KeyTypes.AssetAdministrationShell, "urn:some-shell"),
+                    (Aas.KeyTypes.SubmodelElementCollection, "Sensors"))
+            };
+
+            foreach (var reference in unresolvable)
+            {
+                Assert.IsNull(
+                    resolver.Resolve(reference),
+                    string.Join(", ", reference.Keys.Select(key => key.Value)));
+            }
+        }
+
+        [Test]
+        public void Test_memoization_and_invalidation()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var index = new Aas.EnvironmentIndex(environment);
+            var resolver = new Aas.ReferenceResolver(index);
+
+            var reference = ModelReference(
+                (Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                (Aas.KeyTypes.Property, "Added"));
+
+            Assert.IsNull(resolver.Resolve(reference));
+            Assert.IsNull(resolver.Resolve(reference));
+            Assert.AreEqual(1, resolver.Hits);
+            Assert.AreEqual(1, resolver.Misses);
+
+            var submodel = environment.Submodels![0];
+            var added = new Aas.Property(Aas.DataTypeDefXsd.Int) { IdShort = "Added" };
+            submodel.SubmodelElements!.Add(added);
+
+            // The index has not been informed, so the memo still holds.
+            Assert.IsNull(resolver.Resolve(reference));
+
+            index.Reindex(submodel);
+            Assert.AreSame(added, resolver.Resolve(reference));
+            Assert.AreEqual(2, resolver.Misses);
+
+            resolver.Invalidate();
+            Assert.AreSame(added, resolver.Resolve(reference));
+            Assert.AreEqual(3, resolver.Misses);
+
+            submodel.SubmodelElements!.Remove(added);
+            index.Reindex(submodel);
+            Assert.IsNull(resolver.Resolve(reference));
+            Assert.AreEqual(4, resolver.Misses);
+        }
+
+        [Test]
+        public void Test_memo_evicts_the_least_recently_used()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var resolver = new Aas.ReferenceResolver(
+                new Aas.EnvironmentIndex(environment), 2);
+
+            var submodel = ModelReference((Aas.KeyTypes.Submodel, "urn:some-submodel"));
+            var shell = ModelReference(
+                (Aas.KeyTypes.AssetAdministrationShell, "urn:some-shell"));
+            var conceptDescription = ModelReference(
+                (Aas.KeyTypes.ConceptDescription, "urn:some-concept-description"));
+
+            resolver.Resolve(submodel);
+            resolver.Resolve(shell);
+
+            // The submodel becomes the most recently used, so the shell is evicted.
+            resolver.Resolve(submodel);
+            resolver.Resolve(conceptDescription);
+            Assert.AreEqual(2, resolver.Count);
+            Assert.AreEqual(1, resolver.Hits);
+            Assert.AreEqual(3, resolver.Misses);
+
+            Assert.AreSame(environment.Submodels![0], resolver.Resolve(submodel));
+            Assert.AreEqual(2, resolver.Hits);
+
+            Assert.AreSame(
+                environment.AssetAdministrationShells![0],
+                resolver.Resolve(shell));
+            Assert.AreEqual(4, resolver.Misses);
+            Assert.AreEqual(2, resolver.Count);
+        }
+
+        [Test]
+        public void Test_non_positive_capacity()
+        {
+            var index = new Aas.EnvironmentIndex(Aas.Tests.Common.MakeEnvironment());
+            Assert.Throws<System.ArgumentException>(
+                () => new Aas.ReferenceResolver(index, 0));
+        }
+
+        [Test]
+        public void Test_same_values_in_different_keys_are_memoized_apart()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+            var resolver = new Aas.ReferenceResolver(
+                new Aas.EnvironmentIndex(environment));
+
+            Assert.IsNotNull(
+                resolver.Resolve(
+                    ModelReference((Aas.KeyTypes.Submodel, "urn:some-submodel"))));
+            Assert.IsNull(
+                resolver.Resolve(
+                    ModelReference(
+                        (Aas.KeyTypes.ConceptDescription, "urn:some-submodel"))));
+            Assert.AreEqual(2, resolver.Misses);
+        }
+    }
+}
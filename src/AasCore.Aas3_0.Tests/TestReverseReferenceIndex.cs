@@ -0,0 +1,201 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestReverseReferenceIndex
+    {
+        private static Aas.IReference ExternalReference(string value)
+        {
+            return new Aas.Reference(
+                Aas.ReferenceTypes.ExternalReference,
+                new List<Aas.IKey>
+                {
+                    new Aas.Key(Aas.KeyTypes.GlobalReference, value)
+                });
+        }
+
+        private static Aas.IReference ModelReference(Aas.KeyTypes type, string value)
+        {
+            return new Aas.Reference(
+                Aas.ReferenceTypes.ModelReference,
+                new List<Aas.IKey> { new Aas.Key(type, value) });
+        }
+
+        private static List<(Aas.IClass, string)> Render(
+            IEnumerable<Aas.ReverseReferenceIndex.Referrer> referrers)
+        {
+            return referrers
+                .Select(referrer => (referrer.Instance, referrer.Property))
+                .ToList();
+        }
+
+        [Test]
+        public void Test_referrers_of_a_concept_description()
+        {
+            var property = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "someProperty",
+                SemanticId = ModelReference(
+                    Aas.KeyTypes.ConceptDescription, "urn:some-concept-description")
+            };
+
+            var referenceElement = new Aas.ReferenceElement
+            {
+                IdShort = "someReferenceElement",
+                Value = ModelReference(
+                    Aas.KeyTypes.ConceptDescription, "urn:some-concept-description")
+            };
+
+            var relationship = new Aas.RelationshipElement(
+                ModelReference(Aas.KeyTypes.Submodel, "urn:some-submodel"),
+                ModelReference(
+                    Aas.KeyTypes.ConceptDescription, "urn:some-concept-description"))
+            {
+                IdShort = "someRelationship",
+                SupplementalSemanticIds = new List<Aas.IReference>
+                {
+                    ExternalReference("urn:some-concept-description")
+                }
+            };
+
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                EmbeddedDataSpecifications = new List<Aas.IEmbeddedDataSpecification>
+                {
+                    new Aas.EmbeddedDataSpecification(
+                        ExternalReference("urn:some-concept-description"),
+                        new Aas.DataSpecificationIec61360(
+                            new List<Aas.ILangStringPreferredNameTypeIec61360>
+                            {
+                                new Aas.LangStringPreferredNameTypeIec61360(
+                                    "en", "something")
+                            }))
+                },
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    property, referenceElement, relationship
+                }
+            };
+
+            var conceptDescription = new Aas.ConceptDescription("urn:other")
+            {
+                IsCaseOf = new List<Aas.IReference>
+                {
+                    ExternalReference("urn:some-concept-description")
+                }
+            };
+
+            var environment = new Aas.Environment
+            {
+                Submodels = new List<Aas.ISubmodel> { submodel },
+                ConceptDescriptions = new List<Aas.IConceptDescription>
+                {
+                    conceptDescription
+                }
+            };
+
+            var index = new Aas.ReverseReferenceIndex(environment);
+
+            Assert.AreEqual(
+                new List<(Aas.IClass, string)>
+                {
+                    (submodel, "DataSpecification"),
+                    (property, "SemanticId"),
+                    (referenceElement, "Value"),
+                    (relationship, "SupplementalSemanticIds"),
+                    (relationship, "Second"),
+                    (conceptDescription, "IsCaseOf")
+                },
+                Render(index.ReferrersOf("urn:some-concept-description")));
+
+            Assert.AreEqual(
+                new List<(Aas.IClass, string)> { (relationship, "First") },
+                Render(index.ReferrersOf("urn:some-submodel")));
+
+            Assert.IsEmpty(index.ReferrersOf("urn:unknown"));
+        }
+
+        [Test]
+        public void Test_incremental_maintenance()
+        {
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>()
+            };
+            var environment = new Aas.Environment
+            {
+                Submodels = new List<Aas.ISubmodel> { submodel }
+            };
+
+            var index = new Aas.ReverseReferenceIndex(environment);
+            Assert.IsEmpty(index.ReferrersOf("urn:something"));
+
+            var collection = new Aas.SubmodelElementCollection
+            {
+                IdShort = "someCollection",
+                Value = new List<Aas.ISubmodelElement>
+                {
+                    new Aas.Property(Aas.DataTypeDefXsd.Int)
+                    {
+                        IdShort = "someProperty",
+                        SemanticId = ExternalReference("urn:something")
+                    }
+                }
+            };
+            submodel.SubmodelElements.Add(collection);
+            index.Add(collection);
+
+            // Adding twice does not duplicate the referrers.
+            index.Add(collection);
+            Assert.AreEqual(1, index.ReferrersOf("urn:something").Count);
+
+            // Change the key in place, and re-index.
+            var property = collection.Value[0];
+            property.SemanticId!.Keys[0].Value = "urn:something-else";
+            index.Reindex(property);
+            Assert.IsEmpty(index.ReferrersOf("urn:something"));
+            Assert.AreEqual(1, index.ReferrersOf("urn:something-else").Count);
+
+            submodel.SubmodelElements.Remove(collection);
+            index.Remove(collection);
+            Assert.IsEmpty(index.ReferrersOf("urn:something-else"));
+        }
+
+        [Test]
+        public void Test_on_the_test_data()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var index = new Aas.ReverseReferenceIndex(environment);
+
+                foreach (var instance in environment.Descend().OfType<Aas.IHasSemantics>())
+                {
+                    if (instance.SemanticId == null)
+                    {
+                        continue;
+                    }
+
+                    foreach (var key in instance.SemanticId.Keys)
+                    {
+                        Assert.IsTrue(
+                            index.ReferrersOf(key.Value).Any(
+                                referrer => ReferenceEquals(referrer.Instance, instance)
+                                    && referrer.Property == "SemanticId"),
+                            path);
+                    }
+                }
+
+                // Removing everything leaves the index empty.
+                index.Remove(environment);
+                foreach (var key in environment.Descend().OfType<Aas.IKey>())
+                {
+                    Assert.IsEmpty(index.ReferrersOf(key.Value), path);
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,133 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestSemanticIdIndex
+    {
+        private static Aas.IReference SemanticId(string value)
+        {
+            return new Aas.Reference(
+                Aas.ReferenceTypes.ExternalReference,
+                new List<Aas.IKey>
+                {
+                    new Aas.Key(Aas.KeyTypes.GlobalReference, value)
+                });
+        }
+
+        private static Aas.ISubmodel MakeSubmodel(int i)
+        {
+            return new Aas.Submodel($"urn:some-submodel:{i}")
+            {
+                SemanticId = SemanticId("urn:temperature"),
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    new Aas.Property(Aas.DataTypeDefXsd.Double)
+                    {
+                        IdShort = "Temperature",
+                        SemanticId = SemanticId("urn:temperature")
+                    },
+                    new Aas.SubmodelElementCollection
+                    {
+                        IdShort = "Nested",
+                        SemanticId = SemanticId("urn:temperature"),
+                        Value = new List<Aas.ISubmodelElement>
+                        {
+                            new Aas.Property(Aas.DataTypeDefXsd.Double)
+                            {
+                                IdShort = "Temperature",
+                                SemanticId = SemanticId("urn:temperature"),
+                                SupplementalSemanticIds = new List<Aas.IReference>
+                                {
+                                    SemanticId("urn:celsius")
+                                }
+                            }
+                        }
+                    }
+                }
+            };
+        }
+
+        [Test]
+        public void Test_find()
+        {
+            var environment = new Aas.Environment
+            {
+                Submodels = new List<Aas.ISubmodel> { MakeSubmodel(0), MakeSubmodel(1) }
+            };
+
+            var index = new Aas.SemanticIdIndex(environment);
+
+            var matches = index.Find("urn:temperature");
+
+            // The submodels themselves are not submodel elements.
+            Assert.AreEqual(6, matches.Count);
+            Assert.AreEqual(
+                environment.Submodels
+                    .SelectMany(
+                        submodel => submodel.Descend()
+                            .OfType<Aas.ISubmodelElement>()
+                            .Select(element => (element, submodel)))
+                    .ToList(),
+                matches.Select(match => (match.Element, match.Submodel)).ToList());
+
+            var properties = index.Find<Aas.IProperty>("urn:temperature").ToList();
+            Assert.AreEqual(4, properties.Count);
+            Assert.IsTrue(properties.All(match => match.Element is Aas.IProperty));
+
+            Assert.IsEmpty(index.Find("urn:celsius"));
+            Assert.IsEmpty(index.Find("urn:unknown"));
+        }
+
+        [Test]
+        public void Test_supplemental_semantic_ids()
+        {
+            var environment = new Aas.Environment
+            {
+                Submodels = new List<Aas.ISubmodel> { MakeSubmodel(0) }
+            };
+
+            var index = new Aas.SemanticIdIndex(
+                environment, includeSupplementalSemanticIds: true);
+
+            var matches = index.Find("urn:celsius");
+            Assert.AreEqual(1, matches.Count);
+            Assert.AreEqual("Temperature", matches[0].Element.IdShort);
+        }
+
+        [Test]
+        public void Test_add_remove_and_reindex()
+        {
+            var first = MakeSubmodel(0);
+            var environment = new Aas.Environment
+            {
+                Submodels = new List<Aas.ISubmodel> { first }
+            };
+
+            var index = new Aas.SemanticIdIndex(environment);
+            Assert.AreEqual(3, index.Find("urn:temperature").Count);
+
+            var second = MakeSubmodel(1);
+            index.Add(second);
+            Assert.AreEqual(6, index.Find("urn:temperature").Count);
+            Assert.Throws<System.ArgumentException>(() => index.Add(second));
+
+            Assert.IsTrue(index.Remove(first));
+            Assert.IsFalse(index.Remove(first));
+            Assert.IsTrue(
+                index.Find("urn:temperature")
+                    .All(match => ReferenceEquals(match.Submodel, second)));
+
+            second.SubmodelElements!.RemoveAt(1);
+            index.Reindex(second);
+            Assert.AreEqual(1, index.Find("urn:temperature").Count);
+
+            second.SubmodelElements!.Clear();
+            index.Reindex(second);
+            Assert.IsEmpty(index.Find("urn:temperature"));
+        }
+    }
+}
@@ -0,0 +1,232 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVerificationCache
+    {
+        [Test]
+        public void Test_same_as_verify()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var cache = new Aas.Verification.Cache(environment);
+
+                var expected = Aas.Tests.Common.RenderErrors(
+                    Aas.Verification.Verify(environment));
+
+                Assert.AreEqual(
+                    expected,
+                    Aas.Tests.Common.RenderErrors(cache.Verify()),
+                    path);
+
+                // The cached errors must not accumulate the paths.
+                Assert.AreEqual(
+                    expected,
+                    Aas.Tests.Common.RenderErrors(cache.Verify()),
+                    path);
+            }
+        }
+
+        private static (Aas.Environment, Aas.Property, Aas.Submodel) BuildEnvironment()
+        {
+            var property = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "someProperty",
+                Value = "1"
+            };
+
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement>
+                {
+                    property,
+                    new Aas.Property(Aas.DataTypeDefXsd.String)
+                    {
+                        IdShort = "anotherProperty"
+                    }
+                }
+            };
+
+            var environment = new Aas.Environment(
+                null,
+                new List<Aas.ISubmodel>
+                {
+                    new Aas.Submodel("urn:another-submodel"),
+                    submodel
+                });
+
+            return (environment, property, submodel);
+        }
+
+        private static void AssertSameAsVerify(
+            Aas.Environment environment,
+            Aas.Verification.Cache cache,
+            string label)
+        {
+            Assert.AreEqual(
+                Aas.Tests.Common.RenderErrors(
+                    Aas.Verification.Verify(environment)),
+                Aas.Tests.Common.RenderErrors(cache.Verify()),
+                label);
+        }
+
+        [Test]
+        public void Test_re_verification_after_changes()
+        {
+            var (environment, property, _) = BuildEnvironment();
+
+            var cache = new Aas.Verification.Cache(environment);
+            Assert.IsEmpty(cache.Verify());
+
+            property.Value = "not a number";
+            cache.MarkDirty(property);
+            Assert.AreEqual(1, cache.Verify().Count);
+            AssertSameAsVerify(environment, cache, "invalid value");
+
+            // The uniqueness of ID-shorts is an invariant of the submodel.
+            property.IdShort = "anotherProperty";
+            cache.MarkDirty(property);
+            Assert.AreEqual(2, cache.Verify().Count);
+            AssertSameAsVerify(environment, cache, "duplicate ID-short");
+
+            property.Value = "1";
+            property.IdShort = "someProperty";
+            cache.MarkDirty(property);
+            Assert.IsEmpty(cache.Verify());
+        }
+
+        [Test]
+        public void Test_re_verification_after_adding_and_removing_children()
+        {
+            var (environment, property, submodel) = BuildEnvironment();
+
+            var cache = new Aas.Verification.Cache(environment);
+            Assert.IsEmpty(cache.Verify());
+
+            var added = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "1invalid"
+            };
+            submodel.SubmodelElements!.Add(added);
+            cache.MarkDirty(submodel);
+            Assert.AreEqual(1, cache.Verify().Count);
+            AssertSameAsVerify(environment, cache, "added child");
+
+            // The added child is now in the cache.
+            added.IdShort = "addedProperty";
+            cache.MarkDirty(added);
+            Assert.IsEmpty(cache.Verify());
+
+            submodel.SubmodelElements.Remove(added);
+            cache.MarkDirty(submodel);
+            Assert.IsEmpty(cache.Verify());
+
+            // The removed child has been dropped from the cache.
+            Assert.Throws<System.ArgumentException>(
+                () => cache.MarkDirty(added));
+
+            submodel.SubmodelElements.Remove(property);
+            cache.MarkDirty(submodel);
+            Assert.IsEmpty(cache.Verify());
+            Assert.Throws<System.ArgumentException>(
+                () => cache.MarkDirty(property));
+        }
+
+        private static (Aas.Environment, Aas.Property, Aas.SubmodelElementCollection,
+            Aas.SubmodelElementCollection) BuildEnvironmentWithSharedChild(
+                string idShort)
+        {
+            var shared = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = idShort
+            };
+
+            var first = new Aas.SubmodelElementCollection
+            {
+                IdShort = "first",
+                Value = new List<Aas.ISubmodelElement>
+                {
+                    shared,
+                    new Aas.Property(Aas.DataTypeDefXsd.String)
+                    {
+                        IdShort = "anotherProperty"
+                    }
+                }
+            };
+
+            var second = new Aas.SubmodelElementCollection
+            {
+                IdShort = "second",
+                Value = new List<Aas.ISubmodelElement> { shared }
+            };
+
+            var environment = new Aas.Environment(
+                null,
+                new List<Aas.ISubmodel>
+                {
+                    new Aas.Submodel("urn:some-submodel")
+                    {
+                        SubmodelElements = new List<Aas.ISubmodelElement>
+                        {
+                            first, second
+                        }
+                    }
+                });
+
+            return (environment, shared, first, second);
+        }
+
+        [Test]
+        public void Test_shared_child_removed_from_one_container()
+        {
+            var (environment, shared, first, _) =
+                BuildEnvironmentWithSharedChild("1invalid");
+
+            var cache = new Aas.Verification.Cache(environment);
+            Assert.AreEqual(2, cache.Verify().Count);
+
+            first.Value!.Remove(shared);
+            cache.MarkDirty(first);
+            Assert.AreEqual(1, cache.Verify().Count);
+            AssertSameAsVerify(environment, cache, "removed from one container");
+
+            // The shared child is still held by the other container.
+            shared.IdShort = "valid";
+            cache.MarkDirty(shared);
+            Assert.IsEmpty(cache.Verify());
+        }
+
+        [Test]
+        public void Test_shared_child_marks_all_ancestors()
+        {
+            var (environment, shared, _, _) =
+                BuildEnvironmentWithSharedChild("valid");
+
+            var cache = new Aas.Verification.Cache(environment);
+            Assert.IsEmpty(cache.Verify());
+
+            shared.IdShort = "1invalid";
+            cache.MarkDirty(shared);
+            Assert.AreEqual(2, cache.Verify().Count);
+            AssertSameAsVerify(environment, cache, "invalidated shared child");
+        }
+
+        [Test]
+        public void Test_unmarked_changes_are_not_re_verified()
+        {
+            var (environment, property, _) = BuildEnvironment();
+
+            var cache = new Aas.Verification.Cache(environment);
+            Assert.IsEmpty(cache.Verify());
+
+            property.Value = "not a number";
+            Assert.IsEmpty(cache.Verify());
+
+            cache.MarkDirty(property);
+            Assert.AreEqual(1, cache.Verify().Count);
+        }
+    }
+}
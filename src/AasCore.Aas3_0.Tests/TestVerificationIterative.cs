@@ -0,0 +1,93 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVerificationIterative
+    {
+        [Test]
+        public void Test_same_as_recursive()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                Assert.AreEqual(
+                    Aas.Tests.Common.RenderErrors(
+                        Aas.Verification.Verify(environment)),
+                    Aas.Tests.Common.RenderErrors(
+                        Aas.Verification.VerifyIteratively(environment)),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_same_as_recursive_on_instances_outside_environment()
+        {
+            var paths = Aas.Tests.Common.CollectJsonPaths(
+                "Json", "SelfContained", "Unexpected", "Invalid")
+                .Where(path => path.Contains("EventPayload"))
+                .ToList();
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                var eventPayload = Aas.Jsonization.Deserialize.EventPayloadFrom(
+                    Aas.Tests.CommonJson.ReadFromFile(path));
+
+                var expected = Aas.Tests.Common.RenderErrors(
+                    Aas.Verification.Verify(eventPayload));
+                Assert.IsNotEmpty(expected, path);
+
+                Assert.AreEqual(
+                    expected,
+                    Aas.Tests.Common.RenderErrors(
+                        Aas.Verification.VerifyIteratively(eventPayload)),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_deep_nesting()
+        {
+            const int depth = 500;
+
+            // The innermost property has an invalid ID-short.
+            Aas.ISubmodelElement element = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "1invalid",
+                Value = "1"
+            };
+
+            for (int i = 0; i < depth; i++)
+            {
+                element = new Aas.SubmodelElementCollection
+                {
+                    IdShort = $"collection{i}",
+                    Value = new List<Aas.ISubmodelElement> { element }
+                };
+            }
+
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                SubmodelElements = new List<Aas.ISubmodelElement> { element }
+            };
+
+            var errors = Aas.Tests.Common.RenderErrors(
+                Aas.Verification.VerifyIteratively(submodel));
+
+            Assert.AreEqual(
+                Aas.Tests.Common.RenderErrors(Aas.Verification.Verify(submodel)),
+                errors);
+
+            Assert.AreEqual(1, errors.Count);
+            Assert.IsTrue(
+                errors[0].StartsWith(
+                    "submodelElements[0]" +
+                    string.Concat(Enumerable.Repeat(".value[0]", depth)) +
+                    ".idShort: "),
+                errors[0]);
+        }
+    }
+}
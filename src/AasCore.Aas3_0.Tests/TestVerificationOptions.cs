@@ -0,0 +1,219 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVerificationOptions
+    {
+        private static List<string> VerifyWith(
+            Aas.IClass instance,
+            Aas.Verification.Options options)
+        {
+            return Aas.Tests.Common.RenderErrors(
+                Aas.Verification.Verify(instance, options));
+        }
+
+        [Test]
+        public void Test_default_options_same_as_verify()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                Assert.AreEqual(
+                    Aas.Tests.Common.RenderErrors(
+                        Aas.Verification.Verify(environment)),
+                    VerifyWith(environment, new Aas.Verification.Options()),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_max_error_count_gives_the_first_errors()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var expected = Aas.Tests.Common.RenderErrors(
+                    Aas.Verification.Verify(environment));
+
+                foreach (int maxErrorCount in new[] { 0, 1, 2, 5 })
+                {
+                    Assert.AreEqual(
+                        expected.Take(maxErrorCount).ToList(),
+                        VerifyWith(
+                            environment,
+                            new Aas.Verification.Options
+                            {
+                                MaxErrorCount = maxErrorCount
+                            }),
+                        $"{path} with the maximum error count {maxErrorCount}");
+                }
+
+                Assert.AreEqual(
+                    expected.Take(1).ToList(),
+                    VerifyWith(
+                        environment,
+                        new Aas.Verification.Options
+                        {
+                            StopAtFirstError = true
+                        }),
+                    $"{path} when stopping at the first error");
+            }
+        }
+
+        [Test]
+        public void Test_negative_max_error_count_fails()
+        {
+            Assert.Throws<System.ArgumentException>(
+                () => Aas.Verification.Verify(
+                    new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something"),
+                    new Aas.Verification.Options
+                    {
+                        MaxErrorCount = -1
+                    }));
+        }
+
+        private static bool IsSubsequence(List<string> subsequence, List<string> sequence)
+        {
+            int i = 0;
+            foreach (var item in sequence)
+            {
+                if (i < subsequence.Count && subsequence[i] == item)
+                {
+                    i++;
+                }
+            }
+
+            return i == subsequence.Count;
+        }
+
+        [Test]
+        public void Test_subset_of_checks_gives_a_subsequence()
+        {
+            var subsets = new[]
+            {
+                Aas.Verification.Checks.Invariants,
+                Aas.Verification.Checks.Constraints,
+                Aas.Verification.Checks.ValueTypes,
+                Aas.Verification.Checks.ConstrainedPrimitives,
+                Aas.Verification.Checks.Enumerations
+            };
+
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var expected = Aas.Tests.Common.RenderErrors(
+                    Aas.Verification.Verify(environment));
+
+                Assert.IsEmpty(
+                    VerifyWith(
+                        environment,
+                        new Aas.Verification.Options
+                        {
+                            Checks = Aas.Verification.Checks.None
+                        }),
+                    path);
+
+                foreach (var checks in subsets)
+                {
+                    var got = VerifyWith(
+                        environment,
+                        new Aas.Verification.Options
+                        {
+                            Checks = checks
+                        });
+
+                    Assert.IsTrue(
+                        IsSubsequence(got, expected),
+                        $"{path} with the checks {checks}");
+                }
+            }
+        }
+
+        [Test]
+        public void Test_constraints_are_skipped()
+        {
+            var submodel = new Aas.Submodel("urn:some-submodel")
+            {
+                // Violates AASd-118 as the semantic ID is missing.
+                SupplementalSemanticIds = new List<Aas.IReference>
+                {
+                    new Aas.Reference(
+                        Aas.ReferenceTypes.ExternalReference,
+                        new List<Aas.IKey>
+                        {
+                            new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something")
+                        })
+                }
+            };
+
+            Assert.AreEqual(
+                1,
+                VerifyWith(submodel, new Aas.Verification.Options()).Count);
+
+            Assert.IsEmpty(
+                VerifyWith(
+                    submodel,
+                    new Aas.Verification.Options
+                    {
+                        Checks = Aas.Verification.Checks.All
+                            & ~Aas.Verification.Checks.Constraints
+                    }));
+        }
+
+        [Test]
+        public void Test_value_types_are_skipped()
+        {
+            var property = new Aas.Property(Aas.DataTypeDefXsd.Int)
+            {
+                IdShort = "someProperty",
+                Value = "not a number"
+            };
+
+            Assert.IsNotEmpty(
+                VerifyWith(property, new Aas.Verification.Options()));
+
+            Assert.IsEmpty(
+                VerifyWith(
+                    property,
+                    new Aas.Verification.Options
+                    {
+                        Checks = Aas.Verification.Checks.All
+                            & ~Aas.Verification.Checks.ValueTypes
+                    }));
+        }
+
+        [Test]
+        public void Test_constrained_primitives_and_enumerations_are_skipped()
+        {
+            var property = new Aas.Property((Aas.DataTypeDefXsd)12345)
+            {
+                IdShort = "1invalid"
+            };
+
+            Assert.AreEqual(
+                2,
+                VerifyWith(property, new Aas.Verification.Options()).Count);
+
+            Assert.AreEqual(
+                1,
+                VerifyWith(
+                    property,
+                    new Aas.Verification.Options
+                    {
+                        Checks = Aas.Verification.Checks.All
+                            & ~Aas.Verification.Checks.ConstrainedPrimitives
+                    }).Count);
+
+            Assert.AreEqual(
+                1,
+                VerifyWith(
+                    property,
+                    new Aas.Verification.Options
+                    {
+                        Checks = Aas.Verification.Checks.All
+                            & ~Aas.Verification.Checks.Enumerations
+                    }).Count);
+        }
+    }
+}
@@ -0,0 +1,58 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVerificationParallel
+    {
+        [Test]
+        public void Test_same_as_sequential()
+        {
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                Assert.AreEqual(
+                    Aas.Tests.Common.RenderErrors(Aas.Verification.Verify(environment)),
+                    Aas.Tests.Common.RenderErrors(Aas.Verification.VerifyParallel(environment)),
+                    path);
+            }
+        }
+
+        [Test]
+        public void Test_environment_invariants_and_degree_of_parallelism()
+        {
+            var submodels = new List<Aas.ISubmodel>();
+            for (int i = 0; i < 100; i++)
+            {
+                submodels.Add(
+                    new Aas.Submodel(
+                        // Every third ID is invalid as it is empty.
+                        i % 3 == 0 ? "" : $"urn:some-submodel:{i}"));
+            }
+
+            var environment = new Aas.Environment(
+                new List<Aas.IAssetAdministrationShell>(),
+                submodels,
+                new List<Aas.IConceptDescription>());
+
+            var expected = Aas.Tests.Common.RenderErrors(Aas.Verification.Verify(environment));
+            Assert.IsNotEmpty(expected);
+
+            foreach (int degree in new[] { 1, 4, -1 })
+            {
+                Assert.AreEqual(
+                    expected,
+                    Aas.Tests.Common.RenderErrors(
+                        Aas.Verification.VerifyParallel(
+                            environment,
+                            new System.Threading.Tasks.ParallelOptions
+                            {
+                                MaxDegreeOfParallelism = degree
+                            })),
+                    $"MaxDegreeOfParallelism {degree}");
+            }
+        }
+    }
+}
@@ -0,0 +1,144 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVerificationPatternCache
+    {
+        private static void WithPatternCache(
+            Aas.Verification.PatternCache cache,
+            System.Action action)
+        {
+            var previous = Aas.Verification.CurrentPatternCache;
+            Aas.Verification.CurrentPatternCache = cache;
+            try
+            {
+                action();
+            }
+            finally
+            {
+                Aas.Verification.CurrentPatternCache = previous;
+            }
+        }
+
+        [Test]
+        public void Test_hits_and_misses()
+        {
+            var cache = new Aas.Verification.PatternCache(16);
+
+            WithPatternCache(cache, () =>
+            {
+                Assert.IsTrue(Aas.Verification.Patterns.MatchesIdShort("someProperty"));
+                Assert.IsTrue(Aas.Verification.Patterns.MatchesIdShort("someProperty"));
+                Assert.IsFalse(Aas.Verification.Patterns.MatchesIdShort("1invalid"));
+                Assert.IsFalse(Aas.Verification.Patterns.MatchesIdShort("1invalid"));
+
+                // The same text is cached separately for a different pattern.
+                Assert.IsTrue(Aas.Verification.Patterns.MatchesXsString("someProperty"));
+            });
+
+            Assert.AreEqual(2, cache.Hits);
+            Assert.AreEqual(3, cache.Misses);
+            Assert.AreEqual(3, cache.Count);
+
+            cache.Clear();
+            Assert.AreEqual(0, cache.Hits);
+            Assert.AreEqual(0, cache.Misses);
+            Assert.AreEqual(0, cache.Count);
+        }
+
+        [Test]
+        public void Test_least_recently_used_is_evicted()
+        {
+            var cache = new Aas.Verification.PatternCache(2);
+
+            WithPatternCache(cache, () =>
+            {
+                Aas.Verification.Patterns.MatchesIdShort("a");
+                Aas.Verification.Patterns.MatchesIdShort("b");
+                Aas.Verification.Patterns.MatchesIdShort("a");
+
+                // Evicts "b" as "a" has been used more recently.
+                Aas.Verification.Patterns.MatchesIdShort("c");
+                Assert.AreEqual(2, cache.Count);
+
+                cache.Clear();
+                Aas.Verification.Patterns.MatchesIdShort("x");
+                Aas.Verification.Patterns.MatchesIdShort("y");
+                Aas.Verification.Patterns.MatchesIdShort("x");
+                Aas.Verification.Patterns.MatchesIdShort("z");
+
+                Aas.Verification.Patterns.MatchesIdShort("x");
+                Assert.AreEqual(2, cache.Hits);
+
+                Aas.Verification.Patterns.MatchesIdShort("y");
+                Assert.AreEqual(2, cache.Hits);
+            });
+        }
+
+        [Test]
+        public void Test_invalid_capacity()
+        {
+            Assert.Throws<System.ArgumentException>(
+                () => new Aas.Verification.PatternCache(0));
+        }
+
+        [Test]
+        public void Test_same_errors_with_cache()
+        {
+            var cache = new Aas.Verification.PatternCache(1024);
+
+            foreach (var (path, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                var expected = Aas.Tests.Common.RenderErrors(
+                    Aas.Verification.Verify(environment));
+
+                WithPatternCache(cache, () =>
+                {
+                    Assert.AreEqual(
+                        expected,
+                        Aas.Tests.Common.RenderErrors(
+                            Aas.Verification.VerifyIteratively(environment)),
+                        path);
+
+                    Assert.AreEqual(
+                        expected,
+                        Aas.Tests.Common.RenderErrors(
+                            Aas.Verification.VerifyParallel(environment)),
+                        path);
+                });
+            }
+
+            Assert.Greater(cache.Hits, 0);
+            Assert.LessOrEqual(cache.Count, cache.Capacity);
+        }
+
+        [Test]
+        public void Test_concurrent_matches()
+        {
+            var texts = Enumerable.Range(0, 1000)
+                .Select(i => i % 3 == 0 ? $"{i}invalid" : $"valid{i % 100}")
+                .ToList();
+
+            var expected = texts.Select(Aas.Verification.MatchesIdShort).ToList();
+
+            var cache = new Aas.Verification.PatternCache(50);
+            var got = new bool[texts.Count];
+
+            WithPatternCache(cache, () =>
+            {
+                System.Threading.Tasks.Parallel.For(
+                    0,
+                    texts.Count,
+                    i => { got[i] = Aas.Verification.Patterns.MatchesIdShort(texts[i]); });
+            });
+
+            Assert.AreEqual(expected, got.ToList());
+            Assert.AreEqual(texts.Count, cache.Hits + cache.Misses);
+            Assert.LessOrEqual(cache.Count, 50);
+        }
+    }
+}
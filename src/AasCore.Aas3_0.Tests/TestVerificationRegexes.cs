@@ -0,0 +1,130 @@
+using Aas = AasCore.Aas3_0; // renamed
+using Regex = System.Text.RegularExpressions.Regex;
+using RegexOptions = System.Text.RegularExpressions.RegexOptions;
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVerificationRegexes
+    {
+        [Test]
+        public void Test_prewarm_regexes()
+        {
+            Aas.Verification.PrewarmRegexes();
+            Aas.Verification.PrewarmRegexes();
+
+            Assert.IsTrue(Aas.Verification.Patterns.MatchesIdShort("someProperty"));
+            Assert.IsFalse(Aas.Verification.Patterns.MatchesIdShort("1invalid"));
+        }
+
+        /// <summary>
+        /// Collect the string values of all the JSON files in the test data.
+        /// </summary>
+        private static List<string> CollectTexts()
+        {
+            var texts = new List<string>();
+
+            var stack = new List<System.Text.Json.Nodes.JsonNode?>();
+            foreach (var path in Aas.Tests.Common.CollectJsonPaths("Json"))
+            {
+                stack.Add(Aas.Tests.CommonJson.ReadFromFile(path));
+            }
+
+            while (stack.Count > 0)
+            {
+                var node = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                switch (node)
+                {
+                    case System.Text.Json.Nodes.JsonObject jsonObject:
+                        stack.AddRange(jsonObject.Select(pair => pair.Value));
+                        break;
+                    case System.Text.Json.Nodes.JsonArray jsonArray:
+                        stack.AddRange(jsonArray);
+                        break;
+                    case System.Text.Json.Nodes.JsonValue jsonValue:
+                        if (jsonValue.TryGetValue<string>(out var text))
+                        {
+                            texts.Add(text);
+                        }
+                        break;
+                }
+            }
+
+            return texts;
+        }
+
+        private static List<Regex> CollectRegexes()
+        {
+            return typeof(Aas.Verification.Patterns)
+                .GetFields(
+                    System.Reflection.BindingFlags.NonPublic
+                    | System.Reflection.BindingFlags.Static)
+                .Where(field => field.FieldType == typeof(Regex))
+                .Select(field => (Regex)field.GetValue(null)!)
+                .ToList();
+        }
+
+        private static long Measure(Regex regex, List<string> texts, int repetitions)
+        {
+            var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+            for (int i = 0; i < repetitions; i++)
+            {
+                foreach (var text in texts)
+                {
+                    regex.IsMatch(text);
+                }
+            }
+            stopwatch.Stop();
+            return stopwatch.ElapsedTicks;
+        }
+
+        [Test]
+        [Explicit("Benchmark")]
+        public void Test_benchmark_compiled_against_interpreted_regexes()
+        {
+            const int repetitions = 10;
+
+            var texts = CollectTexts();
+            Assert.IsNotEmpty(texts);
+
+            var regexes = CollectRegexes();
+            Assert.IsNotEmpty(regexes);
+
+            long compiledTicks = 0;
+            long interpretedTicks = 0;
+
+            foreach (var compiled in regexes)
+            {
+                Assert.IsTrue(
+                    (compiled.Options & RegexOptions.Compiled) != 0,
+                    $"Expected the regex to be compiled: {compiled}");
+
+                var interpreted = new Regex(
+                    compiled.ToString(),
+                    compiled.Options & ~RegexOptions.Compiled);
+
+                foreach (var text in texts)
+                {
+                    Assert.AreEqual(
+                        interpreted.IsMatch(text),
+                        compiled.IsMatch(text),
+                        $"Mismatch between {compiled} and {text}");
+                }
+
+                compiledTicks += Measure(compiled, texts, repetitions);
+                interpretedTicks += Measure(interpreted, texts, repetitions);
+            }
+
+            System.Console.WriteLine(
+                $"Matched {regexes.Count} regexes against {texts.Count} texts " +
+                $"from the test data {repetitions} times: " +
+                $"compiled {compiledTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms, " +
+                $"interpreted {interpretedTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms");
+        }
+    }
+}
@@ -0,0 +1,331 @@
+using Aas = AasCore.Aas3_0; // renamed
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestVisitationParallel
+    {
+        /// <summary>
+        /// Record the visited instances in pre-order.
+        /// </summary>
+        private class Recorder : Aas.Visitation.VisitorThrough
+        {
+            internal readonly List<Aas.IClass> Visited = new List<Aas.IClass>();
+
+            public override void Visit(Aas.IClass that)
+            {
+                Visited.Add(that);
+                base.Visit(that);
+            }
+        }
+
+        /// <summary>
+        /// Implement a visitor or a transformer interface with a single function
+        /// of the call arguments.
+        /// </summary>
+        /// <remarks>
+        /// The parallel visitation only calls the main dispatching method,
+        /// <c>Visit</c> or <c>Transform</c>, with the root as the first argument,
+        /// so we need not implement the methods for the individual classes.
+        /// </remarks>
+        private class Dispatching : System.Reflection.DispatchProxy
+        {
+            private System.Func<object?[], object?> _function = null!;
+
+            internal static TInterface Create<TInterface>(
+                System.Func<object?[], object?> function)
+            {
+                var proxy = Create<TInterface, Dispatching>();
+                ((Dispatching)(object)proxy!)._function = function;
+                return proxy;
+            }
+
+            protected override object? Invoke(
+                System.Reflection.MethodInfo? targetMethod,
+                object?[]? args)
+            {
+                Assert.IsTrue(
+                    targetMethod!.Name == "Visit" || targetMethod.Name == "Transform",
+                    $"Unexpected call to {targetMethod.Name}");
+                return _function(args!);
+            }
+        }
+
+        /// <summary>
+        /// Add the instance and all its descendants to the context in pre-order,
+        /// and count them.
+        /// </summary>
+        private static int Collect(Aas.IClass that, List<Aas.IClass> context)
+        {
+            context.Add(that);
+            int count = 1;
+            foreach (var descendant in that.Descend())
+            {
+                context.Add(descendant);
+                count++;
+            }
+            return count;
+        }
+
+        /// <summary>
+        /// Count the instance and all its descendants.
+        /// </summary>
+        private static Aas.Visitation.ITransformer<int> Counter()
+        {
+            return Dispatching.Create<Aas.Visitation.ITransformer<int>>(
+                args => 1 + ((Aas.IClass)args[0]!).Descend().Count());
+        }
+
+        /// <summary>
+        /// Count the instance and all its descendants, and collect them in
+        /// the context in pre-order.
+        /// </summary>
+        private static Aas.Visitation.ITransformerWithContext<List<Aas.IClass>, int>
+            ContextCounter()
+        {
+            return Dispatching.Create<
+                Aas.Visitation.ITransformerWithContext<List<Aas.IClass>, int>>(
+                args => Collect((Aas.IClass)args[0]!, (List<Aas.IClass>)args[1]!));
+        }
+
+        /// <summary>
+        /// Collect the instance and all its descendants in the context in pre-order.
+        /// </summary>
+        private static Aas.Visitation.IVisitorWithContext<List<Aas.IClass>> Collector()
+        {
+            return Dispatching.Create<
+                Aas.Visitation.IVisitorWithContext<List<Aas.IClass>>>(
+                args => Collect((Aas.IClass)args[0]!, (List<Aas.IClass>)args[1]!));
+        }
+
+        /// <summary>
+        /// Collect the roots of all the test environments so that there are
+        /// enough of them for many partitions.
+        /// </summary>
+        private static List<Aas.IClass> LoadRoots()
+        {
+            var roots = new List<Aas.IClass>();
+            foreach (var (_, environment) in Aas.Tests.Common.LoadEnvironments())
+            {
+                roots.AddRange(Aas.Visitation.Identifiables(environment));
+            }
+            return roots;
+        }
+
+        private static List<Aas.IClass> VisitSequentially(IEnumerable<Aas.IClass> roots)
+        {
+            var result = new List<Aas.IClass>();
+            foreach (var root in roots)
+            {
+                result.Add(root);
+                result.AddRange(root.Descend());
+            }
+            return result;
+        }
+
+        private static void AssertSameInstances(
+            List<Aas.IClass> expected,
+            List<Aas.IClass> got)
+        {
+            Assert.AreEqual(expected.Count, got.Count);
+            for (int i = 0; i < expected.Count; i++)
+            {
+                Assert.AreSame(expected[i], got[i], $"at {i}");
+            }
+        }
+
+        private static List<Aas.IClass> Concatenate(
+            List<Aas.IClass> left,
+            List<Aas.IClass> right)
+        {
+            left.AddRange(right);
+            return left;
+        }
+
+        private static IEnumerable<System.Threading.Tasks.ParallelOptions?> AllOptions()
+        {
+            yield return null;
+            yield return new System.Threading.Tasks.ParallelOptions
+            {
+                MaxDegreeOfParallelism = 1
+            };
+            yield return new System.Threading.Tasks.ParallelOptions
+            {
+                MaxDegreeOfParallelism = 3,
+                TaskScheduler = System.Threading.Tasks.TaskScheduler.Default
+            };
+        }
+
+        [Test]
+        public void Test_identifiables()
+        {
+            var environment = Aas.Tests.Common.MakeEnvironment();
+
+            var expected = new List<Aas.IClass>();
+            expected.AddRange(environment.OverAssetAdministrationShellsOrEmpty());
+            expected.AddRange(environment.OverSubmodelsOrEmpty());
+            expected.AddRange(environment.OverConceptDescriptionsOrEmpty());
+
+            AssertSameInstances(expected, Aas.Visitation.Identifiables(environment));
+        }
+
+        [Test]
+        public void Test_visit_parallel_same_as_sequential()
+        {
+            var roots = LoadRoots();
+            var expected = VisitSequentially(roots);
+
+            foreach (var parallelOptions in AllOptions())
+            {
+                var recorder = Aas.Visitation.VisitParallel(
+                    roots,
+                    () => new Recorder(),
+                    (left, right) =>
+                    {
+                        left.Visited.AddRange(right.Visited);
+                        return left;
+                    },
+                    parallelOptions);
+
+                AssertSameInstances(expected, recorder.Visited);
+            }
+        }
+
+        [Test]
+        public void Test_visit_parallel_with_context_same_as_sequential()
+        {
+            var roots = LoadRoots();
+            var expected = VisitSequentially(roots);
+
+            foreach (var parallelOptions in AllOptions())
+            {
+                var visited = Aas.Visitation.VisitParallel(
+                    roots,
+                    Collector,
+                    () => new List<Aas.IClass>(),
+                    Concatenate,
+                    parallelOptions);
+
+                AssertSameInstances(expected, visited);
+            }
+        }
+
+        [Test]
+        public void Test_transform_parallel_same_as_sequential()
+        {
+            var roots = LoadRoots();
+            int expected = VisitSequentially(roots).Count;
+
+            foreach (var parallelOptions in AllOptions())
+            {
+                int count = Aas.Visitation.TransformParallel(
+                    roots,
+                    Counter,
+                    () => 0,
+                    (left, right) => left + right,
+                    parallelOptions);
+
+                Assert.AreEqual(expected, count);
+            }
+        }
+
+        [Test]
+        public void Test_transform_parallel_with_context_same_as_sequential()
+        {
+            var roots = LoadRoots();
+            int expected = VisitSequentially(roots).Count;
+
+            foreach (var parallelOptions in AllOptions())
+            {
+                var contexts = new System.Collections.Concurrent.ConcurrentBag<
+                    List<Aas.IClass>>();
+
+                int count = Aas.Visitation.TransformParallel(
+                    roots,
+                    ContextCounter,
+                    () =>
+                    {
+                        var context = new List<Aas.IClass>();
+                        contexts.Add(context);
+                        return context;
+                    },
+                    () => 0,
+                    (left, right) => left + right,
+                    parallelOptions);
+
+                Assert.AreEqual(expected, count);
+                Assert.AreEqual(expected, contexts.Sum(context => context.Count));
+            }
+        }
+
+        [Test]
+        public void Test_no_roots()
+        {
+            var empty = new List<Aas.IClass>();
+
+            Assert.IsEmpty(
+                Aas.Visitation.VisitParallel(
+                    empty,
+                    () => new Recorder(),
+                    (left, right) => left).Visited);
+
+            Assert.AreEqual(
+                0,
+                Aas.Visitation.TransformParallel(
+                    empty,
+                    Counter,
+                    () => 0,
+                    (left, right) => left + right));
+        }
+
+        [Test]
+        [Explicit("Benchmark")]
+        public void Test_benchmark_transform_parallel_against_sequential()
+        {
+            const int repetitions = 10;
+
+            var roots = LoadRoots();
+            var counter = Counter();
+
+            long Measure(System.Func<int> count)
+            {
+                var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+                for (int i = 0; i < repetitions; i++)
+                {
+                    Assert.Greater(count(), 0);
+                }
+                return stopwatch.ElapsedTicks;
+            }
+
+            int Sequential()
+            {
+                return roots.Sum(root => counter.Transform(root));
+            }
+
+            int Parallel()
+            {
+                return Aas.Visitation.TransformParallel(
+                    roots,
+                    Counter,
+                    () => 0,
+                    (left, right) => left + right);
+            }
+
+            // Warm up the just-in-time compilation.
+            Measure(Sequential);
+            Measure(Parallel);
+
+            long sequentialTicks = Measure(Sequential);
+            long parallelTicks = Measure(Parallel);
+
+            System.Console.WriteLine(
+                $"Counted the descendants of {roots.Count} roots {repetitions} times " +
+                $"on {System.Environment.ProcessorCount} processors: " +
+                $"sequential {sequentialTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms, " +
+                $"parallel {parallelTicks * 1000 / System.Diagnostics.Stopwatch.Frequency} ms");
+        }
+    }
+}
@@ -0,0 +1,195 @@
+using Aas = AasCore.Aas3_0; // renamed
+using Directory = System.IO.Directory;
+using Path = System.IO.Path;
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestXmlizationAsync
+    {
+        private static List<string> CollectPaths(params string[] parts)
+        {
+            var paths = Directory.GetFiles(
+                Path.Combine(
+                    new[] { Aas.Tests.Common.TestDataDir }.Concat(parts).ToArray()),
+                "*.xml",
+                System.IO.SearchOption.AllDirectories).ToList();
+            paths.Sort();
+            return paths;
+        }
+
+        private static string Xmlize(Aas.IClass instance)
+        {
+            using var stream = new System.IO.MemoryStream();
+            using (var writer = System.Xml.XmlWriter.Create(stream))
+            {
+                Aas.Xmlization.Serialize.To(instance, writer);
+            }
+            return System.Text.Encoding.UTF8.GetString(stream.ToArray());
+        }
+
+        [Test]
+        public void Test_round_trip()
+        {
+            var paths = CollectPaths("Xml", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                Aas.Environment expected;
+                using (var xmlReader = System.Xml.XmlReader.Create(path))
+                {
+                    expected = Aas.Xmlization.Deserialize.EnvironmentFrom(xmlReader);
+                }
+
+                using var stream = new System.IO.MemoryStream();
+                Aas.Xmlization.Serialize.ToAsync(expected, stream)
+                    .GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Xmlize(expected),
+                    System.Text.Encoding.UTF8.GetString(stream.ToArray()),
+                    $"Unexpected asynchronous serialization of {path}");
+
+                stream.Position = 0;
+                var got = Aas.Xmlization.Deserialize.EnvironmentFromAsync(stream)
+                    .GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Xmlize(expected),
+                    Xmlize(got),
+                    $"Unexpected asynchronous deserialization of {path}");
+            }
+        }
+
+        [Test]
+        public void Test_to_async_over_many_flushes()
+        {
+            var submodels = new List<Aas.ISubmodel>();
+            for (int i = 0; i < 10000; i++)
+            {
+                submodels.Add(new Aas.Submodel($"urn:some-submodel:{i}"));
+            }
+            var environment = new Aas.Environment(null, submodels);
+
+            var key = new Aas.Key(Aas.KeyTypes.GlobalReference, "urn:something");
+
+            foreach (Aas.IClass instance in new Aas.IClass[] { environment, key })
+            {
+                using var stream = new System.IO.MemoryStream();
+                Aas.Xmlization.Serialize.ToAsync(instance, stream)
+                    .GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Xmlize(instance),
+                    System.Text.Encoding.UTF8.GetString(stream.ToArray()));
+            }
+        }
+
+        private static System.Xml.XmlReader AsyncReader(System.IO.Stream stream)
+        {
+            return System.Xml.XmlReader.Create(
+                stream,
+                new System.Xml.XmlReaderSettings { Async = true });
+        }
+
+        [Test]
+        public void Test_environment_from_async_reader_same_as_sync()
+        {
+            var paths = CollectPaths("Xml", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                Aas.Environment expected;
+                using (var xmlReader = System.Xml.XmlReader.Create(path))
+                {
+                    expected = Aas.Xmlization.Deserialize.EnvironmentFrom(xmlReader);
+                }
+
+                using var stream = System.IO.File.OpenRead(path);
+                using var reader = AsyncReader(stream);
+                var got = Aas.Xmlization.Deserialize.EnvironmentFromAsync(reader)
+                    .GetAwaiter().GetResult();
+
+                Assert.AreEqual(
+                    Xmlize(expected),
+                    Xmlize(got),
+                    $"Unexpected asynchronous deserialization of {path}");
+            }
+        }
+
+        [Test]
+        public void Test_environment_from_async_reader_errors_same_as_sync()
+        {
+            var paths = CollectPaths("Xml", "ContainedInEnvironment", "Unexpected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                string? expected = null;
+                try
+                {
+                    using var xmlReader = System.Xml.XmlReader.Create(path);
+                    Aas.Xmlization.Deserialize.EnvironmentFrom(xmlReader);
+                }
+                catch (Aas.Xmlization.Exception exception)
+                {
+                    expected = exception.Message;
+                }
+                catch (System.Xml.XmlException)
+                {
+                    continue;
+                }
+
+                // Only the errors within the identifiables are reported
+                // in the same manner.
+                if (expected == null || !expected.Contains("/*["))
+                {
+                    continue;
+                }
+
+                using var stream = System.IO.File.OpenRead(path);
+                using var reader = AsyncReader(stream);
+                var got = Assert.Catch<Aas.Xmlization.Exception>(
+                    () => Aas.Xmlization.Deserialize.EnvironmentFromAsync(reader)
+                        .GetAwaiter().GetResult());
+                Assert.AreEqual(expected, got.Message, path);
+            }
+        }
+
+        [Test]
+        public void Test_environment_from_async_reader_needs_async()
+        {
+            var bytes = System.Text.Encoding.UTF8.GetBytes(
+                "<environment xmlns=\"https://admin-shell.io/aas/3/0\"/>");
+
+            using var reader = System.Xml.XmlReader.Create(
+                new System.IO.MemoryStream(bytes));
+            Assert.Catch<System.ArgumentException>(
+                () => Aas.Xmlization.Deserialize.EnvironmentFromAsync(reader)
+                    .GetAwaiter().GetResult());
+
+            using var asyncReader = AsyncReader(new System.IO.MemoryStream(bytes));
+            var environment = Aas.Xmlization.Deserialize.EnvironmentFromAsync(asyncReader)
+                .GetAwaiter().GetResult();
+            Assert.IsNull(environment.Submodels);
+        }
+
+        [Test]
+        public void Test_environment_from_async_error()
+        {
+            var bytes = System.Text.Encoding.UTF8.GetBytes(
+                "<?xml version=\"1.0\" encoding=\"utf-8\"?>" +
+                "<environment xmlns=\"https://admin-shell.io/aas/3/0\">" +
+                "<submodels><submodel></submodel></submodels></environment>");
+
+            Assert.Catch<Aas.Xmlization.Exception>(
+                () => Aas.Xmlization.Deserialize.EnvironmentFromAsync(
+                    new System.IO.MemoryStream(bytes)).GetAwaiter().GetResult());
+        }
+    }
+}
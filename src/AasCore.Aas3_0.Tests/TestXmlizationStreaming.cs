@@ -0,0 +1,202 @@
+using Aas = AasCore.Aas3_0; // renamed
+using Directory = System.IO.Directory;
+using Path = System.IO.Path;
+
+using System.Collections.Generic; // can't alias
+using System.Linq; // can't alias
+using NUnit.Framework; // can't alias
+
+namespace AasCore.Aas3_0.Tests
+{
+    public class TestXmlizationStreaming
+    {
+        private static List<string> CollectPaths(params string[] parts)
+        {
+            var paths = Directory.GetFiles(
+                Path.Combine(
+                    new[] { Aas.Tests.Common.TestDataDir }.Concat(parts).ToArray()),
+                "*.xml",
+                System.IO.SearchOption.AllDirectories).ToList();
+            paths.Sort();
+            return paths;
+        }
+
+        private static List<string> Xmlize(IEnumerable<Aas.IIdentifiable> identifiables)
+        {
+            var result = new List<string>();
+            foreach (var identifiable in identifiables)
+            {
+                var builder = new System.Text.StringBuilder();
+                using (var writer = System.Xml.XmlWriter.Create(builder))
+                {
+                    Aas.Xmlization.Serialize.To(identifiable, writer);
+                }
+                result.Add(builder.ToString());
+            }
+            return result;
+        }
+
+        private static List<Aas.IIdentifiable> IdentifiablesOf(Aas.Environment environment)
+        {
+            var result = new List<Aas.IIdentifiable>();
+            result.AddRange(
+                environment.AssetAdministrationShells
+                ?? new List<Aas.IAssetAdministrationShell>());
+            result.AddRange(
+                environment.Submodels
+                ?? new List<Aas.ISubmodel>());
+            result.AddRange(
+                environment.ConceptDescriptions
+                ?? new List<Aas.IConceptDescription>());
+            return result;
+        }
+
+        private static System.Xml.XmlReader ReaderOf(Aas.Environment environment)
+        {
+            var builder = new System.Text.StringBuilder();
+            using (var writer = System.Xml.XmlWriter.Create(
+                       builder,
+                       new System.Xml.XmlWriterSettings { OmitXmlDeclaration = true }))
+            {
+                Aas.Xmlization.Serialize.To(environment, writer);
+            }
+
+            return System.Xml.XmlReader.Create(
+                new System.IO.StringReader(builder.ToString()));
+        }
+
+        [Test]
+        public void Test_identifiables_same_as_from_environment()
+        {
+            var paths = CollectPaths("Xml", "ContainedInEnvironment", "Expected");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                Aas.Environment environment;
+                using (var xmlReader = System.Xml.XmlReader.Create(path))
+                {
+                    environment = Aas.Xmlization.Deserialize.EnvironmentFrom(xmlReader);
+                }
+
+                List<Aas.IIdentifiable> got;
+                using (var xmlReader = System.Xml.XmlReader.Create(path))
+                {
+                    got = Aas.Xmlization.DeserializeStreaming.IdentifiablesFrom(
+                        xmlReader).ToList();
+                }
+
+                Assert.AreEqual(
+                    Xmlize(IdentifiablesOf(environment)),
+                    Xmlize(got),
+                    $"Unexpected incremental deserialization of {path}");
+            }
+        }
+
+        [Test]
+        public void Test_errors_same_as_from_environment()
+        {
+            var paths = CollectPaths(
+                "Xml", "ContainedInEnvironment", "Unexpected", "Unserializable");
+            Assert.IsNotEmpty(paths);
+
+            foreach (var path in paths)
+            {
+                string? expected = null;
+                using (var xmlReader = System.Xml.XmlReader.Create(path))
+                {
+                    try
+                    {
+                        Aas.Xmlization.Deserialize.EnvironmentFrom(xmlReader);
+                    }
+                    catch (Aas.Xmlization.Exception exception)
+                    {
+                        expected = exception.Message;
+                    }
+                }
+                Assert.IsNotNull(expected, path);
+
+                string? got = null;
+                using (var xmlReader = System.Xml.XmlReader.Create(path))
+                {
+                    try
+                    {
+                        Aas.Xmlization.DeserializeStreaming.IdentifiablesFrom(
+                            xmlReader).ToList();
+                    }
+                    catch (Aas.Xmlization.Exception exception)
+                    {
+                        got = exception.Message;
+                    }
+                }
+
+                Assert.AreEqual(expected, got, path);
+            }
+        }
+
+        [Test]
+        public void Test_sections()
+        {
+            var environment = new Aas.Environment(
+                new List<Aas.IAssetAdministrationShell>
+                {
+                    new Aas.AssetAdministrationShell(
+                        "some-shell",
+                        new Aas.AssetInformation(Aas.AssetKind.Instance))
+                },
+                new List<Aas.ISubmodel>
+                {
+                    new Aas.Submodel("some-submodel"),
+                    new Aas.Submodel("another-submodel")
+                },
+                new List<Aas.IConceptDescription>
+                {
+                    new Aas.ConceptDescription("some-concept-description")
+                });
+
+            using (var xmlReader = ReaderOf(environment))
+            {
+                Assert.AreEqual(
+                    new List<string> { "some-shell" },
+                    Aas.Xmlization.DeserializeStreaming.AssetAdministrationShellsFrom(
+                        xmlReader).Select(shell => shell.Id).ToList());
+            }
+
+            using (var xmlReader = ReaderOf(environment))
+            {
+                Assert.AreEqual(
+                    new List<string> { "some-submodel", "another-submodel" },
+                    Aas.Xmlization.DeserializeStreaming.SubmodelsFrom(
+                        xmlReader).Select(submodel => submodel.Id).ToList());
+            }
+
+            using (var xmlReader = ReaderOf(environment))
+            {
+                Assert.AreEqual(
+                    new List<string> { "some-concept-description" },
+                    Aas.Xmlization.DeserializeStreaming.ConceptDescriptionsFrom(
+                        xmlReader).Select(
+                        conceptDescription => conceptDescription.Id).ToList());
+            }
+        }
+
+        [Test]
+        public void Test_yields_before_the_end_of_input()
+        {
+            // The input is truncated after the first submodel, but we stop before it.
+            var text = (
+                "<environment xmlns=\"https://admin-shell.io/aas/3/0\">" +
+                "<submodels><submodel><id>some-submodel</id></submodel>" +
+                "<submodel><id>another-"
+            );
+
+            using var xmlReader = System.Xml.XmlReader.Create(
+                new System.IO.StringReader(text));
+
+            var first = Aas.Xmlization.DeserializeStreaming.SubmodelsFrom(
+                xmlReader).First();
+
+            Assert.AreEqual("some-submodel", first.Id);
+        }
+    }
+}
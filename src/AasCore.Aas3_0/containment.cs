@@ -0,0 +1,236 @@
+using Aas = AasCore.Aas3_0;  // renamed
+using CodeAnalysis = System.Diagnostics.CodeAnalysis;
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Keep track of which instances contain which, together with a cached entry
+    /// per instance, for the caches which re-compute only the changed parts of
+    /// a model.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The instances are keyed by the reference identity. An instance might be
+    /// shared among more containers, so we track all of its containers. An entry
+    /// is dropped only once no container holds its instance anymore, and marking
+    /// an instance as dirty marks all of its ancestors along all the containers.
+    /// </para>
+    /// <para>
+    /// This class is not thread-safe.
+    /// </para>
+    /// </remarks>
+    internal class Containment<TEntry> where TEntry : class
+    {
+        private class Node
+        {
+            internal TEntry Entry;
+            internal Aas.IClass[] Children;
+            internal bool Dirty;
+
+            internal Node(TEntry entry, Aas.IClass[] children)
+            {
+                Entry = entry;
+                Children = children;
+            }
+        }
+
+        private readonly Aas.IClass _root;
+
+        private readonly Dictionary<Aas.IClass, Node> _nodes =
+            new Dictionary<Aas.IClass, Node>(
+                ReferenceEqualityComparer.Instance);
+
+        /// <summary>
+        /// Map each instance to the distinct instances which contain it
+        /// </summary>
+        /// <remarks>
+        /// A child is registered as soon as its container is put in the cache,
+        /// even though the child itself is put in the cache only afterwards.
+        /// </remarks>
+        private readonly Dictionary<Aas.IClass, List<Aas.IClass>> _containers =
+            new Dictionary<Aas.IClass, List<Aas.IClass>>(
+                ReferenceEqualityComparer.Instance);
+
+        internal Containment(Aas.IClass root)
+        {
+            _root = root;
+        }
+
+        /// <summary>
+        /// Tell whether no entries have been cached so far.
+        /// </summary>
+        internal bool IsEmpty => _nodes.Count == 0;
+
+        /// <summary>
+        /// Retrieve the entry of <paramref name="that" />, if it is in the cache.
+        /// </summary>
+        internal bool TryGetEntry(
+            Aas.IClass that,
+            [CodeAnalysis.MaybeNullWhen(false)] out TEntry entry)
+        {
+            if (_nodes.TryGetValue(that, out var node))
+            {
+                entry = node.Entry;
+                return true;
+            }
+
+            entry = null;
+            return false;
+        }
+
+        /// <summary>
+        /// Retrieve the entry of <paramref name="that" /> which needs to be
+        /// in the cache.
+        /// </summary>
+        internal TEntry EntryOf(Aas.IClass that)
+        {
+            return _nodes[that].Entry;
+        }
+
+        /// <summary>
+        /// Tell whether the entry of <paramref name="that" /> needs to be
+        /// (re-)computed, as it is either dirty or not in the cache.
+        /// </summary>
+        internal bool NeedsUpdate(Aas.IClass that)
+        {
+            return !_nodes.TryGetValue(that, out var node) || node.Dirty;
+        }
+
+        /// <summary>
+        /// Mark <paramref name="that" /> and all its ancestors as dirty.
+        /// </summary>
+        /// <returns>
+        /// False if <paramref name="that" /> is not in the cache
+        /// </returns>
+        internal bool MarkDirty(Aas.IClass that)
+        {
+            if (!_nodes.ContainsKey(that))
+            {
+                return false;
+            }
+
+            var stack = new List<Aas.IClass> { that };
+            while (stack.Count > 0)
+            {
+                var instance = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                var node = _nodes[instance];
+
+                // If the instance is already dirty, so are all its ancestors.
+                if (node.Dirty)
+                {
+                    continue;
+                }
+                node.Dirty = true;
+
+                if (_containers.TryGetValue(instance, out var containers))
+                {
+                    stack.AddRange(containers);
+                }
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        /// Put the freshly computed <paramref name="entry" /> of
+        /// <paramref name="that" /> with its current <paramref name="children" />
+        /// in the cache.
+        /// </summary>
+        /// <remarks>
+        /// The children which <paramref name="that" /> does not contain anymore
+        /// and which are held by no other container are dropped, together
+        /// with their descendants.
+        /// </remarks>
+        internal void Put(
+            Aas.IClass that,
+            TEntry entry,
+            Aas.IClass[] children)
+        {
+            Aas.IClass[] oldChildren;
+            if (_nodes.TryGetValue(that, out var node))
+            {
+                oldChildren = node.Children;
+                node.Entry = entry;
+                node.Children = children;
+                node.Dirty = false;
+            }
+            else
+            {
+                oldChildren = System.Array.Empty<Aas.IClass>();
+                _nodes[that] = new Node(entry, children);
+            }
+
+            var newSet = new HashSet<Aas.IClass>(
+                children, ReferenceEqualityComparer.Instance);
+            var oldSet = new HashSet<Aas.IClass>(
+                oldChildren, ReferenceEqualityComparer.Instance);
+
+            foreach (var child in oldSet)
+            {
+                if (!newSet.Contains(child))
+                {
+                    Release(child, that);
+                }
+            }
+
+            foreach (var child in newSet)
+            {
+                if (!oldSet.Contains(child))
+                {
+                    if (!_containers.TryGetValue(child, out var containers))
+                    {
+                        containers = new List<Aas.IClass>();
+                        _containers[child] = containers;
+                    }
+                    containers.Add(that);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Remove <paramref name="container" /> from the containers of
+        /// <paramref name="child" />, and drop the child with its descendants
+        /// once nothing holds it anymore.
+        /// </summary>
+        private void Release(Aas.IClass child, Aas.IClass container)
+        {
+            var stack = new List<(Aas.IClass, Aas.IClass)> { (child, container) };
+            while (stack.Count > 0)
+            {
+                var (instance, released) = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                if (!_containers.TryGetValue(instance, out var containers))
+                {
+                    continue;
+                }
+
+                containers.RemoveAll(other => ReferenceEquals(other, released));
+                if (containers.Count > 0)
+                {
+                    continue;
+                }
+                _containers.Remove(instance);
+
+                // NOTE: The root is held by the cache itself.
+                if (ReferenceEquals(instance, _root)
+                    || !_nodes.TryGetValue(instance, out var node))
+                {
+                    continue;
+                }
+                _nodes.Remove(instance);
+
+                var children = new HashSet<Aas.IClass>(
+                    node.Children, ReferenceEqualityComparer.Instance);
+                foreach (var grandChild in children)
+                {
+                    stack.Add((grandChild, instance));
+                }
+            }
+        }
+    }  // internal class Containment
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,241 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Iterate over the descendants of the model instances without recursion.
+    /// </summary>
+    /// <remarks>
+    /// <see cref="Aas.IClass.Descend" /> nests one iterator per level of
+    /// the model, so that every yielded instance passes through all the iterators
+    /// of its ancestors. The traversals here keep an explicit stack instead, and
+    /// take constant time per instance regardless of the depth.
+    /// </remarks>
+    public static partial class Descending
+    {
+        /// <summary>
+        /// Tell <see cref="Walk(Aas.IClass, System.Func{Aas.IClass, Control})" />
+        /// how to continue after an instance has been visited.
+        /// </summary>
+        public enum Control
+        {
+            /// <summary>
+            /// Continue with the children of the instance.
+            /// </summary>
+            Continue,
+
+            /// <summary>
+            /// Skip the children of the instance, and continue with its next sibling.
+            /// </summary>
+            SkipChildren,
+
+            /// <summary>
+            /// Stop the traversal altogether.
+            /// </summary>
+            Stop
+        }
+
+        /// <summary>
+        /// Push the children of <paramref name="that" /> to the <paramref name="stack" />
+        /// in reverse so that they are popped in order.
+        /// </summary>
+        private static void PushChildren(
+            Aas.IClass that,
+            List<Aas.IClass> stack,
+            List<Aas.IClass> buffer)
+        {
+            buffer.Clear();
+            buffer.AddRange(that.DescendOnce());
+
+            for (int i = buffer.Count - 1; i >= 0; i--)
+            {
+                stack.Add(buffer[i]);
+            }
+        }
+
+        /// <summary>
+        /// Iterate over all the descendants of <paramref name="that" /> in pre-order.
+        /// </summary>
+        /// <remarks>
+        /// The instances are yielded in the same order as by
+        /// <see cref="Aas.IClass.Descend" />, and <paramref name="that" /> is not
+        /// yielded itself. The stack is allocated once per traversal.
+        /// </remarks>
+        public static IEnumerable<Aas.IClass> PreOrder(Aas.IClass that)
+        {
+            var stack = new List<Aas.IClass>();
+            var buffer = new List<Aas.IClass>();
+
+            PushChildren(that, stack, buffer);
+
+            while (stack.Count > 0)
+            {
+                var instance = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                yield return instance;
+
+                PushChildren(instance, stack, buffer);
+            }
+        }
+
+        /// <summary>
+        /// Visit all the descendants of <paramref name="that" /> in pre-order, and
+        /// let the <paramref name="visit" /> decide whether to descend into
+        /// the children of each instance.
+        /// </summary>
+        /// <remarks>
+        /// The descendants are visited in the same order as by
+        /// <see cref="PreOrder" />, and <paramref name="that" /> is not visited
+        /// itself.
+        /// </remarks>
+        public static void Walk(
+            Aas.IClass that,
+            System.Func<Aas.IClass, Control> visit)
+        {
+            var stack = new List<Aas.IClass>();
+            var buffer = new List<Aas.IClass>();
+
+            PushChildren(that, stack, buffer);
+
+            while (stack.Count > 0)
+            {
+                var instance = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                var control = visit(instance);
+                switch (control)
+                {
+                    case Control.Continue:
+                        PushChildren(instance, stack, buffer);
+                        break;
+                    case Control.SkipChildren:
+                        break;
+                    case Control.Stop:
+                        return;
+                    default:
+                        throw new System.ArgumentException(
+                            $"Unexpected control: {control}");
+                }
+            }
+        }
+
+        /// <summary>
+        /// Visit all the descendants of <paramref name="that" /> in pre-order with
+        /// the <paramref name="transformer" />, which decides whether to descend
+        /// into the children of each instance.
+        /// </summary>
+        /// <remarks>
+        /// Unlike <see cref="Visitation.VisitorThrough" />, the transformer is not
+        /// responsible for descending into the children. It only transforms each
+        /// instance into the <see cref="Control" /> of the traversal.
+        /// </remarks>
+        public static void Walk(
+            Aas.IClass that,
+            Visitation.ITransformer<Control> transformer)
+        {
+            Walk(that, instance => instance.Transform(transformer));
+        }
+
+        /// <summary>
+        /// Hold the concrete classes whose instances can never contain
+        /// an instance of <typeparamref name="T" />.
+        /// </summary>
+        /// <remarks>
+        /// The set is computed once per <typeparamref name="T" /> from
+        /// <see cref="DescendantTypes" />. The classes unknown to the meta-model,
+        /// such as your own sub-classes, are never pruned.
+        /// </remarks>
+        private static class Pruning<T> where T : class, Aas.IClass
+        {
+            internal static readonly HashSet<System.Type> Types = Compute();
+
+            private static HashSet<System.Type> Compute()
+            {
+                var result = new HashSet<System.Type>();
+                foreach (var pair in DescendantTypes)
+                {
+                    bool canContain = false;
+                    foreach (var descendantType in pair.Value)
+                    {
+                        if (typeof(T).IsAssignableFrom(descendantType))
+                        {
+                            canContain = true;
+                            break;
+                        }
+                    }
+
+                    if (!canContain)
+                    {
+                        result.Add(pair.Key);
+                    }
+                }
+
+                return result;
+            }
+        }
+
+        /// <summary>
+        /// Iterate over all the descendants of <paramref name="that" /> which are
+        /// instances of <typeparamref name="T" />, in pre-order.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The result is the same as of
+        /// <c>that.Descend().OfType&lt;T&gt;()</c>, but the sub-trees which can
+        /// never contain a <typeparamref name="T" /> according to the meta-model
+        /// are skipped. For example, the language strings and the keys are never
+        /// visited when you look for the blobs.
+        /// </para>
+        /// <para>
+        /// <paramref name="that" /> is not yielded itself.
+        /// </para>
+        /// </remarks>
+        public static IEnumerable<T> OfType<T>(Aas.IClass that)
+            where T : class, Aas.IClass
+        {
+            var pruned = Pruning<T>.Types;
+
+            var stack = new List<Aas.IClass>();
+
+            foreach (var child in that.DescendOnce())
+            {
+                if (child is T || !pruned.Contains(child.GetType()))
+                {
+                    stack.Add(child);
+                }
+            }
+            stack.Reverse();
+
+            while (stack.Count > 0)
+            {
+                var instance = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                if (instance is T match)
+                {
+                    yield return match;
+                }
+
+                if (pruned.Contains(instance.GetType()))
+                {
+                    continue;
+                }
+
+                // Push the children which may lead to a match, and reverse them
+                // in place so that they are popped in order.
+                int bottom = stack.Count;
+                foreach (var child in instance.DescendOnce())
+                {
+                    if (child is T || !pruned.Contains(child.GetType()))
+                    {
+                        stack.Add(child);
+                    }
+                }
+                stack.Reverse(bottom, stack.Count - bottom);
+            }
+        }
+    }  // public static partial class Descending
+}  // namespace AasCore.Aas3_0
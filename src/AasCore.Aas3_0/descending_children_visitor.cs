@@ -0,0 +1,608 @@
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Descending
+    {
+        private partial class ChildrenVisitor
+        {
+            private static readonly Reporting.NameSegment SemanticIdSegment = (
+                new Reporting.NameSegment("semanticId"));
+
+            private static readonly Reporting.NameSegment SupplementalSemanticIdsSegment = (
+                new Reporting.NameSegment("supplementalSemanticIds"));
+
+            private static readonly Reporting.NameSegment RefersToSegment = (
+                new Reporting.NameSegment("refersTo"));
+
+            private static readonly Reporting.NameSegment EmbeddedDataSpecificationsSegment = (
+                new Reporting.NameSegment("embeddedDataSpecifications"));
+
+            private static readonly Reporting.NameSegment CreatorSegment = (
+                new Reporting.NameSegment("creator"));
+
+            private static readonly Reporting.NameSegment ValueIdSegment = (
+                new Reporting.NameSegment("valueId"));
+
+            private static readonly Reporting.NameSegment ExtensionsSegment = (
+                new Reporting.NameSegment("extensions"));
+
+            private static readonly Reporting.NameSegment DisplayNameSegment = (
+                new Reporting.NameSegment("displayName"));
+
+            private static readonly Reporting.NameSegment DescriptionSegment = (
+                new Reporting.NameSegment("description"));
+
+            private static readonly Reporting.NameSegment AdministrationSegment = (
+                new Reporting.NameSegment("administration"));
+
+            private static readonly Reporting.NameSegment DerivedFromSegment = (
+                new Reporting.NameSegment("derivedFrom"));
+
+            private static readonly Reporting.NameSegment AssetInformationSegment = (
+                new Reporting.NameSegment("assetInformation"));
+
+            private static readonly Reporting.NameSegment SubmodelsSegment = (
+                new Reporting.NameSegment("submodels"));
+
+            private static readonly Reporting.NameSegment SpecificAssetIdsSegment = (
+                new Reporting.NameSegment("specificAssetIds"));
+
+            private static readonly Reporting.NameSegment DefaultThumbnailSegment = (
+                new Reporting.NameSegment("defaultThumbnail"));
+
+            private static readonly Reporting.NameSegment ExternalSubjectIdSegment = (
+                new Reporting.NameSegment("externalSubjectId"));
+
+            private static readonly Reporting.NameSegment QualifiersSegment = (
+                new Reporting.NameSegment("qualifiers"));
+
+            private static readonly Reporting.NameSegment SubmodelElementsSegment = (
+                new Reporting.NameSegment("submodelElements"));
+
+            private static readonly Reporting.NameSegment FirstSegment = (
+                new Reporting.NameSegment("first"));
+
+            private static readonly Reporting.NameSegment SecondSegment = (
+                new Reporting.NameSegment("second"));
+
+            private static readonly Reporting.NameSegment SemanticIdListElementSegment = (
+                new Reporting.NameSegment("semanticIdListElement"));
+
+            private static readonly Reporting.NameSegment ValueSegment = (
+                new Reporting.NameSegment("value"));
+
+            private static readonly Reporting.NameSegment AnnotationsSegment = (
+                new Reporting.NameSegment("annotations"));
+
+            private static readonly Reporting.NameSegment StatementsSegment = (
+                new Reporting.NameSegment("statements"));
+
+            private static readonly Reporting.NameSegment SourceSegment = (
+                new Reporting.NameSegment("source"));
+
+            private static readonly Reporting.NameSegment SourceSemanticIdSegment = (
+                new Reporting.NameSegment("sourceSemanticId"));
+
+            private static readonly Reporting.NameSegment ObservableReferenceSegment = (
+                new Reporting.NameSegment("observableReference"));
+
+            private static readonly Reporting.NameSegment ObservableSemanticIdSegment = (
+                new Reporting.NameSegment("observableSemanticId"));
+
+            private static readonly Reporting.NameSegment SubjectIdSegment = (
+                new Reporting.NameSegment("subjectId"));
+
+            private static readonly Reporting.NameSegment ObservedSegment = (
+                new Reporting.NameSegment("observed"));
+
+            private static readonly Reporting.NameSegment MessageBrokerSegment = (
+                new Reporting.NameSegment("messageBroker"));
+
+            private static readonly Reporting.NameSegment InputVariablesSegment = (
+                new Reporting.NameSegment("inputVariables"));
+
+            private static readonly Reporting.NameSegment OutputVariablesSegment = (
+                new Reporting.NameSegment("outputVariables"));
+
+            private static readonly Reporting.NameSegment InoutputVariablesSegment = (
+                new Reporting.NameSegment("inoutputVariables"));
+
+            private static readonly Reporting.NameSegment IsCaseOfSegment = (
+                new Reporting.NameSegment("isCaseOf"));
+
+            private static readonly Reporting.NameSegment ReferredSemanticIdSegment = (
+                new Reporting.NameSegment("referredSemanticId"));
+
+            private static readonly Reporting.NameSegment KeysSegment = (
+                new Reporting.NameSegment("keys"));
+
+            private static readonly Reporting.NameSegment AssetAdministrationShellsSegment = (
+                new Reporting.NameSegment("assetAdministrationShells"));
+
+            private static readonly Reporting.NameSegment ConceptDescriptionsSegment = (
+                new Reporting.NameSegment("conceptDescriptions"));
+
+            private static readonly Reporting.NameSegment DataSpecificationSegment = (
+                new Reporting.NameSegment("dataSpecification"));
+
+            private static readonly Reporting.NameSegment DataSpecificationContentSegment = (
+                new Reporting.NameSegment("dataSpecificationContent"));
+
+            private static readonly Reporting.NameSegment ValueReferencePairsSegment = (
+                new Reporting.NameSegment("valueReferencePairs"));
+
+            private static readonly Reporting.NameSegment PreferredNameSegment = (
+                new Reporting.NameSegment("preferredName"));
+
+            private static readonly Reporting.NameSegment ShortNameSegment = (
+                new Reporting.NameSegment("shortName"));
+
+            private static readonly Reporting.NameSegment UnitIdSegment = (
+                new Reporting.NameSegment("unitId"));
+
+            private static readonly Reporting.NameSegment DefinitionSegment = (
+                new Reporting.NameSegment("definition"));
+
+            private static readonly Reporting.NameSegment ValueListSegment = (
+                new Reporting.NameSegment("valueList"));
+
+            private static readonly Reporting.NameSegment LevelTypeSegment = (
+                new Reporting.NameSegment("levelType"));
+
+            public override void VisitExtension(
+                Aas.IExtension that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(RefersToSegment, that.RefersTo);
+            }
+
+            public override void VisitAdministrativeInformation(
+                Aas.IAdministrativeInformation that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(CreatorSegment, that.Creator);
+            }
+
+            public override void VisitQualifier(
+                Aas.IQualifier that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Child(ValueIdSegment, that.ValueId);
+            }
+
+            public override void VisitAssetAdministrationShell(
+                Aas.IAssetAdministrationShell that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(AdministrationSegment, that.Administration);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(DerivedFromSegment, that.DerivedFrom);
+                tracker.Child(AssetInformationSegment, that.AssetInformation);
+                tracker.Items(SubmodelsSegment, that.Submodels);
+            }
+
+            public override void VisitAssetInformation(
+                Aas.IAssetInformation that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(SpecificAssetIdsSegment, that.SpecificAssetIds);
+                tracker.Child(DefaultThumbnailSegment, that.DefaultThumbnail);
+            }
+
+            public override void VisitResource(
+                Aas.IResource that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitSpecificAssetId(
+                Aas.ISpecificAssetId that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Child(ExternalSubjectIdSegment, that.ExternalSubjectId);
+            }
+
+            public override void VisitSubmodel(
+                Aas.ISubmodel that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(AdministrationSegment, that.Administration);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Items(SubmodelElementsSegment, that.SubmodelElements);
+            }
+
+            public override void VisitRelationshipElement(
+                Aas.IRelationshipElement that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(FirstSegment, that.First);
+                tracker.Child(SecondSegment, that.Second);
+            }
+
+            public override void VisitSubmodelElementList(
+                Aas.ISubmodelElementList that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(SemanticIdListElementSegment, that.SemanticIdListElement);
+                tracker.Items(ValueSegment, that.Value);
+            }
+
+            public override void VisitSubmodelElementCollection(
+                Aas.ISubmodelElementCollection that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Items(ValueSegment, that.Value);
+            }
+
+            public override void VisitProperty(
+                Aas.IProperty that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(ValueIdSegment, that.ValueId);
+            }
+
+            public override void VisitMultiLanguageProperty(
+                Aas.IMultiLanguageProperty that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Items(ValueSegment, that.Value);
+                tracker.Child(ValueIdSegment, that.ValueId);
+            }
+
+            public override void VisitRange(
+                Aas.IRange that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+            }
+
+            public override void VisitReferenceElement(
+                Aas.IReferenceElement that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(ValueSegment, that.Value);
+            }
+
+            public override void VisitBlob(
+                Aas.IBlob that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+            }
+
+            public override void VisitFile(
+                Aas.IFile that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+            }
+
+            public override void VisitAnnotatedRelationshipElement(
+                Aas.IAnnotatedRelationshipElement that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(FirstSegment, that.First);
+                tracker.Child(SecondSegment, that.Second);
+                tracker.Items(AnnotationsSegment, that.Annotations);
+            }
+
+            public override void VisitEntity(
+                Aas.IEntity that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Items(StatementsSegment, that.Statements);
+                tracker.Items(SpecificAssetIdsSegment, that.SpecificAssetIds);
+            }
+
+            public override void VisitEventPayload(
+                Aas.IEventPayload that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(SourceSegment, that.Source);
+                tracker.Child(SourceSemanticIdSegment, that.SourceSemanticId);
+                tracker.Child(ObservableReferenceSegment, that.ObservableReference);
+                tracker.Child(ObservableSemanticIdSegment, that.ObservableSemanticId);
+                tracker.Child(SubjectIdSegment, that.SubjectId);
+            }
+
+            public override void VisitBasicEventElement(
+                Aas.IBasicEventElement that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Child(ObservedSegment, that.Observed);
+                tracker.Child(MessageBrokerSegment, that.MessageBroker);
+            }
+
+            public override void VisitOperation(
+                Aas.IOperation that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Items(InputVariablesSegment, that.InputVariables);
+                tracker.Items(OutputVariablesSegment, that.OutputVariables);
+                tracker.Items(InoutputVariablesSegment, that.InoutputVariables);
+            }
+
+            public override void VisitOperationVariable(
+                Aas.IOperationVariable that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(ValueSegment, that.Value);
+            }
+
+            public override void VisitCapability(
+                Aas.ICapability that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(SemanticIdSegment, that.SemanticId);
+                tracker.Items(SupplementalSemanticIdsSegment, that.SupplementalSemanticIds);
+                tracker.Items(QualifiersSegment, that.Qualifiers);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+            }
+
+            public override void VisitConceptDescription(
+                Aas.IConceptDescription that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ExtensionsSegment, that.Extensions);
+                tracker.Items(DisplayNameSegment, that.DisplayName);
+                tracker.Items(DescriptionSegment, that.Description);
+                tracker.Child(AdministrationSegment, that.Administration);
+                tracker.Items(EmbeddedDataSpecificationsSegment, that.EmbeddedDataSpecifications);
+                tracker.Items(IsCaseOfSegment, that.IsCaseOf);
+            }
+
+            public override void VisitReference(
+                Aas.IReference that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(ReferredSemanticIdSegment, that.ReferredSemanticId);
+                tracker.Items(KeysSegment, that.Keys);
+            }
+
+            public override void VisitKey(
+                Aas.IKey that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitLangStringNameType(
+                Aas.ILangStringNameType that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitLangStringTextType(
+                Aas.ILangStringTextType that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitEnvironment(
+                Aas.IEnvironment that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(AssetAdministrationShellsSegment, that.AssetAdministrationShells);
+                tracker.Items(SubmodelsSegment, that.Submodels);
+                tracker.Items(ConceptDescriptionsSegment, that.ConceptDescriptions);
+            }
+
+            public override void VisitEmbeddedDataSpecification(
+                Aas.IEmbeddedDataSpecification that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(DataSpecificationSegment, that.DataSpecification);
+                tracker.Child(DataSpecificationContentSegment, that.DataSpecificationContent);
+            }
+
+            public override void VisitLevelType(
+                Aas.ILevelType that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitValueReferencePair(
+                Aas.IValueReferencePair that,
+                Tracker tracker
+            )
+            {
+                tracker.Child(ValueIdSegment, that.ValueId);
+            }
+
+            public override void VisitValueList(
+                Aas.IValueList that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(ValueReferencePairsSegment, that.ValueReferencePairs);
+            }
+
+            public override void VisitLangStringPreferredNameTypeIec61360(
+                Aas.ILangStringPreferredNameTypeIec61360 that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitLangStringShortNameTypeIec61360(
+                Aas.ILangStringShortNameTypeIec61360 that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitLangStringDefinitionTypeIec61360(
+                Aas.ILangStringDefinitionTypeIec61360 that,
+                Tracker tracker
+            )
+            {
+                // Intentionally empty.
+            }
+
+            public override void VisitDataSpecificationIec61360(
+                Aas.IDataSpecificationIec61360 that,
+                Tracker tracker
+            )
+            {
+                tracker.Items(PreferredNameSegment, that.PreferredName);
+                tracker.Items(ShortNameSegment, that.ShortName);
+                tracker.Child(UnitIdSegment, that.UnitId);
+                tracker.Items(DefinitionSegment, that.Definition);
+                tracker.Child(ValueListSegment, that.ValueList);
+                tracker.Child(LevelTypeSegment, that.LevelType);
+            }
+        }  // private partial class ChildrenVisitor
+    }  // public static partial class Descending
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,679 @@
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Descending
+    {
+        /// <summary>
+        /// Map each concrete class of the meta-model to the concrete classes which
+        /// its instances can transitively contain.
+        /// </summary>
+        /// <remarks>
+        /// The table is derived from the types of the properties in the meta-model.
+        /// </remarks>
+        private static readonly Dictionary<System.Type, System.Type[]> DescendantTypes = (
+            new Dictionary<System.Type, System.Type[]>()
+            {
+                {
+                    typeof(Aas.Extension),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.AdministrativeInformation),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Qualifier),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.AssetAdministrationShell),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.AdministrativeInformation),
+                        typeof(Aas.AssetInformation),
+                        typeof(Aas.Resource),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.AssetInformation),
+                    new[]
+                    {
+                        typeof(Aas.Resource),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.Resource),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.SpecificAssetId),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.Submodel),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.AdministrativeInformation),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.RelationshipElement),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.SubmodelElementList),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.SubmodelElementCollection),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Property),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.MultiLanguageProperty),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Range),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.ReferenceElement),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Blob),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.File),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.AnnotatedRelationshipElement),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Entity),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.EventPayload),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.BasicEventElement),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Operation),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.OperationVariable),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Capability),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.ConceptDescription),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.AdministrativeInformation),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.Reference),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.Key),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.LangStringNameType),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.LangStringTextType),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.Environment),
+                    new[]
+                    {
+                        typeof(Aas.Extension),
+                        typeof(Aas.AdministrativeInformation),
+                        typeof(Aas.Qualifier),
+                        typeof(Aas.AssetAdministrationShell),
+                        typeof(Aas.AssetInformation),
+                        typeof(Aas.Resource),
+                        typeof(Aas.SpecificAssetId),
+                        typeof(Aas.Submodel),
+                        typeof(Aas.RelationshipElement),
+                        typeof(Aas.SubmodelElementList),
+                        typeof(Aas.SubmodelElementCollection),
+                        typeof(Aas.Property),
+                        typeof(Aas.MultiLanguageProperty),
+                        typeof(Aas.Range),
+                        typeof(Aas.ReferenceElement),
+                        typeof(Aas.Blob),
+                        typeof(Aas.File),
+                        typeof(Aas.AnnotatedRelationshipElement),
+                        typeof(Aas.Entity),
+                        typeof(Aas.BasicEventElement),
+                        typeof(Aas.Operation),
+                        typeof(Aas.OperationVariable),
+                        typeof(Aas.Capability),
+                        typeof(Aas.ConceptDescription),
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LangStringNameType),
+                        typeof(Aas.LangStringTextType),
+                        typeof(Aas.EmbeddedDataSpecification),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.EmbeddedDataSpecification),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360),
+                        typeof(Aas.DataSpecificationIec61360)
+                    }
+                },
+                {
+                    typeof(Aas.LevelType),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.ValueReferencePair),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key)
+                    }
+                },
+                {
+                    typeof(Aas.ValueList),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.ValueReferencePair)
+                    }
+                },
+                {
+                    typeof(Aas.LangStringPreferredNameTypeIec61360),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.LangStringShortNameTypeIec61360),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.LangStringDefinitionTypeIec61360),
+                    new System.Type[0]
+                },
+                {
+                    typeof(Aas.DataSpecificationIec61360),
+                    new[]
+                    {
+                        typeof(Aas.Reference),
+                        typeof(Aas.Key),
+                        typeof(Aas.LevelType),
+                        typeof(Aas.ValueReferencePair),
+                        typeof(Aas.ValueList),
+                        typeof(Aas.LangStringPreferredNameTypeIec61360),
+                        typeof(Aas.LangStringShortNameTypeIec61360),
+                        typeof(Aas.LangStringDefinitionTypeIec61360)
+                    }
+                }
+            });
+    }  // public static partial class Descending
+}  // namespace AasCore.Aas3_0
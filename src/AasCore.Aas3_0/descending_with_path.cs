@@ -0,0 +1,265 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Descending
+    {
+        /// <summary>
+        /// Represent the path from the root of a traversal to the current instance.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The path is reused by the traversal and changes with every step, so
+        /// convert it with <see cref="Reporting.GenerateJsonPath" /> or
+        /// <see cref="Reporting.GenerateRelativeXPath" /> before you move on if
+        /// you need to keep it.
+        /// </para>
+        /// <para>
+        /// The path is read-only. The methods which would change it throw
+        /// a <see cref="System.NotSupportedException" />.
+        /// </para>
+        /// </remarks>
+        public class Path : ICollection<Reporting.Segment>, IReadOnlyList<Reporting.Segment>
+        {
+            internal readonly List<Reporting.Segment> Segments =
+                new List<Reporting.Segment>();
+
+            internal Path()
+            {
+                // Intentionally empty.
+            }
+
+            /// <summary>
+            /// Number of the segments in the path
+            /// </summary>
+            public int Count => Segments.Count;
+
+            /// <summary>
+            /// Get the segment at the <paramref name="index" />, starting from
+            /// the root.
+            /// </summary>
+            public Reporting.Segment this[int index] => Segments[index];
+
+            /// <summary>
+            /// Always <c>true</c> as the path can only be changed by the traversal
+            /// </summary>
+            public bool IsReadOnly => true;
+
+            public bool Contains(Reporting.Segment item)
+            {
+                return Segments.Contains(item);
+            }
+
+            public void CopyTo(Reporting.Segment[] array, int arrayIndex)
+            {
+                Segments.CopyTo(array, arrayIndex);
+            }
+
+            public IEnumerator<Reporting.Segment> GetEnumerator()
+            {
+                return Segments.GetEnumerator();
+            }
+
+            System.Collections.IEnumerator System.Collections.IEnumerable.GetEnumerator()
+            {
+                return GetEnumerator();
+            }
+
+            void ICollection<Reporting.Segment>.Add(Reporting.Segment item)
+            {
+                throw new System.NotSupportedException("The path is read-only.");
+            }
+
+            void ICollection<Reporting.Segment>.Clear()
+            {
+                throw new System.NotSupportedException("The path is read-only.");
+            }
+
+            bool ICollection<Reporting.Segment>.Remove(Reporting.Segment item)
+            {
+                throw new System.NotSupportedException("The path is read-only.");
+            }
+        }  // public class Path
+
+        /// <summary>
+        /// Represent a single step of <see cref="WithPath" />.
+        /// </summary>
+        public readonly struct InstanceWithPath
+        {
+            /// <summary>
+            /// The current instance
+            /// </summary>
+            public Aas.IClass Instance { get; }
+
+            /// <summary>
+            /// Path from the root of the traversal to <see cref="Instance" />,
+            /// valid only until the next step
+            /// </summary>
+            public Path Path { get; }
+
+            internal InstanceWithPath(Aas.IClass instance, Path path)
+            {
+                Instance = instance;
+                Path = path;
+            }
+
+            public void Deconstruct(out Aas.IClass instance, out Path path)
+            {
+                instance = Instance;
+                path = Path;
+            }
+        }  // public readonly struct InstanceWithPath
+
+        /// <summary>
+        /// Represent an instance on the stack of <see cref="WithPath" />.
+        /// </summary>
+        private readonly struct Entry
+        {
+            internal readonly Aas.IClass Instance;
+
+            /// <summary>
+            /// Number of the segments in the path of the parent
+            /// </summary>
+            internal readonly int ParentLength;
+
+            internal readonly Reporting.NameSegment Name;
+
+            /// <summary>
+            /// Index in the list property, or -1 if the property is not a list
+            /// </summary>
+            internal readonly int Index;
+
+            internal Entry(
+                Aas.IClass instance,
+                int parentLength,
+                Reporting.NameSegment name,
+                int index)
+            {
+                Instance = instance;
+                ParentLength = parentLength;
+                Name = name;
+                Index = index;
+            }
+        }
+
+        /// <summary>
+        /// Keep the stack and the path of a single <see cref="WithPath" />.
+        /// </summary>
+        private class Tracker
+        {
+            internal readonly List<Entry> Stack = new List<Entry>();
+            internal readonly Path Path = new Path();
+
+            /// <summary>
+            /// Index segments re-used over the whole traversal
+            /// </summary>
+            private readonly List<Reporting.IndexSegment> _indexSegments =
+                new List<Reporting.IndexSegment>();
+
+            internal Reporting.IndexSegment IndexSegment(int index)
+            {
+                while (_indexSegments.Count <= index)
+                {
+                    _indexSegments.Add(
+                        new Reporting.IndexSegment(_indexSegments.Count));
+                }
+
+                return _indexSegments[index];
+            }
+
+            internal void Child(Reporting.NameSegment name, Aas.IClass? child)
+            {
+                if (child != null)
+                {
+                    Stack.Add(new Entry(child, Path.Count, name, -1));
+                }
+            }
+
+            internal void Items<T>(Reporting.NameSegment name, List<T>? items)
+                where T : Aas.IClass
+            {
+                if (items != null)
+                {
+                    for (int i = 0; i < items.Count; i++)
+                    {
+                        Stack.Add(new Entry(items[i], Path.Count, name, i));
+                    }
+                }
+            }
+
+            /// <summary>
+            /// Push the children of <paramref name="that" /> so that they are
+            /// popped in order.
+            /// </summary>
+            internal void PushChildren(Aas.IClass that)
+            {
+                int bottom = Stack.Count;
+                ChildrenVisitor.Instance.Visit(that, this);
+                Stack.Reverse(bottom, Stack.Count - bottom);
+            }
+        }
+
+        /// <summary>
+        /// Push the children of an instance together with the names of
+        /// the properties which hold them, in the order of
+        /// <see cref="Aas.IClass.DescendOnce" />.
+        /// </summary>
+        /// <remarks>
+        /// The name segments are shared by all the traversals since they are
+        /// never changed. The visit methods are generated in
+        /// <c>descending_children_visitor.cs</c> from the meta-model.
+        /// </remarks>
+        private partial class ChildrenVisitor
+            : Visitation.AbstractVisitorWithContext<Tracker>
+        {
+            internal static readonly ChildrenVisitor Instance = new ChildrenVisitor();
+        }  // private partial class ChildrenVisitor
+
+        /// <summary>
+        /// Iterate over all the descendants of <paramref name="that" /> in pre-order
+        /// together with their paths relative to <paramref name="that" />.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The instances are yielded in the same order as by
+        /// <see cref="PreOrder" />, and <paramref name="that" /> is not yielded
+        /// itself. The paths use the same property names as
+        /// <see cref="Verification" /> so that you can report the locations in
+        /// the same manner.
+        /// </para>
+        /// <para>
+        /// All the steps share the same <see cref="Path" />, which changes as
+        /// the traversal moves on. No path is allocated per instance, so converting
+        /// the path to a string only costs you when you actually need it.
+        /// </para>
+        /// </remarks>
+        public static IEnumerable<InstanceWithPath> WithPath(Aas.IClass that)
+        {
+            var tracker = new Tracker();
+            var stack = tracker.Stack;
+            var segments = tracker.Path.Segments;
+
+            tracker.PushChildren(that);
+
+            while (stack.Count > 0)
+            {
+                var entry = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                segments.RemoveRange(
+                    entry.ParentLength, segments.Count - entry.ParentLength);
+                segments.Add(entry.Name);
+                if (entry.Index >= 0)
+                {
+                    segments.Add(tracker.IndexSegment(entry.Index));
+                }
+
+                yield return new InstanceWithPath(entry.Instance, tracker.Path);
+
+                tracker.PushChildren(entry.Instance);
+            }
+        }
+    }  // public static partial class Descending
+}  // namespace AasCore.Aas3_0
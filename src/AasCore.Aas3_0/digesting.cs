@@ -0,0 +1,387 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Compute the cryptographic digests of the model instances in a Merkle-tree
+    /// manner so that the changed parts of a model can be found quickly.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The digest of an instance is the SHA-256 over a canonical encoding of its
+    /// class, its primitive properties and the digests of its children. Hence,
+    /// two instances have the same digest if and only if they are deeply equal
+    /// (barring the collisions of SHA-256), and the digest of a container changes
+    /// whenever any of its descendants changes.
+    /// </para>
+    /// <para>
+    /// The digests are stable across processes and platforms so that they can be
+    /// compared between different servers.
+    /// </para>
+    /// </remarks>
+    public static partial class Digesting
+    {
+        /// <summary>
+        /// Length of a digest in bytes
+        /// </summary>
+        public const int DigestLength = 32;
+
+        /// <summary>
+        /// Compute the digest of <paramref name="that" />.
+        /// </summary>
+        /// <remarks>
+        /// Use <see cref="Cache" /> if you need to compute the digests repeatedly
+        /// while changing the model.
+        /// </remarks>
+        public static byte[] Digest(Aas.IClass that)
+        {
+            return new Cache(that).DigestOf(that);
+        }
+
+        /// <summary>
+        /// Encode the instances canonically, and hash the encoding.
+        /// </summary>
+        /// <remarks>
+        /// Every property is encoded by its name followed by a tag of its kind and
+        /// its value. The strings are length-prefixed UTF-8, the enumerations are
+        /// encoded by their literals, and the children by their digests.
+        /// </remarks>
+        internal sealed class Encoder
+        {
+            private readonly System.Buffers.ArrayBufferWriter<byte> _buffer = (
+                new System.Buffers.ArrayBufferWriter<byte>());
+
+            private readonly System.Func<Aas.IClass, byte[]> _digestOfChild;
+
+            internal Encoder(System.Func<Aas.IClass, byte[]> digestOfChild)
+            {
+                _digestOfChild = digestOfChild;
+            }
+
+            private void WriteByte(byte value)
+            {
+                _buffer.GetSpan(1)[0] = value;
+                _buffer.Advance(1);
+            }
+
+            private void WriteInt(int value)
+            {
+                System.Buffers.Binary.BinaryPrimitives.WriteInt32LittleEndian(
+                    _buffer.GetSpan(4), value);
+                _buffer.Advance(4);
+            }
+
+            private void WriteText(string text)
+            {
+                int count = System.Text.Encoding.UTF8.GetByteCount(text);
+                WriteInt(count);
+                System.Text.Encoding.UTF8.GetBytes(text, _buffer.GetSpan(count));
+                _buffer.Advance(count);
+            }
+
+            private void WriteBytes(System.ReadOnlySpan<byte> bytes)
+            {
+                WriteInt(bytes.Length);
+                bytes.CopyTo(_buffer.GetSpan(bytes.Length));
+                _buffer.Advance(bytes.Length);
+            }
+
+            private void WriteProperty(string name, byte kind)
+            {
+                WriteText(name);
+                WriteByte(kind);
+            }
+
+            // NOTE: The tags of the kinds are a part of the encoding and
+            // must not be changed.
+            private const byte AbsentKind = 0;
+            private const byte StringKind = 1;
+            private const byte EnumKind = 2;
+            private const byte InvalidEnumKind = 3;
+            private const byte BoolKind = 4;
+            private const byte BytesKind = 5;
+            private const byte ChildKind = 6;
+            private const byte ListKind = 7;
+
+            internal void Class(string name)
+            {
+                WriteText(name);
+            }
+
+            internal void String(string name, string? value)
+            {
+                if (value == null)
+                {
+                    WriteProperty(name, AbsentKind);
+                    return;
+                }
+
+                WriteProperty(name, StringKind);
+                WriteText(value);
+            }
+
+            internal void Enum(string name, string? literal, int? value)
+            {
+                if (value == null)
+                {
+                    WriteProperty(name, AbsentKind);
+                    return;
+                }
+
+                if (literal == null)
+                {
+                    WriteProperty(name, InvalidEnumKind);
+                    WriteInt(value.Value);
+                    return;
+                }
+
+                WriteProperty(name, EnumKind);
+                WriteText(literal);
+            }
+
+            internal void Bool(string name, bool? value)
+            {
+                if (value == null)
+                {
+                    WriteProperty(name, AbsentKind);
+                    return;
+                }
+
+                WriteProperty(name, BoolKind);
+                WriteByte(value.Value ? (byte)1 : (byte)0);
+            }
+
+            internal void Bytes(string name, byte[]? value)
+            {
+                if (value == null)
+                {
+                    WriteProperty(name, AbsentKind);
+                    return;
+                }
+
+                WriteProperty(name, BytesKind);
+                WriteBytes(value);
+            }
+
+            internal void Child(string name, Aas.IClass? child)
+            {
+                if (child == null)
+                {
+                    WriteProperty(name, AbsentKind);
+                    return;
+                }
+
+                WriteProperty(name, ChildKind);
+                WriteBytes(_digestOfChild(child));
+            }
+
+            internal void List<T>(string name, List<T>? items) where T : Aas.IClass
+            {
+                if (items == null)
+                {
+                    WriteProperty(name, AbsentKind);
+                    return;
+                }
+
+                WriteProperty(name, ListKind);
+                WriteInt(items.Count);
+                foreach (var item in items)
+                {
+                    WriteBytes(_digestOfChild(item));
+                }
+            }
+
+            /// <summary>
+            /// Encode <paramref name="that" /> and compute the digest of
+            /// the encoding.
+            /// </summary>
+            internal byte[] Digest(Aas.IClass that)
+            {
+                _buffer.Clear();
+                EncodingVisitor.Instance.Visit(that, this);
+                return System.Security.Cryptography.SHA256.HashData(
+                    _buffer.WrittenSpan);
+            }
+        }  // internal sealed class Encoder
+
+        /// <summary>Dispatch the encoding of a single instance.</summary>
+        /// <remarks>
+        /// The visit methods are generated in <c>digesting_encoding_visitor.cs</c>
+        /// from the meta-model.
+        /// </remarks>
+        internal partial class EncodingVisitor
+            : Visitation.AbstractVisitorWithContext<Encoder>
+        {
+            internal static readonly EncodingVisitor Instance = new EncodingVisitor();
+        }  // internal partial class EncodingVisitor
+
+        /// <summary>
+        /// Cache the digests of an instance and its descendants so that only
+        /// the changed parts need to be re-hashed.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The digests are cached per instance, keyed by the reference identity.
+        /// When you change an instance, you mark it with <see cref="MarkDirty" />.
+        /// On the next <see cref="Digest" /> or <see cref="DigestOf" />, the marked
+        /// instance and its ancestors up to the root are re-hashed, while
+        /// the digests of all the other instances are taken from the cache.
+        /// </para>
+        /// <para>
+        /// To find out which parts of two models differ, compare the digests of
+        /// the roots first, and descend only into the children whose digests
+        /// differ.
+        /// </para>
+        /// <para>
+        /// If you add, remove or replace a child, mark its container. The removed
+        /// instances are dropped from the cache, and the added ones are hashed
+        /// on the next <see cref="Digest" />.
+        /// An instance might be shared among more containers. It is dropped
+        /// only once none of them contains it anymore.
+        /// </para>
+        /// <para>
+        /// The cache is not thread-safe.
+        /// </para>
+        /// </remarks>
+        public class Cache
+        {
+            private class Entry
+            {
+                internal byte[]? Digest;
+            }
+
+            private readonly Aas.IClass _root;
+
+            private readonly Containment<Entry> _containment;
+
+            private readonly Encoder _encoder;
+
+            /// <summary>
+            /// Initialize the cache for the digests of <paramref name="root" />.
+            /// </summary>
+            /// <remarks>
+            /// Nothing is hashed until the first call to <see cref="Digest" /> or
+            /// <see cref="DigestOf" />.
+            /// </remarks>
+            public Cache(Aas.IClass root)
+            {
+                _root = root;
+                _containment = new Containment<Entry>(root);
+                _encoder = new Encoder(child => _containment.EntryOf(child).Digest!);
+            }
+
+            /// <summary>
+            /// Mark <paramref name="that" /> as changed so that it and its ancestors
+            /// are re-hashed on the next <see cref="Digest" />.
+            /// </summary>
+            /// <remarks>
+            /// If <paramref name="that" /> is shared among more containers,
+            /// the ancestors along all of them are re-hashed.
+            /// </remarks>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when <paramref name="that" /> has not been hashed as part
+            /// of the root.
+            /// </exception>
+            public void MarkDirty(Aas.IClass that)
+            {
+                if (_containment.IsEmpty)
+                {
+                    // Nothing has been hashed so far.
+                    return;
+                }
+
+                if (!_containment.MarkDirty(that))
+                {
+                    throw new System.ArgumentException(
+                        "The instance has not been hashed as part of the root. " +
+                        "Did you mark its container after adding it?");
+                }
+            }
+
+            /// <summary>
+            /// Re-hash the instances which are either dirty or not in the cache,
+            /// children before their containers.
+            /// </summary>
+            private void Refresh()
+            {
+                // The second item tells whether the children have been refreshed.
+                var stack = new List<(Aas.IClass, bool)> { (_root, false) };
+
+                while (stack.Count > 0)
+                {
+                    var (instance, childrenRefreshed) = stack[stack.Count - 1];
+                    stack.RemoveAt(stack.Count - 1);
+
+                    if (childrenRefreshed)
+                    {
+                        var entry = _containment.EntryOf(instance);
+                        entry.Digest = _encoder.Digest(instance);
+                        continue;
+                    }
+
+                    if (!_containment.NeedsUpdate(instance))
+                    {
+                        continue;
+                    }
+
+                    var children = System.Linq.Enumerable.ToArray(
+                        instance.DescendOnce());
+
+                    _containment.Put(instance, new Entry(), children);
+
+                    stack.Add((instance, true));
+                    foreach (var child in children)
+                    {
+                        stack.Add((child, false));
+                    }
+                }
+            }
+
+            /// <summary>
+            /// Compute the digest of the root, re-hashing only the instances
+            /// marked as dirty, their ancestors and the instances not hashed
+            /// before.
+            /// </summary>
+            /// <returns>
+            /// SHA-256 digest of <see cref="Digesting.DigestLength" /> bytes
+            /// </returns>
+            public byte[] Digest()
+            {
+                return DigestOf(_root);
+            }
+
+            /// <summary>
+            /// Compute the digest of <paramref name="that" /> which is either
+            /// the root or one of its descendants.
+            /// </summary>
+            /// <remarks>
+            /// The digests of the whole root are refreshed, if needed. The digest is
+            /// the same as the one given by <see cref="Digesting.Digest" />, provided
+            /// that all the changes have been marked.
+            /// </remarks>
+            /// <returns>
+            /// SHA-256 digest of <see cref="Digesting.DigestLength" /> bytes
+            /// </returns>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when <paramref name="that" /> is not contained in the root.
+            /// </exception>
+            public byte[] DigestOf(Aas.IClass that)
+            {
+                Refresh();
+
+                if (!_containment.TryGetEntry(that, out var entry))
+                {
+                    throw new System.ArgumentException(
+                        "The instance is not contained in the root. " +
+                        "Did you mark its container after adding it?");
+                }
+
+                // NOTE: We copy the digest so that the cached one can not be
+                // modified by the caller.
+                return (byte[])entry.Digest!.Clone();
+            }
+        }  // public class Cache
+    }  // public static partial class Digesting
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,641 @@
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Digesting
+    {
+        internal partial class EncodingVisitor
+        {
+            public override void VisitExtension(
+                Aas.IExtension that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Extension");
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.String("Name", that.Name);
+                encoder.Enum(
+                    "ValueType",
+                    Stringification.ToString(that.ValueType),
+                    (int?)that.ValueType);
+                encoder.String("Value", that.Value);
+                encoder.List("RefersTo", that.RefersTo);
+            }
+
+            public override void VisitAdministrativeInformation(
+                Aas.IAdministrativeInformation that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("AdministrativeInformation");
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.String("Version", that.Version);
+                encoder.String("Revision", that.Revision);
+                encoder.Child("Creator", that.Creator);
+                encoder.String("TemplateId", that.TemplateId);
+            }
+
+            public override void VisitQualifier(
+                Aas.IQualifier that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Qualifier");
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.Enum(
+                    "Kind",
+                    Stringification.ToString(that.Kind),
+                    (int?)that.Kind);
+                encoder.String("Type", that.Type);
+                encoder.Enum(
+                    "ValueType",
+                    Stringification.ToString(that.ValueType),
+                    (int?)that.ValueType);
+                encoder.String("Value", that.Value);
+                encoder.Child("ValueId", that.ValueId);
+            }
+
+            public override void VisitAssetAdministrationShell(
+                Aas.IAssetAdministrationShell that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("AssetAdministrationShell");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("Administration", that.Administration);
+                encoder.String("Id", that.Id);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Child("DerivedFrom", that.DerivedFrom);
+                encoder.Child("AssetInformation", that.AssetInformation);
+                encoder.List("Submodels", that.Submodels);
+            }
+
+            public override void VisitAssetInformation(
+                Aas.IAssetInformation that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("AssetInformation");
+                encoder.Enum(
+                    "AssetKind",
+                    Stringification.ToString(that.AssetKind),
+                    (int?)that.AssetKind);
+                encoder.String("GlobalAssetId", that.GlobalAssetId);
+                encoder.List("SpecificAssetIds", that.SpecificAssetIds);
+                encoder.String("AssetType", that.AssetType);
+                encoder.Child("DefaultThumbnail", that.DefaultThumbnail);
+            }
+
+            public override void VisitResource(
+                Aas.IResource that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Resource");
+                encoder.String("Path", that.Path);
+                encoder.String("ContentType", that.ContentType);
+            }
+
+            public override void VisitSpecificAssetId(
+                Aas.ISpecificAssetId that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("SpecificAssetId");
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.String("Name", that.Name);
+                encoder.String("Value", that.Value);
+                encoder.Child("ExternalSubjectId", that.ExternalSubjectId);
+            }
+
+            public override void VisitSubmodel(
+                Aas.ISubmodel that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Submodel");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("Administration", that.Administration);
+                encoder.String("Id", that.Id);
+                encoder.Enum(
+                    "Kind",
+                    Stringification.ToString(that.Kind),
+                    (int?)that.Kind);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.List("SubmodelElements", that.SubmodelElements);
+            }
+
+            public override void VisitRelationshipElement(
+                Aas.IRelationshipElement that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("RelationshipElement");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Child("First", that.First);
+                encoder.Child("Second", that.Second);
+            }
+
+            public override void VisitSubmodelElementList(
+                Aas.ISubmodelElementList that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("SubmodelElementList");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Bool("OrderRelevant", that.OrderRelevant);
+                encoder.Child("SemanticIdListElement", that.SemanticIdListElement);
+                encoder.Enum(
+                    "TypeValueListElement",
+                    Stringification.ToString(that.TypeValueListElement),
+                    (int?)that.TypeValueListElement);
+                encoder.Enum(
+                    "ValueTypeListElement",
+                    Stringification.ToString(that.ValueTypeListElement),
+                    (int?)that.ValueTypeListElement);
+                encoder.List("Value", that.Value);
+            }
+
+            public override void VisitSubmodelElementCollection(
+                Aas.ISubmodelElementCollection that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("SubmodelElementCollection");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.List("Value", that.Value);
+            }
+
+            public override void VisitProperty(
+                Aas.IProperty that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Property");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Enum(
+                    "ValueType",
+                    Stringification.ToString(that.ValueType),
+                    (int?)that.ValueType);
+                encoder.String("Value", that.Value);
+                encoder.Child("ValueId", that.ValueId);
+            }
+
+            public override void VisitMultiLanguageProperty(
+                Aas.IMultiLanguageProperty that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("MultiLanguageProperty");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.List("Value", that.Value);
+                encoder.Child("ValueId", that.ValueId);
+            }
+
+            public override void VisitRange(
+                Aas.IRange that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Range");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Enum(
+                    "ValueType",
+                    Stringification.ToString(that.ValueType),
+                    (int?)that.ValueType);
+                encoder.String("Min", that.Min);
+                encoder.String("Max", that.Max);
+            }
+
+            public override void VisitReferenceElement(
+                Aas.IReferenceElement that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("ReferenceElement");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Child("Value", that.Value);
+            }
+
+            public override void VisitBlob(
+                Aas.IBlob that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Blob");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Bytes("Value", that.Value);
+                encoder.String("ContentType", that.ContentType);
+            }
+
+            public override void VisitFile(
+                Aas.IFile that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("File");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.String("Value", that.Value);
+                encoder.String("ContentType", that.ContentType);
+            }
+
+            public override void VisitAnnotatedRelationshipElement(
+                Aas.IAnnotatedRelationshipElement that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("AnnotatedRelationshipElement");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Child("First", that.First);
+                encoder.Child("Second", that.Second);
+                encoder.List("Annotations", that.Annotations);
+            }
+
+            public override void VisitEntity(
+                Aas.IEntity that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Entity");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.List("Statements", that.Statements);
+                encoder.Enum(
+                    "EntityType",
+                    Stringification.ToString(that.EntityType),
+                    (int?)that.EntityType);
+                encoder.String("GlobalAssetId", that.GlobalAssetId);
+                encoder.List("SpecificAssetIds", that.SpecificAssetIds);
+            }
+
+            public override void VisitEventPayload(
+                Aas.IEventPayload that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("EventPayload");
+                encoder.Child("Source", that.Source);
+                encoder.Child("SourceSemanticId", that.SourceSemanticId);
+                encoder.Child("ObservableReference", that.ObservableReference);
+                encoder.Child("ObservableSemanticId", that.ObservableSemanticId);
+                encoder.String("Topic", that.Topic);
+                encoder.Child("SubjectId", that.SubjectId);
+                encoder.String("TimeStamp", that.TimeStamp);
+                encoder.Bytes("Payload", that.Payload);
+            }
+
+            public override void VisitBasicEventElement(
+                Aas.IBasicEventElement that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("BasicEventElement");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.Child("Observed", that.Observed);
+                encoder.Enum(
+                    "Direction",
+                    Stringification.ToString(that.Direction),
+                    (int?)that.Direction);
+                encoder.Enum(
+                    "State",
+                    Stringification.ToString(that.State),
+                    (int?)that.State);
+                encoder.String("MessageTopic", that.MessageTopic);
+                encoder.Child("MessageBroker", that.MessageBroker);
+                encoder.String("LastUpdate", that.LastUpdate);
+                encoder.String("MinInterval", that.MinInterval);
+                encoder.String("MaxInterval", that.MaxInterval);
+            }
+
+            public override void VisitOperation(
+                Aas.IOperation that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Operation");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.List("InputVariables", that.InputVariables);
+                encoder.List("OutputVariables", that.OutputVariables);
+                encoder.List("InoutputVariables", that.InoutputVariables);
+            }
+
+            public override void VisitOperationVariable(
+                Aas.IOperationVariable that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("OperationVariable");
+                encoder.Child("Value", that.Value);
+            }
+
+            public override void VisitCapability(
+                Aas.ICapability that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Capability");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("SemanticId", that.SemanticId);
+                encoder.List("SupplementalSemanticIds", that.SupplementalSemanticIds);
+                encoder.List("Qualifiers", that.Qualifiers);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+            }
+
+            public override void VisitConceptDescription(
+                Aas.IConceptDescription that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("ConceptDescription");
+                encoder.List("Extensions", that.Extensions);
+                encoder.String("Category", that.Category);
+                encoder.String("IdShort", that.IdShort);
+                encoder.List("DisplayName", that.DisplayName);
+                encoder.List("Description", that.Description);
+                encoder.Child("Administration", that.Administration);
+                encoder.String("Id", that.Id);
+                encoder.List("EmbeddedDataSpecifications", that.EmbeddedDataSpecifications);
+                encoder.List("IsCaseOf", that.IsCaseOf);
+            }
+
+            public override void VisitReference(
+                Aas.IReference that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Reference");
+                encoder.Enum(
+                    "Type",
+                    Stringification.ToString(that.Type),
+                    (int?)that.Type);
+                encoder.Child("ReferredSemanticId", that.ReferredSemanticId);
+                encoder.List("Keys", that.Keys);
+            }
+
+            public override void VisitKey(
+                Aas.IKey that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Key");
+                encoder.Enum(
+                    "Type",
+                    Stringification.ToString(that.Type),
+                    (int?)that.Type);
+                encoder.String("Value", that.Value);
+            }
+
+            public override void VisitLangStringNameType(
+                Aas.ILangStringNameType that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("LangStringNameType");
+                encoder.String("Language", that.Language);
+                encoder.String("Text", that.Text);
+            }
+
+            public override void VisitLangStringTextType(
+                Aas.ILangStringTextType that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("LangStringTextType");
+                encoder.String("Language", that.Language);
+                encoder.String("Text", that.Text);
+            }
+
+            public override void VisitEnvironment(
+                Aas.IEnvironment that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("Environment");
+                encoder.List("AssetAdministrationShells", that.AssetAdministrationShells);
+                encoder.List("Submodels", that.Submodels);
+                encoder.List("ConceptDescriptions", that.ConceptDescriptions);
+            }
+
+            public override void VisitEmbeddedDataSpecification(
+                Aas.IEmbeddedDataSpecification that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("EmbeddedDataSpecification");
+                encoder.Child("DataSpecification", that.DataSpecification);
+                encoder.Child("DataSpecificationContent", that.DataSpecificationContent);
+            }
+
+            public override void VisitLevelType(
+                Aas.ILevelType that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("LevelType");
+                encoder.Bool("Min", that.Min);
+                encoder.Bool("Nom", that.Nom);
+                encoder.Bool("Typ", that.Typ);
+                encoder.Bool("Max", that.Max);
+            }
+
+            public override void VisitValueReferencePair(
+                Aas.IValueReferencePair that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("ValueReferencePair");
+                encoder.String("Value", that.Value);
+                encoder.Child("ValueId", that.ValueId);
+            }
+
+            public override void VisitValueList(
+                Aas.IValueList that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("ValueList");
+                encoder.List("ValueReferencePairs", that.ValueReferencePairs);
+            }
+
+            public override void VisitLangStringPreferredNameTypeIec61360(
+                Aas.ILangStringPreferredNameTypeIec61360 that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("LangStringPreferredNameTypeIec61360");
+                encoder.String("Language", that.Language);
+                encoder.String("Text", that.Text);
+            }
+
+            public override void VisitLangStringShortNameTypeIec61360(
+                Aas.ILangStringShortNameTypeIec61360 that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("LangStringShortNameTypeIec61360");
+                encoder.String("Language", that.Language);
+                encoder.String("Text", that.Text);
+            }
+
+            public override void VisitLangStringDefinitionTypeIec61360(
+                Aas.ILangStringDefinitionTypeIec61360 that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("LangStringDefinitionTypeIec61360");
+                encoder.String("Language", that.Language);
+                encoder.String("Text", that.Text);
+            }
+
+            public override void VisitDataSpecificationIec61360(
+                Aas.IDataSpecificationIec61360 that,
+                Encoder encoder
+            )
+            {
+                encoder.Class("DataSpecificationIec61360");
+                encoder.List("PreferredName", that.PreferredName);
+                encoder.List("ShortName", that.ShortName);
+                encoder.String("Unit", that.Unit);
+                encoder.Child("UnitId", that.UnitId);
+                encoder.String("SourceOfDefinition", that.SourceOfDefinition);
+                encoder.String("Symbol", that.Symbol);
+                encoder.Enum(
+                    "DataType",
+                    Stringification.ToString(that.DataType),
+                    (int?)that.DataType);
+                encoder.List("Definition", that.Definition);
+                encoder.String("ValueFormat", that.ValueFormat);
+                encoder.Child("ValueList", that.ValueList);
+                encoder.String("Value", that.Value);
+                encoder.Child("LevelType", that.LevelType);
+            }
+        }  // internal partial class EncodingVisitor
+    }  // public static partial class Digesting
+}  // namespace AasCore.Aas3_0
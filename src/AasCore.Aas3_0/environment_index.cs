@@ -0,0 +1,253 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Index an environment so that the identifiables can be looked up by
+    /// their IDs, and the submodel elements by their ID-short paths.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The ID-short paths follow the notation of the specification: the ID-shorts
+    /// of the nested elements are separated by dots, and the items of a submodel
+    /// element list are given by their zero-based index in brackets, such as
+    /// <c>Sensors.Temperatures[3].Value</c>. The paths descend into submodel element
+    /// collections and lists, the statements of entities and the annotations of
+    /// annotated relationship elements. The elements without an ID-short outside of
+    /// lists can not be addressed, and neither can the elements below them.
+    /// </para>
+    /// <para>
+    /// The index is a snapshot of the environment. If you change the environment,
+    /// inform the index with <see cref="Add" />, <see cref="Remove" /> or
+    /// <see cref="Reindex" />. If the IDs or ID-shorts are not unique, the first
+    /// instance in the order of the environment is indexed.
+    /// </para>
+    /// <para>
+    /// The index can be read from multiple threads at the same time, but not while
+    /// it is being changed.
+    /// </para>
+    /// </remarks>
+    public class EnvironmentIndex
+    {
+        private readonly Dictionary<string, Aas.IIdentifiable> _identifiables =
+            new Dictionary<string, Aas.IIdentifiable>();
+
+        /// <summary>
+        /// Map submodel IDs to the submodel elements by their ID-short paths
+        /// </summary>
+        private readonly Dictionary<string, Dictionary<string, Aas.IReferable>> _referables =
+            new Dictionary<string, Dictionary<string, Aas.IReferable>>();
+
+        /// <summary>
+        /// Index the identifiables of the <paramref name="environment" /> and
+        /// the submodel elements of its submodels.
+        /// </summary>
+        public EnvironmentIndex(Aas.IEnvironment environment)
+        {
+            foreach (var shell in environment.OverAssetAdministrationShellsOrEmpty())
+            {
+                _identifiables.TryAdd(shell.Id, shell);
+            }
+
+            foreach (var submodel in environment.OverSubmodelsOrEmpty())
+            {
+                if (_identifiables.TryAdd(submodel.Id, submodel))
+                {
+                    _referables.Add(submodel.Id, IndexElements(submodel));
+                }
+            }
+
+            foreach (var conceptDescription in environment.OverConceptDescriptionsOrEmpty())
+            {
+                _identifiables.TryAdd(conceptDescription.Id, conceptDescription);
+            }
+        }
+
+        /// <summary>
+        /// Number of the indexed identifiables
+        /// </summary>
+        public int Count => _identifiables.Count;
+
+        /// <summary>
+        /// Incremented on every change of the index so that the caches built on
+        /// top of it can be invalidated.
+        /// </summary>
+        internal long Version { get; private set; }
+
+        /// <summary>
+        /// Find the identifiable with the given <paramref name="id" />.
+        /// </summary>
+        /// <returns>The identifiable, or <c>null</c> if there is none</returns>
+        public Aas.IIdentifiable? FindIdentifiable(string id)
+        {
+            return _identifiables.TryGetValue(id, out var identifiable)
+                ? identifiable
+                : null;
+        }
+
+        /// <summary>
+        /// Find the submodel element at the <paramref name="idShortPath" /> in
+        /// the submodel with the given <paramref name="submodelId" />.
+        /// </summary>
+        /// <returns>The submodel element, or <c>null</c> if there is none</returns>
+        public Aas.IReferable? FindReferable(string submodelId, string idShortPath)
+        {
+            return _referables.TryGetValue(submodelId, out var referables)
+                && referables.TryGetValue(idShortPath, out var referable)
+                    ? referable
+                    : null;
+        }
+
+        /// <summary>
+        /// Index the <paramref name="identifiable" /> which has been added to
+        /// the environment.
+        /// </summary>
+        /// <exception cref="System.ArgumentException">
+        /// Thrown when another identifiable with the same ID has already been indexed.
+        /// </exception>
+        public void Add(Aas.IIdentifiable identifiable)
+        {
+            if (!_identifiables.TryAdd(identifiable.Id, identifiable))
+            {
+                throw new System.ArgumentException(
+                    $"Another identifiable with the ID {identifiable.Id} " +
+                    "has already been indexed.");
+            }
+
+            if (identifiable is Aas.ISubmodel submodel)
+            {
+                _referables.Add(submodel.Id, IndexElements(submodel));
+            }
+
+            Version++;
+        }
+
+        /// <summary>
+        /// Remove the <paramref name="identifiable" /> from the index once it has been
+        /// removed from the environment.
+        /// </summary>
+        /// <remarks>
+        /// Remove the identifiable before you change its ID.
+        /// </remarks>
+        /// <returns>
+        /// <c>true</c> if the identifiable has been indexed, <c>false</c> otherwise
+        /// </returns>
+        public bool Remove(Aas.IIdentifiable identifiable)
+        {
+            if (!_identifiables.TryGetValue(identifiable.Id, out var indexed)
+                || !ReferenceEquals(indexed, identifiable))
+            {
+                return false;
+            }
+
+            _identifiables.Remove(identifiable.Id);
+            _referables.Remove(identifiable.Id);
+
+            Version++;
+            return true;
+        }
+
+        /// <summary>
+        /// Re-index the submodel elements of the <paramref name="submodel" /> after
+        /// they have been changed.
+        /// </summary>
+        /// <exception cref="System.ArgumentException">
+        /// Thrown when the <paramref name="submodel" /> has not been indexed.
+        /// </exception>
+        public void Reindex(Aas.ISubmodel submodel)
+        {
+            if (!_identifiables.TryGetValue(submodel.Id, out var indexed)
+                || !ReferenceEquals(indexed, submodel))
+            {
+                throw new System.ArgumentException(
+                    $"The submodel with the ID {submodel.Id} has not been indexed.");
+            }
+
+            _referables[submodel.Id] = IndexElements(submodel);
+
+            Version++;
+        }
+
+        /// <summary>
+        /// Get the addressable children of a submodel element, and whether they are
+        /// addressed by their index rather than by their ID-short.
+        /// </summary>
+        internal static IReadOnlyList<Aas.ISubmodelElement>? ChildrenOf(
+            Aas.ISubmodelElement element,
+            out bool byIndex)
+        {
+            byIndex = false;
+            switch (element)
+            {
+                case Aas.ISubmodelElementCollection collection:
+                    return collection.Value;
+                case Aas.ISubmodelElementList list:
+                    byIndex = true;
+                    return list.Value;
+                case Aas.IEntity entity:
+                    return entity.Statements;
+                case Aas.IAnnotatedRelationshipElement annotated:
+                    return annotated.Annotations;
+                default:
+                    return null;
+            }
+        }
+
+        private static void PushChildren(
+            List<(string, Aas.ISubmodelElement)> stack,
+            string? path,
+            IReadOnlyList<Aas.ISubmodelElement>? children,
+            bool byIndex)
+        {
+            if (children == null)
+            {
+                return;
+            }
+
+            // Push in reverse so that the children are indexed in order.
+            for (int i = children.Count - 1; i >= 0; i--)
+            {
+                var child = children[i];
+                if (byIndex)
+                {
+                    stack.Add(($"{path}[{i}]", child));
+                }
+                else if (child.IdShort != null)
+                {
+                    stack.Add((
+                        path == null ? child.IdShort : $"{path}.{child.IdShort}",
+                        child));
+                }
+            }
+        }
+
+        private static Dictionary<string, Aas.IReferable> IndexElements(
+            Aas.ISubmodel submodel)
+        {
+            var result = new Dictionary<string, Aas.IReferable>();
+
+            var stack = new List<(string, Aas.ISubmodelElement)>();
+            PushChildren(stack, null, submodel.SubmodelElements, false);
+
+            while (stack.Count > 0)
+            {
+                var (path, element) = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                if (!result.TryAdd(path, element))
+                {
+                    // The ID-short is duplicated, so the children of the duplicate
+                    // can not be addressed either.
+                    continue;
+                }
+
+                var children = ChildrenOf(element, out bool byIndex);
+                PushChildren(stack, path, children, byIndex);
+            }
+
+            return result;
+        }
+    }  // public class EnvironmentIndex
+}  // namespace AasCore.Aas3_0
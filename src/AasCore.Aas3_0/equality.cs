@@ -0,0 +1,235 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Compare the model instances by value, and hash them accordingly.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// Two instances are deeply equal if they are of the same concrete class,
+    /// and all their properties are deeply equal. The strings are compared
+    /// ordinally, and the lists item-wise. An unset list is not equal to
+    /// an empty one.
+    /// </para>
+    /// <para>
+    /// The deep hash is consistent with the deep equality, and stable across
+    /// processes and platforms so that it can be persisted.
+    /// </para>
+    /// </remarks>
+    public static partial class Equality
+    {
+        private static readonly DeepEqualityChecker DeepEqualityCheckerInstance = (
+            new DeepEqualityChecker());
+
+        private static readonly DeepHasher DeepHasherInstance = (
+            new DeepHasher());
+
+        /// <summary>
+        /// Check whether <paramref name="that" /> and <paramref name="other" /> are
+        /// deeply equal.
+        /// </summary>
+        public static bool DeepEquals(Aas.IClass that, Aas.IClass other)
+        {
+            return DeepEqualityCheckerInstance.Transform(that, other);
+        }
+
+        /// <summary>
+        /// Compute the deep hash of <paramref name="that" />.
+        /// </summary>
+        /// <remarks>
+        /// Deeply equal instances have the same deep hash.
+        /// </remarks>
+        public static int DeepHash(Aas.IClass that)
+        {
+            return DeepHasherInstance.Transform(that);
+        }
+
+        /// <summary>
+        /// Compare the instances deeply, for example, to use them as keys
+        /// in a dictionary.
+        /// </summary>
+        /// <remarks>
+        /// Mind that the hash of an instance changes when you change the instance.
+        /// Do not change the instances while they are used as keys.
+        /// </remarks>
+        public class DeepEqualityComparer : IEqualityComparer<Aas.IClass>
+        {
+            public static readonly DeepEqualityComparer Instance = (
+                new DeepEqualityComparer());
+
+            public bool Equals(Aas.IClass? that, Aas.IClass? other)
+            {
+                if (that == null || other == null)
+                {
+                    return that == null && other == null;
+                }
+
+                return DeepEquals(that, other);
+            }
+
+            public int GetHashCode(Aas.IClass that)
+            {
+                return DeepHash(that);
+            }
+        }  // public class DeepEqualityComparer
+
+        /// <summary>Dispatch the deep comparison.</summary>
+        /// <remarks>
+        /// The comparisons of the individual classes are generated from the meta-model
+        /// in <c>equality_transformers.cs</c>.
+        /// </remarks>
+        internal partial class DeepEqualityChecker
+            : Visitation.AbstractTransformerWithContext<Aas.IClass, bool>
+        {
+            private bool EqualOrBothNull(Aas.IClass? that, Aas.IClass? other)
+            {
+                if (that == null || other == null)
+                {
+                    return that == null && other == null;
+                }
+
+                return Transform(that, other);
+            }
+
+            private bool ListsEqual<T>(List<T>? that, List<T>? other)
+                where T : Aas.IClass
+            {
+                if (that == null || other == null)
+                {
+                    return that == null && other == null;
+                }
+
+                if (that.Count != other.Count)
+                {
+                    return false;
+                }
+
+                for (int i = 0; i < that.Count; i++)
+                {
+                    if (!Transform(that[i], other[i]))
+                    {
+                        return false;
+                    }
+                }
+
+                return true;
+            }
+
+            private static bool BytesEqual(byte[]? that, byte[]? other)
+            {
+                if (that == null || other == null)
+                {
+                    return that == null && other == null;
+                }
+
+                return System.MemoryExtensions.SequenceEqual(
+                    new System.ReadOnlySpan<byte>(that),
+                    new System.ReadOnlySpan<byte>(other));
+            }
+        }  // internal partial class DeepEqualityChecker
+
+        /// <summary>Dispatch the deep hashing.</summary>
+        /// <remarks>
+        /// <para>
+        /// We use FNV-1a to combine the hashes as <see cref="string.GetHashCode()" />
+        /// is randomized per process.
+        /// </para>
+        /// <para>
+        /// The hashes of the individual classes are generated from the meta-model
+        /// in <c>equality_transformers.cs</c>.
+        /// </para>
+        /// </remarks>
+        internal partial class DeepHasher : Visitation.AbstractTransformer<int>
+        {
+            private const int FnvOffsetBasis = unchecked((int)2166136261);
+            private const int FnvPrime = 16777619;
+
+            private static int Combine(int hash, int value)
+            {
+                return unchecked((hash ^ value) * FnvPrime);
+            }
+
+            private static int HashOf(string? text)
+            {
+                if (text == null)
+                {
+                    return 0;
+                }
+
+                int hash = FnvOffsetBasis;
+                foreach (char character in text)
+                {
+                    hash = Combine(hash, character);
+                }
+
+                return hash;
+            }
+
+            private static int HashOf(bool? value)
+            {
+                if (value == null)
+                {
+                    return 0;
+                }
+
+                return value.Value ? 1 : 2;
+            }
+
+            private static int HashOf(int? value)
+            {
+                if (value == null)
+                {
+                    return 0;
+                }
+
+                return Combine(FnvOffsetBasis, value.Value);
+            }
+
+            private static int HashOf(byte[]? bytes)
+            {
+                if (bytes == null)
+                {
+                    return 0;
+                }
+
+                int hash = Combine(FnvOffsetBasis, bytes.Length);
+                foreach (byte value in bytes)
+                {
+                    hash = Combine(hash, value);
+                }
+
+                return hash;
+            }
+
+            private int HashOf(Aas.IClass? that)
+            {
+                if (that == null)
+                {
+                    return 0;
+                }
+
+                return Transform(that);
+            }
+
+            private int HashOfList<T>(List<T>? items)
+                where T : Aas.IClass
+            {
+                if (items == null)
+                {
+                    return 0;
+                }
+
+                int hash = Combine(FnvOffsetBasis, items.Count);
+                foreach (var item in items)
+                {
+                    hash = Combine(hash, Transform(item));
+                }
+
+                return hash;
+            }
+        }  // internal partial class DeepHasher
+    }  // public static partial class Equality
+}  // namespace AasCore.Aas3_0
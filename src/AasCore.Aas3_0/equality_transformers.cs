@@ -0,0 +1,1372 @@
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Equality
+    {
+        internal partial class DeepEqualityChecker
+        {
+            public override bool TransformExtension(
+                Aas.IExtension that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IExtension casted))
+                {
+                    return false;
+                }
+
+                return (
+                    EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && that.Name == casted.Name
+                    && that.ValueType == casted.ValueType
+                    && that.Value == casted.Value
+                    && ListsEqual(that.RefersTo, casted.RefersTo));
+            }
+
+            public override bool TransformAdministrativeInformation(
+                Aas.IAdministrativeInformation that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IAdministrativeInformation casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && that.Version == casted.Version
+                    && that.Revision == casted.Revision
+                    && EqualOrBothNull(that.Creator, casted.Creator)
+                    && that.TemplateId == casted.TemplateId);
+            }
+
+            public override bool TransformQualifier(
+                Aas.IQualifier that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IQualifier casted))
+                {
+                    return false;
+                }
+
+                return (
+                    EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && that.Kind == casted.Kind
+                    && that.Type == casted.Type
+                    && that.ValueType == casted.ValueType
+                    && that.Value == casted.Value
+                    && EqualOrBothNull(that.ValueId, casted.ValueId));
+            }
+
+            public override bool TransformAssetAdministrationShell(
+                Aas.IAssetAdministrationShell that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IAssetAdministrationShell casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.Administration, casted.Administration)
+                    && that.Id == casted.Id
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && EqualOrBothNull(that.DerivedFrom, casted.DerivedFrom)
+                    && Transform(that.AssetInformation, casted.AssetInformation)
+                    && ListsEqual(that.Submodels, casted.Submodels));
+            }
+
+            public override bool TransformAssetInformation(
+                Aas.IAssetInformation that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IAssetInformation casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.AssetKind == casted.AssetKind
+                    && that.GlobalAssetId == casted.GlobalAssetId
+                    && ListsEqual(that.SpecificAssetIds, casted.SpecificAssetIds)
+                    && that.AssetType == casted.AssetType
+                    && EqualOrBothNull(that.DefaultThumbnail, casted.DefaultThumbnail));
+            }
+
+            public override bool TransformResource(
+                Aas.IResource that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IResource casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Path == casted.Path
+                    && that.ContentType == casted.ContentType);
+            }
+
+            public override bool TransformSpecificAssetId(
+                Aas.ISpecificAssetId that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ISpecificAssetId casted))
+                {
+                    return false;
+                }
+
+                return (
+                    EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && that.Name == casted.Name
+                    && that.Value == casted.Value
+                    && EqualOrBothNull(that.ExternalSubjectId, casted.ExternalSubjectId));
+            }
+
+            public override bool TransformSubmodel(
+                Aas.ISubmodel that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ISubmodel casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.Administration, casted.Administration)
+                    && that.Id == casted.Id
+                    && that.Kind == casted.Kind
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && ListsEqual(that.SubmodelElements, casted.SubmodelElements));
+            }
+
+            public override bool TransformRelationshipElement(
+                Aas.IRelationshipElement that,
+                Aas.IClass other
+            )
+            {
+                // NOTE: The instances of the more specific classes also implement
+                // the interface, but are never equal to the instances of this class.
+                if (!(other is Aas.IRelationshipElement casted)
+                    || other is Aas.IAnnotatedRelationshipElement)
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && Transform(that.First, casted.First)
+                    && Transform(that.Second, casted.Second));
+            }
+
+            public override bool TransformSubmodelElementList(
+                Aas.ISubmodelElementList that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ISubmodelElementList casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && that.OrderRelevant == casted.OrderRelevant
+                    && EqualOrBothNull(that.SemanticIdListElement, casted.SemanticIdListElement)
+                    && that.TypeValueListElement == casted.TypeValueListElement
+                    && that.ValueTypeListElement == casted.ValueTypeListElement
+                    && ListsEqual(that.Value, casted.Value));
+            }
+
+            public override bool TransformSubmodelElementCollection(
+                Aas.ISubmodelElementCollection that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ISubmodelElementCollection casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && ListsEqual(that.Value, casted.Value));
+            }
+
+            public override bool TransformProperty(
+                Aas.IProperty that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IProperty casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && that.ValueType == casted.ValueType
+                    && that.Value == casted.Value
+                    && EqualOrBothNull(that.ValueId, casted.ValueId));
+            }
+
+            public override bool TransformMultiLanguageProperty(
+                Aas.IMultiLanguageProperty that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IMultiLanguageProperty casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && ListsEqual(that.Value, casted.Value)
+                    && EqualOrBothNull(that.ValueId, casted.ValueId));
+            }
+
+            public override bool TransformRange(
+                Aas.IRange that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IRange casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && that.ValueType == casted.ValueType
+                    && that.Min == casted.Min
+                    && that.Max == casted.Max);
+            }
+
+            public override bool TransformReferenceElement(
+                Aas.IReferenceElement that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IReferenceElement casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && EqualOrBothNull(that.Value, casted.Value));
+            }
+
+            public override bool TransformBlob(
+                Aas.IBlob that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IBlob casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && BytesEqual(that.Value, casted.Value)
+                    && that.ContentType == casted.ContentType);
+            }
+
+            public override bool TransformFile(
+                Aas.IFile that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IFile casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && that.Value == casted.Value
+                    && that.ContentType == casted.ContentType);
+            }
+
+            public override bool TransformAnnotatedRelationshipElement(
+                Aas.IAnnotatedRelationshipElement that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IAnnotatedRelationshipElement casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && Transform(that.First, casted.First)
+                    && Transform(that.Second, casted.Second)
+                    && ListsEqual(that.Annotations, casted.Annotations));
+            }
+
+            public override bool TransformEntity(
+                Aas.IEntity that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IEntity casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && ListsEqual(that.Statements, casted.Statements)
+                    && that.EntityType == casted.EntityType
+                    && that.GlobalAssetId == casted.GlobalAssetId
+                    && ListsEqual(that.SpecificAssetIds, casted.SpecificAssetIds));
+            }
+
+            public override bool TransformEventPayload(
+                Aas.IEventPayload that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IEventPayload casted))
+                {
+                    return false;
+                }
+
+                return (
+                    Transform(that.Source, casted.Source)
+                    && EqualOrBothNull(that.SourceSemanticId, casted.SourceSemanticId)
+                    && Transform(that.ObservableReference, casted.ObservableReference)
+                    && EqualOrBothNull(that.ObservableSemanticId, casted.ObservableSemanticId)
+                    && that.Topic == casted.Topic
+                    && EqualOrBothNull(that.SubjectId, casted.SubjectId)
+                    && that.TimeStamp == casted.TimeStamp
+                    && BytesEqual(that.Payload, casted.Payload));
+            }
+
+            public override bool TransformBasicEventElement(
+                Aas.IBasicEventElement that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IBasicEventElement casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && Transform(that.Observed, casted.Observed)
+                    && that.Direction == casted.Direction
+                    && that.State == casted.State
+                    && that.MessageTopic == casted.MessageTopic
+                    && EqualOrBothNull(that.MessageBroker, casted.MessageBroker)
+                    && that.LastUpdate == casted.LastUpdate
+                    && that.MinInterval == casted.MinInterval
+                    && that.MaxInterval == casted.MaxInterval);
+            }
+
+            public override bool TransformOperation(
+                Aas.IOperation that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IOperation casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && ListsEqual(that.InputVariables, casted.InputVariables)
+                    && ListsEqual(that.OutputVariables, casted.OutputVariables)
+                    && ListsEqual(that.InoutputVariables, casted.InoutputVariables));
+            }
+
+            public override bool TransformOperationVariable(
+                Aas.IOperationVariable that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IOperationVariable casted))
+                {
+                    return false;
+                }
+
+                return (
+                    Transform(that.Value, casted.Value));
+            }
+
+            public override bool TransformCapability(
+                Aas.ICapability that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ICapability casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.SemanticId, casted.SemanticId)
+                    && ListsEqual(that.SupplementalSemanticIds, casted.SupplementalSemanticIds)
+                    && ListsEqual(that.Qualifiers, casted.Qualifiers)
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications));
+            }
+
+            public override bool TransformConceptDescription(
+                Aas.IConceptDescription that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IConceptDescription casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.Extensions, casted.Extensions)
+                    && that.Category == casted.Category
+                    && that.IdShort == casted.IdShort
+                    && ListsEqual(that.DisplayName, casted.DisplayName)
+                    && ListsEqual(that.Description, casted.Description)
+                    && EqualOrBothNull(that.Administration, casted.Administration)
+                    && that.Id == casted.Id
+                    && ListsEqual(that.EmbeddedDataSpecifications, casted.EmbeddedDataSpecifications)
+                    && ListsEqual(that.IsCaseOf, casted.IsCaseOf));
+            }
+
+            public override bool TransformReference(
+                Aas.IReference that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IReference casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Type == casted.Type
+                    && EqualOrBothNull(that.ReferredSemanticId, casted.ReferredSemanticId)
+                    && ListsEqual(that.Keys, casted.Keys));
+            }
+
+            public override bool TransformKey(
+                Aas.IKey that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IKey casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Type == casted.Type
+                    && that.Value == casted.Value);
+            }
+
+            public override bool TransformLangStringNameType(
+                Aas.ILangStringNameType that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ILangStringNameType casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Language == casted.Language
+                    && that.Text == casted.Text);
+            }
+
+            public override bool TransformLangStringTextType(
+                Aas.ILangStringTextType that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ILangStringTextType casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Language == casted.Language
+                    && that.Text == casted.Text);
+            }
+
+            public override bool TransformEnvironment(
+                Aas.IEnvironment that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IEnvironment casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.AssetAdministrationShells, casted.AssetAdministrationShells)
+                    && ListsEqual(that.Submodels, casted.Submodels)
+                    && ListsEqual(that.ConceptDescriptions, casted.ConceptDescriptions));
+            }
+
+            public override bool TransformEmbeddedDataSpecification(
+                Aas.IEmbeddedDataSpecification that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IEmbeddedDataSpecification casted))
+                {
+                    return false;
+                }
+
+                return (
+                    Transform(that.DataSpecification, casted.DataSpecification)
+                    && Transform(that.DataSpecificationContent, casted.DataSpecificationContent));
+            }
+
+            public override bool TransformLevelType(
+                Aas.ILevelType that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ILevelType casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Min == casted.Min
+                    && that.Nom == casted.Nom
+                    && that.Typ == casted.Typ
+                    && that.Max == casted.Max);
+            }
+
+            public override bool TransformValueReferencePair(
+                Aas.IValueReferencePair that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IValueReferencePair casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Value == casted.Value
+                    && Transform(that.ValueId, casted.ValueId));
+            }
+
+            public override bool TransformValueList(
+                Aas.IValueList that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IValueList casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.ValueReferencePairs, casted.ValueReferencePairs));
+            }
+
+            public override bool TransformLangStringPreferredNameTypeIec61360(
+                Aas.ILangStringPreferredNameTypeIec61360 that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ILangStringPreferredNameTypeIec61360 casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Language == casted.Language
+                    && that.Text == casted.Text);
+            }
+
+            public override bool TransformLangStringShortNameTypeIec61360(
+                Aas.ILangStringShortNameTypeIec61360 that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ILangStringShortNameTypeIec61360 casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Language == casted.Language
+                    && that.Text == casted.Text);
+            }
+
+            public override bool TransformLangStringDefinitionTypeIec61360(
+                Aas.ILangStringDefinitionTypeIec61360 that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.ILangStringDefinitionTypeIec61360 casted))
+                {
+                    return false;
+                }
+
+                return (
+                    that.Language == casted.Language
+                    && that.Text == casted.Text);
+            }
+
+            public override bool TransformDataSpecificationIec61360(
+                Aas.IDataSpecificationIec61360 that,
+                Aas.IClass other
+            )
+            {
+                if (!(other is Aas.IDataSpecificationIec61360 casted))
+                {
+                    return false;
+                }
+
+                return (
+                    ListsEqual(that.PreferredName, casted.PreferredName)
+                    && ListsEqual(that.ShortName, casted.ShortName)
+                    && that.Unit == casted.Unit
+                    && EqualOrBothNull(that.UnitId, casted.UnitId)
+                    && that.SourceOfDefinition == casted.SourceOfDefinition
+                    && that.Symbol == casted.Symbol
+                    && that.DataType == casted.DataType
+                    && ListsEqual(that.Definition, casted.Definition)
+                    && that.ValueFormat == casted.ValueFormat
+                    && EqualOrBothNull(that.ValueList, casted.ValueList)
+                    && that.Value == casted.Value
+                    && EqualOrBothNull(that.LevelType, casted.LevelType));
+            }
+        }  // internal partial class DeepEqualityChecker
+
+        internal partial class DeepHasher
+        {
+            public override int TransformExtension(
+                Aas.IExtension that
+            )
+            {
+                int hash = HashOf("Extension");
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOf(that.Name));
+                hash = Combine(hash, HashOf((int?)that.ValueType));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOfList(that.RefersTo));
+                return hash;
+            }
+
+            public override int TransformAdministrativeInformation(
+                Aas.IAdministrativeInformation that
+            )
+            {
+                int hash = HashOf("AdministrativeInformation");
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf(that.Version));
+                hash = Combine(hash, HashOf(that.Revision));
+                hash = Combine(hash, HashOf(that.Creator));
+                hash = Combine(hash, HashOf(that.TemplateId));
+                return hash;
+            }
+
+            public override int TransformQualifier(
+                Aas.IQualifier that
+            )
+            {
+                int hash = HashOf("Qualifier");
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOf((int?)that.Kind));
+                hash = Combine(hash, HashOf(that.Type));
+                hash = Combine(hash, HashOf((int?)that.ValueType));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOf(that.ValueId));
+                return hash;
+            }
+
+            public override int TransformAssetAdministrationShell(
+                Aas.IAssetAdministrationShell that
+            )
+            {
+                int hash = HashOf("AssetAdministrationShell");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.Administration));
+                hash = Combine(hash, HashOf(that.Id));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf(that.DerivedFrom));
+                hash = Combine(hash, Transform(that.AssetInformation));
+                hash = Combine(hash, HashOfList(that.Submodels));
+                return hash;
+            }
+
+            public override int TransformAssetInformation(
+                Aas.IAssetInformation that
+            )
+            {
+                int hash = HashOf("AssetInformation");
+                hash = Combine(hash, HashOf((int?)that.AssetKind));
+                hash = Combine(hash, HashOf(that.GlobalAssetId));
+                hash = Combine(hash, HashOfList(that.SpecificAssetIds));
+                hash = Combine(hash, HashOf(that.AssetType));
+                hash = Combine(hash, HashOf(that.DefaultThumbnail));
+                return hash;
+            }
+
+            public override int TransformResource(
+                Aas.IResource that
+            )
+            {
+                int hash = HashOf("Resource");
+                hash = Combine(hash, HashOf(that.Path));
+                hash = Combine(hash, HashOf(that.ContentType));
+                return hash;
+            }
+
+            public override int TransformSpecificAssetId(
+                Aas.ISpecificAssetId that
+            )
+            {
+                int hash = HashOf("SpecificAssetId");
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOf(that.Name));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOf(that.ExternalSubjectId));
+                return hash;
+            }
+
+            public override int TransformSubmodel(
+                Aas.ISubmodel that
+            )
+            {
+                int hash = HashOf("Submodel");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.Administration));
+                hash = Combine(hash, HashOf(that.Id));
+                hash = Combine(hash, HashOf((int?)that.Kind));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOfList(that.SubmodelElements));
+                return hash;
+            }
+
+            public override int TransformRelationshipElement(
+                Aas.IRelationshipElement that
+            )
+            {
+                int hash = HashOf("RelationshipElement");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, Transform(that.First));
+                hash = Combine(hash, Transform(that.Second));
+                return hash;
+            }
+
+            public override int TransformSubmodelElementList(
+                Aas.ISubmodelElementList that
+            )
+            {
+                int hash = HashOf("SubmodelElementList");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf(that.OrderRelevant));
+                hash = Combine(hash, HashOf(that.SemanticIdListElement));
+                hash = Combine(hash, HashOf((int?)that.TypeValueListElement));
+                hash = Combine(hash, HashOf((int?)that.ValueTypeListElement));
+                hash = Combine(hash, HashOfList(that.Value));
+                return hash;
+            }
+
+            public override int TransformSubmodelElementCollection(
+                Aas.ISubmodelElementCollection that
+            )
+            {
+                int hash = HashOf("SubmodelElementCollection");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOfList(that.Value));
+                return hash;
+            }
+
+            public override int TransformProperty(
+                Aas.IProperty that
+            )
+            {
+                int hash = HashOf("Property");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf((int?)that.ValueType));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOf(that.ValueId));
+                return hash;
+            }
+
+            public override int TransformMultiLanguageProperty(
+                Aas.IMultiLanguageProperty that
+            )
+            {
+                int hash = HashOf("MultiLanguageProperty");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOfList(that.Value));
+                hash = Combine(hash, HashOf(that.ValueId));
+                return hash;
+            }
+
+            public override int TransformRange(
+                Aas.IRange that
+            )
+            {
+                int hash = HashOf("Range");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf((int?)that.ValueType));
+                hash = Combine(hash, HashOf(that.Min));
+                hash = Combine(hash, HashOf(that.Max));
+                return hash;
+            }
+
+            public override int TransformReferenceElement(
+                Aas.IReferenceElement that
+            )
+            {
+                int hash = HashOf("ReferenceElement");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf(that.Value));
+                return hash;
+            }
+
+            public override int TransformBlob(
+                Aas.IBlob that
+            )
+            {
+                int hash = HashOf("Blob");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOf(that.ContentType));
+                return hash;
+            }
+
+            public override int TransformFile(
+                Aas.IFile that
+            )
+            {
+                int hash = HashOf("File");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOf(that.ContentType));
+                return hash;
+            }
+
+            public override int TransformAnnotatedRelationshipElement(
+                Aas.IAnnotatedRelationshipElement that
+            )
+            {
+                int hash = HashOf("AnnotatedRelationshipElement");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, Transform(that.First));
+                hash = Combine(hash, Transform(that.Second));
+                hash = Combine(hash, HashOfList(that.Annotations));
+                return hash;
+            }
+
+            public override int TransformEntity(
+                Aas.IEntity that
+            )
+            {
+                int hash = HashOf("Entity");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOfList(that.Statements));
+                hash = Combine(hash, HashOf((int?)that.EntityType));
+                hash = Combine(hash, HashOf(that.GlobalAssetId));
+                hash = Combine(hash, HashOfList(that.SpecificAssetIds));
+                return hash;
+            }
+
+            public override int TransformEventPayload(
+                Aas.IEventPayload that
+            )
+            {
+                int hash = HashOf("EventPayload");
+                hash = Combine(hash, Transform(that.Source));
+                hash = Combine(hash, HashOf(that.SourceSemanticId));
+                hash = Combine(hash, Transform(that.ObservableReference));
+                hash = Combine(hash, HashOf(that.ObservableSemanticId));
+                hash = Combine(hash, HashOf(that.Topic));
+                hash = Combine(hash, HashOf(that.SubjectId));
+                hash = Combine(hash, HashOf(that.TimeStamp));
+                hash = Combine(hash, HashOf(that.Payload));
+                return hash;
+            }
+
+            public override int TransformBasicEventElement(
+                Aas.IBasicEventElement that
+            )
+            {
+                int hash = HashOf("BasicEventElement");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, Transform(that.Observed));
+                hash = Combine(hash, HashOf((int?)that.Direction));
+                hash = Combine(hash, HashOf((int?)that.State));
+                hash = Combine(hash, HashOf(that.MessageTopic));
+                hash = Combine(hash, HashOf(that.MessageBroker));
+                hash = Combine(hash, HashOf(that.LastUpdate));
+                hash = Combine(hash, HashOf(that.MinInterval));
+                hash = Combine(hash, HashOf(that.MaxInterval));
+                return hash;
+            }
+
+            public override int TransformOperation(
+                Aas.IOperation that
+            )
+            {
+                int hash = HashOf("Operation");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOfList(that.InputVariables));
+                hash = Combine(hash, HashOfList(that.OutputVariables));
+                hash = Combine(hash, HashOfList(that.InoutputVariables));
+                return hash;
+            }
+
+            public override int TransformOperationVariable(
+                Aas.IOperationVariable that
+            )
+            {
+                int hash = HashOf("OperationVariable");
+                hash = Combine(hash, Transform(that.Value));
+                return hash;
+            }
+
+            public override int TransformCapability(
+                Aas.ICapability that
+            )
+            {
+                int hash = HashOf("Capability");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.SemanticId));
+                hash = Combine(hash, HashOfList(that.SupplementalSemanticIds));
+                hash = Combine(hash, HashOfList(that.Qualifiers));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                return hash;
+            }
+
+            public override int TransformConceptDescription(
+                Aas.IConceptDescription that
+            )
+            {
+                int hash = HashOf("ConceptDescription");
+                hash = Combine(hash, HashOfList(that.Extensions));
+                hash = Combine(hash, HashOf(that.Category));
+                hash = Combine(hash, HashOf(that.IdShort));
+                hash = Combine(hash, HashOfList(that.DisplayName));
+                hash = Combine(hash, HashOfList(that.Description));
+                hash = Combine(hash, HashOf(that.Administration));
+                hash = Combine(hash, HashOf(that.Id));
+                hash = Combine(hash, HashOfList(that.EmbeddedDataSpecifications));
+                hash = Combine(hash, HashOfList(that.IsCaseOf));
+                return hash;
+            }
+
+            public override int TransformReference(
+                Aas.IReference that
+            )
+            {
+                int hash = HashOf("Reference");
+                hash = Combine(hash, HashOf((int?)that.Type));
+                hash = Combine(hash, HashOf(that.ReferredSemanticId));
+                hash = Combine(hash, HashOfList(that.Keys));
+                return hash;
+            }
+
+            public override int TransformKey(
+                Aas.IKey that
+            )
+            {
+                int hash = HashOf("Key");
+                hash = Combine(hash, HashOf((int?)that.Type));
+                hash = Combine(hash, HashOf(that.Value));
+                return hash;
+            }
+
+            public override int TransformLangStringNameType(
+                Aas.ILangStringNameType that
+            )
+            {
+                int hash = HashOf("LangStringNameType");
+                hash = Combine(hash, HashOf(that.Language));
+                hash = Combine(hash, HashOf(that.Text));
+                return hash;
+            }
+
+            public override int TransformLangStringTextType(
+                Aas.ILangStringTextType that
+            )
+            {
+                int hash = HashOf("LangStringTextType");
+                hash = Combine(hash, HashOf(that.Language));
+                hash = Combine(hash, HashOf(that.Text));
+                return hash;
+            }
+
+            public override int TransformEnvironment(
+                Aas.IEnvironment that
+            )
+            {
+                int hash = HashOf("Environment");
+                hash = Combine(hash, HashOfList(that.AssetAdministrationShells));
+                hash = Combine(hash, HashOfList(that.Submodels));
+                hash = Combine(hash, HashOfList(that.ConceptDescriptions));
+                return hash;
+            }
+
+            public override int TransformEmbeddedDataSpecification(
+                Aas.IEmbeddedDataSpecification that
+            )
+            {
+                int hash = HashOf("EmbeddedDataSpecification");
+                hash = Combine(hash, Transform(that.DataSpecification));
+                hash = Combine(hash, Transform(that.DataSpecificationContent));
+                return hash;
+            }
+
+            public override int TransformLevelType(
+                Aas.ILevelType that
+            )
+            {
+                int hash = HashOf("LevelType");
+                hash = Combine(hash, HashOf((bool?)that.Min));
+                hash = Combine(hash, HashOf((bool?)that.Nom));
+                hash = Combine(hash, HashOf((bool?)that.Typ));
+                hash = Combine(hash, HashOf((bool?)that.Max));
+                return hash;
+            }
+
+            public override int TransformValueReferencePair(
+                Aas.IValueReferencePair that
+            )
+            {
+                int hash = HashOf("ValueReferencePair");
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, Transform(that.ValueId));
+                return hash;
+            }
+
+            public override int TransformValueList(
+                Aas.IValueList that
+            )
+            {
+                int hash = HashOf("ValueList");
+                hash = Combine(hash, HashOfList(that.ValueReferencePairs));
+                return hash;
+            }
+
+            public override int TransformLangStringPreferredNameTypeIec61360(
+                Aas.ILangStringPreferredNameTypeIec61360 that
+            )
+            {
+                int hash = HashOf("LangStringPreferredNameTypeIec61360");
+                hash = Combine(hash, HashOf(that.Language));
+                hash = Combine(hash, HashOf(that.Text));
+                return hash;
+            }
+
+            public override int TransformLangStringShortNameTypeIec61360(
+                Aas.ILangStringShortNameTypeIec61360 that
+            )
+            {
+                int hash = HashOf("LangStringShortNameTypeIec61360");
+                hash = Combine(hash, HashOf(that.Language));
+                hash = Combine(hash, HashOf(that.Text));
+                return hash;
+            }
+
+            public override int TransformLangStringDefinitionTypeIec61360(
+                Aas.ILangStringDefinitionTypeIec61360 that
+            )
+            {
+                int hash = HashOf("LangStringDefinitionTypeIec61360");
+                hash = Combine(hash, HashOf(that.Language));
+                hash = Combine(hash, HashOf(that.Text));
+                return hash;
+            }
+
+            public override int TransformDataSpecificationIec61360(
+                Aas.IDataSpecificationIec61360 that
+            )
+            {
+                int hash = HashOf("DataSpecificationIec61360");
+                hash = Combine(hash, HashOfList(that.PreferredName));
+                hash = Combine(hash, HashOfList(that.ShortName));
+                hash = Combine(hash, HashOf(that.Unit));
+                hash = Combine(hash, HashOf(that.UnitId));
+                hash = Combine(hash, HashOf(that.SourceOfDefinition));
+                hash = Combine(hash, HashOf(that.Symbol));
+                hash = Combine(hash, HashOf((int?)that.DataType));
+                hash = Combine(hash, HashOfList(that.Definition));
+                hash = Combine(hash, HashOf(that.ValueFormat));
+                hash = Combine(hash, HashOf(that.ValueList));
+                hash = Combine(hash, HashOf(that.Value));
+                hash = Combine(hash, HashOf(that.LevelType));
+                return hash;
+            }
+        }  // internal partial class DeepHasher
+    }  // public static partial class Equality
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,407 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Represent a parsed ID-short path such as <c>Sensors.Temperatures[3].Value</c>.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The ID-shorts are separated by dots, and the items of a submodel element
+    /// list are given by their zero-based index in brackets. The path descends
+    /// into submodel element collections and lists, the statements of entities
+    /// and the annotations of annotated relationship elements.
+    /// </para>
+    /// <para>
+    /// Parse a path once, and resolve it as many times as you need. The children
+    /// are looked up through <see cref="ChildIndex" />, so the resolution takes
+    /// the time proportional to the length of the path rather than to the number
+    /// of the children.
+    /// </para>
+    /// </remarks>
+    public class IdShortPath
+    {
+        /// <summary>
+        /// Represent a single step of the path, either an ID-short or an index.
+        /// </summary>
+        public class Segment
+        {
+            /// <summary>
+            /// ID-short of the child, if the child is addressed by its ID-short
+            /// </summary>
+            public string? IdShort { get; }
+
+            /// <summary>
+            /// Zero-based index of the item, if the item of a submodel element list
+            /// is addressed
+            /// </summary>
+            public int? Index { get; }
+
+            internal Segment(string idShort)
+            {
+                IdShort = idShort;
+            }
+
+            internal Segment(int index)
+            {
+                Index = index;
+            }
+        }  // public class Segment
+
+        /// <summary>
+        /// Steps of the path, at least one
+        /// </summary>
+        public IReadOnlyList<Segment> Segments { get; }
+
+        private IdShortPath(IReadOnlyList<Segment> segments)
+        {
+            Segments = segments;
+        }
+
+        /// <summary>
+        /// Try to parse the <paramref name="text" /> as an ID-short path.
+        /// </summary>
+        /// <param name="text">to be parsed</param>
+        /// <param name="path">the parsed path, or <c>null</c> if the text is invalid</param>
+        /// <param name="error">describes the problem, if the text is invalid</param>
+        /// <returns><c>true</c> if the text is a valid path</returns>
+        public static bool TryParse(string text, out IdShortPath? path, out string? error)
+        {
+            path = null;
+            error = null;
+
+            var segments = new List<Segment>();
+
+            int cursor = 0;
+            while (true)
+            {
+                if (cursor < text.Length && text[cursor] == '[')
+                {
+                    int start = cursor + 1;
+                    int end = text.IndexOf(']', start);
+                    if (end == -1)
+                    {
+                        error = $"Expected a closing bracket for the index at {cursor}";
+                        return false;
+                    }
+
+                    string digits = text.Substring(start, end - start);
+                    if (!TryParseIndex(digits, out int index))
+                    {
+                        error = (
+                            "Expected a non-negative integer without leading zeros " +
+                            $"as the index at {start}, but got: {digits}");
+                        return false;
+                    }
+
+                    segments.Add(new Segment(index));
+                    cursor = end + 1;
+                }
+                else
+                {
+                    int start = cursor;
+                    while (cursor < text.Length
+                        && text[cursor] != '.'
+                        && text[cursor] != '['
+                        && text[cursor] != ']')
+                    {
+                        cursor++;
+                    }
+
+                    if (cursor == start)
+                    {
+                        error = $"Expected an ID-short at {start}";
+                        return false;
+                    }
+
+                    segments.Add(new Segment(text.Substring(start, cursor - start)));
+                }
+
+                if (cursor == text.Length)
+                {
+                    break;
+                }
+
+                switch (text[cursor])
+                {
+                    case '.':
+                        cursor++;
+                        if (cursor < text.Length && text[cursor] == '[')
+                        {
+                            error = $"Expected an ID-short after the dot at {cursor - 1}";
+                            return false;
+                        }
+                        break;
+                    case '[':
+                        break;
+                    default:
+                        error = $"Unexpected character {text[cursor]} at {cursor}";
+                        return false;
+                }
+            }
+
+            path = new IdShortPath(segments);
+            return true;
+        }
+
+        /// <summary>
+        /// Parse the <paramref name="text" /> as an ID-short path.
+        /// </summary>
+        /// <exception cref="System.ArgumentException">
+        /// Thrown when the <paramref name="text" /> is not a valid path.
+        /// </exception>
+        public static IdShortPath Parse(string text)
+        {
+            if (!TryParse(text, out var path, out var error))
+            {
+                throw new System.ArgumentException(
+                    $"Invalid ID-short path {text}: {error}");
+            }
+
+            return path!;
+        }
+
+        private static bool TryParseIndex(string digits, out int index)
+        {
+            index = 0;
+            if (digits.Length == 0 || (digits[0] == '0' && digits.Length > 1))
+            {
+                return false;
+            }
+
+            foreach (char character in digits)
+            {
+                if (character < '0' || character > '9')
+                {
+                    return false;
+                }
+            }
+
+            return int.TryParse(
+                digits,
+                System.Globalization.NumberStyles.None,
+                System.Globalization.CultureInfo.InvariantCulture,
+                out index);
+        }
+
+        /// <summary>
+        /// Render the path in the notation understood by <see cref="Parse" />.
+        /// </summary>
+        public override string ToString()
+        {
+            var builder = new System.Text.StringBuilder();
+            foreach (var segment in Segments)
+            {
+                if (segment.IdShort != null)
+                {
+                    if (builder.Length > 0)
+                    {
+                        builder.Append('.');
+                    }
+                    builder.Append(segment.IdShort);
+                }
+                else
+                {
+                    builder.Append('[').Append(segment.Index).Append(']');
+                }
+            }
+
+            return builder.ToString();
+        }
+
+        /// <summary>
+        /// Resolve the path starting from the submodel elements of
+        /// the <paramref name="submodel" />.
+        /// </summary>
+        /// <returns>The addressed element, or <c>null</c> if there is none</returns>
+        public Aas.ISubmodelElement? Resolve(Aas.ISubmodel submodel)
+        {
+            return Walk(submodel.SubmodelElements, false);
+        }
+
+        /// <summary>
+        /// Resolve the path starting from the children of
+        /// the <paramref name="container" />, such as a submodel element collection.
+        /// </summary>
+        /// <returns>The addressed element, or <c>null</c> if there is none</returns>
+        public Aas.ISubmodelElement? Resolve(Aas.ISubmodelElement container)
+        {
+            var children = EnvironmentIndex.ChildrenOf(container, out bool byIndex);
+            return Walk(children, byIndex);
+        }
+
+        private Aas.ISubmodelElement? Walk(
+            IReadOnlyList<Aas.ISubmodelElement>? children,
+            bool byIndex)
+        {
+            Aas.ISubmodelElement? current = null;
+            foreach (var segment in Segments)
+            {
+                if (children == null)
+                {
+                    return null;
+                }
+
+                if (segment.IdShort != null)
+                {
+                    if (byIndex)
+                    {
+                        return null;
+                    }
+
+                    current = ChildIndex.Find(children, segment.IdShort);
+                }
+                else
+                {
+                    int index = segment.Index!.Value;
+                    if (!byIndex || index >= children.Count)
+                    {
+                        return null;
+                    }
+
+                    current = children[index];
+                }
+
+                if (current == null)
+                {
+                    return null;
+                }
+
+                children = EnvironmentIndex.ChildrenOf(current, out byIndex);
+            }
+
+            return current;
+        }
+    }  // public class IdShortPath
+
+    /// <summary>
+    /// Look up the children of a container by their ID-shorts through an index
+    /// built lazily per list of children.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The index of a list is built on the first look-up, and kept as long as
+    /// the list is alive. The index is rebuilt when the number of the children
+    /// changes, or when it turns out to be stale: a found child does not have
+    /// the ID-short anymore, or a child missing from the index is found by
+    /// a linear scan. Hence a changed list costs at most a rebuild, and
+    /// the look-ups of missing ID-shorts cost a linear scan. If you introduce
+    /// a duplicate ID-short before the indexed child, call
+    /// <see cref="Invalidate" /> so that the first child is found.
+    /// </para>
+    /// <para>
+    /// Small lists are scanned linearly as it is faster than hashing.
+    /// </para>
+    /// <para>
+    /// The look-ups are thread-safe as long as the lists are not changed
+    /// at the same time.
+    /// </para>
+    /// </remarks>
+    public static class ChildIndex
+    {
+        /// <summary>
+        /// Lists up to this size are scanned without an index.
+        /// </summary>
+        private const int LinearScanLimit = 8;
+
+        private class Entry
+        {
+            internal readonly int Count;
+            internal readonly Dictionary<string, int> Positions;
+
+            internal Entry(IReadOnlyList<Aas.ISubmodelElement> children)
+            {
+                Count = children.Count;
+                Positions = new Dictionary<string, int>(children.Count);
+                for (int i = 0; i < children.Count; i++)
+                {
+                    string? idShort = children[i].IdShort;
+                    if (idShort != null)
+                    {
+                        // The first child is found in case of duplicates.
+                        Positions.TryAdd(idShort, i);
+                    }
+                }
+            }
+        }
+
+        private static readonly System.Runtime.CompilerServices.ConditionalWeakTable<
+            object, Entry> Entries =
+            new System.Runtime.CompilerServices.ConditionalWeakTable<object, Entry>();
+
+        private static bool ContainsIdShort(
+            IReadOnlyList<Aas.ISubmodelElement> children,
+            string idShort)
+        {
+            foreach (var child in children)
+            {
+                if (child.IdShort == idShort)
+                {
+                    return true;
+                }
+            }
+
+            return false;
+        }
+
+        /// <summary>
+        /// Find the first child with the given <paramref name="idShort" />.
+        /// </summary>
+        /// <returns>The child, or <c>null</c> if there is none</returns>
+        public static Aas.ISubmodelElement? Find(
+            IReadOnlyList<Aas.ISubmodelElement> children,
+            string idShort)
+        {
+            if (children.Count <= LinearScanLimit)
+            {
+                foreach (var child in children)
+                {
+                    if (child.IdShort == idShort)
+                    {
+                        return child;
+                    }
+                }
+
+                return null;
+            }
+
+            if (Entries.TryGetValue(children, out var entry)
+                && entry.Count == children.Count)
+            {
+                if (entry.Positions.TryGetValue(idShort, out int position))
+                {
+                    var child = children[position];
+                    if (child.IdShort == idShort)
+                    {
+                        return child;
+                    }
+                }
+                else if (!ContainsIdShort(children, idShort))
+                {
+                    return null;
+                }
+
+                // NOTE: The list has been changed without changing its count,
+                // for example, by removing a child and adding another one.
+            }
+
+            entry = new Entry(children);
+            Entries.AddOrUpdate(children, entry);
+
+            return entry.Positions.TryGetValue(idShort, out int rebuiltPosition)
+                ? children[rebuiltPosition]
+                : null;
+        }
+
+        /// <summary>
+        /// Drop the index of the <paramref name="children" /> so that it is rebuilt
+        /// on the next look-up.
+        /// </summary>
+        public static void Invalidate(IReadOnlyList<Aas.ISubmodelElement> children)
+        {
+            Entries.Remove(children);
+        }
+    }  // public static class ChildIndex
+}  // namespace AasCore.Aas3_0
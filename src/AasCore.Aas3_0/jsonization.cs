@@ -19,7 +19,7 @@ namespace AasCore.Aas3_0
     /// properties do not have fixed order, and hence we can not read
     /// <c>modelType</c> property ahead of the remaining properties.
     /// </remarks>
-    public static class Jsonization
+    public static partial class Jsonization
     {
         /// <summary>
         /// Implement the deserialization of meta-model classes from JSON nodes.
@@ -20974,7 +20974,7 @@ namespace AasCore.Aas3_0
         ///         anInstance));
         /// </code>
         /// </example>
-        public static class Serialize
+        public static partial class Serialize
         {
             private static readonly Transformer Transformer = new Transformer();
 
@@ -21106,8 +21106,8 @@ namespace AasCore.Aas3_0
                     ?? throw new System.ArgumentException(
                         $"Invalid DataTypeIec61360: {that}");
             }
-        }  // public static class Serialize
-    }  // public static class Jsonization
+        }  // public static partial class Serialize
+    }  // public static partial class Jsonization
 }  // namespace AasCore.Aas3_0
 
 /*
@@ -0,0 +1,353 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Jsonization
+    {
+        /// <summary>
+        /// Write the JSON text in the canonical form of RFC 8785 to a buffer.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The properties of each object are sorted by their names. The names of
+        /// the meta-model are all in ASCII so that the ordinal order coincides with
+        /// the order of UTF-16 code units required by the RFC. The meta-model has no
+        /// numbers, so the number formatting of the RFC does not apply.
+        /// </para>
+        /// <para>
+        /// There is no whitespace between the tokens. The strings are escaped
+        /// minimally: only the quotation mark, the reverse solidus and the control
+        /// characters are escaped, using the short escapes where available and
+        /// lower-case hexadecimal digits otherwise. All the other characters are
+        /// written as UTF-8.
+        /// </para>
+        /// </remarks>
+        internal sealed class CanonicalWriter : IWriter
+        {
+            /// <summary>
+            /// Encode UTF-8 without the byte-order mark, and throw on lone
+            /// surrogates as they can not be represented canonically.
+            /// </summary>
+            private static readonly System.Text.Encoding Utf8 =
+                new System.Text.UTF8Encoding(false, true);
+
+            private static readonly byte[] HexDigits =
+                System.Text.Encoding.ASCII.GetBytes("0123456789abcdef");
+
+            private static readonly byte[] TrueLiteral =
+                System.Text.Encoding.ASCII.GetBytes("true");
+
+            private static readonly byte[] FalseLiteral =
+                System.Text.Encoding.ASCII.GetBytes("false");
+
+            private readonly struct Member
+            {
+                internal readonly string Name;
+
+                /// <summary>
+                /// Start of the value in <see cref="Frame.Values" />
+                /// </summary>
+                internal readonly int Start;
+
+                /// <summary>
+                /// End of the value in <see cref="Frame.Values" />, known only once
+                /// the next member has been started
+                /// </summary>
+                internal readonly int End;
+
+                internal Member(string name, int start, int end)
+                {
+                    Name = name;
+                    Start = start;
+                    End = end;
+                }
+            }
+
+            private static readonly System.Comparison<Member> ByName = (
+                (that, other) => string.CompareOrdinal(that.Name, other.Name));
+
+            /// <summary>
+            /// Hold the members of an object until all of them have been written.
+            /// </summary>
+            private sealed class Frame
+            {
+                internal readonly List<Member> Members = new List<Member>();
+
+                /// <summary>
+                /// Written values of the members, one after another
+                /// </summary>
+                internal readonly System.Buffers.ArrayBufferWriter<byte> Values =
+                    new System.Buffers.ArrayBufferWriter<byte>();
+            }
+
+            private readonly System.Buffers.IBufferWriter<byte> _output;
+
+            /// <summary>
+            /// Frames of the objects which are currently open
+            /// </summary>
+            /// <remarks>
+            /// The frames beyond <see cref="_depth" /> are re-used for the next
+            /// objects.
+            /// </remarks>
+            private readonly List<Frame> _frames = new List<Frame>();
+
+            private int _depth;
+
+            /// <summary>
+            /// Where the tokens are currently written to
+            /// </summary>
+            private System.Buffers.IBufferWriter<byte> _target;
+
+            /// <summary>
+            /// Tell whether a comma needs to precede the next item.
+            /// </summary>
+            private bool _needsComma;
+
+            internal CanonicalWriter(System.Buffers.IBufferWriter<byte> output)
+            {
+                _output = output;
+                _target = output;
+            }
+
+            private void WriteByte(byte value)
+            {
+                _target.GetSpan(1)[0] = value;
+                _target.Advance(1);
+            }
+
+            private void WriteBytes(System.ReadOnlySpan<byte> bytes)
+            {
+                bytes.CopyTo(_target.GetSpan(bytes.Length));
+                _target.Advance(bytes.Length);
+            }
+
+            private void WriteUnescaped(string text, int start, int end)
+            {
+                if (start == end)
+                {
+                    return;
+                }
+
+                var chars = System.MemoryExtensions.AsSpan(text, start, end - start);
+                var span = _target.GetSpan(Utf8.GetMaxByteCount(chars.Length));
+                _target.Advance(Utf8.GetBytes(chars, span));
+            }
+
+            private void WriteQuoted(string text)
+            {
+                WriteByte((byte)'"');
+
+                // NOTE: We write the runs of the characters which need no escaping
+                // at once.
+                int start = 0;
+                for (int i = 0; i < text.Length; i++)
+                {
+                    char character = text[i];
+                    if (character >= 0x20 && character != '"' && character != '\\')
+                    {
+                        continue;
+                    }
+
+                    WriteUnescaped(text, start, i);
+                    start = i + 1;
+
+                    WriteByte((byte)'\\');
+                    switch (character)
+                    {
+                        case '"':
+                            WriteByte((byte)'"');
+                            break;
+                        case '\\':
+                            WriteByte((byte)'\\');
+                            break;
+                        case '\b':
+                            WriteByte((byte)'b');
+                            break;
+                        case '\f':
+                            WriteByte((byte)'f');
+                            break;
+                        case '\n':
+                            WriteByte((byte)'n');
+                            break;
+                        case '\r':
+                            WriteByte((byte)'r');
+                            break;
+                        case '\t':
+                            WriteByte((byte)'t');
+                            break;
+                        default:
+                            WriteByte((byte)'u');
+                            WriteByte((byte)'0');
+                            WriteByte((byte)'0');
+                            WriteByte(HexDigits[character >> 4]);
+                            WriteByte(HexDigits[character & 0xF]);
+                            break;
+                    }
+                }
+
+                WriteUnescaped(text, start, text.Length);
+
+                WriteByte((byte)'"');
+            }
+
+            public void WriteStartObject()
+            {
+                // NOTE: The objects are either values of the members, which need
+                // no separator, or items of an array.
+                if (_needsComma)
+                {
+                    WriteByte((byte)',');
+                }
+
+                if (_depth == _frames.Count)
+                {
+                    _frames.Add(new Frame());
+                }
+
+                _target = _frames[_depth].Values;
+                _depth++;
+            }
+
+            public void WriteEndObject()
+            {
+                _depth--;
+                var frame = _frames[_depth];
+                _target = _depth == 0 ? _output : _frames[_depth - 1].Values;
+
+                var members = frame.Members;
+                var values = frame.Values.WrittenSpan;
+
+                // NOTE: The values follow each other in the order in which they
+                // have been written, so we determine their ends before sorting.
+                for (int i = 0; i < members.Count; i++)
+                {
+                    var member = members[i];
+                    members[i] = new Member(
+                        member.Name,
+                        member.Start,
+                        i + 1 < members.Count ? members[i + 1].Start : values.Length);
+                }
+
+                members.Sort(ByName);
+
+                WriteByte((byte)'{');
+                for (int i = 0; i < members.Count; i++)
+                {
+                    if (i > 0)
+                    {
+                        WriteByte((byte)',');
+                    }
+
+                    var member = members[i];
+                    WriteQuoted(member.Name);
+                    WriteByte((byte)':');
+                    WriteBytes(values.Slice(member.Start, member.End - member.Start));
+                }
+                WriteByte((byte)'}');
+
+                members.Clear();
+                frame.Values.Clear();
+
+                _needsComma = true;
+            }
+
+            public void WritePropertyName(string name)
+            {
+                var frame = _frames[_depth - 1];
+                frame.Members.Add(new Member(name, frame.Values.WrittenCount, -1));
+                _needsComma = false;
+            }
+
+            public void WriteStartArray(string name)
+            {
+                WritePropertyName(name);
+                WriteByte((byte)'[');
+            }
+
+            public void WriteEndArray()
+            {
+                WriteByte((byte)']');
+                _needsComma = true;
+            }
+
+            public void WriteString(string name, string value)
+            {
+                WritePropertyName(name);
+                WriteQuoted(value);
+                _needsComma = true;
+            }
+
+            public void WriteBoolean(string name, bool value)
+            {
+                WritePropertyName(name);
+                WriteBytes(value ? TrueLiteral : FalseLiteral);
+                _needsComma = true;
+            }
+        }  // internal sealed class CanonicalWriter
+
+        public static partial class Serialize
+        {
+            private static readonly WritingVisitor<CanonicalWriter> CanonicalWritingVisitor = (
+                new WritingVisitor<CanonicalWriter>());
+
+            /// <summary>
+            /// Serialize an instance of the meta-model in the canonical form of
+            /// RFC 8785 directly to the <paramref name="output" /> as UTF-8 encoded
+            /// JSON text.
+            /// </summary>
+            /// <remarks>
+            /// <para>
+            /// The canonical form is meant for signatures, content-addressed storage
+            /// and byte-level comparisons: deeply equal instances are always written
+            /// as the same bytes. The properties are sorted by their names,
+            /// there is no whitespace, and the strings are escaped minimally.
+            /// </para>
+            /// <para>
+            /// The output is parsed to the same instance as the output of
+            /// <see cref="To(Aas.IClass, System.Text.Json.Utf8JsonWriter)" />, but the bytes
+            /// differ in general.
+            /// </para>
+            /// </remarks>
+            /// <param name="that">instance to be serialized</param>
+            /// <param name="output">where to write the JSON to</param>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when a string contains a lone surrogate, or when an enumeration
+            /// has an invalid value.
+            /// </exception>
+            public static void ToCanonical(
+                Aas.IClass that,
+                System.Buffers.IBufferWriter<byte> output)
+            {
+                Serialize.CanonicalWritingVisitor.Visit(
+                    that, new CanonicalWriter(output));
+            }
+
+            /// <summary>
+            /// Serialize an instance of the meta-model in the canonical form of
+            /// RFC 8785 to the <paramref name="stream" /> as UTF-8 encoded JSON text.
+            /// </summary>
+            /// <remarks>
+            /// See <see cref="ToCanonical(Aas.IClass, System.Buffers.IBufferWriter{byte})" />
+            /// for the details of the canonical form. The properties of an object
+            /// can only be sorted once all of them are known, so the whole text is
+            /// buffered before it is written to the stream.
+            /// </remarks>
+            /// <param name="that">instance to be serialized</param>
+            /// <param name="stream">where to write the JSON to</param>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when a string contains a lone surrogate, or when an enumeration
+            /// has an invalid value.
+            /// </exception>
+            public static void ToCanonical(
+                Aas.IClass that,
+                System.IO.Stream stream)
+            {
+                var buffer = new System.Buffers.ArrayBufferWriter<byte>();
+                ToCanonical(that, buffer);
+                stream.Write(buffer.WrittenSpan);
+            }
+        }  // public static partial class Serialize
+    }  // public static partial class Jsonization
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,1500 @@
+using Aas = AasCore.Aas3_0;  // renamed
+using ArrayPool = System.Buffers.ArrayPool<byte>;
+using Json = System.Text.Json;
+using Nodes = System.Text.Json.Nodes;
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Jsonization
+    {
+        /// <summary>
+        /// Read JSON tokens from a stream through a pooled buffer.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// <see cref="Json.Utf8JsonReader" /> is a ref struct and can not outlive
+        /// a single call. We therefore keep only its <see cref="Json.JsonReaderState" />
+        /// between the calls, and re-create the reader over the unconsumed part
+        /// of the buffer on every read.
+        /// </para>
+        /// <para>
+        /// The buffer grows only if a single token, or a single value which needs to be
+        /// materialized as a <see cref="Nodes.JsonNode" />, does not fit in it.
+        /// </para>
+        /// </remarks>
+        internal sealed class BufferedTokenReader : System.IDisposable
+        {
+            private const int DefaultBufferSize = 64 * 1024;
+
+            private static readonly byte[] Utf8Bom = { 0xEF, 0xBB, 0xBF };
+
+            private readonly System.IO.Stream _stream;
+            private byte[] _buffer;
+
+            /// <summary>Start of the unconsumed data in the buffer</summary>
+            private int _start;
+
+            /// <summary>End of the valid data in the buffer</summary>
+            private int _end;
+
+            private bool _isFinalBlock;
+            private bool _bomSkipped;
+            private Json.JsonReaderState _state;
+
+            private bool _hasBufferedValue;
+            private int _bufferedStart;
+            private int _bufferedLength;
+            private int _bufferedConsumed;
+            private Json.JsonReaderState _bufferedState;
+
+            /// <summary>
+            /// Type of the last read token, or <see cref="Json.JsonTokenType.None" />
+            /// at the end of the input.
+            /// </summary>
+            internal Json.JsonTokenType TokenType { get; private set; }
+
+            /// <summary>
+            /// Text of the last read property name or string, if any.
+            /// </summary>
+            internal string? Text { get; private set; }
+
+            /// <summary>
+            /// Type of the first token of the buffered value.
+            /// </summary>
+            internal Json.JsonTokenType BufferedTokenType { get; private set; }
+
+            internal BufferedTokenReader(
+                System.IO.Stream stream,
+                int bufferSize = DefaultBufferSize)
+            {
+                if (bufferSize < 1)
+                {
+                    throw new System.ArgumentException(
+                        $"Expected a positive buffer size, but got: {bufferSize}");
+                }
+
+                _stream = stream;
+                _buffer = ArrayPool.Shared.Rent(bufferSize);
+                _state = new Json.JsonReaderState();
+            }
+
+            /// <summary>
+            /// Skip the UTF-8 byte order mark, if any, at the beginning of the input.
+            /// </summary>
+            /// <returns>False if more data need to be filled in</returns>
+            private bool TrySkipBom()
+            {
+                if (_bomSkipped)
+                {
+                    return true;
+                }
+
+                int available = _end - _start;
+                if (available < Utf8Bom.Length && !_isFinalBlock)
+                {
+                    return false;
+                }
+
+                if (available >= Utf8Bom.Length
+                    && _buffer[_start] == Utf8Bom[0]
+                    && _buffer[_start + 1] == Utf8Bom[1]
+                    && _buffer[_start + 2] == Utf8Bom[2])
+                {
+                    _start += Utf8Bom.Length;
+                }
+
+                _bomSkipped = true;
+                return true;
+            }
+
+            private Json.Utf8JsonReader CreateReader()
+            {
+                return new Json.Utf8JsonReader(
+                    new System.ReadOnlySpan<byte>(_buffer, _start, _end - _start),
+                    _isFinalBlock,
+                    _state);
+            }
+
+            private void Commit(ref Json.Utf8JsonReader reader)
+            {
+                _state = reader.CurrentState;
+                _start += (int)reader.BytesConsumed;
+            }
+
+            /// <summary>
+            /// Try to read the next token from the buffered data.
+            /// </summary>
+            /// <param name="advance">
+            /// If false, only peek at the token and leave the position as-is
+            /// </param>
+            /// <returns>False if more data need to be filled in</returns>
+            /// <exception cref="Json.JsonException">
+            /// Thrown if the input is not a valid JSON
+            /// </exception>
+            internal bool TryRead(bool advance)
+            {
+                if (!TrySkipBom())
+                {
+                    return false;
+                }
+
+                var reader = CreateReader();
+                if (!reader.Read())
+                {
+                    if (!_isFinalBlock)
+                    {
+                        return false;
+                    }
+
+                    TokenType = Json.JsonTokenType.None;
+                    Text = null;
+                    return true;
+                }
+
+                TokenType = reader.TokenType;
+                Text = (
+                    reader.TokenType == Json.JsonTokenType.PropertyName
+                    || reader.TokenType == Json.JsonTokenType.String
+                )
+                    ? reader.GetString()
+                    : null;
+
+                if (advance)
+                {
+                    Commit(ref reader);
+                }
+
+                return true;
+            }
+
+            /// <summary>
+            /// Try to buffer the next complete value without consuming it.
+            /// </summary>
+            /// <remarks>
+            /// The buffered value needs to be either parsed with
+            /// <see cref="ParseBufferedValue" /> or skipped with
+            /// <see cref="SkipBufferedValue" /> before any further read or fill.
+            /// </remarks>
+            /// <returns>False if more data need to be filled in</returns>
+            /// <exception cref="Json.JsonException">
+            /// Thrown if the input is not a valid JSON
+            /// </exception>
+            internal bool TryBufferValue()
+            {
+                if (!TrySkipBom())
+                {
+                    return false;
+                }
+
+                var reader = CreateReader();
+                if (!reader.Read())
+                {
+                    if (!_isFinalBlock)
+                    {
+                        return false;
+                    }
+
+                    throw new Json.JsonException(
+                        "Expected a JSON value, but reached the end of the input");
+                }
+
+                var tokenType = reader.TokenType;
+                int tokenStart = (int)reader.TokenStartIndex;
+                if (!reader.TrySkip())
+                {
+                    return false;
+                }
+
+                _hasBufferedValue = true;
+                BufferedTokenType = tokenType;
+                _bufferedStart = _start + tokenStart;
+                _bufferedLength = (int)reader.BytesConsumed - tokenStart;
+                _bufferedConsumed = (int)reader.BytesConsumed;
+                _bufferedState = reader.CurrentState;
+                return true;
+            }
+
+            private System.ReadOnlySpan<byte> BufferedValue()
+            {
+                if (!_hasBufferedValue)
+                {
+                    throw new System.InvalidOperationException(
+                        "Unexpected access to a buffered value when there is none");
+                }
+
+                return new System.ReadOnlySpan<byte>(_buffer, _bufferedStart, _bufferedLength);
+            }
+
+            /// <summary>
+            /// Find the string value of the property <paramref name="name" /> of
+            /// the buffered value without parsing it.
+            /// </summary>
+            /// <returns>
+            /// The string value, or null if the buffered value is not an object,
+            /// or the property is missing or not a string
+            /// </returns>
+            internal string? FindStringPropertyOfBufferedValue(string name)
+            {
+                var reader = new Json.Utf8JsonReader(BufferedValue());
+                if (!reader.Read() || reader.TokenType != Json.JsonTokenType.StartObject)
+                {
+                    return null;
+                }
+
+                while (reader.Read() && reader.TokenType == Json.JsonTokenType.PropertyName)
+                {
+                    bool found = reader.ValueTextEquals(name);
+                    reader.Read();
+                    if (found)
+                    {
+                        return reader.TokenType == Json.JsonTokenType.String
+                            ? reader.GetString()
+                            : null;
+                    }
+                    reader.Skip();
+                }
+
+                return null;
+            }
+
+            /// <summary>
+            /// Materialize the buffered value as a JSON node, and consume it.
+            /// </summary>
+            /// <returns>The parsed value, or null if the value is a JSON null</returns>
+            internal Nodes.JsonNode? ParseBufferedValue()
+            {
+                var node = Nodes.JsonNode.Parse(BufferedValue());
+                SkipBufferedValue();
+                return node;
+            }
+
+            /// <summary>
+            /// Consume the buffered value without materializing it.
+            /// </summary>
+            internal void SkipBufferedValue()
+            {
+                if (!_hasBufferedValue)
+                {
+                    throw new System.InvalidOperationException(
+                        "Unexpected skip of a buffered value when there is none");
+                }
+
+                _state = _bufferedState;
+                _start += _bufferedConsumed;
+                _hasBufferedValue = false;
+                TokenType = Json.JsonTokenType.None;
+                Text = null;
+            }
+
+            /// <summary>
+            /// Try to read the next complete value from the buffered data and
+            /// materialize it as a JSON node.
+            /// </summary>
+            /// <param name="node">
+            /// The parsed value, or null if the value is a JSON null
+            /// </param>
+            /// <returns>False if more data need to be filled in</returns>
+            /// <exception cref="Json.JsonException">
+            /// Thrown if the input is not a valid JSON
+            /// </exception>
+            internal bool TryReadNode(out Nodes.JsonNode? node)
+            {
+                node = null;
+                if (!TryBufferValue())
+                {
+                    return false;
+                }
+
+                node = ParseBufferedValue();
+                return true;
+            }
+
+            /// <summary>
+            /// Shift the unconsumed data to the beginning of the buffer, and grow
+            /// the buffer if there is no space left for new data.
+            /// </summary>
+            private void PrepareFill()
+            {
+                if (_isFinalBlock)
+                {
+                    throw new System.InvalidOperationException(
+                        "Unexpected fill after the end of the stream");
+                }
+
+                if (_hasBufferedValue)
+                {
+                    throw new System.InvalidOperationException(
+                        "Unexpected fill while a value is buffered");
+                }
+
+                int unconsumed = _end - _start;
+                if (_start > 0)
+                {
+                    System.Buffer.BlockCopy(_buffer, _start, _buffer, 0, unconsumed);
+                    _start = 0;
+                    _end = unconsumed;
+                }
+
+                if (_end == _buffer.Length)
+                {
+                    byte[] larger = ArrayPool.Shared.Rent(_buffer.Length * 2);
+                    System.Buffer.BlockCopy(_buffer, 0, larger, 0, _end);
+                    ArrayPool.Shared.Return(_buffer);
+                    _buffer = larger;
+                }
+            }
+
+            /// <summary>
+            /// Read more data from the stream into the buffer, blocking if necessary.
+            /// </summary>
+            internal void Fill()
+            {
+                PrepareFill();
+                int read = _stream.Read(_buffer, _end, _buffer.Length - _end);
+                if (read == 0)
+                {
+                    _isFinalBlock = true;
+                }
+
+                _end += read;
+            }
+
+            /// <summary>
+            /// Read more data from the stream into the buffer asynchronously.
+            /// </summary>
+            internal async System.Threading.Tasks.ValueTask FillAsync(
+                System.Threading.CancellationToken cancellationToken)
+            {
+                PrepareFill();
+                int read = await _stream.ReadAsync(
+                    new System.Memory<byte>(_buffer, _end, _buffer.Length - _end),
+                    cancellationToken).ConfigureAwait(false);
+                if (read == 0)
+                {
+                    _isFinalBlock = true;
+                }
+
+                _end += read;
+            }
+
+            public void Dispose()
+            {
+                ArrayPool.Shared.Return(_buffer);
+                _buffer = System.Array.Empty<byte>();
+            }
+        }  // internal sealed class BufferedTokenReader
+
+        /// <summary>
+        /// Select the lists of identifiables in an environment.
+        /// </summary>
+        [System.Flags]
+        internal enum EnvironmentSections
+        {
+            None = 0,
+            AssetAdministrationShells = 1,
+            Submodels = 2,
+            ConceptDescriptions = 4,
+            All = AssetAdministrationShells | Submodels | ConceptDescriptions
+        }
+
+        /// <summary>
+        /// Implement the streaming deserialization of meta-model classes.
+        /// </summary>
+        /// <remarks>
+        /// As noted in <see cref="Jsonization" />, the properties of a JSON object
+        /// do not have a fixed order, so an instance can not be deserialized before
+        /// its <c>modelType</c> has been seen. We therefore stream only through
+        /// the containers of the environment, and materialize each top-level
+        /// identifiable as a JSON node which we deserialize with
+        /// <see cref="DeserializeImplementation" />, and discard immediately.
+        /// Hence the peak memory is bound by the largest identifiable instead of
+        /// the whole environment.
+        /// </remarks>
+        internal static class DeserializeStreamingImplementation
+        {
+            private static Reporting.Error ErrorForUnexpectedValue(
+                Nodes.JsonNode? node,
+                string expected)
+            {
+                return new Reporting.Error(
+                    $"Expected a {expected}, but got {node?.GetType().ToString() ?? "null"}");
+            }
+
+            /// <summary>
+            /// Walk through an environment, and deserialize its identifiables
+            /// one at a time.
+            /// </summary>
+            /// <remarks>
+            /// The walker never blocks. <see cref="TryNext" /> returns false whenever
+            /// the reader needs more data, and the caller decides whether to fill it
+            /// in synchronously or asynchronously.
+            /// </remarks>
+            internal sealed class EnvironmentWalker
+            {
+                private enum State
+                {
+                    Start,
+                    Properties,
+                    Section,
+                    Items,
+                    Trailing,
+                    Done
+                }
+
+                private readonly BufferedTokenReader _reader;
+                private readonly EnvironmentSections _sections;
+                private readonly System.Func<string, bool>? _selectById;
+                private readonly bool _collect;
+
+                private State _state = State.Start;
+                private EnvironmentSections _section;
+                private string _sectionName = "";
+                private int _index;
+
+                internal List<IAssetAdministrationShell>? AssetAdministrationShells;
+                internal List<ISubmodel>? Submodels;
+                internal List<IConceptDescription>? ConceptDescriptions;
+
+                /// <summary>
+                /// The identifiable deserialized in the last step, if any.
+                /// </summary>
+                internal Aas.IIdentifiable? Current { get; private set; }
+
+                /// <summary>
+                /// True if the whole environment has been walked through,
+                /// or an error occurred.
+                /// </summary>
+                internal bool IsDone => _state == State.Done;
+
+                /// <param name="reader">where to read the environment from</param>
+                /// <param name="sections">which lists of identifiables to deserialize</param>
+                /// <param name="selectById">
+                /// if set, deserialize only the identifiables whose ID satisfies it
+                /// </param>
+                /// <param name="collect">
+                /// if set, collect the identifiables in the lists instead of
+                /// returning them one by one
+                /// </param>
+                internal EnvironmentWalker(
+                    BufferedTokenReader reader,
+                    EnvironmentSections sections,
+                    System.Func<string, bool>? selectById,
+                    bool collect)
+                {
+                    _reader = reader;
+                    _sections = sections;
+                    _selectById = selectById;
+                    _collect = collect;
+                }
+
+                private static bool TrySectionFrom(
+                    string propertyName,
+                    out EnvironmentSections section)
+                {
+                    switch (propertyName)
+                    {
+                        case "assetAdministrationShells":
+                            section = EnvironmentSections.AssetAdministrationShells;
+                            return true;
+                        case "submodels":
+                            section = EnvironmentSections.Submodels;
+                            return true;
+                        case "conceptDescriptions":
+                            section = EnvironmentSections.ConceptDescriptions;
+                            return true;
+                        default:
+                            section = EnvironmentSections.None;
+                            return false;
+                    }
+                }
+
+                private void StartCollecting()
+                {
+                    switch (_section)
+                    {
+                        case EnvironmentSections.AssetAdministrationShells:
+                            AssetAdministrationShells = new List<IAssetAdministrationShell>();
+                            break;
+                        case EnvironmentSections.Submodels:
+                            Submodels = new List<ISubmodel>();
+                            break;
+                        case EnvironmentSections.ConceptDescriptions:
+                            ConceptDescriptions = new List<IConceptDescription>();
+                            break;
+                        default:
+                            throw new System.InvalidOperationException(
+                                $"Unexpected section: {_section}");
+                    }
+                }
+
+                private Aas.IIdentifiable? ItemFrom(
+                    Nodes.JsonNode node,
+                    out Reporting.Error? error)
+                {
+                    switch (_section)
+                    {
+                        case EnvironmentSections.AssetAdministrationShells:
+                            {
+                                var item = DeserializeImplementation.AssetAdministrationShellFrom(
+                                    node, out error);
+                                if (item != null && _collect)
+                                {
+                                    AssetAdministrationShells!.Add(item);
+                                }
+                                return item;
+                            }
+                        case EnvironmentSections.Submodels:
+                            {
+                                var item = DeserializeImplementation.SubmodelFrom(
+                                    node, out error);
+                                if (item != null && _collect)
+                                {
+                                    Submodels!.Add(item);
+                                }
+                                return item;
+                            }
+                        case EnvironmentSections.ConceptDescriptions:
+                            {
+                                var item = DeserializeImplementation.ConceptDescriptionFrom(
+                                    node, out error);
+                                if (item != null && _collect)
+                                {
+                                    ConceptDescriptions!.Add(item);
+                                }
+                                return item;
+                            }
+                        default:
+                            throw new System.InvalidOperationException(
+                                $"Unexpected section: {_section}");
+                    }
+                }
+
+                private bool Stop()
+                {
+                    _state = State.Done;
+                    Current = null;
+                    return true;
+                }
+
+                private Reporting.Error PrefixWithItem(Reporting.Error error)
+                {
+                    error.PrependSegment(
+                        new Reporting.IndexSegment(
+                            _index));
+                    error.PrependSegment(
+                        new Reporting.NameSegment(
+                            _sectionName));
+                    return error;
+                }
+
+                /// <summary>
+                /// Advance through the buffered data to the next identifiable.
+                /// </summary>
+                /// <param name="error">Error, if any, during the deserialization</param>
+                /// <returns>
+                /// False if the reader needs more data. Otherwise, either
+                /// <see cref="Current" /> is set, or the walk is done.
+                /// </returns>
+                internal bool TryNext(out Reporting.Error? error)
+                {
+                    error = null;
+                    Current = null;
+
+                    while (true)
+                    {
+                        switch (_state)
+                        {
+                            case State.Start:
+                                {
+                                    if (!_reader.TryRead(false))
+                                    {
+                                        return false;
+                                    }
+
+                                    if (_reader.TokenType != Json.JsonTokenType.StartObject)
+                                    {
+                                        if (!_reader.TryReadNode(out Nodes.JsonNode? node))
+                                        {
+                                            return false;
+                                        }
+
+                                        error = ErrorForUnexpectedValue(node, "JsonObject");
+                                        return Stop();
+                                    }
+
+                                    _reader.TryRead(true);
+                                    _state = State.Properties;
+                                    break;
+                                }
+                            case State.Properties:
+                                {
+                                    if (!_reader.TryRead(true))
+                                    {
+                                        return false;
+                                    }
+
+                                    if (_reader.TokenType == Json.JsonTokenType.EndObject)
+                                    {
+                                        _state = State.Trailing;
+                                        break;
+                                    }
+
+                                    string propertyName = _reader.Text
+                                        ?? throw new System.InvalidOperationException(
+                                            "Unexpected null text of a property name");
+
+                                    if (!TrySectionFrom(propertyName, out _section))
+                                    {
+                                        error = new Reporting.Error(
+                                            $"Unexpected property: {propertyName}");
+                                        return Stop();
+                                    }
+
+                                    _sectionName = propertyName;
+                                    _state = State.Section;
+                                    break;
+                                }
+                            case State.Section:
+                                {
+                                    if (!_reader.TryRead(false))
+                                    {
+                                        return false;
+                                    }
+
+                                    switch (_reader.TokenType)
+                                    {
+                                        case Json.JsonTokenType.Null:
+                                            _reader.TryRead(true);
+                                            error = new Reporting.Error(
+                                                "Expected optional property to be absent, " +
+                                                "but got null instead");
+                                            break;
+                                        case Json.JsonTokenType.StartArray:
+                                            _reader.TryRead(true);
+                                            break;
+                                        default:
+                                            {
+                                                if (!_reader.TryReadNode(out Nodes.JsonNode? node))
+                                                {
+                                                    return false;
+                                                }
+
+                                                error = ErrorForUnexpectedValue(node, "JsonArray");
+                                                break;
+                                            }
+                                    }
+
+                                    if (error != null)
+                                    {
+                                        error.PrependSegment(
+                                            new Reporting.NameSegment(
+                                                _sectionName));
+                                        return Stop();
+                                    }
+
+                                    if (_collect)
+                                    {
+                                        StartCollecting();
+                                    }
+
+                                    _index = 0;
+                                    _state = State.Items;
+                                    break;
+                                }
+                            case State.Items:
+                                {
+                                    if (!_reader.TryRead(false))
+                                    {
+                                        return false;
+                                    }
+
+                                    if (_reader.TokenType == Json.JsonTokenType.EndArray)
+                                    {
+                                        _reader.TryRead(true);
+                                        _state = State.Properties;
+                                        break;
+                                    }
+
+                                    if (!_reader.TryBufferValue())
+                                    {
+                                        return false;
+                                    }
+
+                                    bool skip = (_sections & _section) == 0;
+                                    if (!skip
+                                        && _reader.BufferedTokenType == Json.JsonTokenType.Null)
+                                    {
+                                        _reader.SkipBufferedValue();
+                                        error = PrefixWithItem(
+                                            new Reporting.Error(
+                                                "Expected a non-null item, but got a null"));
+                                        return Stop();
+                                    }
+
+                                    if (!skip && _selectById != null)
+                                    {
+                                        // NOTE: We deserialize the item if the ID is missing
+                                        // or invalid so that the error is reported.
+                                        string? id = _reader.FindStringPropertyOfBufferedValue("id");
+                                        skip = id != null && !_selectById(id);
+                                    }
+
+                                    if (skip)
+                                    {
+                                        _reader.SkipBufferedValue();
+                                        _index++;
+                                        break;
+                                    }
+
+                                    Nodes.JsonNode node = _reader.ParseBufferedValue()
+                                        ?? throw new System.InvalidOperationException(
+                                            "Unexpected null node of a non-null value");
+
+                                    Aas.IIdentifiable? item = ItemFrom(node, out error);
+                                    if (error != null)
+                                    {
+                                        PrefixWithItem(error);
+                                        return Stop();
+                                    }
+
+                                    _index++;
+
+                                    if (!_collect)
+                                    {
+                                        Current = item
+                                            ?? throw new System.InvalidOperationException(
+                                                "Unexpected result null when error is null");
+                                        return true;
+                                    }
+                                    break;
+                                }
+                            case State.Trailing:
+                                {
+                                    // Consume the rest of the input so that the trailing
+                                    // data are checked to be valid JSON.
+                                    if (!_reader.TryRead(true))
+                                    {
+                                        return false;
+                                    }
+
+                                    if (_reader.TokenType == Json.JsonTokenType.None)
+                                    {
+                                        _state = State.Done;
+                                    }
+                                    break;
+                                }
+                            case State.Done:
+                                return true;
+                            default:
+                                throw new System.InvalidOperationException(
+                                    $"Unexpected state: {_state}");
+                        }
+                    }
+                }
+
+                /// <summary>
+                /// Construct the environment out of the collected identifiables.
+                /// </summary>
+                internal Aas.Environment ToEnvironment()
+                {
+                    return new Aas.Environment(
+                        AssetAdministrationShells,
+                        Submodels,
+                        ConceptDescriptions);
+                }
+            }  // internal sealed class EnvironmentWalker
+
+            /// <summary>
+            /// Deserialize an environment by streaming through its containers.
+            /// </summary>
+            /// <param name="reader">Reader positioned before the environment</param>
+            /// <param name="error">Error, if any, during the deserialization</param>
+            internal static Aas.Environment? EnvironmentFrom(
+                BufferedTokenReader reader,
+                out Reporting.Error? error)
+            {
+                var walker = new EnvironmentWalker(
+                    reader, EnvironmentSections.All, null, true);
+
+                while (!walker.TryNext(out error))
+                {
+                    reader.Fill();
+                }
+
+                return error == null ? walker.ToEnvironment() : null;
+            }
+
+            /// <summary>
+            /// Deserialize the identifiables of an environment lazily, one at a time.
+            /// </summary>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown on the first identifiable which could not be deserialized.
+            /// </exception>
+            internal static IEnumerable<T> IdentifiablesFrom<T>(
+                System.IO.Stream stream,
+                EnvironmentSections sections,
+                System.Func<string, bool>? selectById) where T : Aas.IIdentifiable
+            {
+                using var reader = new BufferedTokenReader(stream);
+                var walker = new EnvironmentWalker(reader, sections, selectById, false);
+
+                while (true)
+                {
+                    Reporting.Error? error;
+                    while (!walker.TryNext(out error))
+                    {
+                        reader.Fill();
+                    }
+
+                    if (error != null)
+                    {
+                        throw new Jsonization.Exception(
+                            Reporting.GenerateJsonPath(error.PathSegments),
+                            error.Cause);
+                    }
+
+                    if (walker.IsDone)
+                    {
+                        yield break;
+                    }
+
+                    yield return (T)walker.Current!;
+                }
+            }
+
+            /// <summary>
+            /// Deserialize the identifiables of an environment lazily, one at a time,
+            /// reading the stream asynchronously.
+            /// </summary>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown on the first identifiable which could not be deserialized.
+            /// </exception>
+            internal static async IAsyncEnumerable<T> IdentifiablesFromAsync<T>(
+                System.IO.Stream stream,
+                EnvironmentSections sections,
+                System.Func<string, bool>? selectById,
+                [System.Runtime.CompilerServices.EnumeratorCancellation]
+                System.Threading.CancellationToken cancellationToken
+            ) where T : Aas.IIdentifiable
+            {
+                using var reader = new BufferedTokenReader(stream);
+                var walker = new EnvironmentWalker(reader, sections, selectById, false);
+
+                while (true)
+                {
+                    Reporting.Error? error;
+                    while (!walker.TryNext(out error))
+                    {
+                        await reader.FillAsync(cancellationToken).ConfigureAwait(false);
+                    }
+
+                    if (error != null)
+                    {
+                        throw new Jsonization.Exception(
+                            Reporting.GenerateJsonPath(error.PathSegments),
+                            error.Cause);
+                    }
+
+                    if (walker.IsDone)
+                    {
+                        yield break;
+                    }
+
+                    yield return (T)walker.Current!;
+                }
+            }
+
+            /// <summary>
+            /// Check that the <paramref name="node" /> read as the single value of
+            /// the input is not a JSON null.
+            /// </summary>
+            private static Nodes.JsonNode NotNull(Nodes.JsonNode? node)
+            {
+                return node
+                    ?? throw new Jsonization.Exception(
+                        "",
+                        ErrorForUnexpectedValue(null, "JsonObject").Cause);
+            }
+
+            /// <summary>
+            /// Read the single value from the <paramref name="stream" /> as a JSON node,
+            /// and check that only whitespace follows it.
+            /// </summary>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown if the value is a JSON null.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown if the input is not a valid JSON
+            /// </exception>
+            internal static Nodes.JsonNode ReadSingleNode(System.IO.Stream stream)
+            {
+                using var reader = new BufferedTokenReader(stream);
+
+                Nodes.JsonNode? node;
+                while (!reader.TryReadNode(out node))
+                {
+                    reader.Fill();
+                }
+
+                while (true)
+                {
+                    while (!reader.TryRead(true))
+                    {
+                        reader.Fill();
+                    }
+
+                    if (reader.TokenType == Json.JsonTokenType.None)
+                    {
+                        break;
+                    }
+                }
+
+                return NotNull(node);
+            }
+
+            /// <summary>
+            /// Read the single value from the <paramref name="stream" /> as a JSON node
+            /// asynchronously, and check that only whitespace follows it.
+            /// </summary>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown if the value is a JSON null.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown if the input is not a valid JSON
+            /// </exception>
+            internal static async System.Threading.Tasks.Task<Nodes.JsonNode> ReadSingleNodeAsync(
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken)
+            {
+                using var reader = new BufferedTokenReader(stream);
+
+                Nodes.JsonNode? node;
+                while (!reader.TryReadNode(out node))
+                {
+                    await reader.FillAsync(cancellationToken).ConfigureAwait(false);
+                }
+
+                while (true)
+                {
+                    while (!reader.TryRead(true))
+                    {
+                        await reader.FillAsync(cancellationToken).ConfigureAwait(false);
+                    }
+
+                    if (reader.TokenType == Json.JsonTokenType.None)
+                    {
+                        break;
+                    }
+                }
+
+                return NotNull(node);
+            }
+        }  // internal static class DeserializeStreamingImplementation
+
+        /// <summary>
+        /// Deserialize instances of meta-model classes directly from a stream
+        /// of JSON text without materializing the whole document first.
+        /// The memory is bounded per identifiable, not per document: each
+        /// asset administration shell, submodel and concept description is still
+        /// materialized as a JSON node before it is deserialized.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The environment is streamed through its containers, so an environment
+        /// with many identifiables needs only as much memory as its largest
+        /// identifiable in addition to the result. If the document consists of
+        /// a single large submodel, as with <see cref="SubmodelFrom" />, the peak
+        /// memory is that of the JSON node of the whole submodel plus
+        /// the deserialized instances, the same as with <see cref="Deserialize" />,
+        /// but without reading the text into a string first.
+        /// </para>
+        /// <para>
+        /// The errors are reported with the same paths and causes as in
+        /// <see cref="Deserialize" />. However, the input is only read until
+        /// the first error so that the syntax errors which come after it
+        /// go unnoticed.
+        /// </para>
+        /// <para>
+        /// The methods which return an enumerable deserialize the identifiables
+        /// lazily, one at a time, as the enumeration proceeds. The enumeration
+        /// reads from the stream, so the stream must stay open until
+        /// the enumeration is finished.
+        /// </para>
+        /// </remarks>
+        /// <example>
+        /// Here is an example how to deserialize an environment from a file:
+        /// <code>
+        /// using var stream = System.IO.File.OpenRead("environment.json");
+        /// Aas.Environment environment = DeserializeStreaming.EnvironmentFrom(
+        ///     stream);
+        /// </code>
+        /// Here is an example how to look up a single submodel in a file without
+        /// deserializing the rest:
+        /// <code>
+        /// using var stream = System.IO.File.OpenRead("environment.json");
+        /// Aas.ISubmodel? submodel = DeserializeStreaming.SubmodelsFrom(
+        ///     stream,
+        ///     id => id == "urn:some-submodel")
+        ///     .FirstOrDefault();
+        /// </code>
+        /// </example>
+        public static class DeserializeStreaming
+        {
+            /// <summary>
+            /// Deserialize an instance of Environment from <paramref name="stream" />.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of Environment.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static Aas.Environment EnvironmentFrom(
+                System.IO.Stream stream)
+            {
+                using var reader = new BufferedTokenReader(stream);
+
+                Aas.Environment? result = DeserializeStreamingImplementation.EnvironmentFrom(
+                    reader,
+                    out Reporting.Error? error);
+                if (error != null)
+                {
+                    throw new Jsonization.Exception(
+                        Reporting.GenerateJsonPath(error.PathSegments),
+                        error.Cause);
+                }
+                return result
+                    ?? throw new System.InvalidOperationException(
+                        "Unexpected output null when error is null");
+            }
+
+            /// <summary>
+            /// Deserialize an instance of Environment from <paramref name="stream" />,
+            /// reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of Environment.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static async System.Threading.Tasks.Task<Aas.Environment> EnvironmentFromAsync(
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                using var reader = new BufferedTokenReader(stream);
+
+                var walker = new DeserializeStreamingImplementation.EnvironmentWalker(
+                    reader, EnvironmentSections.All, null, true);
+
+                Reporting.Error? error;
+                while (!walker.TryNext(out error))
+                {
+                    await reader.FillAsync(cancellationToken).ConfigureAwait(false);
+                }
+
+                if (error != null)
+                {
+                    throw new Jsonization.Exception(
+                        Reporting.GenerateJsonPath(error.PathSegments),
+                        error.Cause);
+                }
+                return walker.ToEnvironment();
+            }
+
+            /// <summary>
+            /// Deserialize lazily the asset administration shells, submodels and
+            /// concept descriptions of the environment in <paramref name="stream" />
+            /// in the order of their appearance.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the identifiables whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when an identifiable is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IEnumerable<Aas.IIdentifiable> IdentifiablesFrom(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.IIdentifiable>(
+                    stream, EnvironmentSections.All, selectById);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the asset administration shells of the environment
+            /// in <paramref name="stream" />, and skip the other identifiables.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the shells whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when a shell is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IEnumerable<Aas.IAssetAdministrationShell> AssetAdministrationShellsFrom(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.IAssetAdministrationShell>(
+                    stream, EnvironmentSections.AssetAdministrationShells, selectById);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the submodels of the environment
+            /// in <paramref name="stream" />, and skip the other identifiables.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the submodels whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when a submodel is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IEnumerable<Aas.ISubmodel> SubmodelsFrom(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.ISubmodel>(
+                    stream, EnvironmentSections.Submodels, selectById);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the concept descriptions of the environment
+            /// in <paramref name="stream" />, and skip the other identifiables.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the concept descriptions whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when a concept description is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IEnumerable<Aas.IConceptDescription> ConceptDescriptionsFrom(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.IConceptDescription>(
+                    stream, EnvironmentSections.ConceptDescriptions, selectById);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the asset administration shells, submodels and
+            /// concept descriptions of the environment in <paramref name="stream" />
+            /// in the order of their appearance, reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the identifiables whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when an identifiable is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IAsyncEnumerable<Aas.IIdentifiable> IdentifiablesFromAsync(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFromAsync<Aas.IIdentifiable>(
+                    stream, EnvironmentSections.All, selectById, cancellationToken);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the asset administration shells of the environment
+            /// in <paramref name="stream" />, and skip the other identifiables,
+            /// reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the shells whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when a shell is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IAsyncEnumerable<Aas.IAssetAdministrationShell> AssetAdministrationShellsFromAsync(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFromAsync<Aas.IAssetAdministrationShell>(
+                    stream, EnvironmentSections.AssetAdministrationShells, selectById, cancellationToken);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the submodels of the environment
+            /// in <paramref name="stream" />, and skip the other identifiables,
+            /// reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the submodels whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when a submodel is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IAsyncEnumerable<Aas.ISubmodel> SubmodelsFromAsync(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFromAsync<Aas.ISubmodel>(
+                    stream, EnvironmentSections.Submodels, selectById, cancellationToken);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the concept descriptions of the environment
+            /// in <paramref name="stream" />, and skip the other identifiables,
+            /// reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="selectById">
+            /// If set, deserialize only the concept descriptions whose ID satisfies it;
+            /// the others are skipped without being deserialized
+            /// </param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown during the enumeration when a concept description is not
+            /// a valid JSON representation.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown during the enumeration when the input is not a valid JSON.
+            /// </exception>
+            public static IAsyncEnumerable<Aas.IConceptDescription> ConceptDescriptionsFromAsync(
+                System.IO.Stream stream,
+                System.Func<string, bool>? selectById = null,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFromAsync<Aas.IConceptDescription>(
+                    stream, EnvironmentSections.ConceptDescriptions, selectById, cancellationToken);
+            }
+
+            /// <summary>
+            /// Deserialize an instance from the single JSON value in
+            /// <paramref name="stream" /> with <paramref name="deserialize" />.
+            /// </summary>
+            /// <remarks>
+            /// Use this method for the classes without a dedicated streaming method,
+            /// and pass in the corresponding method of <see cref="Deserialize" />,
+            /// for example <c>Deserialize.SubmodelElementCollectionFrom</c>.
+            /// The whole value is materialized as a JSON node before it is
+            /// deserialized.
+            /// </remarks>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="deserialize">deserializes the instance from a JSON node</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of <typeparamref name="T" />.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static T From<T>(
+                System.IO.Stream stream,
+                System.Func<Nodes.JsonNode, T> deserialize)
+            {
+                return deserialize(
+                    DeserializeStreamingImplementation.ReadSingleNode(stream));
+            }
+
+            /// <summary>
+            /// Deserialize an instance from the single JSON value in
+            /// <paramref name="stream" /> with <paramref name="deserialize" />,
+            /// reading the stream asynchronously.
+            /// </summary>
+            /// <remarks>
+            /// See <see cref="From{T}" /> for the details.
+            /// </remarks>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="deserialize">deserializes the instance from a JSON node</param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of <typeparamref name="T" />.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static async System.Threading.Tasks.Task<T> FromAsync<T>(
+                System.IO.Stream stream,
+                System.Func<Nodes.JsonNode, T> deserialize,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                var node = await DeserializeStreamingImplementation.ReadSingleNodeAsync(
+                    stream, cancellationToken).ConfigureAwait(false);
+                return deserialize(node);
+            }
+
+            /// <summary>
+            /// Deserialize an instance of AssetAdministrationShell from <paramref name="stream" />
+            /// which contains an asset administration shell on its own, not in an environment.
+            /// </summary>
+            /// <remarks>
+            /// The whole asset administration shell is materialized as a JSON node
+            /// before it is deserialized.
+            /// </remarks>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of AssetAdministrationShell.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static Aas.AssetAdministrationShell AssetAdministrationShellFrom(
+                System.IO.Stream stream)
+            {
+                return From(stream, Deserialize.AssetAdministrationShellFrom);
+            }
+
+            /// <summary>
+            /// Deserialize an instance of AssetAdministrationShell from <paramref name="stream" />
+            /// which contains an asset administration shell on its own, reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of AssetAdministrationShell.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static System.Threading.Tasks.Task<Aas.AssetAdministrationShell> AssetAdministrationShellFromAsync(
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return FromAsync(stream, Deserialize.AssetAdministrationShellFrom, cancellationToken);
+            }
+
+            /// <summary>
+            /// Deserialize an instance of Submodel from <paramref name="stream" />
+            /// which contains a submodel on its own, not in an environment.
+            /// </summary>
+            /// <remarks>
+            /// The whole submodel is materialized as a JSON node
+            /// before it is deserialized.
+            /// </remarks>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of Submodel.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static Aas.Submodel SubmodelFrom(
+                System.IO.Stream stream)
+            {
+                return From(stream, Deserialize.SubmodelFrom);
+            }
+
+            /// <summary>
+            /// Deserialize an instance of Submodel from <paramref name="stream" />
+            /// which contains a submodel on its own, reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of Submodel.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static System.Threading.Tasks.Task<Aas.Submodel> SubmodelFromAsync(
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return FromAsync(stream, Deserialize.SubmodelFrom, cancellationToken);
+            }
+
+            /// <summary>
+            /// Deserialize an instance of ConceptDescription from <paramref name="stream" />
+            /// which contains a concept description on its own, not in an environment.
+            /// </summary>
+            /// <remarks>
+            /// The whole concept description is materialized as a JSON node
+            /// before it is deserialized.
+            /// </remarks>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of ConceptDescription.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static Aas.ConceptDescription ConceptDescriptionFrom(
+                System.IO.Stream stream)
+            {
+                return From(stream, Deserialize.ConceptDescriptionFrom);
+            }
+
+            /// <summary>
+            /// Deserialize an instance of ConceptDescription from <paramref name="stream" />
+            /// which contains a concept description on its own, reading the stream asynchronously.
+            /// </summary>
+            /// <param name="stream">Stream of UTF-8 encoded JSON text</param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Jsonization.Exception">
+            /// Thrown when the input is not a valid JSON
+            /// representation of ConceptDescription.
+            /// </exception>
+            /// <exception cref="Json.JsonException">
+            /// Thrown when the input is not a valid JSON.
+            /// </exception>
+            public static System.Threading.Tasks.Task<Aas.ConceptDescription> ConceptDescriptionFromAsync(
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                return FromAsync(stream, Deserialize.ConceptDescriptionFrom, cancellationToken);
+            }
+        }  // public static class DeserializeStreaming
+    }  // public static partial class Jsonization
+}  // namespace AasCore.Aas3_0
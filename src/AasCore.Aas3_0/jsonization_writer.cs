@@ -0,0 +1,235 @@
+using Aas = AasCore.Aas3_0;  // renamed
+using Json = System.Text.Json;
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Jsonization
+    {
+        /// <summary>
+        /// Receive the JSON text written by <see cref="WritingVisitor{TWriter}" />.
+        /// </summary>
+        /// <remarks>
+        /// The implementations decide on the formatting and on the order in which
+        /// the properties of an object end up in the output.
+        /// </remarks>
+        internal interface IWriter
+        {
+            void WriteStartObject();
+
+            void WriteEndObject();
+
+            void WritePropertyName(string name);
+
+            void WriteStartArray(string name);
+
+            void WriteEndArray();
+
+            void WriteString(string name, string value);
+
+            void WriteBoolean(string name, bool value);
+        }
+
+        /// <summary>
+        /// Pass the JSON text on to a <see cref="Json.Utf8JsonWriter" />.
+        /// </summary>
+        /// <remarks>
+        /// This is a struct so that the calls through
+        /// <see cref="WritingVisitor{TWriter}" /> are specialized and inlined.
+        /// </remarks>
+        internal readonly struct Utf8Writer : IWriter
+        {
+            private readonly Json.Utf8JsonWriter _writer;
+
+            internal Utf8Writer(Json.Utf8JsonWriter writer)
+            {
+                _writer = writer;
+            }
+
+            public void WriteStartObject()
+            {
+                _writer.WriteStartObject();
+            }
+
+            public void WriteEndObject()
+            {
+                _writer.WriteEndObject();
+            }
+
+            public void WritePropertyName(string name)
+            {
+                _writer.WritePropertyName(name);
+            }
+
+            public void WriteStartArray(string name)
+            {
+                _writer.WriteStartArray(name);
+            }
+
+            public void WriteEndArray()
+            {
+                _writer.WriteEndArray();
+            }
+
+            public void WriteString(string name, string value)
+            {
+                _writer.WriteString(name, value);
+            }
+
+            public void WriteBoolean(string name, bool value)
+            {
+                _writer.WriteBoolean(name, value);
+            }
+        }  // internal readonly struct Utf8Writer
+
+        /// <summary>
+        /// Write instances of the meta-model directly to a JSON writer.
+        /// </summary>
+        /// <remarks>
+        /// The properties are written in the same order and with the same
+        /// encoding as in <see cref="Transformer" /> so that the output over
+        /// <see cref="Utf8Writer" /> is byte-identical to the serialization over
+        /// the JSON nodes, but without building the intermediate
+        /// <see cref="System.Text.Json.Nodes.JsonObject" />'s. The visit
+        /// methods are generated in <c>jsonization_writing_visitor.cs</c> from
+        /// the meta-model.
+        /// </remarks>
+        internal partial class WritingVisitor<TWriter>
+            : Visitation.AbstractVisitorWithContext<TWriter>
+            where TWriter : IWriter
+        {
+        }  // internal partial class WritingVisitor<TWriter>
+
+        public static partial class Serialize
+        {
+            private static readonly WritingVisitor<Utf8Writer> WritingVisitor = (
+                new WritingVisitor<Utf8Writer>());
+
+            /// <summary>
+            /// Write asynchronously the pending output once it reaches this size.
+            /// </summary>
+            private const int FlushThreshold = 64 * 1024;
+
+            /// <summary>
+            /// Serialize an instance of the meta-model directly to
+            /// the <paramref name="writer" />.
+            /// </summary>
+            /// <remarks>
+            /// The output is the same as of <see cref="ToJsonObject" /> followed by
+            /// <see cref="System.Text.Json.Nodes.JsonNode.ToJsonString" />, given
+            /// the writer with the default options. The writer is not flushed.
+            /// </remarks>
+            /// <param name="that">instance to be serialized</param>
+            /// <param name="writer">where to write the JSON to</param>
+            public static void To(
+                Aas.IClass that,
+                Json.Utf8JsonWriter writer)
+            {
+                Serialize.WritingVisitor.Visit(that, new Utf8Writer(writer));
+            }
+
+            /// <summary>
+            /// Serialize an instance of the meta-model directly to
+            /// the <paramref name="stream" /> as UTF-8 encoded JSON text.
+            /// </summary>
+            /// <remarks>
+            /// The output is the same as of <see cref="ToJsonObject" /> followed by
+            /// <see cref="System.Text.Json.Nodes.JsonNode.ToJsonString" />.
+            /// </remarks>
+            /// <param name="that">instance to be serialized</param>
+            /// <param name="stream">where to write the JSON to</param>
+            public static void To(
+                Aas.IClass that,
+                System.IO.Stream stream)
+            {
+                using var writer = new Json.Utf8JsonWriter(stream);
+                To(that, writer);
+                writer.Flush();
+            }
+
+            private static async System.Threading.Tasks.Task ItemsToAsync<T>(
+                string propertyName,
+                IEnumerable<T>? items,
+                Json.Utf8JsonWriter writer,
+                System.Threading.CancellationToken cancellationToken) where T : Aas.IClass
+            {
+                if (items == null)
+                {
+                    return;
+                }
+
+                writer.WriteStartArray(propertyName);
+                foreach (T item in items)
+                {
+                    Serialize.WritingVisitor.Visit(item, new Utf8Writer(writer));
+
+                    if (writer.BytesPending >= FlushThreshold)
+                    {
+                        await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+                    }
+                }
+                writer.WriteEndArray();
+            }
+
+            /// <summary>
+            /// Serialize an instance of the meta-model asynchronously to
+            /// the <paramref name="stream" /> as UTF-8 encoded JSON text.
+            /// </summary>
+            /// <remarks>
+            /// <para>
+            /// The output is the same as of <see cref="To(Aas.IClass, System.IO.Stream)" />.
+            /// </para>
+            /// <para>
+            /// The instance is written to an in-memory buffer, and the buffer is
+            /// written asynchronously to the stream. In case of an environment,
+            /// the buffer is written out between the identifiables so that only
+            /// about a single identifiable needs to be held in memory.
+            /// </para>
+            /// </remarks>
+            /// <param name="that">instance to be serialized</param>
+            /// <param name="stream">where to write the JSON to</param>
+            /// <param name="cancellationToken">to cancel the writing</param>
+            public static async System.Threading.Tasks.Task ToAsync(
+                Aas.IClass that,
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                await using var writer = new Json.Utf8JsonWriter(stream);
+
+                if (that is Aas.IEnvironment environment)
+                {
+                    // NOTE: The order of the properties must follow
+                    // WritingVisitor.VisitEnvironment.
+                    writer.WriteStartObject();
+
+                    await ItemsToAsync(
+                        "assetAdministrationShells",
+                        environment.AssetAdministrationShells,
+                        writer,
+                        cancellationToken).ConfigureAwait(false);
+
+                    await ItemsToAsync(
+                        "submodels",
+                        environment.Submodels,
+                        writer,
+                        cancellationToken).ConfigureAwait(false);
+
+                    await ItemsToAsync(
+                        "conceptDescriptions",
+                        environment.ConceptDescriptions,
+                        writer,
+                        cancellationToken).ConfigureAwait(false);
+
+                    writer.WriteEndObject();
+                }
+                else
+                {
+                    To(that, writer);
+                }
+
+                await writer.FlushAsync(cancellationToken).ConfigureAwait(false);
+            }
+        }  // public static partial class Serialize
+    }  // public static partial class Jsonization
+}  // namespace AasCore.Aas3_0
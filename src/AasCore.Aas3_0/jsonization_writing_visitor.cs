@@ -0,0 +1,2614 @@
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_property_visitors.py from types.cs and
+ * jsonization.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Jsonization
+    {
+        internal partial class WritingVisitor<TWriter>
+        {
+            public override void VisitExtension(
+                Aas.IExtension that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "name",
+                    that.Name);
+
+                if (that.ValueType != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.DataTypeDefXsd value = that.ValueType
+                        ?? throw new System.InvalidOperationException();
+                    writer.WriteString(
+                        "valueType",
+                        Stringification.ToString(value)
+                            ?? throw new System.ArgumentException(
+                                $"Invalid DataTypeDefXsd: {value}"));
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteString(
+                        "value",
+                        that.Value);
+                }
+
+                if (that.RefersTo != null)
+                {
+                    writer.WriteStartArray("refersTo");
+                    foreach (IReference item in that.RefersTo)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitAdministrativeInformation(
+                Aas.IAdministrativeInformation that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Version != null)
+                {
+                    writer.WriteString(
+                        "version",
+                        that.Version);
+                }
+
+                if (that.Revision != null)
+                {
+                    writer.WriteString(
+                        "revision",
+                        that.Revision);
+                }
+
+                if (that.Creator != null)
+                {
+                    writer.WritePropertyName("creator");
+                    Visit(that.Creator, writer);
+                }
+
+                if (that.TemplateId != null)
+                {
+                    writer.WriteString(
+                        "templateId",
+                        that.TemplateId);
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitQualifier(
+                Aas.IQualifier that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Kind != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.QualifierKind value = that.Kind
+                        ?? throw new System.InvalidOperationException();
+                    writer.WriteString(
+                        "kind",
+                        Stringification.ToString(value)
+                            ?? throw new System.ArgumentException(
+                                $"Invalid QualifierKind: {value}"));
+                }
+
+                writer.WriteString(
+                    "type",
+                    that.Type);
+
+                writer.WriteString(
+                    "valueType",
+                    Stringification.ToString(that.ValueType)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid DataTypeDefXsd: {that.ValueType}"));
+
+                if (that.Value != null)
+                {
+                    writer.WriteString(
+                        "value",
+                        that.Value);
+                }
+
+                if (that.ValueId != null)
+                {
+                    writer.WritePropertyName("valueId");
+                    Visit(that.ValueId, writer);
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitAssetAdministrationShell(
+                Aas.IAssetAdministrationShell that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Administration != null)
+                {
+                    writer.WritePropertyName("administration");
+                    Visit(that.Administration, writer);
+                }
+
+                writer.WriteString(
+                    "id",
+                    that.Id);
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.DerivedFrom != null)
+                {
+                    writer.WritePropertyName("derivedFrom");
+                    Visit(that.DerivedFrom, writer);
+                }
+
+                writer.WritePropertyName("assetInformation");
+                Visit(that.AssetInformation, writer);
+
+                if (that.Submodels != null)
+                {
+                    writer.WriteStartArray("submodels");
+                    foreach (IReference item in that.Submodels)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "AssetAdministrationShell");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitAssetInformation(
+                Aas.IAssetInformation that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "assetKind",
+                    Stringification.ToString(that.AssetKind)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid AssetKind: {that.AssetKind}"));
+
+                if (that.GlobalAssetId != null)
+                {
+                    writer.WriteString(
+                        "globalAssetId",
+                        that.GlobalAssetId);
+                }
+
+                if (that.SpecificAssetIds != null)
+                {
+                    writer.WriteStartArray("specificAssetIds");
+                    foreach (ISpecificAssetId item in that.SpecificAssetIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.AssetType != null)
+                {
+                    writer.WriteString(
+                        "assetType",
+                        that.AssetType);
+                }
+
+                if (that.DefaultThumbnail != null)
+                {
+                    writer.WritePropertyName("defaultThumbnail");
+                    Visit(that.DefaultThumbnail, writer);
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitResource(
+                Aas.IResource that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "path",
+                    that.Path);
+
+                if (that.ContentType != null)
+                {
+                    writer.WriteString(
+                        "contentType",
+                        that.ContentType);
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitSpecificAssetId(
+                Aas.ISpecificAssetId that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "name",
+                    that.Name);
+
+                writer.WriteString(
+                    "value",
+                    that.Value);
+
+                if (that.ExternalSubjectId != null)
+                {
+                    writer.WritePropertyName("externalSubjectId");
+                    Visit(that.ExternalSubjectId, writer);
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitSubmodel(
+                Aas.ISubmodel that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Administration != null)
+                {
+                    writer.WritePropertyName("administration");
+                    Visit(that.Administration, writer);
+                }
+
+                writer.WriteString(
+                    "id",
+                    that.Id);
+
+                if (that.Kind != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.ModellingKind value = that.Kind
+                        ?? throw new System.InvalidOperationException();
+                    writer.WriteString(
+                        "kind",
+                        Stringification.ToString(value)
+                            ?? throw new System.ArgumentException(
+                                $"Invalid ModellingKind: {value}"));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SubmodelElements != null)
+                {
+                    writer.WriteStartArray("submodelElements");
+                    foreach (ISubmodelElement item in that.SubmodelElements)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "Submodel");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitRelationshipElement(
+                Aas.IRelationshipElement that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WritePropertyName("first");
+                Visit(that.First, writer);
+
+                writer.WritePropertyName("second");
+                Visit(that.Second, writer);
+
+                writer.WriteString(
+                    "modelType",
+                    "RelationshipElement");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitSubmodelElementList(
+                Aas.ISubmodelElementList that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.OrderRelevant != null)
+                {
+                    writer.WriteBoolean(
+                        "orderRelevant",
+                        that.OrderRelevant.Value);
+                }
+
+                if (that.SemanticIdListElement != null)
+                {
+                    writer.WritePropertyName("semanticIdListElement");
+                    Visit(that.SemanticIdListElement, writer);
+                }
+
+                writer.WriteString(
+                    "typeValueListElement",
+                    Stringification.ToString(that.TypeValueListElement)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid AasSubmodelElements: {that.TypeValueListElement}"));
+
+                if (that.ValueTypeListElement != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.DataTypeDefXsd value = that.ValueTypeListElement
+                        ?? throw new System.InvalidOperationException();
+                    writer.WriteString(
+                        "valueTypeListElement",
+                        Stringification.ToString(value)
+                            ?? throw new System.ArgumentException(
+                                $"Invalid DataTypeDefXsd: {value}"));
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteStartArray("value");
+                    foreach (ISubmodelElement item in that.Value)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "SubmodelElementList");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitSubmodelElementCollection(
+                Aas.ISubmodelElementCollection that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteStartArray("value");
+                    foreach (ISubmodelElement item in that.Value)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "SubmodelElementCollection");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitProperty(
+                Aas.IProperty that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "valueType",
+                    Stringification.ToString(that.ValueType)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid DataTypeDefXsd: {that.ValueType}"));
+
+                if (that.Value != null)
+                {
+                    writer.WriteString(
+                        "value",
+                        that.Value);
+                }
+
+                if (that.ValueId != null)
+                {
+                    writer.WritePropertyName("valueId");
+                    Visit(that.ValueId, writer);
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "Property");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitMultiLanguageProperty(
+                Aas.IMultiLanguageProperty that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteStartArray("value");
+                    foreach (ILangStringTextType item in that.Value)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.ValueId != null)
+                {
+                    writer.WritePropertyName("valueId");
+                    Visit(that.ValueId, writer);
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "MultiLanguageProperty");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitRange(
+                Aas.IRange that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "valueType",
+                    Stringification.ToString(that.ValueType)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid DataTypeDefXsd: {that.ValueType}"));
+
+                if (that.Min != null)
+                {
+                    writer.WriteString(
+                        "min",
+                        that.Min);
+                }
+
+                if (that.Max != null)
+                {
+                    writer.WriteString(
+                        "max",
+                        that.Max);
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "Range");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitReferenceElement(
+                Aas.IReferenceElement that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WritePropertyName("value");
+                    Visit(that.Value, writer);
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "ReferenceElement");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitBlob(
+                Aas.IBlob that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteString(
+                        "value",
+                        System.Convert.ToBase64String(
+                            that.Value));
+                }
+
+                writer.WriteString(
+                    "contentType",
+                    that.ContentType);
+
+                writer.WriteString(
+                    "modelType",
+                    "Blob");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitFile(
+                Aas.IFile that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteString(
+                        "value",
+                        that.Value);
+                }
+
+                writer.WriteString(
+                    "contentType",
+                    that.ContentType);
+
+                writer.WriteString(
+                    "modelType",
+                    "File");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitAnnotatedRelationshipElement(
+                Aas.IAnnotatedRelationshipElement that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WritePropertyName("first");
+                Visit(that.First, writer);
+
+                writer.WritePropertyName("second");
+                Visit(that.Second, writer);
+
+                if (that.Annotations != null)
+                {
+                    writer.WriteStartArray("annotations");
+                    foreach (IDataElement item in that.Annotations)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "AnnotatedRelationshipElement");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitEntity(
+                Aas.IEntity that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Statements != null)
+                {
+                    writer.WriteStartArray("statements");
+                    foreach (ISubmodelElement item in that.Statements)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "entityType",
+                    Stringification.ToString(that.EntityType)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid EntityType: {that.EntityType}"));
+
+                if (that.GlobalAssetId != null)
+                {
+                    writer.WriteString(
+                        "globalAssetId",
+                        that.GlobalAssetId);
+                }
+
+                if (that.SpecificAssetIds != null)
+                {
+                    writer.WriteStartArray("specificAssetIds");
+                    foreach (ISpecificAssetId item in that.SpecificAssetIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "Entity");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitEventPayload(
+                Aas.IEventPayload that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WritePropertyName("source");
+                Visit(that.Source, writer);
+
+                if (that.SourceSemanticId != null)
+                {
+                    writer.WritePropertyName("sourceSemanticId");
+                    Visit(that.SourceSemanticId, writer);
+                }
+
+                writer.WritePropertyName("observableReference");
+                Visit(that.ObservableReference, writer);
+
+                if (that.ObservableSemanticId != null)
+                {
+                    writer.WritePropertyName("observableSemanticId");
+                    Visit(that.ObservableSemanticId, writer);
+                }
+
+                if (that.Topic != null)
+                {
+                    writer.WriteString(
+                        "topic",
+                        that.Topic);
+                }
+
+                if (that.SubjectId != null)
+                {
+                    writer.WritePropertyName("subjectId");
+                    Visit(that.SubjectId, writer);
+                }
+
+                writer.WriteString(
+                    "timeStamp",
+                    that.TimeStamp);
+
+                if (that.Payload != null)
+                {
+                    writer.WriteString(
+                        "payload",
+                        System.Convert.ToBase64String(
+                            that.Payload));
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitBasicEventElement(
+                Aas.IBasicEventElement that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WritePropertyName("observed");
+                Visit(that.Observed, writer);
+
+                writer.WriteString(
+                    "direction",
+                    Stringification.ToString(that.Direction)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid Direction: {that.Direction}"));
+
+                writer.WriteString(
+                    "state",
+                    Stringification.ToString(that.State)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid StateOfEvent: {that.State}"));
+
+                if (that.MessageTopic != null)
+                {
+                    writer.WriteString(
+                        "messageTopic",
+                        that.MessageTopic);
+                }
+
+                if (that.MessageBroker != null)
+                {
+                    writer.WritePropertyName("messageBroker");
+                    Visit(that.MessageBroker, writer);
+                }
+
+                if (that.LastUpdate != null)
+                {
+                    writer.WriteString(
+                        "lastUpdate",
+                        that.LastUpdate);
+                }
+
+                if (that.MinInterval != null)
+                {
+                    writer.WriteString(
+                        "minInterval",
+                        that.MinInterval);
+                }
+
+                if (that.MaxInterval != null)
+                {
+                    writer.WriteString(
+                        "maxInterval",
+                        that.MaxInterval);
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "BasicEventElement");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitOperation(
+                Aas.IOperation that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.InputVariables != null)
+                {
+                    writer.WriteStartArray("inputVariables");
+                    foreach (IOperationVariable item in that.InputVariables)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.OutputVariables != null)
+                {
+                    writer.WriteStartArray("outputVariables");
+                    foreach (IOperationVariable item in that.OutputVariables)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.InoutputVariables != null)
+                {
+                    writer.WriteStartArray("inoutputVariables");
+                    foreach (IOperationVariable item in that.InoutputVariables)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "Operation");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitOperationVariable(
+                Aas.IOperationVariable that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WritePropertyName("value");
+                Visit(that.Value, writer);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitCapability(
+                Aas.ICapability that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.SemanticId != null)
+                {
+                    writer.WritePropertyName("semanticId");
+                    Visit(that.SemanticId, writer);
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    writer.WriteStartArray("supplementalSemanticIds");
+                    foreach (IReference item in that.SupplementalSemanticIds)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    writer.WriteStartArray("qualifiers");
+                    foreach (IQualifier item in that.Qualifiers)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "Capability");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitConceptDescription(
+                Aas.IConceptDescription that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.Extensions != null)
+                {
+                    writer.WriteStartArray("extensions");
+                    foreach (IExtension item in that.Extensions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Category != null)
+                {
+                    writer.WriteString(
+                        "category",
+                        that.Category);
+                }
+
+                if (that.IdShort != null)
+                {
+                    writer.WriteString(
+                        "idShort",
+                        that.IdShort);
+                }
+
+                if (that.DisplayName != null)
+                {
+                    writer.WriteStartArray("displayName");
+                    foreach (ILangStringNameType item in that.DisplayName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Description != null)
+                {
+                    writer.WriteStartArray("description");
+                    foreach (ILangStringTextType item in that.Description)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Administration != null)
+                {
+                    writer.WritePropertyName("administration");
+                    Visit(that.Administration, writer);
+                }
+
+                writer.WriteString(
+                    "id",
+                    that.Id);
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    writer.WriteStartArray("embeddedDataSpecifications");
+                    foreach (IEmbeddedDataSpecification item in that.EmbeddedDataSpecifications)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.IsCaseOf != null)
+                {
+                    writer.WriteStartArray("isCaseOf");
+                    foreach (IReference item in that.IsCaseOf)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "ConceptDescription");
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitReference(
+                Aas.IReference that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "type",
+                    Stringification.ToString(that.Type)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid ReferenceTypes: {that.Type}"));
+
+                if (that.ReferredSemanticId != null)
+                {
+                    writer.WritePropertyName("referredSemanticId");
+                    Visit(that.ReferredSemanticId, writer);
+                }
+
+                writer.WriteStartArray("keys");
+                foreach (IKey item in that.Keys)
+                {
+                    Visit(item, writer);
+                }
+                writer.WriteEndArray();
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitKey(
+                Aas.IKey that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "type",
+                    Stringification.ToString(that.Type)
+                        ?? throw new System.ArgumentException(
+                            $"Invalid KeyTypes: {that.Type}"));
+
+                writer.WriteString(
+                    "value",
+                    that.Value);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitLangStringNameType(
+                Aas.ILangStringNameType that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "language",
+                    that.Language);
+
+                writer.WriteString(
+                    "text",
+                    that.Text);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitLangStringTextType(
+                Aas.ILangStringTextType that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "language",
+                    that.Language);
+
+                writer.WriteString(
+                    "text",
+                    that.Text);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitEnvironment(
+                Aas.IEnvironment that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                if (that.AssetAdministrationShells != null)
+                {
+                    writer.WriteStartArray("assetAdministrationShells");
+                    foreach (IAssetAdministrationShell item in that.AssetAdministrationShells)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Submodels != null)
+                {
+                    writer.WriteStartArray("submodels");
+                    foreach (ISubmodel item in that.Submodels)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.ConceptDescriptions != null)
+                {
+                    writer.WriteStartArray("conceptDescriptions");
+                    foreach (IConceptDescription item in that.ConceptDescriptions)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitEmbeddedDataSpecification(
+                Aas.IEmbeddedDataSpecification that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WritePropertyName("dataSpecification");
+                Visit(that.DataSpecification, writer);
+
+                writer.WritePropertyName("dataSpecificationContent");
+                Visit(that.DataSpecificationContent, writer);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitLevelType(
+                Aas.ILevelType that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteBoolean(
+                    "min",
+                    that.Min);
+
+                writer.WriteBoolean(
+                    "nom",
+                    that.Nom);
+
+                writer.WriteBoolean(
+                    "typ",
+                    that.Typ);
+
+                writer.WriteBoolean(
+                    "max",
+                    that.Max);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitValueReferencePair(
+                Aas.IValueReferencePair that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "value",
+                    that.Value);
+
+                writer.WritePropertyName("valueId");
+                Visit(that.ValueId, writer);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitValueList(
+                Aas.IValueList that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteStartArray("valueReferencePairs");
+                foreach (IValueReferencePair item in that.ValueReferencePairs)
+                {
+                    Visit(item, writer);
+                }
+                writer.WriteEndArray();
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitLangStringPreferredNameTypeIec61360(
+                Aas.ILangStringPreferredNameTypeIec61360 that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "language",
+                    that.Language);
+
+                writer.WriteString(
+                    "text",
+                    that.Text);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitLangStringShortNameTypeIec61360(
+                Aas.ILangStringShortNameTypeIec61360 that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "language",
+                    that.Language);
+
+                writer.WriteString(
+                    "text",
+                    that.Text);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitLangStringDefinitionTypeIec61360(
+                Aas.ILangStringDefinitionTypeIec61360 that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteString(
+                    "language",
+                    that.Language);
+
+                writer.WriteString(
+                    "text",
+                    that.Text);
+
+                writer.WriteEndObject();
+            }
+
+            public override void VisitDataSpecificationIec61360(
+                Aas.IDataSpecificationIec61360 that,
+                TWriter writer
+            )
+            {
+                writer.WriteStartObject();
+
+                writer.WriteStartArray("preferredName");
+                foreach (ILangStringPreferredNameTypeIec61360 item in that.PreferredName)
+                {
+                    Visit(item, writer);
+                }
+                writer.WriteEndArray();
+
+                if (that.ShortName != null)
+                {
+                    writer.WriteStartArray("shortName");
+                    foreach (ILangStringShortNameTypeIec61360 item in that.ShortName)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.Unit != null)
+                {
+                    writer.WriteString(
+                        "unit",
+                        that.Unit);
+                }
+
+                if (that.UnitId != null)
+                {
+                    writer.WritePropertyName("unitId");
+                    Visit(that.UnitId, writer);
+                }
+
+                if (that.SourceOfDefinition != null)
+                {
+                    writer.WriteString(
+                        "sourceOfDefinition",
+                        that.SourceOfDefinition);
+                }
+
+                if (that.Symbol != null)
+                {
+                    writer.WriteString(
+                        "symbol",
+                        that.Symbol);
+                }
+
+                if (that.DataType != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.DataTypeIec61360 value = that.DataType
+                        ?? throw new System.InvalidOperationException();
+                    writer.WriteString(
+                        "dataType",
+                        Stringification.ToString(value)
+                            ?? throw new System.ArgumentException(
+                                $"Invalid DataTypeIec61360: {value}"));
+                }
+
+                if (that.Definition != null)
+                {
+                    writer.WriteStartArray("definition");
+                    foreach (ILangStringDefinitionTypeIec61360 item in that.Definition)
+                    {
+                        Visit(item, writer);
+                    }
+                    writer.WriteEndArray();
+                }
+
+                if (that.ValueFormat != null)
+                {
+                    writer.WriteString(
+                        "valueFormat",
+                        that.ValueFormat);
+                }
+
+                if (that.ValueList != null)
+                {
+                    writer.WritePropertyName("valueList");
+                    Visit(that.ValueList, writer);
+                }
+
+                if (that.Value != null)
+                {
+                    writer.WriteString(
+                        "value",
+                        that.Value);
+                }
+
+                if (that.LevelType != null)
+                {
+                    writer.WritePropertyName("levelType");
+                    Visit(that.LevelType, writer);
+                }
+
+                writer.WriteString(
+                    "modelType",
+                    "DataSpecificationIec61360");
+
+                writer.WriteEndObject();
+            }
+        }  // internal partial class WritingVisitor<TWriter>
+    }  // public static partial class Jsonization
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,26 @@
+//------------------------------------------------------------------------------
+// <auto-generated>
+//     This code was generated by a tool.
+//
+//     Changes to this file may cause incorrect behavior and will be lost if
+//     the code is regenerated.
+// </auto-generated>
+//------------------------------------------------------------------------------
+
+using System;
+using System.Reflection;
+
+[assembly: System.Reflection.AssemblyCompanyAttribute("Marko Ristin")]
+[assembly: System.Reflection.AssemblyConfigurationAttribute("Release")]
+[assembly: System.Reflection.AssemblyCopyrightAttribute("Copyright (c) 2023 Marko Ristin")]
+[assembly: System.Reflection.AssemblyDescriptionAttribute("\n        An SDK for manipulating, verifying and de/serializing Asset Administrati" +
+    "on Shells.\n    ")]
+[assembly: System.Reflection.AssemblyFileVersionAttribute("1.0.6.0")]
+[assembly: System.Reflection.AssemblyInformationalVersionAttribute("1.0.6+6ff734d88201cecd568b4552c17e42e7106e68b4")]
+[assembly: System.Reflection.AssemblyProductAttribute("AasCore.Aas3_0")]
+[assembly: System.Reflection.AssemblyTitleAttribute("AasCore.Aas3_0")]
+[assembly: System.Reflection.AssemblyVersionAttribute("1.0.6.0")]
+[assembly: System.Reflection.AssemblyMetadataAttribute("RepositoryUrl", "https://github.com/aas-core-works/aas-core3.0-csharp.git")]
+
+// Generated by the MSBuild WriteCodeFragment class.
+
@@ -0,0 +1,347 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Resolve the model references to the instances in an environment.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The first key of a reference needs to refer to an identifiable
+    /// (see <see cref="Constants.AasIdentifiables" />). The following keys walk
+    /// down the submodel elements of a submodel by their ID-shorts
+    /// (see <see cref="Constants.FragmentKeys" />), where the items of a submodel
+    /// element list are given by their zero-based index, and the other values
+    /// need to be valid ID-shorts. A fragment reference as the last key, following
+    /// a key of a file or a blob, resolves to the file or the blob containing
+    /// the fragment. The type of every key needs to match the instance it refers to.
+    /// </para>
+    /// <para>
+    /// The lookups go through an <see cref="EnvironmentIndex" />, so a reference
+    /// is resolved in the time proportional to the number of its keys. The results
+    /// are memoized per reference value, and dropped whenever the index changes.
+    /// </para>
+    /// <para>
+    /// The memo holds at most <see cref="Capacity" /> results, and evicts the least
+    /// recently used one when full.
+    /// </para>
+    /// <para>
+    /// The resolver is not thread-safe.
+    /// </para>
+    /// </remarks>
+    public class ReferenceResolver
+    {
+        /// <summary>
+        /// Capacity of the memo if none is given
+        /// </summary>
+        public const int DefaultCapacity = 65536;
+
+        private readonly struct Entry
+        {
+            internal readonly string Key;
+            internal readonly Aas.IClass? Result;
+
+            internal Entry(string key, Aas.IClass? result)
+            {
+                Key = key;
+                Result = result;
+            }
+        }
+
+        private readonly EnvironmentIndex _index;
+
+        /// <summary>
+        /// Version of <see cref="_index" /> at which <see cref="_memo" /> is valid
+        /// </summary>
+        private long _version;
+
+        private readonly Dictionary<string, LinkedListNode<Entry>> _memo =
+            new Dictionary<string, LinkedListNode<Entry>>();
+
+        /// <summary>
+        /// Keep the entries of <see cref="_memo" /> from the most to the least
+        /// recently used
+        /// </summary>
+        private readonly LinkedList<Entry> _order = new LinkedList<Entry>();
+
+        private readonly System.Text.StringBuilder _builder =
+            new System.Text.StringBuilder();
+
+        /// <summary>
+        /// Number of the resolutions answered from the memo
+        /// </summary>
+        public long Hits { get; private set; }
+
+        /// <summary>
+        /// Number of the resolutions which had to walk the keys
+        /// </summary>
+        public long Misses { get; private set; }
+
+        /// <summary>
+        /// Maximum number of the memoized results
+        /// </summary>
+        public int Capacity { get; }
+
+        /// <summary>
+        /// Number of the currently memoized results
+        /// </summary>
+        public int Count => _memo.Count;
+
+        /// <summary>
+        /// Initialize the resolver over the <paramref name="index" /> which
+        /// memoizes at most <paramref name="capacity" /> results.
+        /// </summary>
+        /// <remarks>
+        /// Keep the <paramref name="index" /> up to date with the environment, and
+        /// the memoized results are dropped automatically.
+        /// </remarks>
+        /// <exception cref="System.ArgumentException">
+        /// Thrown when <paramref name="capacity" /> is not positive.
+        /// </exception>
+        public ReferenceResolver(
+            EnvironmentIndex index,
+            int capacity = DefaultCapacity)
+        {
+            if (capacity <= 0)
+            {
+                throw new System.ArgumentException(
+                    $"Expected a positive capacity, but got: {capacity}");
+            }
+
+            _index = index;
+            _version = index.Version;
+            Capacity = capacity;
+        }
+
+        /// <summary>
+        /// Drop all the memoized results.
+        /// </summary>
+        /// <remarks>
+        /// Call this if you changed the model without informing the index.
+        /// </remarks>
+        public void Invalidate()
+        {
+            _memo.Clear();
+            _order.Clear();
+        }
+
+        /// <summary>
+        /// Resolve the <paramref name="reference" /> to the instance it refers to.
+        /// </summary>
+        /// <returns>
+        /// The referred instance, or <c>null</c> if the reference is not a model
+        /// reference, or if it does not refer to any instance
+        /// </returns>
+        public Aas.IClass? Resolve(Aas.IReference reference)
+        {
+            if (reference.Type != Aas.ReferenceTypes.ModelReference
+                || reference.Keys.Count == 0)
+            {
+                return null;
+            }
+
+            if (_version != _index.Version)
+            {
+                Invalidate();
+                _version = _index.Version;
+            }
+
+            // NOTE: The values are length-prefixed so that the memo keys of
+            // different key chains can not coincide.
+            _builder.Clear();
+            foreach (var key in reference.Keys)
+            {
+                _builder
+                    .Append((int)key.Type)
+                    .Append(':')
+                    .Append(key.Value.Length)
+                    .Append(':')
+                    .Append(key.Value);
+            }
+            string memoKey = _builder.ToString();
+
+            if (_memo.TryGetValue(memoKey, out var node))
+            {
+                _order.Remove(node);
+                _order.AddFirst(node);
+
+                Hits++;
+                return node.Value.Result;
+            }
+
+            Misses++;
+            var result = Walk(reference.Keys);
+
+            if (_memo.Count == Capacity)
+            {
+                var last = _order.Last!;
+                _order.RemoveLast();
+                _memo.Remove(last.Value.Key);
+            }
+
+            _memo.Add(memoKey, _order.AddFirst(new Entry(memoKey, result)));
+            return result;
+        }
+
+        private Aas.IClass? Walk(List<Aas.IKey> keys)
+        {
+            var first = keys[0];
+            if (!Constants.AasIdentifiables.Contains(first.Type))
+            {
+                return null;
+            }
+
+            var identifiable = _index.FindIdentifiable(first.Value);
+            if (identifiable == null || !Matches(first.Type, identifiable))
+            {
+                return null;
+            }
+
+            if (keys.Count == 1)
+            {
+                return identifiable;
+            }
+
+            if (!(identifiable is Aas.ISubmodel submodel))
+            {
+                return null;
+            }
+
+            Aas.IClass current = submodel;
+            string? path = null;
+            for (int i = 1; i < keys.Count; i++)
+            {
+                var key = keys[i];
+
+                if (!Constants.FragmentKeys.Contains(key.Type))
+                {
+                    return null;
+                }
+
+                if (key.Type == Aas.KeyTypes.FragmentReference)
+                {
+                    // The fragment is not a part of the model, so we resolve to
+                    // the file or the blob containing it. It must be the last key.
+                    var previousType = keys[i - 1].Type;
+                    return i == keys.Count - 1
+                        && (previousType == Aas.KeyTypes.File
+                            || previousType == Aas.KeyTypes.Blob)
+                        ? current
+                        : null;
+                }
+
+                if (current is Aas.ISubmodelElementList)
+                {
+                    if (!IsIndex(key.Value))
+                    {
+                        return null;
+                    }
+
+                    path = $"{path}[{key.Value}]";
+                }
+                else
+                {
+                    // NOTE: We check the ID-short before joining it so that the dots
+                    // and the brackets in the value can not walk a different path.
+                    if (!Verification.Patterns.MatchesIdShort(key.Value))
+                    {
+                        return null;
+                    }
+
+                    path = path == null ? key.Value : $"{path}.{key.Value}";
+                }
+
+                var referable = _index.FindReferable(submodel.Id, path);
+                if (referable == null || !Matches(key.Type, referable))
+                {
+                    return null;
+                }
+
+                current = referable;
+            }
+
+            return current;
+        }
+
+        /// <summary>
+        /// Check that the <paramref name="value" /> is a non-negative integer
+        /// without leading zeros.
+        /// </summary>
+        private static bool IsIndex(string value)
+        {
+            if (value.Length == 0 || (value[0] == '0' && value.Length > 1))
+            {
+                return false;
+            }
+
+            foreach (char character in value)
+            {
+                if (character < '0' || character > '9')
+                {
+                    return false;
+                }
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        /// Check that the <paramref name="instance" /> is of the key
+        /// <paramref name="type" />.
+        /// </summary>
+        private static bool Matches(Aas.KeyTypes type, Aas.IClass instance)
+        {
+            switch (type)
+            {
+                case Aas.KeyTypes.AnnotatedRelationshipElement:
+                    return instance is Aas.IAnnotatedRelationshipElement;
+                case Aas.KeyTypes.AssetAdministrationShell:
+                    return instance is Aas.IAssetAdministrationShell;
+                case Aas.KeyTypes.BasicEventElement:
+                    return instance is Aas.IBasicEventElement;
+                case Aas.KeyTypes.Blob:
+                    return instance is Aas.IBlob;
+                case Aas.KeyTypes.Capability:
+                    return instance is Aas.ICapability;
+                case Aas.KeyTypes.ConceptDescription:
+                    return instance is Aas.IConceptDescription;
+                case Aas.KeyTypes.DataElement:
+                    return instance is Aas.IDataElement;
+                case Aas.KeyTypes.Entity:
+                    return instance is Aas.IEntity;
+                case Aas.KeyTypes.EventElement:
+                    return instance is Aas.IEventElement;
+                case Aas.KeyTypes.File:
+                    return instance is Aas.IFile;
+                case Aas.KeyTypes.Identifiable:
+                    return instance is Aas.IIdentifiable;
+                case Aas.KeyTypes.MultiLanguageProperty:
+                    return instance is Aas.IMultiLanguageProperty;
+                case Aas.KeyTypes.Operation:
+                    return instance is Aas.IOperation;
+                case Aas.KeyTypes.Property:
+                    return instance is Aas.IProperty;
+                case Aas.KeyTypes.Range:
+                    return instance is Aas.IRange;
+                case Aas.KeyTypes.Referable:
+                    return instance is Aas.IReferable;
+                case Aas.KeyTypes.ReferenceElement:
+                    return instance is Aas.IReferenceElement;
+                case Aas.KeyTypes.RelationshipElement:
+                    return instance is Aas.IRelationshipElement;
+                case Aas.KeyTypes.Submodel:
+                    return instance is Aas.ISubmodel;
+                case Aas.KeyTypes.SubmodelElement:
+                    return instance is Aas.ISubmodelElement;
+                case Aas.KeyTypes.SubmodelElementCollection:
+                    return instance is Aas.ISubmodelElementCollection;
+                case Aas.KeyTypes.SubmodelElementList:
+                    return instance is Aas.ISubmodelElementList;
+                default:
+                    return false;
+            }
+        }
+    }  // public class ReferenceResolver
+}  // namespace AasCore.Aas3_0
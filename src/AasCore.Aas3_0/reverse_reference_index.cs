@@ -0,0 +1,278 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Index the references in an environment by the values of their keys so that
+    /// you can find all the instances pointing to an identifiable.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// The index covers the semantic IDs and the supplemental semantic IDs,
+    /// <see cref="Aas.IConceptDescription.IsCaseOf" />, the data specifications of
+    /// the embedded data specifications, <see cref="Aas.IReferenceElement.Value" />,
+    /// <see cref="Aas.IRelationshipElement.First" /> and
+    /// <see cref="Aas.IRelationshipElement.Second" />,
+    /// <see cref="Aas.IBasicEventElement.Observed" />, as well as
+    /// <see cref="Aas.IAssetAdministrationShell.DerivedFrom" /> and
+    /// <see cref="Aas.IAssetAdministrationShell.Submodels" />.
+    /// </para>
+    /// <para>
+    /// A reference is indexed under the value of each of its keys. For example,
+    /// a model reference to a submodel element is found by the ID of the submodel
+    /// as well as by the ID-shorts along the path.
+    /// </para>
+    /// <para>
+    /// The index is a snapshot of the environment. If you change the environment,
+    /// inform the index with <see cref="Add" />, <see cref="Remove" /> or
+    /// <see cref="Reindex" />.
+    /// </para>
+    /// </remarks>
+    public class ReverseReferenceIndex
+    {
+        /// <summary>
+        /// Represent an instance referring to something through one of
+        /// its properties.
+        /// </summary>
+        public class Referrer
+        {
+            /// <summary>
+            /// Instance which holds the reference
+            /// </summary>
+            /// <remarks>
+            /// For data specifications, this is the instance which embeds
+            /// the data specification.
+            /// </remarks>
+            public Aas.IClass Instance { get; }
+
+            /// <summary>
+            /// Name of the property holding the reference, such as
+            /// <c>SemanticId</c> or <c>First</c>
+            /// </summary>
+            public string Property { get; }
+
+            /// <summary>
+            /// The reference itself
+            /// </summary>
+            public Aas.IReference Reference { get; }
+
+            /// <summary>
+            /// Distinct values of the keys at the time of the indexing
+            /// </summary>
+            /// <remarks>
+            /// We need them to un-index the referrer even if the keys have been
+            /// changed in the meanwhile.
+            /// </remarks>
+            internal readonly List<string> IndexedValues = new List<string>();
+
+            internal Referrer(Aas.IClass instance, string property, Aas.IReference reference)
+            {
+                Instance = instance;
+                Property = property;
+                Reference = reference;
+            }
+        }  // public class Referrer
+
+        private static readonly Referrer[] NoReferrers = new Referrer[0];
+
+        private readonly Dictionary<string, List<Referrer>> _byValue =
+            new Dictionary<string, List<Referrer>>();
+
+        private readonly Dictionary<Aas.IClass, List<Referrer>> _byInstance =
+            new Dictionary<Aas.IClass, List<Referrer>>(
+                ReferenceEqualityComparer.Instance);
+
+        /// <summary>
+        /// Index the references in the <paramref name="environment" /> in
+        /// a single traversal.
+        /// </summary>
+        public ReverseReferenceIndex(Aas.IEnvironment environment)
+        {
+            Add(environment);
+        }
+
+        /// <summary>
+        /// Find all the referrers whose references contain a key with
+        /// the <paramref name="value" />, in the order of the environment.
+        /// </summary>
+        /// <remarks>
+        /// The referrers added with <see cref="Add" /> come after the others.
+        /// </remarks>
+        public IReadOnlyList<Referrer> ReferrersOf(string value)
+        {
+            if (!_byValue.TryGetValue(value, out var referrers))
+            {
+                return NoReferrers;
+            }
+
+            return referrers;
+        }
+
+        /// <summary>
+        /// Index the references held by <paramref name="that" /> and
+        /// its descendants once they have been added to the environment.
+        /// </summary>
+        public void Add(Aas.IClass that)
+        {
+            IndexInstance(that);
+            foreach (var instance in that.Descend())
+            {
+                IndexInstance(instance);
+            }
+        }
+
+        /// <summary>
+        /// Remove the references held by <paramref name="that" /> and
+        /// its descendants once they have been removed from the environment.
+        /// </summary>
+        public void Remove(Aas.IClass that)
+        {
+            UnindexInstance(that);
+            foreach (var instance in that.Descend())
+            {
+                UnindexInstance(instance);
+            }
+        }
+
+        /// <summary>
+        /// Re-index the references held directly by <paramref name="that" /> after
+        /// they have been changed.
+        /// </summary>
+        /// <remarks>
+        /// The descendants of <paramref name="that" /> are not re-indexed. Use
+        /// <see cref="Remove" /> and <see cref="Add" /> for whole subtrees.
+        /// </remarks>
+        public void Reindex(Aas.IClass that)
+        {
+            UnindexInstance(that);
+            IndexInstance(that);
+        }
+
+        private void IndexInstance(Aas.IClass instance)
+        {
+            if (_byInstance.ContainsKey(instance))
+            {
+                // The instance has already been indexed, for example, when its
+                // container has been added twice.
+                return;
+            }
+
+            var referrers = new List<Referrer>();
+            CollectReferrers(instance, referrers);
+            if (referrers.Count == 0)
+            {
+                return;
+            }
+            _byInstance.Add(instance, referrers);
+
+            foreach (var referrer in referrers)
+            {
+                foreach (var key in referrer.Reference.Keys)
+                {
+                    if (referrer.IndexedValues.Contains(key.Value))
+                    {
+                        continue;
+                    }
+                    referrer.IndexedValues.Add(key.Value);
+
+                    if (!_byValue.TryGetValue(key.Value, out var list))
+                    {
+                        list = new List<Referrer>();
+                        _byValue.Add(key.Value, list);
+                    }
+                    list.Add(referrer);
+                }
+            }
+        }
+
+        private void UnindexInstance(Aas.IClass instance)
+        {
+            if (!_byInstance.TryGetValue(instance, out var referrers))
+            {
+                return;
+            }
+            _byInstance.Remove(instance);
+
+            foreach (var referrer in referrers)
+            {
+                foreach (var value in referrer.IndexedValues)
+                {
+                    var list = _byValue[value];
+
+                    list.RemoveAll(other => ReferenceEquals(other, referrer));
+                    if (list.Count == 0)
+                    {
+                        _byValue.Remove(value);
+                    }
+                }
+            }
+        }
+
+        private static void CollectReferrers(Aas.IClass instance, List<Referrer> into)
+        {
+            if (instance is Aas.IHasSemantics hasSemantics)
+            {
+                if (hasSemantics.SemanticId != null)
+                {
+                    into.Add(new Referrer(instance, "SemanticId", hasSemantics.SemanticId));
+                }
+
+                foreach (var reference in hasSemantics.OverSupplementalSemanticIdsOrEmpty())
+                {
+                    into.Add(new Referrer(instance, "SupplementalSemanticIds", reference));
+                }
+            }
+
+            if (instance is Aas.IHasDataSpecification hasDataSpecification)
+            {
+                foreach (var embedded in
+                    hasDataSpecification.OverEmbeddedDataSpecificationsOrEmpty())
+                {
+                    into.Add(
+                        new Referrer(
+                            instance, "DataSpecification", embedded.DataSpecification));
+                }
+            }
+
+            switch (instance)
+            {
+                case Aas.IConceptDescription conceptDescription:
+                    foreach (var reference in conceptDescription.OverIsCaseOfOrEmpty())
+                    {
+                        into.Add(new Referrer(instance, "IsCaseOf", reference));
+                    }
+                    break;
+
+                case Aas.IAssetAdministrationShell shell:
+                    if (shell.DerivedFrom != null)
+                    {
+                        into.Add(new Referrer(instance, "DerivedFrom", shell.DerivedFrom));
+                    }
+
+                    foreach (var reference in shell.OverSubmodelsOrEmpty())
+                    {
+                        into.Add(new Referrer(instance, "Submodels", reference));
+                    }
+                    break;
+
+                case Aas.IReferenceElement referenceElement:
+                    if (referenceElement.Value != null)
+                    {
+                        into.Add(new Referrer(instance, "Value", referenceElement.Value));
+                    }
+                    break;
+
+                case Aas.IRelationshipElement relationship:
+                    into.Add(new Referrer(instance, "First", relationship.First));
+                    into.Add(new Referrer(instance, "Second", relationship.Second));
+                    break;
+
+                case Aas.IBasicEventElement eventElement:
+                    into.Add(new Referrer(instance, "Observed", eventElement.Observed));
+                    break;
+            }
+        }
+    }  // public class ReverseReferenceIndex
+}  // namespace AasCore.Aas3_0
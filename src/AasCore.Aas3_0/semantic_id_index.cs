@@ -0,0 +1,241 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    /// <summary>
+    /// Index the submodel elements of an environment by their semantic IDs so
+    /// that they can be queried without walking the submodels.
+    /// </summary>
+    /// <remarks>
+    /// <para>
+    /// An element is indexed under the value of each key of its semantic ID, and,
+    /// if requested, of its supplemental semantic IDs. The elements are found at
+    /// any depth of the submodels.
+    /// </para>
+    /// <para>
+    /// The index is a snapshot of the environment. If you change a submodel,
+    /// inform the index with <see cref="Add" />, <see cref="Remove" /> or
+    /// <see cref="Reindex" />.
+    /// </para>
+    /// <para>
+    /// The index can be queried from multiple threads at the same time, but not
+    /// while it is being changed.
+    /// </para>
+    /// </remarks>
+    public class SemanticIdIndex
+    {
+        /// <summary>
+        /// Represent a submodel element found by its semantic ID.
+        /// </summary>
+        public class Match
+        {
+            /// <summary>
+            /// The element with the semantic ID
+            /// </summary>
+            public Aas.ISubmodelElement Element { get; }
+
+            /// <summary>
+            /// Submodel containing the <see cref="Element" />
+            /// </summary>
+            public Aas.ISubmodel Submodel { get; }
+
+            internal Match(Aas.ISubmodelElement element, Aas.ISubmodel submodel)
+            {
+                Element = element;
+                Submodel = submodel;
+            }
+        }  // public class Match
+
+        private static readonly Match[] NoMatches = new Match[0];
+
+        private readonly bool _includeSupplementalSemanticIds;
+
+        private readonly Dictionary<string, List<Match>> _byValue =
+            new Dictionary<string, List<Match>>();
+
+        /// <summary>
+        /// Map the indexed submodels to the values their elements are indexed under
+        /// </summary>
+        private readonly Dictionary<Aas.ISubmodel, HashSet<string>> _bySubmodel =
+            new Dictionary<Aas.ISubmodel, HashSet<string>>(
+                ReferenceEqualityComparer.Instance);
+
+        /// <summary>
+        /// Index the submodel elements of all the submodels in
+        /// the <paramref name="environment" />.
+        /// </summary>
+        /// <param name="environment">to be indexed</param>
+        /// <param name="includeSupplementalSemanticIds">
+        /// if set, index the elements also by their supplemental semantic IDs
+        /// </param>
+        public SemanticIdIndex(
+            Aas.IEnvironment environment,
+            bool includeSupplementalSemanticIds = false)
+        {
+            _includeSupplementalSemanticIds = includeSupplementalSemanticIds;
+
+            foreach (var submodel in environment.OverSubmodelsOrEmpty())
+            {
+                Add(submodel);
+            }
+        }
+
+        /// <summary>
+        /// Find all the submodel elements whose semantic ID contains a key with
+        /// the given <paramref name="value" />.
+        /// </summary>
+        /// <remarks>
+        /// The matches are in the order of the submodels, and in the order of
+        /// <see cref="Aas.IClass.Descend" /> within a submodel.
+        /// </remarks>
+        public IReadOnlyList<Match> Find(string value)
+        {
+            if (!_byValue.TryGetValue(value, out var matches))
+            {
+                return NoMatches;
+            }
+
+            return matches;
+        }
+
+        /// <summary>
+        /// Find the submodel elements of the type <typeparamref name="T" /> whose
+        /// semantic ID contains a key with the given <paramref name="value" />.
+        /// </summary>
+        /// <remarks>
+        /// For example, use <c>Find&lt;Aas.IProperty&gt;(...)</c> to find only
+        /// the properties.
+        /// </remarks>
+        public IEnumerable<Match> Find<T>(string value) where T : Aas.ISubmodelElement
+        {
+            foreach (var match in Find(value))
+            {
+                if (match.Element is T)
+                {
+                    yield return match;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Index the elements of the <paramref name="submodel" /> once it has been
+        /// added to the environment.
+        /// </summary>
+        /// <exception cref="System.ArgumentException">
+        /// Thrown when the <paramref name="submodel" /> has already been indexed.
+        /// </exception>
+        public void Add(Aas.ISubmodel submodel)
+        {
+            if (_bySubmodel.ContainsKey(submodel))
+            {
+                throw new System.ArgumentException(
+                    $"The submodel with the ID {submodel.Id} has already been indexed.");
+            }
+
+            var values = new HashSet<string>();
+            var elementValues = new List<string>();
+
+            foreach (var instance in submodel.Descend())
+            {
+                if (!(instance is Aas.ISubmodelElement element))
+                {
+                    continue;
+                }
+
+                elementValues.Clear();
+                CollectValues(element.SemanticId, elementValues);
+                if (_includeSupplementalSemanticIds)
+                {
+                    foreach (var reference in element.OverSupplementalSemanticIdsOrEmpty())
+                    {
+                        CollectValues(reference, elementValues);
+                    }
+                }
+
+                if (elementValues.Count == 0)
+                {
+                    continue;
+                }
+
+                var match = new Match(element, submodel);
+                foreach (var value in elementValues)
+                {
+                    if (!_byValue.TryGetValue(value, out var matches))
+                    {
+                        matches = new List<Match>();
+                        _byValue.Add(value, matches);
+                    }
+                    matches.Add(match);
+
+                    values.Add(value);
+                }
+            }
+
+            _bySubmodel.Add(submodel, values);
+        }
+
+        /// <summary>
+        /// Remove the elements of the <paramref name="submodel" /> from the index
+        /// once it has been removed from the environment.
+        /// </summary>
+        /// <returns>
+        /// <c>true</c> if the submodel has been indexed, <c>false</c> otherwise
+        /// </returns>
+        public bool Remove(Aas.ISubmodel submodel)
+        {
+            if (!_bySubmodel.TryGetValue(submodel, out var values))
+            {
+                return false;
+            }
+            _bySubmodel.Remove(submodel);
+
+            foreach (var value in values)
+            {
+                var matches = _byValue[value];
+                matches.RemoveAll(match => ReferenceEquals(match.Submodel, submodel));
+                if (matches.Count == 0)
+                {
+                    _byValue.Remove(value);
+                }
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        /// Re-index the elements of the <paramref name="submodel" /> after it has
+        /// been changed.
+        /// </summary>
+        /// <remarks>
+        /// The re-indexed elements come after the elements of the other submodels
+        /// in the results of <see cref="Find" />.
+        /// </remarks>
+        public void Reindex(Aas.ISubmodel submodel)
+        {
+            Remove(submodel);
+            Add(submodel);
+        }
+
+        /// <summary>
+        /// Add the distinct values of the keys of the <paramref name="reference" />,
+        /// if any.
+        /// </summary>
+        private static void CollectValues(Aas.IReference? reference, List<string> into)
+        {
+            if (reference == null)
+            {
+                return;
+            }
+
+            foreach (var key in reference.Keys)
+            {
+                if (!into.Contains(key.Value))
+                {
+                    into.Add(key.Value);
+                }
+            }
+        }
+    }  // public class SemanticIdIndex
+}  // namespace AasCore.Aas3_0
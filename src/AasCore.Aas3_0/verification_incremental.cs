@@ -0,0 +1,225 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Cache the verification of an instance so that only the changed parts
+        /// need to be re-verified.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The results are cached per instance, keyed by the reference identity.
+        /// When you change an instance, you mark it with <see cref="MarkDirty" />.
+        /// On the next <see cref="Verify" />, the marked instance and all its
+        /// ancestors are re-verified, while the other instances are taken from
+        /// the cache.
+        /// </para>
+        /// <para>
+        /// The ancestors are re-verified as their invariants might depend on their
+        /// descendants (such as the uniqueness of ID-shorts among the submodel
+        /// elements). This only re-checks their own invariants, not their
+        /// unchanged descendants.
+        /// </para>
+        /// <para>
+        /// If you add, remove or replace a child, mark its container. The removed
+        /// instances are dropped from the cache, and the added ones are verified
+        /// on the next <see cref="Verify" />.
+        /// An instance might be shared among more containers. It is dropped
+        /// only once none of them contains it anymore.
+        /// </para>
+        /// <para>
+        /// The cache is not thread-safe.
+        /// </para>
+        /// </remarks>
+        public class Cache
+        {
+            private class Entry
+            {
+                internal readonly Step[] Steps;
+
+                /// <summary>
+                /// Number of errors in the whole subtree
+                /// </summary>
+                internal int ErrorCount;
+
+                internal Entry(Step[] steps)
+                {
+                    Steps = steps;
+                }
+            }
+
+            private readonly Aas.IClass _root;
+
+            private readonly Containment<Entry> _containment;
+
+            private readonly Agenda _agenda = new Agenda();
+
+            /// <summary>
+            /// Initialize the cache for the verification of <paramref name="root" />.
+            /// </summary>
+            /// <remarks>
+            /// Nothing is verified until the first call to <see cref="Verify" />.
+            /// </remarks>
+            public Cache(Aas.IClass root)
+            {
+                _root = root;
+                _containment = new Containment<Entry>(root);
+            }
+
+            /// <summary>
+            /// Mark <paramref name="that" /> as changed so that it and its ancestors
+            /// are re-verified on the next <see cref="Verify" />.
+            /// </summary>
+            /// <remarks>
+            /// If <paramref name="that" /> is shared among more containers,
+            /// the ancestors along all of them are re-verified.
+            /// </remarks>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when <paramref name="that" /> has not been verified as part
+            /// of the root.
+            /// </exception>
+            public void MarkDirty(Aas.IClass that)
+            {
+                if (_containment.IsEmpty)
+                {
+                    // Nothing has been verified so far.
+                    return;
+                }
+
+                if (!_containment.MarkDirty(that))
+                {
+                    throw new System.ArgumentException(
+                        "The instance has not been verified as part of the root. " +
+                        "Did you mark its container after adding it?");
+                }
+            }
+
+            /// <summary>
+            /// Re-verify the instances which are either dirty or not in the cache,
+            /// and update the error counts of the subtrees.
+            /// </summary>
+            private void Refresh()
+            {
+                // The second item tells whether the children have been refreshed.
+                var stack = new List<(Aas.IClass, bool)> { (_root, false) };
+
+                while (stack.Count > 0)
+                {
+                    var (instance, childrenRefreshed) = stack[stack.Count - 1];
+                    stack.RemoveAt(stack.Count - 1);
+
+                    if (childrenRefreshed)
+                    {
+                        var entry = _containment.EntryOf(instance);
+
+                        int errorCount = 0;
+                        foreach (var step in entry.Steps)
+                        {
+                            errorCount += step.Error != null
+                                ? 1
+                                : _containment.EntryOf(step.Child!).ErrorCount;
+                        }
+                        entry.ErrorCount = errorCount;
+                        continue;
+                    }
+
+                    if (!_containment.NeedsUpdate(instance))
+                    {
+                        continue;
+                    }
+
+                    _agenda.Reset(int.MaxValue);
+                    _localVerifier.Visit(instance, _agenda);
+                    var steps = _agenda.Steps.ToArray();
+
+                    var children = new List<Aas.IClass>();
+                    foreach (var step in steps)
+                    {
+                        if (step.Child != null)
+                        {
+                            children.Add(step.Child);
+                        }
+                    }
+
+                    _containment.Put(instance, new Entry(steps), children.ToArray());
+
+                    stack.Add((instance, true));
+                    foreach (var child in children)
+                    {
+                        stack.Add((child, false));
+                    }
+                }
+            }
+
+            /// <summary>
+            /// Verify the constraints of the root recursively, re-verifying only
+            /// the instances marked as dirty, their ancestors and the instances
+            /// not verified before.
+            /// </summary>
+            /// <remarks>
+            /// The errors are the same and in the same order as the ones given by
+            /// <see cref="Verification.Verify(Aas.IClass)" />, provided that all
+            /// the changes have been marked. The subtrees without errors are
+            /// skipped.
+            /// </remarks>
+            public List<Reporting.Error> Verify()
+            {
+                Refresh();
+
+                var result = new List<Reporting.Error>();
+
+                var stack = new List<Frame>
+                {
+                    new Frame(new Step(null, _root, null, -1), 0)
+                };
+                var path = new List<PathPart>();
+
+                while (stack.Count > 0)
+                {
+                    Frame frame = stack[stack.Count - 1];
+                    stack.RemoveAt(stack.Count - 1);
+
+                    path.RemoveRange(frame.Depth, path.Count - frame.Depth);
+
+                    Reporting.Error? error = frame.Step.Error;
+                    if (error != null)
+                    {
+                        // NOTE: We copy the error as the cached one must not
+                        // receive the path.
+                        var copy = new Reporting.Error(error.Cause);
+                        foreach (var segment in error._pathSegments)
+                        {
+                            copy._pathSegments.AddLast(segment);
+                        }
+                        PrependPath(copy, path);
+                        result.Add(copy);
+                        continue;
+                    }
+
+                    var entry = _containment.EntryOf(frame.Step.Child!);
+                    if (entry.ErrorCount == 0)
+                    {
+                        continue;
+                    }
+
+                    if (frame.Step.Name != null)
+                    {
+                        path.Add(new PathPart(frame.Step.Name, frame.Step.Index));
+                    }
+
+                    // Push in reverse so that the steps are taken in order.
+                    for (int i = entry.Steps.Length - 1; i >= 0; i--)
+                    {
+                        stack.Add(new Frame(entry.Steps[i], path.Count));
+                    }
+                }
+
+                return result;
+            }
+        }  // public class Cache
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,357 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Categorize the checks of the verification.
+        /// </summary>
+        [System.Flags]
+        public enum Checks
+        {
+            None = 0,
+
+            /// <summary>
+            /// Invariants of the classes which are not numbered constraints,
+            /// such as the number of items in a list or the uniqueness of languages
+            /// </summary>
+            Invariants = 1,
+
+            /// <summary>
+            /// Numbered constraints of the specification, such as AASd-118
+            /// </summary>
+            Constraints = 2,
+
+            /// <summary>
+            /// Consistency of values with their value types, such as xs:int
+            /// </summary>
+            ValueTypes = 4,
+
+            /// <summary>
+            /// Patterns, lengths and other constraints of the primitive properties,
+            /// such as ID-shorts or language tags
+            /// </summary>
+            ConstrainedPrimitives = 8,
+
+            /// <summary>
+            /// Literals of the enumerations
+            /// </summary>
+            Enumerations = 16,
+
+            All = Invariants | Constraints | ValueTypes | ConstrainedPrimitives | Enumerations
+        }
+
+        /// <summary>
+        /// Configure which checks the verification performs, and when it stops.
+        /// </summary>
+        public class Options
+        {
+            /// <summary>
+            /// Stop the verification after reporting this many errors.
+            /// If not set, all the errors are reported.
+            /// </summary>
+            public int? MaxErrorCount { get; set; }
+
+            /// <summary>
+            /// Stop the verification at the first error. This is the same as setting
+            /// <see cref="MaxErrorCount" /> to 1.
+            /// </summary>
+            public bool StopAtFirstError { get; set; }
+
+            /// <summary>
+            /// Perform only these checks. A check belonging to more categories,
+            /// such as a numbered constraint on the value type, is performed only if
+            /// all of its categories are enabled.
+            /// </summary>
+            public Checks Checks { get; set; } = Checks.All;
+        }
+
+        /// <summary>
+        /// Represent a step in the verification of an instance: either an error
+        /// of the instance itself, or a child which still needs to be verified.
+        /// </summary>
+        internal readonly struct Step
+        {
+            /// <summary>
+            /// Error of the instance, with the path relative to the instance
+            /// </summary>
+            internal readonly Reporting.Error? Error;
+
+            /// <summary>
+            /// Child instance which needs to be verified
+            /// </summary>
+            internal readonly Aas.IClass? Child;
+
+            /// <summary>
+            /// Name of the property holding <see cref="Child" />
+            /// </summary>
+            internal readonly string? Name;
+
+            /// <summary>
+            /// Index of <see cref="Child" /> in the list, or -1 if not in a list
+            /// </summary>
+            internal readonly int Index;
+
+            internal Step(
+                Reporting.Error? error,
+                Aas.IClass? child,
+                string? name,
+                int index)
+            {
+                Error = error;
+                Child = child;
+                Name = name;
+                Index = index;
+            }
+        }
+
+        /// <summary>
+        /// Collect the steps of the verification of a single instance in the same
+        /// order as <see cref="Verify(Aas.IClass)" /> would report them.
+        /// </summary>
+        internal sealed class Agenda
+        {
+            internal readonly List<Step> Steps = new List<Step>();
+
+            /// <summary>
+            /// Checks which need to be performed
+            /// </summary>
+            internal Checks Enabled = Checks.All;
+
+            /// <summary>
+            /// Maximum number of errors which still need to be reported
+            /// </summary>
+            internal int Budget = int.MaxValue;
+
+            private int _errorCount;
+
+            internal void Reset(int budget)
+            {
+                Steps.Clear();
+                Budget = budget;
+                _errorCount = 0;
+            }
+
+            /// <summary>
+            /// Check whether the checks need to be performed.
+            /// </summary>
+            /// <remarks>
+            /// A check belonging to more categories is performed only if
+            /// all of them are enabled. Once the budget is exhausted, none of
+            /// the remaining checks is needed as they come later in the order.
+            /// </remarks>
+            internal bool Wants(Checks checks)
+            {
+                return _errorCount < Budget && (Enabled & checks) == checks;
+            }
+
+            internal void Error(Reporting.Error error)
+            {
+                Steps.Add(new Step(error, null, null, -1));
+                _errorCount++;
+            }
+
+            internal void Child(Aas.IClass child, string name)
+            {
+                if (_errorCount < Budget)
+                {
+                    Steps.Add(new Step(null, child, name, -1));
+                }
+            }
+
+            internal void Item(Aas.IClass child, string name, int index)
+            {
+                if (_errorCount < Budget)
+                {
+                    Steps.Add(new Step(null, child, name, index));
+                }
+            }
+        }  // internal sealed class Agenda
+
+        /// <summary>
+        /// Capture a part of the path to the instance being verified.
+        /// </summary>
+        private readonly struct PathPart
+        {
+            internal readonly string Name;
+            internal readonly int Index;
+
+            internal PathPart(string name, int index)
+            {
+                Name = name;
+                Index = index;
+            }
+        }
+
+        /// <summary>
+        /// Capture a step which still needs to be taken, together with the length
+        /// of the path to the instance it belongs to.
+        /// </summary>
+        private readonly struct Frame
+        {
+            internal readonly Step Step;
+            internal readonly int Depth;
+
+            internal Frame(Step step, int depth)
+            {
+                Step = step;
+                Depth = depth;
+            }
+        }
+
+        /// <summary>
+        /// Prepend the path to the instance to the path of the error.
+        /// </summary>
+        private static void PrependPath(
+            Reporting.Error error,
+            List<PathPart> path)
+        {
+            for (int i = path.Count - 1; i >= 0; i--)
+            {
+                if (path[i].Index >= 0)
+                {
+                    error.PrependSegment(
+                        new Reporting.IndexSegment(
+                            path[i].Index));
+                }
+                error.PrependSegment(
+                    new Reporting.NameSegment(
+                        path[i].Name));
+            }
+        }
+
+        private static IEnumerable<Reporting.Error> VerifyIteratively(
+            Aas.IClass that,
+            Checks checks,
+            int maxErrorCount)
+        {
+            if (maxErrorCount <= 0)
+            {
+                yield break;
+            }
+
+            var stack = new List<Frame>
+            {
+                new Frame(new Step(null, that, null, -1), 0)
+            };
+            var path = new List<PathPart>();
+            var agenda = new Agenda
+            {
+                Enabled = checks
+            };
+            int errorCount = 0;
+
+            while (stack.Count > 0)
+            {
+                Frame frame = stack[stack.Count - 1];
+                stack.RemoveAt(stack.Count - 1);
+
+                path.RemoveRange(frame.Depth, path.Count - frame.Depth);
+
+                Reporting.Error? error = frame.Step.Error;
+                if (error != null)
+                {
+                    PrependPath(error, path);
+                    yield return error;
+
+                    errorCount++;
+                    if (errorCount == maxErrorCount)
+                    {
+                        yield break;
+                    }
+                    continue;
+                }
+
+                if (frame.Step.Name != null)
+                {
+                    path.Add(new PathPart(frame.Step.Name, frame.Step.Index));
+                }
+
+                agenda.Reset(maxErrorCount - errorCount);
+                _localVerifier.Visit(
+                    frame.Step.Child
+                        ?? throw new System.InvalidOperationException(
+                            "Unexpected step without an error and without a child"),
+                    agenda);
+
+                // Push in reverse so that the steps are taken in order.
+                for (int i = agenda.Steps.Count - 1; i >= 0; i--)
+                {
+                    stack.Add(new Frame(agenda.Steps[i], path.Count));
+                }
+            }
+        }
+
+        /// <summary>
+        /// Verify the constraints of <paramref name="that" /> recursively
+        /// without recursive calls.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The errors are the same and in the same order as the ones given by
+        /// <see cref="Verify(Aas.IClass)" />.
+        /// </para>
+        /// <para>
+        /// <see cref="Verify(Aas.IClass)" /> nests an enumerator for every level
+        /// of the tree, and prepends a path segment to each error at every level.
+        /// Instead, we keep the instances to be verified on an explicit stack and
+        /// share the path to the current instance among them. The path of an error
+        /// is only materialized when the error is reported. This makes
+        /// a difference for deeply nested models.
+        /// </para>
+        /// </remarks>
+        /// <param name="that">
+        /// The instance of the meta-model to be verified
+        /// </param>
+        public static IEnumerable<Reporting.Error> VerifyIteratively(Aas.IClass that)
+        {
+            return VerifyIteratively(that, Checks.All, int.MaxValue);
+        }
+
+        /// <summary>
+        /// Verify the constraints of <paramref name="that" /> recursively
+        /// as configured by <paramref name="options" />.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The errors are a subset of the ones given by <see cref="Verify(Aas.IClass)" />
+        /// in the same order. If all the checks are enabled, the errors are exactly
+        /// the first ones given by <see cref="Verify(Aas.IClass)" />.
+        /// </para>
+        /// <para>
+        /// The checks which are not enabled are not performed at all. Once the maximum
+        /// number of errors is reached, the verification stops without performing
+        /// the remaining checks.
+        /// </para>
+        /// </remarks>
+        /// <param name="that">
+        /// The instance of the meta-model to be verified
+        /// </param>
+        /// <param name="options">
+        /// Options of the verification
+        /// </param>
+        /// <exception cref="System.ArgumentException">
+        /// Thrown when the maximum error count is negative.
+        /// </exception>
+        public static IEnumerable<Reporting.Error> Verify(
+            Aas.IClass that,
+            Options options)
+        {
+            if (options.MaxErrorCount < 0)
+            {
+                throw new System.ArgumentException(
+                    "Expected a non-negative maximum error count, " +
+                    $"but got: {options.MaxErrorCount}");
+            }
+
+            int maxErrorCount = options.StopAtFirstError
+                ? 1
+                : options.MaxErrorCount ?? int.MaxValue;
+
+            return VerifyIteratively(that, options.Checks, maxErrorCount);
+        }
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,7079 @@
+/*
+ * This code has been automatically generated by
+ * dev_scripts/codegen/generate_local_verifier.py from verification.cs.
+ * Do NOT edit or append.
+ */
+
+using Aas = AasCore.Aas3_0;  // renamed
+using CodeAnalysis = System.Diagnostics.CodeAnalysis;
+
+using System.Collections.Generic;  // can't alias
+using System.Linq;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Verify the invariants of a single instance, and put its children
+        /// on the agenda instead of verifying them recursively.
+        /// </summary>
+        /// <remarks>
+        /// The checks follow one-to-one the ones in <see cref="Transformer" />.
+        /// </remarks>
+        private class LocalVerifier
+            : Visitation.AbstractVisitorWithContext<Agenda>
+        {
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitExtension(
+                Aas.IExtension that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.RefersTo != null)
+                    || (that.RefersTo.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Refers-to must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.ValueTypes) && !(
+                    !(that.Value != null)
+                    || Verification.ValueConsistentWithXsdType(that.Value, that.ValueTypeOrDefault())))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must match the value type."));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyNameType(that.Name))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "name"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.ValueType != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.DataTypeDefXsd value = that.ValueType
+                        ?? throw new System.InvalidOperationException();
+                    if (agenda.Wants(Checks.Enumerations))
+                    {
+                        foreach (var error in Verification.VerifyDataTypeDefXsd(value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "valueType"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyValueDataType(that.Value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "value"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.RefersTo != null)
+                {
+                    int indexRefersTo = 0;
+                    foreach (var item in that.RefersTo)
+                    {
+                        agenda.Item(
+                            item,
+                            "refersTo",
+                            indexRefersTo);
+                        indexRefersTo++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitAdministrativeInformation(
+                Aas.IAdministrativeInformation that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Revision != null)
+                    || (that.Version != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-005: If version is not specified then also " +
+                            "revision shall be unspecified. This means, a revision " +
+                            "requires a version. If there is no version there is no " +
+                            "revision either. Revision is optional."));
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Version != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyVersionType(that.Version))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "version"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Revision != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyRevisionType(that.Revision))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "revision"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Creator != null)
+                {
+                    agenda.Child(
+                        that.Creator,
+                        "creator");
+                }
+
+                if (that.TemplateId != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdentifier(that.TemplateId))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "templateId"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitQualifier(
+                Aas.IQualifier that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Constraints | Checks.ValueTypes) && !(
+                    !(that.Value != null)
+                    || Verification.ValueConsistentWithXsdType(that.Value, that.ValueType)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-020: The value shall be consistent to " +
+                            "the data type as defined in value type."));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.QualifierKind value = that.Kind
+                        ?? throw new System.InvalidOperationException();
+                    if (agenda.Wants(Checks.Enumerations))
+                    {
+                        foreach (var error in Verification.VerifyQualifierKind(value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "kind"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyQualifierType(that.Type))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "type"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyDataTypeDefXsd(that.ValueType))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "valueType"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyValueDataType(that.Value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "value"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.ValueId != null)
+                {
+                    agenda.Child(
+                        that.ValueId,
+                        "valueId");
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitAssetAdministrationShell(
+                Aas.IAssetAdministrationShell that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Submodels != null)
+                    || (that.Submodels.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Submodels must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DerivedFrom != null)
+                    || Verification.IsModelReferenceTo(
+                        that.DerivedFrom,
+                        KeyTypes.AssetAdministrationShell)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Derived-from must be a model reference to an asset " +
+                            "administration shell."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Submodels != null)
+                    || (
+                        that.Submodels.All(
+                            reference => Verification.IsModelReferenceTo(reference, KeyTypes.Submodel))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "All submodels must be model references to a submodel."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.Administration != null)
+                {
+                    agenda.Child(
+                        that.Administration,
+                        "administration");
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyIdentifier(that.Id))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "id"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.DerivedFrom != null)
+                {
+                    agenda.Child(
+                        that.DerivedFrom,
+                        "derivedFrom");
+                }
+
+                agenda.Child(
+                    that.AssetInformation,
+                    "assetInformation");
+
+                if (that.Submodels != null)
+                {
+                    int indexSubmodels = 0;
+                    foreach (var item in that.Submodels)
+                    {
+                        agenda.Item(
+                            item,
+                            "submodels",
+                            indexSubmodels);
+                        indexSubmodels++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitAssetInformation(
+                Aas.IAssetInformation that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SpecificAssetIds != null)
+                    || (
+                        that.SpecificAssetIds.All(
+                            specificAssetId => specificAssetId.Name != "globalAssetId"
+                                || (
+                                    (that.GlobalAssetId != null)
+                                    && specificAssetId.Name == "globalAssetId"
+                                    && specificAssetId.Value == that.GlobalAssetId
+                                ))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-116: ``globalAssetId`` is a reserved key. " +
+                            "If used as value for the name of specific asset ID then " +
+                            "the value of specific asset ID shall be identical to " +
+                            "the global asset ID."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    (
+                        (that.GlobalAssetId != null)
+                        || (that.SpecificAssetIds != null)
+                    )
+                    && (
+                        !(that.SpecificAssetIds != null)
+                        || (that.SpecificAssetIds.Count >= 1)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-131: Either the global asset ID shall be " +
+                            "defined or at least one specific asset ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SpecificAssetIds != null)
+                    || (that.SpecificAssetIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Specific asset IDs must be either not set or have at least " +
+                            "one item."));
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyAssetKind(that.AssetKind))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "assetKind"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.GlobalAssetId != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdentifier(that.GlobalAssetId))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "globalAssetId"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.SpecificAssetIds != null)
+                {
+                    int indexSpecificAssetIds = 0;
+                    foreach (var item in that.SpecificAssetIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "specificAssetIds",
+                            indexSpecificAssetIds);
+                        indexSpecificAssetIds++;
+                    }
+                }
+
+                if (that.AssetType != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdentifier(that.AssetType))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "assetType"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DefaultThumbnail != null)
+                {
+                    agenda.Child(
+                        that.DefaultThumbnail,
+                        "defaultThumbnail");
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitResource(
+                Aas.IResource that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyPathType(that.Path))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "path"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.ContentType != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyContentType(that.ContentType))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "contentType"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitSpecificAssetId(
+                Aas.ISpecificAssetId that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.ExternalSubjectId != null)
+                    || (that.ExternalSubjectId.Type == ReferenceTypes.ExternalReference)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-133: External subject ID shall be " +
+                            "an external reference."));
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyLabelType(that.Name))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "name"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyIdentifier(that.Value))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "value"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.ExternalSubjectId != null)
+                {
+                    agenda.Child(
+                        that.ExternalSubjectId,
+                        "externalSubjectId");
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitSubmodel(
+                Aas.ISubmodel that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SubmodelElements != null)
+                    || (that.SubmodelElements.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Submodel elements must be either not set or have at least " +
+                            "one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SubmodelElements != null)
+                    || (
+                        that.SubmodelElements.All(
+                            item => item.IdShort != null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "ID-shorts need to be defined for all the items of submodel " +
+                            "elements according to AASd-117 (ID-short of Referables not " +
+                            "being a direct child of a Submodel element list shall be " +
+                            "specified)."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SubmodelElements != null)
+                    || Verification.IdShortsAreUnique(that.SubmodelElements)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-022: ID-short of non-identifiable " +
+                            "referables within the same name space shall be unique " +
+                            "(case-sensitive)."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SubmodelElements != null)
+                    || (
+                        !(that.KindOrDefault() != ModellingKind.Template)
+                        || (
+                            that.SubmodelElements.All(
+                                submodelElement => !(submodelElement.Qualifiers != null)
+                                    || (
+                                        submodelElement.Qualifiers.All(
+                                            qualifier => qualifier.KindOrDefault() != QualifierKind.TemplateQualifier)
+                                    ))
+                        )
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-129: If any qualifier kind value of " +
+                            "a Submodel element qualifier (attribute qualifier inherited " +
+                            "via Qualifiable) is equal to Template Qualifier then " +
+                            "the submodel element shall be part of a submodel template, " +
+                            "i.e. a Submodel with submodel kind (attribute kind " +
+                            "inherited via Has-Kind) value is equal to Template."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || (
+                        !(
+                            that.Qualifiers.Any(
+                                qualifier => qualifier.KindOrDefault() == QualifierKind.TemplateQualifier)
+                        )
+                        || (that.KindOrDefault() == ModellingKind.Template)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-119: If any qualifier kind value of " +
+                            "a qualifiable qualifier is equal to template qualifier and " +
+                            "the qualified element has kind then the qualified element " +
+                            "shall be of kind template."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.Administration != null)
+                {
+                    agenda.Child(
+                        that.Administration,
+                        "administration");
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyIdentifier(that.Id))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "id"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.Kind != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.ModellingKind value = that.Kind
+                        ?? throw new System.InvalidOperationException();
+                    if (agenda.Wants(Checks.Enumerations))
+                    {
+                        foreach (var error in Verification.VerifyModellingKind(value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "kind"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.SubmodelElements != null)
+                {
+                    int indexSubmodelElements = 0;
+                    foreach (var item in that.SubmodelElements)
+                    {
+                        agenda.Item(
+                            item,
+                            "submodelElements",
+                            indexSubmodelElements);
+                        indexSubmodelElements++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitRelationshipElement(
+                Aas.IRelationshipElement that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                agenda.Child(
+                    that.First,
+                    "first");
+
+                agenda.Child(
+                    that.Second,
+                    "second");
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitSubmodelElementList(
+                Aas.ISubmodelElementList that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Value != null)
+                    || (that.Value.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        (that.Value != null)
+                        && (that.SemanticIdListElement != null)
+                    )
+                    || (
+                        that.Value.All(
+                            child => !(child.SemanticId != null)
+                                || Verification.ReferenceKeyValuesEqual(child.SemanticId, that.SemanticIdListElement))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-107: If a first level child element has " +
+                            "a semantic ID it shall be identical to semantic ID list " +
+                            "element."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Value != null)
+                    || Verification.SubmodelElementsHaveIdenticalSemanticIds(that.Value)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-114: If two first level child elements have " +
+                            "a semantic ID then they shall be identical."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Value != null)
+                    || (
+                        that.Value.All(
+                            element => Verification.SubmodelElementIsOfType(element, that.TypeValueListElement))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-108: All first level child elements shall " +
+                            "have the same submodel element type as specified in type " +
+                            "value list element."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.TypeValueListElement == AasSubmodelElements.Property
+                        || that.TypeValueListElement == AasSubmodelElements.Range
+                    )
+                    || (
+                        (that.ValueTypeListElement != null)
+                        && (
+                            (that.Value == null)
+                            || Verification.PropertiesOrRangesHaveValueType(that.Value, that.ValueTypeListElement)
+                        )
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-109: If type value list element is equal to " +
+                            "Property or Range value type list element shall be set and " +
+                            "all first level child elements shall have the value type as " +
+                            "specified in value type list element."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Value != null)
+                    || (
+                        that.Value.All(
+                            element => element.IdShort == null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-120: ID-short of submodel elements being " +
+                            "a direct child of a  Submodel element list shall not be " +
+                            "specified."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.SemanticIdListElement != null)
+                {
+                    agenda.Child(
+                        that.SemanticIdListElement,
+                        "semanticIdListElement");
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (
+                            var error in Verification.VerifyAasSubmodelElements(
+                                that.TypeValueListElement))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "typeValueListElement"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.ValueTypeListElement != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.DataTypeDefXsd value = that.ValueTypeListElement
+                        ?? throw new System.InvalidOperationException();
+                    if (agenda.Wants(Checks.Enumerations))
+                    {
+                        foreach (var error in Verification.VerifyDataTypeDefXsd(value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "valueTypeListElement"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    int indexValue = 0;
+                    foreach (var item in that.Value)
+                    {
+                        agenda.Item(
+                            item,
+                            "value",
+                            indexValue);
+                        indexValue++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitSubmodelElementCollection(
+                Aas.ISubmodelElementCollection that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Value != null)
+                    || (that.Value.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Value != null)
+                    || (
+                        that.Value.All(
+                            item => item.IdShort != null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "ID-shorts need to be defined for all the items of value " +
+                            "according to AASd-117 (ID-short of Referables not being " +
+                            "a direct child of a Submodel element list shall be " +
+                            "specified)."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Value != null)
+                    || Verification.IdShortsAreUnique(that.Value)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "ID-shorts of the value must be unique."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    int indexValue = 0;
+                    foreach (var item in that.Value)
+                    {
+                        agenda.Item(
+                            item,
+                            "value",
+                            indexValue);
+                        indexValue++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitProperty(
+                Aas.IProperty that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Category != null)
+                    || Aas.Constants.ValidCategoriesForDataElement.Contains(that.Category)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-090: For data elements category shall be " +
+                            "one of the following values: CONSTANT, PARAMETER or " +
+                            "VARIABLE."));
+                }
+
+                if (agenda.Wants(Checks.ValueTypes) && !(
+                    !(that.Value != null)
+                    || Verification.ValueConsistentWithXsdType(that.Value, that.ValueType)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value must be consistent with the value type."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyDataTypeDefXsd(that.ValueType))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "valueType"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyValueDataType(that.Value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "value"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.ValueId != null)
+                {
+                    agenda.Child(
+                        that.ValueId,
+                        "valueId");
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitMultiLanguageProperty(
+                Aas.IMultiLanguageProperty that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Category != null)
+                    || Aas.Constants.ValidCategoriesForDataElement.Contains(that.Category)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-090: For data elements category shall be " +
+                            "one of the following values: CONSTANT, PARAMETER or " +
+                            "VARIABLE."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Value != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Value)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Value != null)
+                    || (that.Value.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value must be either not set or have at least one item."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    int indexValue = 0;
+                    foreach (var item in that.Value)
+                    {
+                        agenda.Item(
+                            item,
+                            "value",
+                            indexValue);
+                        indexValue++;
+                    }
+                }
+
+                if (that.ValueId != null)
+                {
+                    agenda.Child(
+                        that.ValueId,
+                        "valueId");
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitRange(
+                Aas.IRange that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Category != null)
+                    || Aas.Constants.ValidCategoriesForDataElement.Contains(that.Category)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-090: For data elements category shall be " +
+                            "one of the following values: CONSTANT, PARAMETER or " +
+                            "VARIABLE."));
+                }
+
+                if (agenda.Wants(Checks.ValueTypes) && !(
+                    !(that.Max != null)
+                    || Verification.ValueConsistentWithXsdType(that.Max, that.ValueType)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Max must be consistent with the value type."));
+                }
+
+                if (agenda.Wants(Checks.ValueTypes) && !(
+                    !(that.Min != null)
+                    || Verification.ValueConsistentWithXsdType(that.Min, that.ValueType)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Min must be consistent with the value type."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyDataTypeDefXsd(that.ValueType))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "valueType"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.Min != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyValueDataType(that.Min))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "min"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Max != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyValueDataType(that.Max))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "max"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitReferenceElement(
+                Aas.IReferenceElement that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Category != null)
+                    || Aas.Constants.ValidCategoriesForDataElement.Contains(that.Category)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-090: For data elements category shall be " +
+                            "one of the following values: CONSTANT, PARAMETER or " +
+                            "VARIABLE."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    agenda.Child(
+                        that.Value,
+                        "value");
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitBlob(
+                Aas.IBlob that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Category != null)
+                    || Aas.Constants.ValidCategoriesForDataElement.Contains(that.Category)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-090: For data elements category shall be " +
+                            "one of the following values: CONSTANT, PARAMETER or " +
+                            "VARIABLE."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Verification.VerifyBlobType(that.Value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "value"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyContentType(that.ContentType))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "contentType"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitFile(
+                Aas.IFile that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Category != null)
+                    || Aas.Constants.ValidCategoriesForDataElement.Contains(that.Category)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-090: For data elements category shall be " +
+                            "one of the following values: CONSTANT, PARAMETER or " +
+                            "VARIABLE."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Value != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyPathType(that.Value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "value"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyContentType(that.ContentType))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "contentType"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitAnnotatedRelationshipElement(
+                Aas.IAnnotatedRelationshipElement that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Annotations != null)
+                    || (that.Annotations.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Annotations must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Annotations != null)
+                    || (
+                        that.Annotations.All(
+                            item => item.IdShort != null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "ID-shorts need to be defined for all the items of " +
+                            "annotations according to AASd-117 (ID-short of Referables " +
+                            "not being a direct child of a Submodel element list shall " +
+                            "be specified)."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                agenda.Child(
+                    that.First,
+                    "first");
+
+                agenda.Child(
+                    that.Second,
+                    "second");
+
+                if (that.Annotations != null)
+                {
+                    int indexAnnotations = 0;
+                    foreach (var item in that.Annotations)
+                    {
+                        agenda.Item(
+                            item,
+                            "annotations",
+                            indexAnnotations);
+                        indexAnnotations++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitEntity(
+                Aas.IEntity that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Statements != null)
+                    || (that.Statements.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Statements must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Statements != null)
+                    || (
+                        that.Statements.All(
+                            item => item.IdShort != null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "ID-shorts need to be defined for all the items of " +
+                            "statements according to AASd-117 (ID-short of Referables " +
+                            "not being a direct child of a Submodel element list shall " +
+                            "be specified)."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    (
+                        that.EntityType == EntityType.SelfManagedEntity
+                        && (
+                            (
+                                (that.GlobalAssetId != null)
+                                && (that.SpecificAssetIds == null)
+                            )
+                            || (
+                                (that.GlobalAssetId == null)
+                                && (that.SpecificAssetIds != null)
+                                && that.SpecificAssetIds.Count >= 1
+                            )
+                        )
+                    )
+                    || (
+                        that.EntityType != EntityType.SelfManagedEntity
+                        && (that.GlobalAssetId == null)
+                        && (that.SpecificAssetIds == null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-014: Either the attribute global asset ID " +
+                            "or specific asset ID must be set if entity type is set to " +
+                            "self-managed entity. They are not existing otherwise."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SpecificAssetIds != null)
+                    || (that.SpecificAssetIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Specific asset IDs must be either not set or have at least " +
+                            "one item."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.Statements != null)
+                {
+                    int indexStatements = 0;
+                    foreach (var item in that.Statements)
+                    {
+                        agenda.Item(
+                            item,
+                            "statements",
+                            indexStatements);
+                        indexStatements++;
+                    }
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyEntityType(that.EntityType))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "entityType"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.GlobalAssetId != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdentifier(that.GlobalAssetId))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "globalAssetId"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.SpecificAssetIds != null)
+                {
+                    int indexSpecificAssetIds = 0;
+                    foreach (var item in that.SpecificAssetIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "specificAssetIds",
+                            indexSpecificAssetIds);
+                        indexSpecificAssetIds++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitEventPayload(
+                Aas.IEventPayload that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    Verification.IsModelReferenceTo(that.Source, KeyTypes.EventElement)
+                    || Verification.IsModelReferenceTo(that.Source, KeyTypes.BasicEventElement)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Source must be a model reference to an Event element."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    Verification.IsModelReferenceToReferable(that.ObservableReference)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Observable reference must be a model reference to " +
+                            "a referable."));
+                }
+
+                agenda.Child(
+                    that.Source,
+                    "source");
+
+                if (that.SourceSemanticId != null)
+                {
+                    agenda.Child(
+                        that.SourceSemanticId,
+                        "sourceSemanticId");
+                }
+
+                agenda.Child(
+                    that.ObservableReference,
+                    "observableReference");
+
+                if (that.ObservableSemanticId != null)
+                {
+                    agenda.Child(
+                        that.ObservableSemanticId,
+                        "observableSemanticId");
+                }
+
+                if (that.Topic != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyMessageTopicType(that.Topic))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "topic"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.SubjectId != null)
+                {
+                    agenda.Child(
+                        that.SubjectId,
+                        "subjectId");
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyDateTimeUtc(that.TimeStamp))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "timeStamp"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.Payload != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Verification.VerifyBlobType(that.Payload))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "payload"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitBasicEventElement(
+                Aas.IBasicEventElement that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Direction == Direction.Input)
+                    || (that.MaxInterval == null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Max. interval is not applicable for input direction."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    Verification.IsModelReferenceToReferable(that.Observed)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Observed must be a model reference to a referable."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.MessageBroker != null)
+                    || Verification.IsModelReferenceToReferable(that.MessageBroker)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Message broker must be a model reference to a referable."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                agenda.Child(
+                    that.Observed,
+                    "observed");
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyDirection(that.Direction))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "direction"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyStateOfEvent(that.State))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "state"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.MessageTopic != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyMessageTopicType(that.MessageTopic))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "messageTopic"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.MessageBroker != null)
+                {
+                    agenda.Child(
+                        that.MessageBroker,
+                        "messageBroker");
+                }
+
+                if (that.LastUpdate != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyDateTimeUtc(that.LastUpdate))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "lastUpdate"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.MinInterval != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyDuration(that.MinInterval))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "minInterval"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.MaxInterval != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyDuration(that.MaxInterval))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "maxInterval"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitOperation(
+                Aas.IOperation that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    Verification.IdShortsOfVariablesAreUnique(
+                        that.InputVariables,
+                        that.OutputVariables,
+                        that.InoutputVariables)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-134: For an Operation the ID-short of all " +
+                            "values of input, output and in/output variables shall be " +
+                            "unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.InputVariables != null)
+                    || (that.InputVariables.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Input variables must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.OutputVariables != null)
+                    || (that.OutputVariables.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Output variables must be either not set or have at least " +
+                            "one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.InoutputVariables != null)
+                    || (that.InoutputVariables.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Inoutput variables must be either not set or have at least " +
+                            "one item."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.InputVariables != null)
+                {
+                    int indexInputVariables = 0;
+                    foreach (var item in that.InputVariables)
+                    {
+                        agenda.Item(
+                            item,
+                            "inputVariables",
+                            indexInputVariables);
+                        indexInputVariables++;
+                    }
+                }
+
+                if (that.OutputVariables != null)
+                {
+                    int indexOutputVariables = 0;
+                    foreach (var item in that.OutputVariables)
+                    {
+                        agenda.Item(
+                            item,
+                            "outputVariables",
+                            indexOutputVariables);
+                        indexOutputVariables++;
+                    }
+                }
+
+                if (that.InoutputVariables != null)
+                {
+                    int indexInoutputVariables = 0;
+                    foreach (var item in that.InoutputVariables)
+                    {
+                        agenda.Item(
+                            item,
+                            "inoutputVariables",
+                            indexInoutputVariables);
+                        indexInoutputVariables++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitOperationVariable(
+                Aas.IOperationVariable that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Constraints) && !(that.Value.IdShort != null))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value must have the ID-short specified according to " +
+                            "Constraint AASd-117 (ID-short of Referables not being " +
+                            "a direct child of a Submodel element list shall be " +
+                            "specified)."));
+                }
+
+                agenda.Child(
+                    that.Value,
+                    "value");
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitCapability(
+                Aas.ICapability that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SupplementalSemanticIds.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Supplemental semantic IDs must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.SupplementalSemanticIds != null)
+                    || (that.SemanticId != null)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-118: If there are supplemental semantic IDs " +
+                            "defined then there shall be also a main semantic ID."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Qualifiers != null)
+                    || (that.Qualifiers.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Qualifiers must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Qualifiers != null)
+                    || Verification.QualifierTypesAreUnique(that.Qualifiers)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-021: Every qualifiable can only have one " +
+                            "qualifier with the same type."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.SemanticId != null)
+                {
+                    agenda.Child(
+                        that.SemanticId,
+                        "semanticId");
+                }
+
+                if (that.SupplementalSemanticIds != null)
+                {
+                    int indexSupplementalSemanticIds = 0;
+                    foreach (var item in that.SupplementalSemanticIds)
+                    {
+                        agenda.Item(
+                            item,
+                            "supplementalSemanticIds",
+                            indexSupplementalSemanticIds);
+                        indexSupplementalSemanticIds++;
+                    }
+                }
+
+                if (that.Qualifiers != null)
+                {
+                    int indexQualifiers = 0;
+                    foreach (var item in that.Qualifiers)
+                    {
+                        agenda.Item(
+                            item,
+                            "qualifiers",
+                            indexQualifiers);
+                        indexQualifiers++;
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitConceptDescription(
+                Aas.IConceptDescription that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Extensions != null)
+                    || (that.Extensions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Extensions must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Extensions != null)
+                    || Verification.ExtensionNamesAreUnique(that.Extensions)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-077: The name of an extension within " +
+                            "Has-Extensions needs to be unique."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || (that.Description.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Description != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Description)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Description must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || (that.DisplayName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must be either not set or have at least one " +
+                            "item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.DisplayName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.DisplayName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Display name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (that.EmbeddedDataSpecifications.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Embedded data specifications must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.IsCaseOf != null)
+                    || (that.IsCaseOf.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Is-case-of must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.EmbeddedDataSpecifications != null)
+                    || (
+                        Verification.DataSpecificationIec61360sHaveDefinitionAtLeastInEnglish(that.EmbeddedDataSpecifications)
+                        || Verification.DataSpecificationIec61360sHaveValue(that.EmbeddedDataSpecifications)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-008: For a concept description using " +
+                            "data specification template IEC 61360, the definition is " +
+                            "mandatory and shall be defined at least in English. " +
+                            "Exception: The concept description describes a value."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        (that.Category != null)
+                        && that.Category == "QUALIFIER_TYPE"
+                        && (that.EmbeddedDataSpecifications != null)
+                    )
+                    || Verification.DataSpecificationIec61360sHaveDataType(that.EmbeddedDataSpecifications)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-007: For a concept description with " +
+                            "category QUALIFIER_TYPE using data specification IEC 61360, " +
+                            "the data type of the data specification is mandatory and " +
+                            "shall be defined."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        (that.Category != null)
+                        && that.Category == "DOCUMENT"
+                        && (that.EmbeddedDataSpecifications != null)
+                    )
+                    || Verification.DataSpecificationIec61360sForDocumentHaveAppropriateDataType(that.EmbeddedDataSpecifications)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-006: For a concept description with " +
+                            "category DOCUMENT using data specification IEC 61360, " +
+                            "the data type of the data specification shall be one of: " +
+                            "FILE, BLOB, HTML."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        (that.Category != null)
+                        && that.Category == "REFERENCE"
+                        && (that.EmbeddedDataSpecifications != null)
+                    )
+                    || Verification.DataSpecificationIec61360sForReferenceHaveAppropriateDataType(that.EmbeddedDataSpecifications)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-005: For a concept description with " +
+                            "category REFERENCE using data specification IEC 61360, " +
+                            "the data type of the data specification shall be one of: " +
+                            "STRING, IRI, IRDI."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        (that.Category != null)
+                        && (
+                            that.Category == "PROPERTY"
+                            || that.Category == "VALUE"
+                        )
+                        && (that.EmbeddedDataSpecifications != null)
+                    )
+                    || Verification.DataSpecificationIec61360sForPropertyOrValueHaveAppropriateDataType(that.EmbeddedDataSpecifications)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-004: For a concept description with " +
+                            "category PROPERTY or VALUE using data specification IEC " +
+                            "61360, the data type of the data specification is mandatory " +
+                            "and shall be one of: DATE, STRING, STRING_TRANSLATABLE, " +
+                            "INTEGER_MEASURE, INTEGER_COUNT, INTEGER_CURRENCY, " +
+                            "REAL_MEASURE, REAL_COUNT, REAL_CURRENCY, BOOLEAN, RATIONAL, " +
+                            "RATIONAL_MEASURE, TIME, TIMESTAMP."));
+                }
+
+                if (that.Extensions != null)
+                {
+                    int indexExtensions = 0;
+                    foreach (var item in that.Extensions)
+                    {
+                        agenda.Item(
+                            item,
+                            "extensions",
+                            indexExtensions);
+                        indexExtensions++;
+                    }
+                }
+
+                if (that.Category != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyNameType(that.Category))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "category"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.IdShort != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyIdShortType(that.IdShort))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "idShort"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DisplayName != null)
+                {
+                    int indexDisplayName = 0;
+                    foreach (var item in that.DisplayName)
+                    {
+                        agenda.Item(
+                            item,
+                            "displayName",
+                            indexDisplayName);
+                        indexDisplayName++;
+                    }
+                }
+
+                if (that.Description != null)
+                {
+                    int indexDescription = 0;
+                    foreach (var item in that.Description)
+                    {
+                        agenda.Item(
+                            item,
+                            "description",
+                            indexDescription);
+                        indexDescription++;
+                    }
+                }
+
+                if (that.Administration != null)
+                {
+                    agenda.Child(
+                        that.Administration,
+                        "administration");
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyIdentifier(that.Id))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "id"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.EmbeddedDataSpecifications != null)
+                {
+                    int indexEmbeddedDataSpecifications = 0;
+                    foreach (var item in that.EmbeddedDataSpecifications)
+                    {
+                        agenda.Item(
+                            item,
+                            "embeddedDataSpecifications",
+                            indexEmbeddedDataSpecifications);
+                        indexEmbeddedDataSpecifications++;
+                    }
+                }
+
+                if (that.IsCaseOf != null)
+                {
+                    int indexIsCaseOf = 0;
+                    foreach (var item in that.IsCaseOf)
+                    {
+                        agenda.Item(
+                            item,
+                            "isCaseOf",
+                            indexIsCaseOf);
+                        indexIsCaseOf++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitReference(
+                Aas.IReference that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.Keys.Count >= 1))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Keys must contain at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(that.Keys.Count >= 1)
+                    || Aas.Constants.GloballyIdentifiables.Contains(that.Keys[0].Type)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-121: For References the value of type of " +
+                            "the first key of keys shall be one of Globally " +
+                            "Identifiables."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ExternalReference
+                        && that.Keys.Count >= 1
+                    )
+                    || Aas.Constants.GenericGloballyIdentifiables.Contains(that.Keys[0].Type)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-122: For external references the value of " +
+                            "type of the first key of keys shall be one of Generic " +
+                            "Globally Identifiables."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ModelReference
+                        && that.Keys.Count >= 1
+                    )
+                    || Aas.Constants.AasIdentifiables.Contains(that.Keys[0].Type)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-123: For model references the value of type " +
+                            "of the first key of keys shall be one of AAS identifiables."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ExternalReference
+                        && that.Keys.Count >= 1
+                    )
+                    || (
+                        Aas.Constants.GenericGloballyIdentifiables.Contains(that.Keys[^1].Type)
+                        || Aas.Constants.GenericFragmentKeys.Contains(that.Keys[^1].Type)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-124: For external references the last key " +
+                            "of keys shall be either one of Generic Globally " +
+                            "Identifiables or one of Generic Fragment Keys."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ModelReference
+                        && that.Keys.Count > 1
+                    )
+                    || (
+                        Enumerable.Range(
+                            1,
+                            that.Keys.Count - 1
+                        ).All(
+                            i => Aas.Constants.FragmentKeys.Contains(that.Keys[i].Type))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-125: For model references with more than " +
+                            "one key in keys the value of type of each of the keys " +
+                            "following the first key of keys shall be one of Fragment " +
+                            "Keys."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ModelReference
+                        && that.Keys.Count > 1
+                    )
+                    || (
+                        Enumerable.Range(
+                            0,
+                            that.Keys.Count - 1
+                        ).All(
+                            i => !Aas.Constants.GenericFragmentKeys.Contains(that.Keys[i].Type))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-126: For model references with more than " +
+                            "one key in keys the value of type of the last key in " +
+                            "the reference key chain may be one of Generic Fragment Keys " +
+                            "or no key at all shall have a value out of Generic Fragment " +
+                            "Keys."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ModelReference
+                        && that.Keys.Count > 1
+                        && that.Keys[^1].Type == KeyTypes.FragmentReference
+                    )
+                    || (
+                        that.Keys[^2].Type == KeyTypes.File
+                        || that.Keys[^2].Type == KeyTypes.Blob
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-127: For model references, with more than " +
+                            "one key in keys a key with type Fragment Reference shall be " +
+                            "preceded by a key with type File or Blob."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        that.Type == ReferenceTypes.ModelReference
+                        && that.Keys.Count > 2
+                    )
+                    || (
+                        Enumerable.Range(
+                            0,
+                            that.Keys.Count - 1
+                        ).All(
+                            i => !(that.Keys[i].Type == KeyTypes.SubmodelElementList)
+                                || Patterns.MatchesXsNonNegativeInteger(that.Keys[i + 1].Value))
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-128: For model references, the value of " +
+                            "a key preceded by a key with type Submodel element list is " +
+                            "an integer number denoting the position in the array of " +
+                            "the submodel element list."));
+                }
+
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyReferenceTypes(that.Type))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "type"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (that.ReferredSemanticId != null)
+                {
+                    agenda.Child(
+                        that.ReferredSemanticId,
+                        "referredSemanticId");
+                }
+
+                int indexKeys = 0;
+                foreach (var item in that.Keys)
+                {
+                    agenda.Item(
+                        item,
+                        "keys",
+                        indexKeys);
+                    indexKeys++;
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitKey(
+                Aas.IKey that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Enumerations))
+                {
+                    foreach (var error in Verification.VerifyKeyTypes(that.Type))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "type"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyIdentifier(that.Value))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "value"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitLangStringNameType(
+                Aas.ILangStringNameType that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.Text.Length <= 128))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "String shall have a maximum length of 128 characters."));
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyBcp47LanguageTag(that.Language))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "language"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (
+                            var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                that.Text))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "text"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitLangStringTextType(
+                Aas.ILangStringTextType that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.Text.Length <= 1023))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "String shall have a maximum length of 1023 characters."));
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyBcp47LanguageTag(that.Language))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "language"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (
+                            var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                that.Text))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "text"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitEnvironment(
+                Aas.IEnvironment that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.ConceptDescriptions != null)
+                    || (that.ConceptDescriptions.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Concept descriptions must be either not set or have at " +
+                            "least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Submodels != null)
+                    || (that.Submodels.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Submodels must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.AssetAdministrationShells != null)
+                    || (that.AssetAdministrationShells.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Asset administration shells must be either not set or have " +
+                            "at least one item."));
+                }
+
+                if (that.AssetAdministrationShells != null)
+                {
+                    int indexAssetAdministrationShells = 0;
+                    foreach (var item in that.AssetAdministrationShells)
+                    {
+                        agenda.Item(
+                            item,
+                            "assetAdministrationShells",
+                            indexAssetAdministrationShells);
+                        indexAssetAdministrationShells++;
+                    }
+                }
+
+                if (that.Submodels != null)
+                {
+                    int indexSubmodels = 0;
+                    foreach (var item in that.Submodels)
+                    {
+                        agenda.Item(
+                            item,
+                            "submodels",
+                            indexSubmodels);
+                        indexSubmodels++;
+                    }
+                }
+
+                if (that.ConceptDescriptions != null)
+                {
+                    int indexConceptDescriptions = 0;
+                    foreach (var item in that.ConceptDescriptions)
+                    {
+                        agenda.Item(
+                            item,
+                            "conceptDescriptions",
+                            indexConceptDescriptions);
+                        indexConceptDescriptions++;
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitEmbeddedDataSpecification(
+                Aas.IEmbeddedDataSpecification that,
+                Agenda agenda
+            )
+            {
+                agenda.Child(
+                    that.DataSpecification,
+                    "dataSpecification");
+
+                agenda.Child(
+                    that.DataSpecificationContent,
+                    "dataSpecificationContent");
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitLevelType(
+                Aas.ILevelType that,
+                Agenda agenda
+            )
+            {
+                // No verification has been defined for LevelType.
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitValueReferencePair(
+                Aas.IValueReferencePair that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyValueTypeIec61360(that.Value))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "value"));
+                        agenda.Error(error);
+                    }
+                }
+
+                agenda.Child(
+                    that.ValueId,
+                    "valueId");
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitValueList(
+                Aas.IValueList that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.ValueReferencePairs.Count >= 1))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value reference pair types must contain at least one item."));
+                }
+
+                int indexValueReferencePairs = 0;
+                foreach (var item in that.ValueReferencePairs)
+                {
+                    agenda.Item(
+                        item,
+                        "valueReferencePairs",
+                        indexValueReferencePairs);
+                    indexValueReferencePairs++;
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitLangStringPreferredNameTypeIec61360(
+                Aas.ILangStringPreferredNameTypeIec61360 that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.Text.Length <= 255))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "String shall have a maximum length of 255 characters."));
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyBcp47LanguageTag(that.Language))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "language"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (
+                            var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                that.Text))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "text"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitLangStringShortNameTypeIec61360(
+                Aas.ILangStringShortNameTypeIec61360 that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.Text.Length <= 18))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "String shall have a maximum length of 18 characters."));
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyBcp47LanguageTag(that.Language))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "language"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (
+                            var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                that.Text))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "text"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitLangStringDefinitionTypeIec61360(
+                Aas.ILangStringDefinitionTypeIec61360 that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Invariants) && !(that.Text.Length <= 1023))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "String shall have a maximum length of 1023 characters."));
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (var error in Primitives.VerifyBcp47LanguageTag(that.Language))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "language"));
+                        agenda.Error(error);
+                    }
+                }
+
+                if (agenda.Wants(Checks.ConstrainedPrimitives))
+                {
+                    foreach (
+                            var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                that.Text))
+                    {
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                "text"));
+                        agenda.Error(error);
+                    }
+                }
+            }
+
+            [CodeAnalysis.SuppressMessage("ReSharper", "NegativeEqualityExpression")]
+            public override void VisitDataSpecificationIec61360(
+                Aas.IDataSpecificationIec61360 that,
+                Agenda agenda
+            )
+            {
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !((that.Value != null)
+                    && (that.ValueList != null))))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-010: If value is not empty then value " +
+                            "list shall be empty and vice versa."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    !(
+                        (that.DataType != null)
+                        && Aas.Constants.Iec61360DataTypesWithUnit.Contains(that.DataType)
+                    )
+                    || (
+                        (that.Unit != null)
+                        || (that.UnitId != null)
+                    )))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-009: If data type is a an integer, real " +
+                            "or rational with a measure or currency, unit or unit ID " +
+                            "shall be defined."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Definition != null)
+                    || (that.Definition.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Definition must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.Definition != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.Definition)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Definition must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.ShortName != null)
+                    || (that.ShortName.Count >= 1)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Short name must be either not set or have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    !(that.ShortName != null)
+                    || Verification.LangStringsHaveUniqueLanguages(that.ShortName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Short name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(that.PreferredName.Count >= 1))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Preferred name must have at least one item."));
+                }
+
+                if (agenda.Wants(Checks.Invariants) && !(
+                    Verification.LangStringsHaveUniqueLanguages(that.PreferredName)))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Preferred name must specify unique languages."));
+                }
+
+                if (agenda.Wants(Checks.Constraints) && !(
+                    that.PreferredName.Any(
+                        langString => Verification.IsBcp47ForEnglish(langString.Language))))
+                {
+                    agenda.Error(
+                        new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASc-3a-002: preferred name shall be provided at " +
+                            "least in English."));
+                }
+
+                int indexPreferredName = 0;
+                foreach (var item in that.PreferredName)
+                {
+                    agenda.Item(
+                        item,
+                        "preferredName",
+                        indexPreferredName);
+                    indexPreferredName++;
+                }
+
+                if (that.ShortName != null)
+                {
+                    int indexShortName = 0;
+                    foreach (var item in that.ShortName)
+                    {
+                        agenda.Item(
+                            item,
+                            "shortName",
+                            indexShortName);
+                        indexShortName++;
+                    }
+                }
+
+                if (that.Unit != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (
+                                var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                    that.Unit))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "unit"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.UnitId != null)
+                {
+                    agenda.Child(
+                        that.UnitId,
+                        "unitId");
+                }
+
+                if (that.SourceOfDefinition != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (
+                                var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                    that.SourceOfDefinition))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "sourceOfDefinition"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Symbol != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (
+                                var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                    that.Symbol))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "symbol"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.DataType != null)
+                {
+                    // We need to help the static analyzer with a null coalescing.
+                    Aas.DataTypeIec61360 value = that.DataType
+                        ?? throw new System.InvalidOperationException();
+                    if (agenda.Wants(Checks.Enumerations))
+                    {
+                        foreach (var error in Verification.VerifyDataTypeIec61360(value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "dataType"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.Definition != null)
+                {
+                    int indexDefinition = 0;
+                    foreach (var item in that.Definition)
+                    {
+                        agenda.Item(
+                            item,
+                            "definition",
+                            indexDefinition);
+                        indexDefinition++;
+                    }
+                }
+
+                if (that.ValueFormat != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (
+                                var error in Primitives.VerifyNonEmptyXmlSerializableString(
+                                    that.ValueFormat))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "valueFormat"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.ValueList != null)
+                {
+                    agenda.Child(
+                        that.ValueList,
+                        "valueList");
+                }
+
+                if (that.Value != null)
+                {
+                    if (agenda.Wants(Checks.ConstrainedPrimitives))
+                    {
+                        foreach (var error in Primitives.VerifyValueTypeIec61360(that.Value))
+                        {
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    "value"));
+                            agenda.Error(error);
+                        }
+                    }
+                }
+
+                if (that.LevelType != null)
+                {
+                    agenda.Child(
+                        that.LevelType,
+                        "levelType");
+                }
+            }
+
+            /// <summary>
+            /// Verify the constrained primitives as in <see cref="Verification" />,
+            /// but match the patterns through <see cref="Patterns" />.
+            /// </summary>
+            private static class Primitives
+            {
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyXmlSerializableString(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyNonEmptyXmlSerializableString(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyDateTimeUtc(
+                    string that)
+                {
+                    if (!Patterns.MatchesXsDateTimeUtc(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must match the pattern of xs:dateTime with " +
+                            "the time zone fixed to UTC.");
+                    }
+
+                    if (!Verification.IsXsDateTimeUtc(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must represent a valid xs:dateTime with the time " +
+                            "zone fixed to UTC.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyDuration(
+                    string that)
+                {
+                    if (!Patterns.MatchesXsDuration(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must match the pattern of xs:duration.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyIdentifier(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 2000))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Identifier shall have a maximum length of 2000 characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyValueTypeIec61360(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 2000))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Value type IEC 61360 shall have a maximum length of 2000 " +
+                            "characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyNameType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 128))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Name type shall have a maximum length of 128 characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyVersionType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!Patterns.MatchesVersionType(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Version type shall match the version pattern.");
+                    }
+
+                    if (!(that.Length <= 4))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Version type shall have a maximum length of 4 characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyRevisionType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!Patterns.MatchesRevisionType(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Revision type shall match the revision pattern.");
+                    }
+
+                    if (!(that.Length <= 4))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Revision type shall have a maximum length of 4 characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyLabelType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 64))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Label type shall have a maximum length of 64 characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyMessageTopicType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 255))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Message topic type shall have a maximum length of 255 " +
+                            "characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyBcp47LanguageTag(
+                    string that)
+                {
+                    if (!Patterns.MatchesBcp47(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must represent a value language tag conformant to " +
+                            "BCP 47.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyContentType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 100))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Content type shall have a maximum length of 100 characters.");
+                    }
+
+                    if (!Patterns.MatchesMimeType(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must represent a valid content MIME type " +
+                            "according to RFC 2046.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyPathType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 2000))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Identifier shall have a maximum length of 2000 characters.");
+                    }
+
+                    if (!Patterns.MatchesRfc2396(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "String with max 2048 and min 1 characters conformant to " +
+                            "a URI as per RFC 2396.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyQualifierType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 128))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Name type shall have a maximum length of 128 characters.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyValueDataType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+                }
+
+                /// <summary>
+                /// Verify the constraints of <paramref name="that" />.
+                /// </summary>
+                internal static IEnumerable<Reporting.Error> VerifyIdShortType(
+                    string that)
+                {
+                    if (!Patterns.MatchesXmlSerializableString(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Constraint AASd-130: An attribute with data type 'string' " +
+                            "shall consist of these characters only: " +
+                            "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$.");
+                    }
+
+                    if (!(that.Length >= 1))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "The value must not be empty.");
+                    }
+
+                    if (!(that.Length <= 128))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "Name type shall have a maximum length of 128 characters.");
+                    }
+
+                    if (!Patterns.MatchesIdShort(that))
+                    {
+                        yield return new Reporting.Error(
+                            "Invariant violated:\n" +
+                            "ID-short of Referables shall only feature letters, digits, " +
+                            "underscore (``_``); starting mandatory with a letter. " +
+                            "*I.e.* ``[a-zA-Z][a-zA-Z0-9_]*``.");
+                    }
+                }
+            }  // private static class Primitives
+        }  // private class LocalVerifier
+
+        [CodeAnalysis.SuppressMessage("ReSharper", "InconsistentNaming")]
+        private static readonly LocalVerifier _localVerifier = new LocalVerifier();
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
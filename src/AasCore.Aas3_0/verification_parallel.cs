@@ -0,0 +1,105 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Verify the constraints of the environment <paramref name="that" />
+        /// without its identifiables.
+        /// </summary>
+        private static List<Reporting.Error> VerifyEnvironmentWithoutItems(
+            Aas.IEnvironment that)
+        {
+            var agenda = new Agenda();
+            _localVerifier.Visit(that, agenda);
+
+            var result = new List<Reporting.Error>();
+            foreach (var step in agenda.Steps)
+            {
+                if (step.Error != null)
+                {
+                    result.Add(step.Error);
+                }
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Verify the constraints of <paramref name="that" /> recursively,
+        /// and verify the asset administration shells, submodels and
+        /// concept descriptions in parallel.
+        /// </summary>
+        /// <remarks>
+        /// The errors are the same and in the same order as the ones
+        /// given by <see cref="Verify(Aas.IClass)" />. In contrast to
+        /// <see cref="Verify(Aas.IClass)" />, all the errors are collected before
+        /// the method returns.
+        /// </remarks>
+        /// <param name="that">
+        /// The environment to be verified
+        /// </param>
+        /// <param name="parallelOptions">
+        /// Options to configure the parallel loop, if any
+        /// </param>
+        public static List<Reporting.Error> VerifyParallel(
+            Aas.IEnvironment that,
+            System.Threading.Tasks.ParallelOptions? parallelOptions = null)
+        {
+            var names = new List<string>();
+            var indices = new List<int>();
+            var items = new List<Aas.IClass>();
+
+            void Add<T>(string name, List<T>? list) where T : Aas.IClass
+            {
+                if (list == null)
+                {
+                    return;
+                }
+
+                for (int i = 0; i < list.Count; i++)
+                {
+                    names.Add(name);
+                    indices.Add(i);
+                    items.Add(list[i]);
+                }
+            }
+
+            // NOTE: The order of the lists must follow the one in Verify.
+            Add("assetAdministrationShells", that.AssetAdministrationShells);
+            Add("submodels", that.Submodels);
+            Add("conceptDescriptions", that.ConceptDescriptions);
+
+            var errorsPerItem = new List<Reporting.Error>[items.Count];
+
+            System.Threading.Tasks.Parallel.For(
+                0,
+                items.Count,
+                parallelOptions ?? new System.Threading.Tasks.ParallelOptions(),
+                i =>
+                {
+                    var errors = new List<Reporting.Error>();
+                    foreach (var error in VerifyIteratively(items[i]))
+                    {
+                        error.PrependSegment(
+                            new Reporting.IndexSegment(
+                                indices[i]));
+                        error.PrependSegment(
+                            new Reporting.NameSegment(
+                                names[i]));
+                        errors.Add(error);
+                    }
+                    errorsPerItem[i] = errors;
+                });
+
+            var result = VerifyEnvironmentWithoutItems(that);
+            foreach (var errors in errorsPerItem)
+            {
+                result.AddRange(errors);
+            }
+            return result;
+        }
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,186 @@
+using Regex = System.Text.RegularExpressions.Regex;
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Cache the results of the pattern matching in <c>Matches*</c> functions
+        /// of <see cref="Patterns" /> such as <see cref="Patterns.MatchesBcp47" />
+        /// or <see cref="Patterns.MatchesXsAnyUri" />.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The generated <c>Matches*</c> functions of <see cref="Verification" />,
+        /// and hence <see cref="Verify(Aas.IClass)" />, do not consult the cache.
+        /// </para>
+        /// <para>
+        /// The models repeat the same strings very often, such as language tags,
+        /// content types and values of the keys. With the cache, every distinct
+        /// string is matched only once per pattern as long as it is not evicted.
+        /// </para>
+        /// <para>
+        /// The cache holds at most <see cref="Capacity" /> results, and evicts
+        /// the least recently used one when full. The cache is thread-safe.
+        /// </para>
+        /// </remarks>
+        public class PatternCache
+        {
+            private readonly struct Entry
+            {
+                internal readonly (Regex, string) Key;
+                internal readonly bool Result;
+
+                internal Entry((Regex, string) key, bool result)
+                {
+                    Key = key;
+                    Result = result;
+                }
+            }
+
+            private readonly object _lock = new object();
+
+            private readonly Dictionary<(Regex, string), LinkedListNode<Entry>> _nodes;
+
+            /// <summary>
+            /// Keep the entries from the most to the least recently used
+            /// </summary>
+            private readonly LinkedList<Entry> _order = new LinkedList<Entry>();
+
+            private long _hits;
+            private long _misses;
+
+            /// <summary>
+            /// Maximum number of the cached results
+            /// </summary>
+            public int Capacity { get; }
+
+            /// <summary>
+            /// Number of the matches answered from the cache
+            /// </summary>
+            public long Hits => System.Threading.Interlocked.Read(ref _hits);
+
+            /// <summary>
+            /// Number of the matches which had to be performed
+            /// </summary>
+            public long Misses => System.Threading.Interlocked.Read(ref _misses);
+
+            /// <summary>
+            /// Number of the currently cached results
+            /// </summary>
+            public int Count
+            {
+                get
+                {
+                    lock (_lock)
+                    {
+                        return _nodes.Count;
+                    }
+                }
+            }
+
+            /// <summary>
+            /// Initialize an empty cache with the given <paramref name="capacity" />.
+            /// </summary>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when <paramref name="capacity" /> is not positive.
+            /// </exception>
+            public PatternCache(int capacity)
+            {
+                if (capacity <= 0)
+                {
+                    throw new System.ArgumentException(
+                        $"Expected a positive capacity, but got: {capacity}");
+                }
+
+                Capacity = capacity;
+                _nodes = new Dictionary<(Regex, string), LinkedListNode<Entry>>();
+            }
+
+            /// <summary>
+            /// Remove all the cached results, and reset the counters.
+            /// </summary>
+            public void Clear()
+            {
+                lock (_lock)
+                {
+                    _nodes.Clear();
+                    _order.Clear();
+                    System.Threading.Interlocked.Exchange(ref _hits, 0);
+                    System.Threading.Interlocked.Exchange(ref _misses, 0);
+                }
+            }
+
+            internal bool IsMatch(Regex regex, string text)
+            {
+                var key = (regex, text);
+
+                lock (_lock)
+                {
+                    if (_nodes.TryGetValue(key, out var node))
+                    {
+                        _order.Remove(node);
+                        _order.AddFirst(node);
+
+                        System.Threading.Interlocked.Increment(ref _hits);
+                        return node.Value.Result;
+                    }
+                }
+
+                System.Threading.Interlocked.Increment(ref _misses);
+
+                // NOTE: We match outside of the lock so that the other threads are
+                // not blocked. Two threads might match the same text at the same
+                // time, but they obtain the same result.
+                bool result = regex.IsMatch(text);
+
+                lock (_lock)
+                {
+                    if (!_nodes.ContainsKey(key))
+                    {
+                        if (_nodes.Count == Capacity)
+                        {
+                            var last = _order.Last!;
+                            _order.RemoveLast();
+                            _nodes.Remove(last.Value.Key);
+                        }
+
+                        _nodes.Add(key, _order.AddFirst(new Entry(key, result)));
+                    }
+                }
+
+                return result;
+            }
+        }  // public class PatternCache
+
+        private static volatile PatternCache? _currentPatternCache;
+
+        /// <summary>
+        /// Cache consulted by the <c>Matches*</c> functions of
+        /// <see cref="Patterns" />, if any.
+        /// </summary>
+        /// <remarks>
+        /// No cache is used by default. Set it to a <see cref="PatternCache" /> to
+        /// enable the caching for the whole process, and to <c>null</c> to disable it.
+        /// </remarks>
+        public static PatternCache? CurrentPatternCache
+        {
+            get => _currentPatternCache;
+            set => _currentPatternCache = value;
+        }
+
+        /// <summary>
+        /// Match the <paramref name="text" /> against the <paramref name="regex" />
+        /// through the <see cref="CurrentPatternCache" />, if set.
+        /// </summary>
+        private static bool IsMatchWithPatternCache(Regex regex, string text)
+        {
+            var cache = _currentPatternCache;
+            return cache == null
+                ? regex.IsMatch(text)
+                : cache.IsMatch(regex, text);
+        }
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,574 @@
+using Regex = System.Text.RegularExpressions.Regex;
+using RegexOptions = System.Text.RegularExpressions.RegexOptions;
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Verification
+    {
+        /// <summary>
+        /// Match the patterns of the <c>Matches*</c> functions with the regular
+        /// expressions compiled to IL.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The generated <c>Matches*</c> functions, and hence
+        /// <see cref="Verify(Aas.IClass)" />, use the interpreted regular expressions.
+        /// The expressions here are compiled from the same patterns. They are faster
+        /// to match, but their compilation takes time on the first use.
+        /// </para>
+        /// <para>
+        /// <see cref="VerifyIteratively(Aas.IClass)" />,
+        /// <see cref="Verify(Aas.IClass, Options)" />, <see cref="VerifyParallel" />
+        /// and <see cref="Cache" /> check the constrained primitives through these
+        /// functions.
+        /// </para>
+        /// </remarks>
+        public static class Patterns
+        {
+            private static Regex Compile(Regex interpreted)
+            {
+                return new Regex(
+                    interpreted.ToString(),
+                    interpreted.Options | RegexOptions.Compiled);
+            }
+
+            private static readonly Regex RegexMatchesIdShort = Compile(
+                Verification.RegexMatchesIdShort);
+
+            private static readonly Regex RegexMatchesVersionType = Compile(
+                Verification.RegexMatchesVersionType);
+
+            private static readonly Regex RegexMatchesRevisionType = Compile(
+                Verification.RegexMatchesRevisionType);
+
+            private static readonly Regex RegexMatchesXsDateTimeUtc = Compile(
+                Verification.RegexMatchesXsDateTimeUtc);
+
+            private static readonly Regex RegexMatchesMimeType = Compile(
+                Verification.RegexMatchesMimeType);
+
+            private static readonly Regex RegexMatchesRfc2396 = Compile(
+                Verification.RegexMatchesRfc2396);
+
+            private static readonly Regex RegexMatchesBcp47 = Compile(
+                Verification.RegexMatchesBcp47);
+
+            private static readonly Regex RegexMatchesXmlSerializableString = Compile(
+                Verification.RegexMatchesXmlSerializableString);
+
+            private static readonly Regex RegexMatchesXsAnyUri = Compile(
+                Verification.RegexMatchesXsAnyUri);
+
+            private static readonly Regex RegexMatchesXsBase64Binary = Compile(
+                Verification.RegexMatchesXsBase64Binary);
+
+            private static readonly Regex RegexMatchesXsBoolean = Compile(
+                Verification.RegexMatchesXsBoolean);
+
+            private static readonly Regex RegexMatchesXsDate = Compile(
+                Verification.RegexMatchesXsDate);
+
+            private static readonly Regex RegexMatchesXsDateTime = Compile(
+                Verification.RegexMatchesXsDateTime);
+
+            private static readonly Regex RegexMatchesXsDecimal = Compile(
+                Verification.RegexMatchesXsDecimal);
+
+            private static readonly Regex RegexMatchesXsDouble = Compile(
+                Verification.RegexMatchesXsDouble);
+
+            private static readonly Regex RegexMatchesXsDuration = Compile(
+                Verification.RegexMatchesXsDuration);
+
+            private static readonly Regex RegexMatchesXsFloat = Compile(
+                Verification.RegexMatchesXsFloat);
+
+            private static readonly Regex RegexMatchesXsGDay = Compile(
+                Verification.RegexMatchesXsGDay);
+
+            private static readonly Regex RegexMatchesXsGMonth = Compile(
+                Verification.RegexMatchesXsGMonth);
+
+            private static readonly Regex RegexMatchesXsGMonthDay = Compile(
+                Verification.RegexMatchesXsGMonthDay);
+
+            private static readonly Regex RegexMatchesXsGYear = Compile(
+                Verification.RegexMatchesXsGYear);
+
+            private static readonly Regex RegexMatchesXsGYearMonth = Compile(
+                Verification.RegexMatchesXsGYearMonth);
+
+            private static readonly Regex RegexMatchesXsHexBinary = Compile(
+                Verification.RegexMatchesXsHexBinary);
+
+            private static readonly Regex RegexMatchesXsTime = Compile(
+                Verification.RegexMatchesXsTime);
+
+            private static readonly Regex RegexMatchesXsInteger = Compile(
+                Verification.RegexMatchesXsInteger);
+
+            private static readonly Regex RegexMatchesXsLong = Compile(
+                Verification.RegexMatchesXsLong);
+
+            private static readonly Regex RegexMatchesXsInt = Compile(
+                Verification.RegexMatchesXsInt);
+
+            private static readonly Regex RegexMatchesXsShort = Compile(
+                Verification.RegexMatchesXsShort);
+
+            private static readonly Regex RegexMatchesXsByte = Compile(
+                Verification.RegexMatchesXsByte);
+
+            private static readonly Regex RegexMatchesXsNonNegativeInteger = Compile(
+                Verification.RegexMatchesXsNonNegativeInteger);
+
+            private static readonly Regex RegexMatchesXsPositiveInteger = Compile(
+                Verification.RegexMatchesXsPositiveInteger);
+
+            private static readonly Regex RegexMatchesXsUnsignedLong = Compile(
+                Verification.RegexMatchesXsUnsignedLong);
+
+            private static readonly Regex RegexMatchesXsUnsignedInt = Compile(
+                Verification.RegexMatchesXsUnsignedInt);
+
+            private static readonly Regex RegexMatchesXsUnsignedShort = Compile(
+                Verification.RegexMatchesXsUnsignedShort);
+
+            private static readonly Regex RegexMatchesXsUnsignedByte = Compile(
+                Verification.RegexMatchesXsUnsignedByte);
+
+            private static readonly Regex RegexMatchesXsNonPositiveInteger = Compile(
+                Verification.RegexMatchesXsNonPositiveInteger);
+
+            private static readonly Regex RegexMatchesXsNegativeInteger = Compile(
+                Verification.RegexMatchesXsNegativeInteger);
+
+            private static readonly Regex RegexMatchesXsString = Compile(
+                Verification.RegexMatchesXsString);
+
+            private static bool IsMatch(Regex regex, string text)
+            {
+                return IsMatchWithPatternCache(regex, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesIdShort" />.
+            /// </summary>
+            public static bool MatchesIdShort(string text)
+            {
+                return IsMatch(RegexMatchesIdShort, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesVersionType" />.
+            /// </summary>
+            public static bool MatchesVersionType(string text)
+            {
+                return IsMatch(RegexMatchesVersionType, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesRevisionType" />.
+            /// </summary>
+            public static bool MatchesRevisionType(string text)
+            {
+                return IsMatch(RegexMatchesRevisionType, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsDateTimeUtc" />.
+            /// </summary>
+            public static bool MatchesXsDateTimeUtc(string text)
+            {
+                return IsMatch(RegexMatchesXsDateTimeUtc, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesMimeType" />.
+            /// </summary>
+            public static bool MatchesMimeType(string text)
+            {
+                return IsMatch(RegexMatchesMimeType, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesRfc2396" />.
+            /// </summary>
+            public static bool MatchesRfc2396(string text)
+            {
+                return IsMatch(RegexMatchesRfc2396, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesBcp47" />.
+            /// </summary>
+            public static bool MatchesBcp47(string text)
+            {
+                return IsMatch(RegexMatchesBcp47, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXmlSerializableString" />.
+            /// </summary>
+            public static bool MatchesXmlSerializableString(string text)
+            {
+                return IsMatch(RegexMatchesXmlSerializableString, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsAnyUri" />.
+            /// </summary>
+            public static bool MatchesXsAnyUri(string text)
+            {
+                return IsMatch(RegexMatchesXsAnyUri, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsBase64Binary" />.
+            /// </summary>
+            public static bool MatchesXsBase64Binary(string text)
+            {
+                return IsMatch(RegexMatchesXsBase64Binary, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsBoolean" />.
+            /// </summary>
+            public static bool MatchesXsBoolean(string text)
+            {
+                return IsMatch(RegexMatchesXsBoolean, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsDate" />.
+            /// </summary>
+            public static bool MatchesXsDate(string text)
+            {
+                return IsMatch(RegexMatchesXsDate, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsDateTime" />.
+            /// </summary>
+            public static bool MatchesXsDateTime(string text)
+            {
+                return IsMatch(RegexMatchesXsDateTime, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsDecimal" />.
+            /// </summary>
+            public static bool MatchesXsDecimal(string text)
+            {
+                return IsMatch(RegexMatchesXsDecimal, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsDouble" />.
+            /// </summary>
+            public static bool MatchesXsDouble(string text)
+            {
+                return IsMatch(RegexMatchesXsDouble, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsDuration" />.
+            /// </summary>
+            public static bool MatchesXsDuration(string text)
+            {
+                return IsMatch(RegexMatchesXsDuration, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsFloat" />.
+            /// </summary>
+            public static bool MatchesXsFloat(string text)
+            {
+                return IsMatch(RegexMatchesXsFloat, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsGDay" />.
+            /// </summary>
+            public static bool MatchesXsGDay(string text)
+            {
+                return IsMatch(RegexMatchesXsGDay, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsGMonth" />.
+            /// </summary>
+            public static bool MatchesXsGMonth(string text)
+            {
+                return IsMatch(RegexMatchesXsGMonth, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsGMonthDay" />.
+            /// </summary>
+            public static bool MatchesXsGMonthDay(string text)
+            {
+                return IsMatch(RegexMatchesXsGMonthDay, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsGYear" />.
+            /// </summary>
+            public static bool MatchesXsGYear(string text)
+            {
+                return IsMatch(RegexMatchesXsGYear, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsGYearMonth" />.
+            /// </summary>
+            public static bool MatchesXsGYearMonth(string text)
+            {
+                return IsMatch(RegexMatchesXsGYearMonth, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsHexBinary" />.
+            /// </summary>
+            public static bool MatchesXsHexBinary(string text)
+            {
+                return IsMatch(RegexMatchesXsHexBinary, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsTime" />.
+            /// </summary>
+            public static bool MatchesXsTime(string text)
+            {
+                return IsMatch(RegexMatchesXsTime, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsInteger" />.
+            /// </summary>
+            public static bool MatchesXsInteger(string text)
+            {
+                return IsMatch(RegexMatchesXsInteger, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsLong" />.
+            /// </summary>
+            public static bool MatchesXsLong(string text)
+            {
+                return IsMatch(RegexMatchesXsLong, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsInt" />.
+            /// </summary>
+            public static bool MatchesXsInt(string text)
+            {
+                return IsMatch(RegexMatchesXsInt, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsShort" />.
+            /// </summary>
+            public static bool MatchesXsShort(string text)
+            {
+                return IsMatch(RegexMatchesXsShort, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsByte" />.
+            /// </summary>
+            public static bool MatchesXsByte(string text)
+            {
+                return IsMatch(RegexMatchesXsByte, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsNonNegativeInteger" />.
+            /// </summary>
+            public static bool MatchesXsNonNegativeInteger(string text)
+            {
+                return IsMatch(RegexMatchesXsNonNegativeInteger, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsPositiveInteger" />.
+            /// </summary>
+            public static bool MatchesXsPositiveInteger(string text)
+            {
+                return IsMatch(RegexMatchesXsPositiveInteger, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsUnsignedLong" />.
+            /// </summary>
+            public static bool MatchesXsUnsignedLong(string text)
+            {
+                return IsMatch(RegexMatchesXsUnsignedLong, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsUnsignedInt" />.
+            /// </summary>
+            public static bool MatchesXsUnsignedInt(string text)
+            {
+                return IsMatch(RegexMatchesXsUnsignedInt, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsUnsignedShort" />.
+            /// </summary>
+            public static bool MatchesXsUnsignedShort(string text)
+            {
+                return IsMatch(RegexMatchesXsUnsignedShort, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsUnsignedByte" />.
+            /// </summary>
+            public static bool MatchesXsUnsignedByte(string text)
+            {
+                return IsMatch(RegexMatchesXsUnsignedByte, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsNonPositiveInteger" />.
+            /// </summary>
+            public static bool MatchesXsNonPositiveInteger(string text)
+            {
+                return IsMatch(RegexMatchesXsNonPositiveInteger, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsNegativeInteger" />.
+            /// </summary>
+            public static bool MatchesXsNegativeInteger(string text)
+            {
+                return IsMatch(RegexMatchesXsNegativeInteger, text);
+            }
+
+            /// <summary>
+            /// Check with the compiled expression as
+            /// <see cref="Verification.MatchesXsString" />.
+            /// </summary>
+            public static bool MatchesXsString(string text)
+            {
+                return IsMatch(RegexMatchesXsString, text);
+            }
+
+            /// <summary>
+            /// Compile the regular expressions ahead of time.
+            /// </summary>
+            /// <remarks>
+            /// <para>
+            /// The compilation and the just-in-time compilation take time on the first
+            /// use. Call this method once at startup, for example, on a background
+            /// thread, so that the first verification of a model does not pay for it.
+            /// </para>
+            /// <para>
+            /// Calling this method more than once is cheap and harmless.
+            /// </para>
+            /// </remarks>
+            public static void Prewarm()
+            {
+                var regexes = new[]
+                {
+                    RegexMatchesIdShort,
+                    RegexMatchesVersionType,
+                    RegexMatchesRevisionType,
+                    RegexMatchesXsDateTimeUtc,
+                    RegexMatchesMimeType,
+                    RegexMatchesRfc2396,
+                    RegexMatchesBcp47,
+                    RegexMatchesXmlSerializableString,
+                    RegexMatchesXsAnyUri,
+                    RegexMatchesXsBase64Binary,
+                    RegexMatchesXsBoolean,
+                    RegexMatchesXsDate,
+                    RegexMatchesXsDateTime,
+                    RegexMatchesXsDecimal,
+                    RegexMatchesXsDouble,
+                    RegexMatchesXsDuration,
+                    RegexMatchesXsFloat,
+                    RegexMatchesXsGDay,
+                    RegexMatchesXsGMonth,
+                    RegexMatchesXsGMonthDay,
+                    RegexMatchesXsGYear,
+                    RegexMatchesXsGYearMonth,
+                    RegexMatchesXsHexBinary,
+                    RegexMatchesXsTime,
+                    RegexMatchesXsInteger,
+                    RegexMatchesXsLong,
+                    RegexMatchesXsInt,
+                    RegexMatchesXsShort,
+                    RegexMatchesXsByte,
+                    RegexMatchesXsNonNegativeInteger,
+                    RegexMatchesXsPositiveInteger,
+                    RegexMatchesXsUnsignedLong,
+                    RegexMatchesXsUnsignedInt,
+                    RegexMatchesXsUnsignedShort,
+                    RegexMatchesXsUnsignedByte,
+                    RegexMatchesXsNonPositiveInteger,
+                    RegexMatchesXsNegativeInteger,
+                    RegexMatchesXsString
+                };
+
+                // NOTE: The constructors of the regular expressions have already run
+                // at this point as we accessed the fields. A match triggers
+                // the just-in-time compilation of the compiled expressions.
+                foreach (Regex regex in regexes)
+                {
+                    regex.IsMatch("");
+                }
+            }
+        }  // public static class Patterns
+
+        /// <summary>
+        /// Compile the regular expressions of <see cref="Patterns" /> ahead of time.
+        /// </summary>
+        /// <remarks>
+        /// This is a shortcut for <see cref="Patterns.Prewarm" />.
+        /// </remarks>
+        public static void PrewarmRegexes()
+        {
+            Patterns.Prewarm();
+        }
+    }  // public static partial class Verification
+}  // namespace AasCore.Aas3_0
@@ -5,7 +5,7 @@
 
 namespace AasCore.Aas3_0
 {
-    public static class Visitation
+    public static partial class Visitation
     {
         /// <summary>
         /// Define the interface for a visitor which visits the instances of the model.
@@ -1696,7 +1696,7 @@ namespace AasCore.Aas3_0
                 TContext context
             );
         }  // public abstract class AbstractTransformerWithContext
-    }  // public static class Visitation
+    }  // public static partial class Visitation
 }  // namespace AasCore.Aas3_0
 
 /*
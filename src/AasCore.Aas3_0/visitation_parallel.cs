@@ -0,0 +1,295 @@
+using Aas = AasCore.Aas3_0;  // renamed
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Visitation
+    {
+        /// <summary>
+        /// List the asset administration shells, submodels and concept descriptions
+        /// of <paramref name="that" /> in this order.
+        /// </summary>
+        /// <remarks>
+        /// Use the result as the roots for the parallel visitors and transformers
+        /// such as <c>VisitParallel</c>. The environment itself
+        /// is not included.
+        /// </remarks>
+        public static List<Aas.IClass> Identifiables(Aas.IEnvironment that)
+        {
+            var result = new List<Aas.IClass>();
+            result.AddRange(that.OverAssetAdministrationShellsOrEmpty());
+            result.AddRange(that.OverSubmodelsOrEmpty());
+            result.AddRange(that.OverConceptDescriptionsOrEmpty());
+            return result;
+        }
+
+        /// <summary>
+        /// Split the <paramref name="count" /> roots into contiguous partitions,
+        /// run the <paramref name="run" /> on each partition in parallel, and
+        /// give back the results in the order of the partitions.
+        /// </summary>
+        private static TPartial[] RunPartitions<TPartial>(
+            int count,
+            System.Threading.Tasks.ParallelOptions? parallelOptions,
+            System.Func<int, int, TPartial> run)
+        {
+            parallelOptions ??= new System.Threading.Tasks.ParallelOptions();
+
+            int degree = (parallelOptions.MaxDegreeOfParallelism > 0)
+                ? parallelOptions.MaxDegreeOfParallelism
+                : System.Environment.ProcessorCount;
+
+            // NOTE: We make more partitions than workers so that a single large
+            // root does not hold up all the others.
+            int partitionCount = System.Math.Min(count, 4 * degree);
+
+            var results = new TPartial[partitionCount];
+
+            System.Threading.Tasks.Parallel.For(
+                0,
+                partitionCount,
+                parallelOptions,
+                partition =>
+                {
+                    int start = (int)((long)count * partition / partitionCount);
+                    int end = (int)((long)count * (partition + 1) / partitionCount);
+                    results[partition] = run(start, end);
+                });
+
+            return results;
+        }
+
+        /// <summary>
+        /// Fold the <paramref name="partials" /> from left to right with
+        /// the <paramref name="combine" />.
+        /// </summary>
+        private static TPartial Combine<TPartial>(
+            TPartial[] partials,
+            System.Func<TPartial, TPartial, TPartial> combine)
+        {
+            var result = partials[0];
+            for (int i = 1; i < partials.Length; i++)
+            {
+                result = combine(result, partials[i]);
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Visit the <paramref name="roots" /> in parallel, with one visitor
+        /// per partition of the roots.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The roots are split into contiguous partitions. Each partition is
+        /// visited by its own visitor from <paramref name="createVisitor" />, so
+        /// the visitors need not be thread-safe. The visitors of the partitions
+        /// are then merged from left to right with <paramref name="combine" />,
+        /// in the order of the roots.
+        /// </para>
+        /// <para>
+        /// The roots must not contain each other, or their common descendants
+        /// will be visited more than once. Use <see cref="Identifiables" /> to
+        /// partition an environment. If a single submodel element list dominates
+        /// your model, pass its items as the roots instead.
+        /// </para>
+        /// </remarks>
+        /// <param name="roots">instances to be visited</param>
+        /// <param name="createVisitor">creates a fresh visitor for a partition</param>
+        /// <param name="combine">
+        /// merges the right visitor into the left one, and returns the merged visitor
+        /// </param>
+        /// <param name="parallelOptions">
+        /// Options to configure the parallel loop, such as the task scheduler, if any
+        /// </param>
+        /// <returns>
+        /// The merged visitor, or a fresh one if there are no roots
+        /// </returns>
+        public static TVisitor VisitParallel<TVisitor>(
+            IReadOnlyList<Aas.IClass> roots,
+            System.Func<TVisitor> createVisitor,
+            System.Func<TVisitor, TVisitor, TVisitor> combine,
+            System.Threading.Tasks.ParallelOptions? parallelOptions = null)
+            where TVisitor : IVisitor
+        {
+            if (roots.Count == 0)
+            {
+                return createVisitor();
+            }
+
+            var partials = RunPartitions(
+                roots.Count,
+                parallelOptions,
+                (start, end) =>
+                {
+                    var visitor = createVisitor();
+                    for (int i = start; i < end; i++)
+                    {
+                        visitor.Visit(roots[i]);
+                    }
+                    return visitor;
+                });
+
+            return Combine(partials, combine);
+        }
+
+        /// <summary>
+        /// Visit the <paramref name="roots" /> in parallel, with one visitor and
+        /// one context per partition of the roots.
+        /// </summary>
+        /// <remarks>
+        /// The roots are partitioned as for the visitors without a context.
+        /// The contexts of the partitions are merged from left to right with
+        /// <paramref name="combine" />, in the order of the roots.
+        /// </remarks>
+        /// <param name="roots">instances to be visited</param>
+        /// <param name="createVisitor">creates a fresh visitor for a partition</param>
+        /// <param name="createContext">creates a fresh context for a partition</param>
+        /// <param name="combine">
+        /// merges the right context into the left one, and returns the merged context
+        /// </param>
+        /// <param name="parallelOptions">
+        /// Options to configure the parallel loop, such as the task scheduler, if any
+        /// </param>
+        /// <returns>
+        /// The merged context, or a fresh one if there are no roots
+        /// </returns>
+        public static TContext VisitParallel<TContext>(
+            IReadOnlyList<Aas.IClass> roots,
+            System.Func<IVisitorWithContext<TContext>> createVisitor,
+            System.Func<TContext> createContext,
+            System.Func<TContext, TContext, TContext> combine,
+            System.Threading.Tasks.ParallelOptions? parallelOptions = null)
+        {
+            if (roots.Count == 0)
+            {
+                return createContext();
+            }
+
+            var partials = RunPartitions(
+                roots.Count,
+                parallelOptions,
+                (start, end) =>
+                {
+                    var visitor = createVisitor();
+                    var context = createContext();
+                    for (int i = start; i < end; i++)
+                    {
+                        visitor.Visit(roots[i], context);
+                    }
+                    return context;
+                });
+
+            return Combine(partials, combine);
+        }
+
+        /// <summary>
+        /// Transform the <paramref name="roots" /> in parallel, with one transformer
+        /// per partition of the roots, and aggregate the results.
+        /// </summary>
+        /// <remarks>
+        /// <para>
+        /// The roots are partitioned as for the visitors.
+        /// Each partition starts with the seed from <paramref name="createSeed" />,
+        /// and combines it with the result of every root in turn. The results of
+        /// the partitions are then combined from left to right.
+        /// </para>
+        /// <para>
+        /// The result is the same as of the sequential aggregation if
+        /// the <paramref name="combine" /> is associative, and the seed is its
+        /// identity, such as an empty list for concatenation or zero for addition.
+        /// </para>
+        /// </remarks>
+        /// <param name="roots">instances to be transformed</param>
+        /// <param name="createTransformer">creates a fresh transformer for a partition</param>
+        /// <param name="createSeed">creates the initial result of a partition</param>
+        /// <param name="combine">merges two results into one</param>
+        /// <param name="parallelOptions">
+        /// Options to configure the parallel loop, such as the task scheduler, if any
+        /// </param>
+        /// <returns>
+        /// The aggregated result, or a seed if there are no roots
+        /// </returns>
+        public static T TransformParallel<T>(
+            IReadOnlyList<Aas.IClass> roots,
+            System.Func<ITransformer<T>> createTransformer,
+            System.Func<T> createSeed,
+            System.Func<T, T, T> combine,
+            System.Threading.Tasks.ParallelOptions? parallelOptions = null)
+        {
+            if (roots.Count == 0)
+            {
+                return createSeed();
+            }
+
+            var partials = RunPartitions(
+                roots.Count,
+                parallelOptions,
+                (start, end) =>
+                {
+                    var transformer = createTransformer();
+                    var result = createSeed();
+                    for (int i = start; i < end; i++)
+                    {
+                        result = combine(result, transformer.Transform(roots[i]));
+                    }
+                    return result;
+                });
+
+            return Combine(partials, combine);
+        }
+
+        /// <summary>
+        /// Transform the <paramref name="roots" /> in parallel, with one transformer
+        /// and one context per partition of the roots, and aggregate the results.
+        /// </summary>
+        /// <remarks>
+        /// The roots are partitioned as for the visitors,
+        /// and the results are aggregated as in
+        /// <see cref="TransformParallel{T}" />. The contexts are not merged.
+        /// </remarks>
+        /// <param name="roots">instances to be transformed</param>
+        /// <param name="createTransformer">creates a fresh transformer for a partition</param>
+        /// <param name="createContext">creates a fresh context for a partition</param>
+        /// <param name="createSeed">creates the initial result of a partition</param>
+        /// <param name="combine">merges two results into one</param>
+        /// <param name="parallelOptions">
+        /// Options to configure the parallel loop, such as the task scheduler, if any
+        /// </param>
+        /// <returns>
+        /// The aggregated result, or a seed if there are no roots
+        /// </returns>
+        public static T TransformParallel<TContext, T>(
+            IReadOnlyList<Aas.IClass> roots,
+            System.Func<ITransformerWithContext<TContext, T>> createTransformer,
+            System.Func<TContext> createContext,
+            System.Func<T> createSeed,
+            System.Func<T, T, T> combine,
+            System.Threading.Tasks.ParallelOptions? parallelOptions = null)
+        {
+            if (roots.Count == 0)
+            {
+                return createSeed();
+            }
+
+            var partials = RunPartitions(
+                roots.Count,
+                parallelOptions,
+                (start, end) =>
+                {
+                    var transformer = createTransformer();
+                    var context = createContext();
+                    var result = createSeed();
+                    for (int i = start; i < end; i++)
+                    {
+                        result = combine(
+                            result, transformer.Transform(roots[i], context));
+                    }
+                    return result;
+                });
+
+            return Combine(partials, combine);
+        }
+    }  // public static partial class Visitation
+}  // namespace AasCore.Aas3_0
@@ -14,7 +14,7 @@ namespace AasCore.Aas3_0
     /// <summary>
     /// Provide de/serialization of meta-model classes to/from XML.
     /// </summary>
-    public static class Xmlization
+    public static partial class Xmlization
     {
         /// The XML namespace of the meta-model
         [CodeAnalysis.SuppressMessage("ReSharper", "InconsistentNaming")]
@@ -19904,7 +19904,7 @@ namespace AasCore.Aas3_0
         ///     "http://www.example.com/5/12");
         /// </code>
         /// </example>
-        public static class Deserialize
+        public static partial class Deserialize
         {
             /// <summary>
             /// Deserialize an instance of IHasSemantics from <paramref name="reader" />.
@@ -21805,7 +21805,7 @@ namespace AasCore.Aas3_0
                     ?? throw new System.InvalidOperationException(
                         "Unexpected output null when error is null");
             }
-        }  // public static class Deserialize
+        }  // public static partial class Deserialize
 
         /// <summary>
         /// Serialize recursively the instances as XML elements.
@@ -26294,7 +26294,7 @@ namespace AasCore.Aas3_0
         ///     writer);
         /// </code>
         /// </example>
-        public static class Serialize
+        public static partial class Serialize
         {
             [CodeAnalysis.SuppressMessage("ReSharper", "InconsistentNaming")]
             private static readonly VisitorWithWriter _visitorWithWriter = (
@@ -26310,8 +26310,8 @@ namespace AasCore.Aas3_0
                 Serialize._visitorWithWriter.Visit(
                     that, writer);
             }
-        }  // public static class Serialize
-    }  // public static class Xmlization
+        }  // public static partial class Serialize
+    }  // public static partial class Xmlization
 }  // namespace AasCore.Aas3_0
 
 /*
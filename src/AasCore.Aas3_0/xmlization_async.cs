@@ -0,0 +1,438 @@
+using Aas = AasCore.Aas3_0;  // renamed
+using Xml = System.Xml;
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Xmlization
+    {
+        public static partial class Deserialize
+        {
+            /// <summary>
+            /// Deserialize an instance of Environment from <paramref name="stream" />,
+            /// reading the stream asynchronously into memory as a whole first.
+            /// </summary>
+            /// <remarks>
+            /// The deserialization from XML is synchronous. The whole input is therefore
+            /// buffered in memory before it is parsed, so that no thread is blocked
+            /// while waiting for the stream. Hence, the memory grows with the size of
+            /// the document. Pass in an asynchronous reader to
+            /// <see cref="EnvironmentFromAsync(Xml.XmlReader, System.Threading.CancellationToken)" />
+            /// if you need to bound the memory instead.
+            /// </remarks>
+            /// <param name="stream">Stream of an XML document</param>
+            /// <param name="settings">Settings of the reader, if any</param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown when the document is not a valid XML
+            /// representation of Environment.
+            /// </exception>
+            /// <exception cref="Xml.XmlException">
+            /// Thrown when the input is not a valid XML.
+            /// </exception>
+            public static async System.Threading.Tasks.Task<Aas.Environment> EnvironmentFromAsync(
+                System.IO.Stream stream,
+                Xml.XmlReaderSettings? settings = null,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                using var buffer = new System.IO.MemoryStream();
+                await stream.CopyToAsync(buffer, cancellationToken).ConfigureAwait(false);
+                buffer.Position = 0;
+
+                using var reader = Xml.XmlReader.Create(buffer, settings);
+
+                // Skip the XML declaration, if any, as the stream holds
+                // a whole document.
+                reader.MoveToContent();
+
+                return EnvironmentFrom(reader);
+            }
+
+            private static Xmlization.Exception ExceptionFor(Reporting.Error error)
+            {
+                return new Xmlization.Exception(
+                    Reporting.GenerateRelativeXPath(error.PathSegments),
+                    error.Cause);
+            }
+
+            /// <summary>
+            /// Check that the <paramref name="reader" /> is at an element with
+            /// the given namespace and the name <paramref name="expectedName" />,
+            /// if the name is given.
+            /// </summary>
+            /// <returns>The local name of the element</returns>
+            private static string ExpectElement(
+                Xml.XmlReader reader,
+                string description,
+                string? expectedName)
+            {
+                if (reader.NodeType != Xml.XmlNodeType.Element)
+                {
+                    throw ExceptionFor(
+                        new Reporting.Error(
+                            $"Expected an XML element representing {description}, " +
+                            $"but got a node of type {reader.NodeType} " +
+                            $"with value {reader.Value}"));
+                }
+
+                if (reader.NamespaceURI != NS)
+                {
+                    throw ExceptionFor(
+                        new Reporting.Error(
+                            $"Expected an element within a namespace {NS}, " +
+                            $"but got: {reader.NamespaceURI}"));
+                }
+
+                if (expectedName != null && reader.LocalName != expectedName)
+                {
+                    throw ExceptionFor(
+                        new Reporting.Error(
+                            $"Expected an element representing {description} " +
+                            $"with element name {expectedName}, " +
+                            $"but got: {reader.LocalName}"));
+                }
+
+                return reader.LocalName;
+            }
+
+            /// <summary>
+            /// Deserialize a single identifiable from its <paramref name="text" />
+            /// as read by <see cref="Xml.XmlReader.ReadOuterXmlAsync" />.
+            /// </summary>
+            /// <remarks>
+            /// The line numbers and positions are shifted by the ones of
+            /// the identifiable's element in the original document so that
+            /// the errors point to the original input.
+            /// </remarks>
+            private static Aas.IIdentifiable? IdentifiableFromText(
+                string text,
+                int lineNumber,
+                int linePosition,
+                EnvironmentSections section,
+                out Reporting.Error? error)
+            {
+                var settings = new Xml.XmlReaderSettings();
+                if (lineNumber > 0)
+                {
+                    settings.LineNumberOffset = lineNumber - 1;
+
+                    // NOTE: The position of an element points to its name,
+                    // right after the opening angle bracket.
+                    settings.LinePositionOffset = linePosition - 2;
+                }
+
+                using var reader = Xml.XmlReader.Create(
+                    new System.IO.StringReader(text), settings);
+                reader.MoveToContent();
+
+                switch (section)
+                {
+                    case EnvironmentSections.AssetAdministrationShells:
+                        return DeserializeImplementation.AssetAdministrationShellFromElement(
+                            reader, out error);
+                    case EnvironmentSections.Submodels:
+                        return DeserializeImplementation.SubmodelFromElement(
+                            reader, out error);
+                    case EnvironmentSections.ConceptDescriptions:
+                        return DeserializeImplementation.ConceptDescriptionFromElement(
+                            reader, out error);
+                    default:
+                        throw new System.InvalidOperationException(
+                            $"Unexpected section: {section}");
+                }
+            }
+
+            /// <summary>
+            /// Deserialize an instance of Environment from <paramref name="reader" />,
+            /// reading the input asynchronously one identifiable at a time.
+            /// </summary>
+            /// <remarks>
+            /// <para>
+            /// The elements of the environment and its lists are read with
+            /// the asynchronous methods of the reader. Each asset administration shell,
+            /// submodel and concept description is read asynchronously as text with
+            /// <see cref="Xml.XmlReader.ReadOuterXmlAsync" />, and then deserialized
+            /// synchronously. Hence, the memory is bounded by the largest identifiable
+            /// in addition to the result, not by the whole document.
+            /// </para>
+            /// <para>
+            /// The errors in the identifiables are reported with the same paths and
+            /// causes as in <see cref="EnvironmentFrom" />. The cancellation is checked
+            /// between the identifiables, as the reader does not accept
+            /// a cancellation token.
+            /// </para>
+            /// </remarks>
+            /// <param name="reader">
+            /// Reader created with <see cref="Xml.XmlReaderSettings.Async" /> set
+            /// to <c>true</c>
+            /// </param>
+            /// <param name="cancellationToken">to cancel the reading</param>
+            /// <exception cref="System.ArgumentException">
+            /// Thrown when the <paramref name="reader" /> is not asynchronous.
+            /// </exception>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown when the document is not a valid XML
+            /// representation of Environment.
+            /// </exception>
+            /// <exception cref="Xml.XmlException">
+            /// Thrown when the input is not a valid XML.
+            /// </exception>
+            public static async System.Threading.Tasks.Task<Aas.Environment> EnvironmentFromAsync(
+                Xml.XmlReader reader,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                if (reader.Settings == null || !reader.Settings.Async)
+                {
+                    throw new System.ArgumentException(
+                        "Expected a reader created with XmlReaderSettings.Async " +
+                        "set to true",
+                        nameof(reader));
+                }
+
+                List<Aas.IAssetAdministrationShell>? shells = null;
+                List<Aas.ISubmodel>? submodels = null;
+                List<Aas.IConceptDescription>? conceptDescriptions = null;
+
+                await reader.MoveToContentAsync().ConfigureAwait(false);
+                ExpectElement(reader, "an instance of class Environment", "environment");
+
+                bool isEmptyEnvironment = reader.IsEmptyElement;
+                await reader.ReadAsync().ConfigureAwait(false);
+
+                while (!isEmptyEnvironment)
+                {
+                    await reader.MoveToContentAsync().ConfigureAwait(false);
+                    if (reader.NodeType == Xml.XmlNodeType.EndElement)
+                    {
+                        await reader.ReadAsync().ConfigureAwait(false);
+                        break;
+                    }
+
+                    string sectionName = ExpectElement(
+                        reader, "a property of an instance of class Environment", null);
+
+                    if (!DeserializeStreamingImplementation.TrySectionFrom(
+                            sectionName, out EnvironmentSections section))
+                    {
+                        throw ExceptionFor(
+                            new Reporting.Error(
+                                "We expected properties of the class Environment, " +
+                                "but got an unexpected element " +
+                                $"with the name {sectionName}"));
+                    }
+
+                    switch (section)
+                    {
+                        case EnvironmentSections.AssetAdministrationShells:
+                            shells = new List<Aas.IAssetAdministrationShell>();
+                            break;
+                        case EnvironmentSections.Submodels:
+                            submodels = new List<Aas.ISubmodel>();
+                            break;
+                        case EnvironmentSections.ConceptDescriptions:
+                            conceptDescriptions = new List<Aas.IConceptDescription>();
+                            break;
+                    }
+
+                    bool isEmptySection = reader.IsEmptyElement;
+                    await reader.ReadAsync().ConfigureAwait(false);
+
+                    int index = 0;
+                    while (!isEmptySection)
+                    {
+                        await reader.MoveToContentAsync().ConfigureAwait(false);
+                        if (reader.NodeType == Xml.XmlNodeType.EndElement)
+                        {
+                            await reader.ReadAsync().ConfigureAwait(false);
+                            break;
+                        }
+
+                        if (reader.NodeType != Xml.XmlNodeType.Element)
+                        {
+                            throw ExceptionFor(
+                                new Reporting.Error(
+                                    "Expected an XML element representing " +
+                                    $"an item of {sectionName}, " +
+                                    $"but got a node of type {reader.NodeType} " +
+                                    $"with value {reader.Value}"));
+                        }
+
+                        cancellationToken.ThrowIfCancellationRequested();
+
+                        var lineInfo = reader as Xml.IXmlLineInfo;
+                        int lineNumber = lineInfo?.LineNumber ?? 0;
+                        int linePosition = lineInfo?.LinePosition ?? 0;
+
+                        string text = await reader.ReadOuterXmlAsync().ConfigureAwait(false);
+
+                        Aas.IIdentifiable? item = IdentifiableFromText(
+                            text, lineNumber, linePosition, section, out Reporting.Error? error);
+                        if (error != null)
+                        {
+                            error.PrependSegment(
+                                new Reporting.IndexSegment(
+                                    index));
+                            error.PrependSegment(
+                                new Reporting.NameSegment(
+                                    sectionName));
+                            throw ExceptionFor(error);
+                        }
+
+                        switch (item)
+                        {
+                            case Aas.IAssetAdministrationShell shell:
+                                shells!.Add(shell);
+                                break;
+                            case Aas.ISubmodel submodel:
+                                submodels!.Add(submodel);
+                                break;
+                            case Aas.IConceptDescription conceptDescription:
+                                conceptDescriptions!.Add(conceptDescription);
+                                break;
+                            default:
+                                throw new System.InvalidOperationException(
+                                    "Unexpected item null when error null");
+                        }
+
+                        index++;
+                    }
+                }
+
+                return new Aas.Environment(shells, submodels, conceptDescriptions);
+            }
+        }  // public static partial class Deserialize
+
+        public static partial class Serialize
+        {
+            /// <summary>
+            /// Write asynchronously the buffered output once it reaches this size.
+            /// </summary>
+            private const int FlushThreshold = 64 * 1024;
+
+            private static async System.Threading.Tasks.Task WriteOutAsync(
+                System.IO.MemoryStream buffer,
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken)
+            {
+                await stream.WriteAsync(
+                    buffer.GetBuffer(),
+                    0,
+                    (int)buffer.Length,
+                    cancellationToken).ConfigureAwait(false);
+
+                buffer.SetLength(0);
+            }
+
+            private static async System.Threading.Tasks.Task ItemsToAsync<T>(
+                string elementName,
+                IEnumerable<T>? items,
+                Xml.XmlWriter writer,
+                System.IO.MemoryStream buffer,
+                System.IO.Stream stream,
+                System.Threading.CancellationToken cancellationToken) where T : Aas.IClass
+            {
+                if (items == null)
+                {
+                    return;
+                }
+
+                writer.WriteStartElement(elementName, NS);
+                foreach (T item in items)
+                {
+                    To(item, writer);
+
+                    writer.Flush();
+                    if (buffer.Length >= FlushThreshold)
+                    {
+                        await WriteOutAsync(
+                            buffer, stream, cancellationToken).ConfigureAwait(false);
+                    }
+                }
+                writer.WriteEndElement();
+            }
+
+            /// <summary>
+            /// Serialize an instance of the meta-model asynchronously to
+            /// the <paramref name="stream" /> as an XML document.
+            /// </summary>
+            /// <remarks>
+            /// <para>
+            /// The serialization to XML is synchronous. The instance is therefore
+            /// written to an in-memory buffer, and the buffer is written asynchronously
+            /// to the stream. In case of an environment, the buffer is written out
+            /// between the identifiables so that only about a single identifiable
+            /// needs to be held in memory.
+            /// </para>
+            /// <para>
+            /// The output is the same as if you passed in an
+            /// <see cref="Xml.XmlWriter" /> created over the stream with
+            /// the given <paramref name="settings" /> to <see cref="To" />.
+            /// </para>
+            /// </remarks>
+            /// <param name="that">instance to be serialized</param>
+            /// <param name="stream">where to write the XML to</param>
+            /// <param name="settings">Settings of the writer, if any</param>
+            /// <param name="cancellationToken">to cancel the writing</param>
+            public static async System.Threading.Tasks.Task ToAsync(
+                Aas.IClass that,
+                System.IO.Stream stream,
+                Xml.XmlWriterSettings? settings = null,
+                System.Threading.CancellationToken cancellationToken = default)
+            {
+                Xml.XmlWriterSettings writerSettings = (
+                    settings?.Clone() ?? new Xml.XmlWriterSettings());
+
+                // We write synchronously to the in-memory buffer, and close it
+                // ourselves.
+                writerSettings.Async = false;
+                writerSettings.CloseOutput = false;
+
+                using var buffer = new System.IO.MemoryStream();
+
+                using (var writer = Xml.XmlWriter.Create(buffer, writerSettings))
+                {
+                    if (that is Aas.IEnvironment environment)
+                    {
+                        // NOTE: The order of the elements must follow
+                        // VisitorWithWriter.VisitEnvironment.
+                        writer.WriteStartElement("environment", NS);
+
+                        await ItemsToAsync(
+                            "assetAdministrationShells",
+                            environment.AssetAdministrationShells,
+                            writer,
+                            buffer,
+                            stream,
+                            cancellationToken).ConfigureAwait(false);
+
+                        await ItemsToAsync(
+                            "submodels",
+                            environment.Submodels,
+                            writer,
+                            buffer,
+                            stream,
+                            cancellationToken).ConfigureAwait(false);
+
+                        await ItemsToAsync(
+                            "conceptDescriptions",
+                            environment.ConceptDescriptions,
+                            writer,
+                            buffer,
+                            stream,
+                            cancellationToken).ConfigureAwait(false);
+
+                        writer.WriteEndElement();
+                    }
+                    else
+                    {
+                        To(that, writer);
+                    }
+                }
+
+                await WriteOutAsync(
+                    buffer, stream, cancellationToken).ConfigureAwait(false);
+            }
+        }  // public static partial class Serialize
+    }  // public static partial class Xmlization
+}  // namespace AasCore.Aas3_0
@@ -0,0 +1,571 @@
+using Aas = AasCore.Aas3_0;  // renamed
+using Xml = System.Xml;
+
+using System.Collections.Generic;  // can't alias
+
+namespace AasCore.Aas3_0
+{
+    public static partial class Xmlization
+    {
+        /// <summary>
+        /// Select the lists of identifiables in an environment.
+        /// </summary>
+        [System.Flags]
+        internal enum EnvironmentSections
+        {
+            None = 0,
+            AssetAdministrationShells = 1,
+            Submodels = 2,
+            ConceptDescriptions = 4,
+            All = AssetAdministrationShells | Submodels | ConceptDescriptions
+        }
+
+        /// <summary>
+        /// Implement the incremental deserialization of environments from XML.
+        /// </summary>
+        /// <remarks>
+        /// We walk through the elements of the environment and its lists ourselves,
+        /// and delegate the deserialization of each top-level identifiable to
+        /// <see cref="DeserializeImplementation" />. The identifiable is handed out
+        /// as soon as its end element has been consumed, so that the peak memory
+        /// is bound by the largest identifiable instead of the whole environment.
+        ///
+        /// The errors are reported with the same paths and causes as in
+        /// <see cref="DeserializeImplementation.EnvironmentFromElement" />.
+        /// </remarks>
+        internal static class DeserializeStreamingImplementation
+        {
+            /// <summary>
+            /// Check the namespace and extract the element's name.
+            /// </summary>
+            private static string TryElementName(
+                Xml.XmlReader reader,
+                out Reporting.Error? error)
+            {
+                error = null;
+                if (reader.NamespaceURI != NS)
+                {
+                    error = new Reporting.Error(
+                        $"Expected an element within a namespace {NS}, " +
+                        $"but got: {reader.NamespaceURI}");
+                    return "";
+                }
+
+                return reader.LocalName;
+            }
+
+            internal static bool TrySectionFrom(
+                string elementName,
+                out EnvironmentSections section)
+            {
+                switch (elementName)
+                {
+                    case "assetAdministrationShells":
+                        section = EnvironmentSections.AssetAdministrationShells;
+                        return true;
+                    case "submodels":
+                        section = EnvironmentSections.Submodels;
+                        return true;
+                    case "conceptDescriptions":
+                        section = EnvironmentSections.ConceptDescriptions;
+                        return true;
+                    default:
+                        section = EnvironmentSections.None;
+                        return false;
+                }
+            }
+
+            /// <summary>
+            /// Walk through an environment, and deserialize its identifiables
+            /// one at a time.
+            /// </summary>
+            internal sealed class EnvironmentWalker
+            {
+                private enum State
+                {
+                    Start,
+                    Properties,
+                    Items,
+                    End,
+                    Done
+                }
+
+                private readonly Xml.XmlReader _reader;
+                private readonly EnvironmentSections _sections;
+
+                private State _state = State.Start;
+                private bool _isEmptyElement;
+                private string _elementName = "";
+                private EnvironmentSections _section;
+                private string _sectionName = "";
+                private int _index;
+
+                /// <param name="reader">
+                /// Initialized XML reader with cursor set to the environment element
+                /// </param>
+                /// <param name="sections">which lists of identifiables to deserialize</param>
+                internal EnvironmentWalker(
+                    Xml.XmlReader reader,
+                    EnvironmentSections sections)
+                {
+                    _reader = reader;
+                    _sections = sections;
+                }
+
+                private Aas.IIdentifiable? ItemFrom(out Reporting.Error? error)
+                {
+                    switch (_section)
+                    {
+                        case EnvironmentSections.AssetAdministrationShells:
+                            return DeserializeImplementation.AssetAdministrationShellFromElement(
+                                _reader, out error);
+                        case EnvironmentSections.Submodels:
+                            return DeserializeImplementation.SubmodelFromElement(
+                                _reader, out error);
+                        case EnvironmentSections.ConceptDescriptions:
+                            return DeserializeImplementation.ConceptDescriptionFromElement(
+                                _reader, out error);
+                        default:
+                            throw new System.InvalidOperationException(
+                                $"Unexpected section: {_section}");
+                    }
+                }
+
+                private Aas.IIdentifiable? Stop(Reporting.Error? error)
+                {
+                    if (error != null)
+                    {
+                        _state = State.Done;
+                    }
+                    return null;
+                }
+
+                private void Start(out Reporting.Error? error)
+                {
+                    error = null;
+
+                    DeserializeImplementation.SkipNoneWhitespaceAndComments(_reader);
+
+                    if (!_reader.EOF && _reader.NodeType == Xml.XmlNodeType.XmlDeclaration)
+                    {
+                        error = new Reporting.Error(
+                            "Unexpected XML declaration when reading an instance " +
+                            "of class Environment, as we expect the reader " +
+                            "to be set at content with MoveToContent");
+                        return;
+                    }
+
+                    if (_reader.EOF)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML element representing an instance of class Environment, " +
+                            "but reached the end-of-file");
+                        return;
+                    }
+
+                    if (_reader.NodeType != Xml.XmlNodeType.Element)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML element representing an instance of class Environment, " +
+                            $"but got a node of type {_reader.NodeType} " +
+                            $"with value {_reader.Value}");
+                        return;
+                    }
+
+                    _elementName = TryElementName(_reader, out error);
+                    if (error != null)
+                    {
+                        return;
+                    }
+
+                    if (_elementName != "environment")
+                    {
+                        error = new Reporting.Error(
+                            "Expected an element representing an instance of class Environment " +
+                            $"with element name environment, but got: {_elementName}");
+                        return;
+                    }
+
+                    _isEmptyElement = _reader.IsEmptyElement;
+
+                    // Skip the element node and go to the content
+                    _reader.Read();
+
+                    if (_isEmptyElement)
+                    {
+                        _state = State.End;
+                        return;
+                    }
+
+                    DeserializeImplementation.SkipNoneWhitespaceAndComments(_reader);
+                    if (_reader.EOF)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML element representing " +
+                            "a property of an instance of class Environment, " +
+                            "but reached the end-of-file");
+                        return;
+                    }
+
+                    _state = State.Properties;
+                }
+
+                private void StartProperty(out Reporting.Error? error)
+                {
+                    error = null;
+
+                    DeserializeImplementation.SkipNoneWhitespaceAndComments(_reader);
+
+                    if (_reader.NodeType == Xml.XmlNodeType.EndElement || _reader.EOF)
+                    {
+                        _state = State.End;
+                        return;
+                    }
+
+                    if (_reader.NodeType != Xml.XmlNodeType.Element)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML start element representing " +
+                            "a property of an instance of class Environment, " +
+                            $"but got the node of type {_reader.NodeType} " +
+                            $"with the value {_reader.Value}");
+                        return;
+                    }
+
+                    _sectionName = TryElementName(_reader, out error);
+                    if (error != null)
+                    {
+                        return;
+                    }
+
+                    if (!TrySectionFrom(_sectionName, out _section))
+                    {
+                        error = new Reporting.Error(
+                            "We expected properties of the class Environment, " +
+                            "but got an unexpected element " +
+                            $"with the name {_sectionName}");
+                        return;
+                    }
+
+                    bool isEmptyProperty = _reader.IsEmptyElement;
+
+                    // Skip the expected element
+                    _reader.Read();
+
+                    if (isEmptyProperty)
+                    {
+                        return;
+                    }
+
+                    DeserializeImplementation.SkipNoneWhitespaceAndComments(_reader);
+
+                    _index = 0;
+                    _state = State.Items;
+                }
+
+                private void EndProperty(out Reporting.Error? error)
+                {
+                    error = null;
+
+                    DeserializeImplementation.SkipNoneWhitespaceAndComments(_reader);
+
+                    if (_reader.EOF)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML end element to conclude a property of class Environment " +
+                            $"with the element name {_sectionName}, " +
+                            "but got the end-of-file.");
+                        return;
+                    }
+                    if (_reader.NodeType != Xml.XmlNodeType.EndElement)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML end element to conclude a property of class Environment " +
+                            $"with the element name {_sectionName}, " +
+                            $"but got the node of type {_reader.NodeType} " +
+                            $"with the value {_reader.Value}");
+                        return;
+                    }
+
+                    string endElementName = TryElementName(_reader, out error);
+                    if (error != null)
+                    {
+                        return;
+                    }
+
+                    if (endElementName != _sectionName)
+                    {
+                        error = new Reporting.Error(
+                            "Expected an XML end element to conclude a property of class Environment " +
+                            $"with the element name {_sectionName}, " +
+                            $"but got the end element with the name {_reader.Name}");
+                        return;
+                    }
+
+                    // Skip the expected end element
+                    _reader.Read();
+
+                    _state = State.Properties;
+                }
+
+                private void End(out Reporting.Error? error)
+                {
+                    error = null;
+
+                    DeserializeImplementation.SkipNoneWhitespaceAndComments(_reader);
+
+                    if (!_isEmptyElement)
+                    {
+                        if (_reader.EOF)
+                        {
+                            error = new Reporting.Error(
+                                "Expected an XML end element concluding an instance of class Environment, " +
+                                "but reached the end-of-file");
+                            return;
+                        }
+
+                        if (_reader.NodeType != Xml.XmlNodeType.EndElement)
+                        {
+                            error = new Reporting.Error(
+                                "Expected an XML end element concluding an instance of class Environment, " +
+                                $"but got a node of type {_reader.NodeType} " +
+                                $"with value {_reader.Value}");
+                            return;
+                        }
+
+                        string endElementName = TryElementName(_reader, out error);
+                        if (error != null)
+                        {
+                            return;
+                        }
+
+                        if (endElementName != _elementName)
+                        {
+                            error = new Reporting.Error(
+                                $"Expected an XML end element with an name {_elementName}, " +
+                                $"but got: {endElementName}");
+                            return;
+                        }
+
+                        // Skip the end element
+                        _reader.Read();
+                    }
+
+                    _state = State.Done;
+                }
+
+                /// <summary>
+                /// Read up to and including the next identifiable in the selected lists.
+                /// </summary>
+                /// <param name="error">Error, if any, during the deserialization</param>
+                /// <returns>
+                /// The next identifiable, or null if the environment has been
+                /// concluded or an error occurred
+                /// </returns>
+                internal Aas.IIdentifiable? Next(out Reporting.Error? error)
+                {
+                    error = null;
+
+                    while (true)
+                    {
+                        switch (_state)
+                        {
+                            case State.Start:
+                                Start(out error);
+                                if (error != null)
+                                {
+                                    return Stop(error);
+                                }
+                                break;
+
+                            case State.Properties:
+                                StartProperty(out error);
+                                if (error != null)
+                                {
+                                    return Stop(error);
+                                }
+                                break;
+
+                            case State.Items:
+                                {
+                                    if (_reader.NodeType != Xml.XmlNodeType.Element)
+                                    {
+                                        EndProperty(out error);
+                                        if (error != null)
+                                        {
+                                            return Stop(error);
+                                        }
+                                        break;
+                                    }
+
+                                    if ((_sections & _section) == 0)
+                                    {
+                                        _reader.Skip();
+                                        _index++;
+                                        DeserializeImplementation.SkipNoneWhitespaceAndComments(
+                                            _reader);
+                                        break;
+                                    }
+
+                                    Aas.IIdentifiable? item = ItemFrom(out error);
+                                    if (error != null)
+                                    {
+                                        error.PrependSegment(
+                                            new Reporting.IndexSegment(
+                                                _index));
+                                        error.PrependSegment(
+                                            new Reporting.NameSegment(
+                                                _sectionName));
+                                        return Stop(error);
+                                    }
+
+                                    _index++;
+                                    DeserializeImplementation.SkipNoneWhitespaceAndComments(
+                                        _reader);
+
+                                    return item
+                                        ?? throw new System.InvalidOperationException(
+                                            "Unexpected item null when error null");
+                                }
+
+                            case State.End:
+                                End(out error);
+                                return Stop(error);
+
+                            case State.Done:
+                                return null;
+
+                            default:
+                                throw new System.InvalidOperationException(
+                                    $"Unexpected state: {_state}");
+                        }
+                    }
+                }
+            }  // internal sealed class EnvironmentWalker
+
+            /// <summary>
+            /// Deserialize the identifiables of an environment lazily, one at a time.
+            /// </summary>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown on the first identifiable which could not be deserialized.
+            /// </exception>
+            internal static IEnumerable<T> IdentifiablesFrom<T>(
+                Xml.XmlReader reader,
+                EnvironmentSections sections) where T : Aas.IIdentifiable
+            {
+                var walker = new EnvironmentWalker(reader, sections);
+
+                while (true)
+                {
+                    Aas.IIdentifiable? item = walker.Next(out Reporting.Error? error);
+                    if (error != null)
+                    {
+                        throw new Xmlization.Exception(
+                            Reporting.GenerateRelativeXPath(error.PathSegments),
+                            error.Cause);
+                    }
+
+                    if (item == null)
+                    {
+                        yield break;
+                    }
+
+                    yield return (T)item;
+                }
+            }
+        }  // internal static class DeserializeStreamingImplementation
+
+        /// <summary>
+        /// Deserialize the identifiables of an environment from XML incrementally,
+        /// without constructing the whole environment.
+        /// </summary>
+        /// <remarks>
+        /// The identifiables are deserialized lazily as the enumeration proceeds,
+        /// and each one is yielded as soon as its end element has been consumed.
+        /// The enumeration advances <c>reader</c>, so the reader must stay open until
+        /// the enumeration is finished.
+        ///
+        /// The errors are reported with the same paths and causes as in
+        /// <see cref="Deserialize.EnvironmentFrom" />.
+        /// </remarks>
+        /// <example>
+        /// Here is an example how to process the submodels of a large environment
+        /// one by one:
+        /// <code>
+        /// using var xmlReader = System.Xml.XmlReader.Create("environment.xml");
+        /// foreach (Aas.ISubmodel submodel in DeserializeStreaming.SubmodelsFrom(
+        ///     xmlReader))
+        /// {
+        ///     // Do something with the submodel
+        /// }
+        /// </code>
+        /// </example>
+        public static class DeserializeStreaming
+        {
+            /// <summary>
+            /// Deserialize lazily the asset administration shells, submodels and
+            /// concept descriptions of the environment in <paramref name="reader" />
+            /// in the order of their appearance.
+            /// </summary>
+            /// <param name="reader">Initialized XML reader with cursor set to the element</param>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown during the enumeration when the element is not a valid XML
+            /// representation of Environment.
+            /// </exception>
+            public static IEnumerable<Aas.IIdentifiable> IdentifiablesFrom(
+                Xml.XmlReader reader)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.IIdentifiable>(
+                    reader, EnvironmentSections.All);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the asset administration shells of the environment
+            /// in <paramref name="reader" />, and skip the other identifiables.
+            /// </summary>
+            /// <param name="reader">Initialized XML reader with cursor set to the element</param>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown during the enumeration when the element is not a valid XML
+            /// representation of Environment.
+            /// </exception>
+            public static IEnumerable<Aas.IAssetAdministrationShell> AssetAdministrationShellsFrom(
+                Xml.XmlReader reader)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.IAssetAdministrationShell>(
+                    reader, EnvironmentSections.AssetAdministrationShells);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the submodels of the environment
+            /// in <paramref name="reader" />, and skip the other identifiables.
+            /// </summary>
+            /// <param name="reader">Initialized XML reader with cursor set to the element</param>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown during the enumeration when the element is not a valid XML
+            /// representation of Environment.
+            /// </exception>
+            public static IEnumerable<Aas.ISubmodel> SubmodelsFrom(
+                Xml.XmlReader reader)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.ISubmodel>(
+                    reader, EnvironmentSections.Submodels);
+            }
+
+            /// <summary>
+            /// Deserialize lazily the concept descriptions of the environment
+            /// in <paramref name="reader" />, and skip the other identifiables.
+            /// </summary>
+            /// <param name="reader">Initialized XML reader with cursor set to the element</param>
+            /// <exception cref="Xmlization.Exception">
+            /// Thrown during the enumeration when the element is not a valid XML
+            /// representation of Environment.
+            /// </exception>
+            public static IEnumerable<Aas.IConceptDescription> ConceptDescriptionsFrom(
+                Xml.XmlReader reader)
+            {
+                return DeserializeStreamingImplementation.IdentifiablesFrom<Aas.IConceptDescription>(
+                    reader, EnvironmentSections.ConceptDescriptions);
+            }
+        }  // public static class DeserializeStreaming
+    }  // public static partial class Xmlization
+}  // namespace AasCore.Aas3_0